@@ -0,0 +1,90 @@
+"""Authentication that builds request.user from JWT claims instead of a database read."""
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import User
+
+# Fields GetUser and other profile readers need; loaded together on first use.
+PROFILE_FIELDS = ["first_name", "last_name", "phone", "email"]
+
+
+def user_from_claims(user_id: int, email: str = None) -> User:
+    """Build a User from token claims without querying the database.
+
+    Fields not present in the claims are deferred, so reading one loads it
+    from the database on access. Use load_user to load them all in one query.
+
+    :param int user_id: Primary key from the token's user id claim.
+    :param str email: Email claim, if the token carries one.
+    :return: User instance with only id (and email) loaded.
+    :rtype: User
+    """
+    field_names = ["id"]
+    values = [user_id]
+    if email is not None:
+        field_names.append("email")
+        values.append(email)
+    # Not router.db_for_write, which would count as a write and keep the
+    # request's reads off the replicas
+    return User.from_db(DEFAULT_DB_ALIAS, field_names, values)
+
+
+def load_user(user: User) -> User:
+    """Load a claims-built user's remaining fields in a single query.
+
+    The email claim may predate a profile change, so it is reloaded too. Users
+    loaded from the database are returned unchanged.
+
+    :param User user: The authenticated user.
+    :return: The same user, fully loaded.
+    :rtype: User
+    """
+    deferred = user.get_deferred_fields()
+    if deferred:
+        user.refresh_from_db(fields=deferred | {"email"})
+    return user
+
+
+async def aload_user(user: User) -> User:
+    """Async version of load_user.
+
+    :param User user: The authenticated user.
+    :return: The same user, fully loaded.
+    :rtype: User
+    """
+    deferred = user.get_deferred_fields()
+    if deferred:
+        await user.arefresh_from_db(fields=deferred | {"email"})
+    return user
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """JWT authentication that skips the per-request User query.
+
+    request.user is built from the user_id and email claims. Set
+    JWT_CLAIMS_USER to False to load the user row on every request instead,
+    which also rejects tokens of deleted or inactive users.
+    """
+
+    def get_user(self, validated_token):
+        """Return the user identified by a validated token.
+
+        :param validated_token: Token that has passed signature and expiry checks.
+        :return: User built from the token claims.
+        :rtype: User
+        :raises InvalidToken: If the token has no user id claim.
+        """
+        if not settings.JWT_CLAIMS_USER:
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        return user_from_claims(user_id, validated_token.get("email"))
@@ -0,0 +1,206 @@
+"""Helpers for load testing a running server and timing database connection setup."""
+
+import json
+import re
+import subprocess
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from django.utils import timezone
+
+from .serializers.token import CustomTokenObtainPairSerializer
+
+_TIMING_QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+def access_token(user) -> str:
+    """Mint an access token for a user, as the login endpoint would.
+
+    :param User user: User to authenticate as.
+    :return: Encoded JWT access token.
+    :rtype: str
+    """
+    return str(CustomTokenObtainPairSerializer.get_token(user).access_token)
+
+
+def send_request(url: str, method: str = "GET", token: str = None, body=None) -> tuple:
+    """Send one HTTP request and read the whole response.
+
+    :param str url: Absolute URL to request.
+    :param str method: HTTP method.
+    :param str token: Bearer token, if any.
+    :param body: JSON-serializable request body, if any.
+    :return: Response status code, and the number of queries the server
+        reported in its Server-Timing header, or None when it did not.
+    :rtype: tuple
+    """
+    headers = {"Accept": "application/json"}
+    data = None
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    if body is not None:
+        headers["Content-Type"] = "application/json"
+        data = json.dumps(body).encode()
+
+    request = urllib.request.Request(url, data=data, headers=headers, method=method)
+    try:
+        with urllib.request.urlopen(request) as response:
+            response.read()
+            return response.status, timing_queries(response.headers.get("Server-Timing"))
+    except urllib.error.HTTPError as exc:
+        return exc.code, timing_queries(exc.headers.get("Server-Timing"))
+
+
+def timing_queries(header: str):
+    """Return the query count from a Server-Timing header, as format_server_timing writes it.
+
+    :param str header: Server-Timing header value, or None.
+    :return: Number of queries, or None when the header does not report one.
+    :rtype: int or None
+    """
+    match = _TIMING_QUERIES.search(header or "")
+    return int(match.group(1)) if match else None
+
+
+def percentile(values: list, q: float) -> float:
+    """Return the q-th percentile (0-100) of values by the nearest-rank method.
+
+    :param list values: Sorted sample values.
+    :param float q: Percentile to return.
+    :return: The percentile, or 0 when there are no values.
+    :rtype: float
+    """
+    if not values:
+        return 0
+    rank = max(1, -(-len(values) * q // 100))
+    return values[int(rank) - 1]
+
+
+def run_load(send, concurrency: int, total: int) -> dict:
+    """Call send total times from concurrency threads and summarize latencies.
+
+    :param send: Callable taking no arguments and returning a status code and
+        a query count (or None), as send_request does.
+    :param int concurrency: Number of requests in flight at once.
+    :param int total: Number of requests to send.
+    :return: Request and error counts, throughput (requests/s), p50, p90,
+        p95, p99 and max latency in milliseconds, and the mean and max
+        queries per request when the server reported them.
+    :rtype: dict
+    """
+
+    def timed(_):
+        start = time.perf_counter()
+        try:
+            code, queries = send()
+        except OSError:
+            code, queries = None, None
+        return time.perf_counter() - start, code, queries
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        samples = list(pool.map(timed, range(total)))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(seconds * 1000 for seconds, _, _ in samples)
+    errors = sum(1 for _, code, _ in samples if code is None or code >= 400)
+    queries = [count for _, _, count in samples if count is not None]
+    return {
+        "concurrency": concurrency,
+        "requests": total,
+        "errors": errors,
+        "throughput": round(total / elapsed, 1) if elapsed else 0,
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p90_ms": round(percentile(latencies, 90), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "max_ms": round(latencies[-1], 2) if latencies else 0,
+        "mean_queries": round(sum(queries) / len(queries), 2) if queries else None,
+        "max_queries": max(queries) if queries else None,
+    }
+
+
+def connection_cost(db, iterations: int) -> dict:
+    """Time the database work of a minimal request on a database wrapper.
+
+    Each iteration runs one query between the connection checks Django makes
+    when a request starts and finishes, so the connection is opened, reused,
+    health checked or returned to the pool as the wrapper's settings dictate.
+
+    :param db: Database wrapper to measure, not registered in connections.
+    :type db: django.db.backends.base.base.BaseDatabaseWrapper
+    :param int iterations: Number of simulated requests.
+    :return: Mean and p50/p99 milliseconds per request, and how many distinct
+        connections were used.
+    :rtype: dict
+    """
+    # Keyed by id, holding each connection so its id is not reused
+    seen = {}
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        db.close_if_unusable_or_obsolete()
+        with db.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+        seen[id(db.connection)] = db.connection
+        db.close_if_unusable_or_obsolete()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    latencies.sort()
+    return {
+        "iterations": iterations,
+        "connections_opened": len(seen),
+        "mean_ms": round(sum(latencies) / len(latencies), 3),
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+    }
+
+
+def current_commit():
+    """Return the git commit the code runs from, or None outside a git checkout.
+
+    :rtype: str or None
+    """
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def write_results(path: str, results: list, **meta):
+    """Write benchmark results to a JSON file along with the commit and time of the run.
+
+    :param str path: File to write.
+    :param list results: Result rows.
+    :param meta: Further top-level fields, e.g. label and url.
+    """
+    with open(path, "w") as file:
+        json.dump(
+            {
+                "commit": current_commit(),
+                "timestamp": timezone.now().isoformat(),
+                **meta,
+                "results": results,
+            },
+            file,
+            indent=2,
+        )
+
+
+def load_baseline(path: str, *keys) -> dict:
+    """Read the results of an earlier run, keyed by the given row fields.
+
+    :param str path: Results file written by write_results.
+    :param keys: Row fields identifying a measurement, e.g. endpoint and concurrency.
+    :return: Mapping of key tuples to result rows.
+    :rtype: dict
+    """
+    with open(path) as file:
+        rows = json.load(file)["results"]
+    return {tuple(row[key] for key in keys): row for row in rows}
@@ -0,0 +1,27 @@
+"""System checks for settings that are unsafe in a multi-process deployment."""
+
+from django.conf import settings
+from django.core import checks
+
+PER_PROCESS_CACHES = ("django.core.cache.backends.locmem.LocMemCache",)
+
+
+@checks.register(checks.Tags.caches, deploy=True)
+def check_permissions_cache(app_configs, **kwargs):
+    """Warn when memberships are cached per process.
+
+    invalidate_membership only clears the cache of the worker that made the
+    change, so other workers would keep serving revoked permissions.
+    """
+    backend = settings.CACHES.get("permissions", {}).get("BACKEND")
+    if backend not in PER_PROCESS_CACHES:
+        return []
+    return [
+        checks.Warning(
+            "The permissions cache is local to each process, so revoked or removed "
+            "members stay authorized on other workers until their entries expire.",
+            hint="Set PERMISSIONS_CACHE_BACKEND to a shared backend such as RedisCache or "
+            "DatabaseCache, or leave it unset to disable the cache.",
+            id="api.W001",
+        )
+    ]
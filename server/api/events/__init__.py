@@ -0,0 +1,37 @@
+"""Schedule change events pushed to clients over server-sent event streams.
+
+Writes publish small events such as {"type": "shift", "action": "saved",
+"ids": [1, 2]} per workspace; clients refetch what changed, e.g. through the
+shift changes feed. SCHEDULE_EVENTS_BACKEND selects how events reach the
+processes serving the streams.
+"""
+
+from functools import cache
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from .backends import Hub, InProcessBackend, PostgresBackend, Subscription
+
+
+@cache
+def get_backend():
+    """Return this process's event backend, built from SCHEDULE_EVENTS_BACKEND.
+
+    :return: The configured backend.
+    :rtype: Hub
+    """
+    return import_string(settings.SCHEDULE_EVENTS_BACKEND)()
+
+
+def publish(workspace_id: int, type: str, action: str, ids):
+    """Publish a change to a workspace's shifts, members or roles.
+
+    :param int workspace_id: Primary key of the workspace.
+    :param str type: What changed: "shift", "member" or "role".
+    :param str action: "saved" or "deleted".
+    :param ids: Primary keys of the changed rows.
+    :type ids: Iterable[int]
+    """
+    event = {"type": type, "action": action, "ids": list(ids)}
+    get_backend().publish(int(workspace_id), event)
@@ -0,0 +1,216 @@
+"""Pub/sub backends delivering schedule change events to event stream subscribers."""
+
+import asyncio
+import json
+import logging
+import select
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import connection, transaction
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """A connected client's queue of events for one workspace.
+
+    Created and read on the client's event loop. When the client falls more
+    than SCHEDULE_EVENTS_QUEUE_SIZE events behind, the queued events are
+    dropped and a single resync event is delivered instead.
+    """
+
+    def __init__(self, workspace_id: int):
+        self.workspace_id = workspace_id
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=settings.SCHEDULE_EVENTS_QUEUE_SIZE)
+
+    def put(self, event: dict):
+        """Queue an event; must be called on the subscription's loop."""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"type": "resync"})
+
+    async def get(self) -> dict:
+        """Wait for the next event."""
+        return await self.queue.get()
+
+
+class Hub:
+    """Per-process registry of subscriptions, fanning events out to their loops.
+
+    Events are delivered with one call_soon_threadsafe per event loop rather
+    than per subscriber, so thousands of idle streams on a loop cost one
+    wakeup per event.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions = defaultdict(set)
+
+    def subscribe(self, workspace_id: int) -> Subscription:
+        """Register a subscription for a workspace's events on the running loop.
+
+        :param int workspace_id: Primary key of the workspace.
+        :return: The new subscription.
+        :rtype: Subscription
+        """
+        subscription = Subscription(workspace_id)
+        with self._lock:
+            self._subscriptions[workspace_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """Stop delivering events to a subscription.
+
+        :param Subscription subscription: Subscription returned by subscribe.
+        """
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.workspace_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.workspace_id]
+
+    def subscriber_count(self, workspace_id: int) -> int:
+        """Return how many subscriptions a workspace has in this process."""
+        with self._lock:
+            return len(self._subscriptions.get(workspace_id, ()))
+
+    def dispatch(self, workspace_id: int, event: dict):
+        """Deliver an event to this process's subscribers of a workspace.
+
+        Safe to call from any thread.
+
+        :param int workspace_id: Primary key of the workspace.
+        :param dict event: Event to deliver.
+        """
+        by_loop = defaultdict(list)
+        with self._lock:
+            for subscription in self._subscriptions.get(workspace_id, ()):
+                by_loop[subscription.loop].append(subscription)
+
+        for loop, subscriptions in by_loop.items():
+            try:
+                loop.call_soon_threadsafe(_deliver, subscriptions, event)
+            except RuntimeError:
+                # The loop was closed; its streams are gone
+                for subscription in subscriptions:
+                    self.unsubscribe(subscription)
+
+
+def _deliver(subscriptions, event):
+    for subscription in subscriptions:
+        subscription.put(event)
+
+
+class InProcessBackend(Hub):
+    """Backend delivering events only to streams served by the same process.
+
+    Needs no external services, which suits tests, development and a single
+    ASGI worker. Events are dispatched once the publishing transaction commits.
+    """
+
+    def publish(self, workspace_id: int, event: dict):
+        """Publish an event to a workspace's subscribers after commit.
+
+        :param int workspace_id: Primary key of the workspace.
+        :param dict event: JSON-serializable event.
+        """
+        transaction.on_commit(lambda: self.dispatch(workspace_id, event))
+
+
+class PostgresBackend(Hub):
+    """Backend relaying events between processes with Postgres LISTEN/NOTIFY.
+
+    publish() issues pg_notify in the publishing transaction, so Postgres
+    delivers the event only if it commits. Each process runs one listener
+    thread, started on its first subscription, that dispatches notifications
+    to the process's own subscribers.
+    """
+
+    channel = "schedule_events"
+    # Postgres rejects notification payloads of 8000 bytes or more
+    max_payload = 7900
+
+    def __init__(self):
+        super().__init__()
+        self._listener = None
+
+    def publish(self, workspace_id: int, event: dict):
+        """Publish an event to a workspace's subscribers in every process.
+
+        :param int workspace_id: Primary key of the workspace.
+        :param dict event: JSON-serializable event.
+        """
+        payload = json.dumps({"workspace": workspace_id, "event": event})
+        if len(payload) > self.max_payload:
+            # Too many ids to carry; clients refetch the collection instead
+            payload = json.dumps({"workspace": workspace_id, "event": {**event, "ids": None}})
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", [self.channel, payload])
+
+    def subscribe(self, workspace_id: int) -> Subscription:
+        """Register a subscription, starting this process's listener if needed.
+
+        :param int workspace_id: Primary key of the workspace.
+        :return: The new subscription.
+        :rtype: Subscription
+        """
+        with self._lock:
+            if self._listener is None or not self._listener.is_alive():
+                self._listener = threading.Thread(
+                    target=self._listen, name="schedule-events-listener", daemon=True
+                )
+                self._listener.start()
+        return super().subscribe(workspace_id)
+
+    def _listen(self):
+        """Receive notifications forever, reconnecting after connection errors."""
+        from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+        params = connection.get_connection_params()
+        while True:
+            try:
+                if is_psycopg3:
+                    self._listen_psycopg(params)
+                else:
+                    self._listen_psycopg2(params)
+            except Exception:
+                logger.exception("Schedule event listener failed; reconnecting.")
+                threading.Event().wait(settings.SCHEDULE_EVENTS_KEEPALIVE)
+
+    def _listen_psycopg(self, params: dict):
+        """Relay notifications received on a dedicated psycopg 3 connection."""
+        import psycopg
+
+        with psycopg.connect(**params, autocommit=True) as listener:
+            listener.execute(f"LISTEN {self.channel}")
+            for notify in listener.notifies():
+                self._relay(notify.payload)
+
+    def _listen_psycopg2(self, params: dict):
+        """Relay notifications received on a dedicated psycopg2 connection."""
+        import psycopg2
+
+        listener = psycopg2.connect(**params)
+        try:
+            listener.autocommit = True
+            with listener.cursor() as cursor:
+                cursor.execute(f"LISTEN {self.channel}")
+            while True:
+                if select.select([listener], [], [], 30) == ([], [], []):
+                    continue
+                listener.poll()
+                while listener.notifies:
+                    self._relay(listener.notifies.pop(0).payload)
+        finally:
+            listener.close()
+
+    def _relay(self, payload: str):
+        message = json.loads(payload)
+        self.dispatch(message["workspace"], message["event"])
@@ -0,0 +1,264 @@
+"""Streaming CSV and XLSX exports of a workspace's shifts, for payroll.
+
+Rows are read with a server-side cursor and written out a chunk at a time,
+so memory use does not grow with the number of shifts exported.
+"""
+
+import csv
+import zipfile
+from decimal import Decimal
+from xml.sax.saxutils import escape
+
+from asgiref.sync import sync_to_async
+from django.db.models import Value
+from django.db.models.functions import Concat
+
+from .models import Shift
+from .scheduling.rollup import shift_cost
+from .utils.ranges import overlapping
+
+# Rows fetched from the cursor and written out at a time
+CHUNK_SIZE = 2000
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+COLUMNS = (
+    "shift_id",
+    "start_time",
+    "end_time",
+    "hours",
+    "member_id",
+    "member_name",
+    "member_email",
+    "role",
+    "pay_rate",
+    "cost",
+)
+
+# Text starting with one of these is evaluated as a formula by spreadsheet
+# applications, so member-supplied names and emails could run as formulas
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def export_rows(workspace_id: int, range_start=None, range_end=None):
+    """Yield a workspace's shifts as tuples in COLUMNS order, oldest first.
+
+    Reads through a server-side cursor in chunks of CHUNK_SIZE. Cost uses the
+    member's pay rate, or the role's when the member has none, and keeps the
+    four places of rollup.shift_cost, so summing the column gives the labor
+    report's totals. Open shifts have no member and no member rate.
+
+    :param int workspace_id: Primary key of the workspace.
+    :param datetime range_start: Only shifts ending after this, if given.
+    :param datetime range_end: Only shifts starting before this, if given.
+    """
+    shifts = (
+        overlapping(Shift.objects.filter(workspace_id=workspace_id), range_start, range_end)
+        .order_by("start_time", "id")
+        .values_list(
+            "id",
+            "start_time",
+            "end_time",
+            "member_id",
+            Concat("member__user__first_name", Value(" "), "member__user__last_name"),
+            "member__user__email",
+            "role__name",
+            "member__pay_rate",
+            "role__pay_rate",
+        )
+    )
+    for pk, start, end, member_id, name, email, role, member_rate, role_rate in shifts.iterator(
+        chunk_size=CHUNK_SIZE
+    ):
+        seconds = int((end - start).total_seconds())
+        rate = member_rate if member_rate is not None else role_rate
+        cost = shift_cost(seconds, rate)
+        yield (
+            pk,
+            start.isoformat(),
+            end.isoformat(),
+            round(seconds / 3600, 2),
+            member_id,
+            (name or "").strip() if member_id else "",
+            email or "",
+            role,
+            rate,
+            cost,
+        )
+
+
+class _Buffer:
+    """Write-only file object whose contents are taken out after each chunk."""
+
+    def __init__(self):
+        self.parts = []
+
+    def write(self, data):
+        self.parts.append(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self) -> bytes:
+        data = b"".join(part if isinstance(part, bytes) else part.encode() for part in self.parts)
+        self.parts = []
+        return data
+
+
+def _chunks(rows):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def is_formula(value) -> bool:
+    """Return whether a spreadsheet would evaluate a value as a formula."""
+    return isinstance(value, str) and value.startswith(FORMULA_PREFIXES)
+
+
+def _csv_field(value):
+    return f"'{value}" if is_formula(value) else value
+
+
+def stream_csv(rows):
+    """Yield a CSV document of rows, with a header, a chunk of rows at a time.
+
+    None is written as an empty field. Text that a spreadsheet would evaluate
+    as a formula is prefixed with a quote, which keeps it text.
+
+    :param rows: Iterable of tuples in COLUMNS order.
+    """
+    buffer = _Buffer()
+    writer = csv.writer(buffer)
+    writer.writerow(COLUMNS)
+    for chunk in _chunks(rows):
+        writer.writerows([_csv_field(value) for value in row] for row in chunk)
+        yield buffer.take()
+    yield buffer.take()
+
+
+def _cell(value) -> str:
+    if value is None or value == "":
+        return "<c/>"
+    if isinstance(value, (int, float, Decimal)):
+        return f"<c><v>{value}</v></c>"
+    # Style 1 sets quotePrefix, which keeps the cell text when it is edited
+    style = ' s="1"' if is_formula(value) else ""
+    return f'<c t="inlineStr"{style}><is><t>{escape(str(value))}</t></is></c>'
+
+
+def _sheet_row(values) -> str:
+    return f"<row>{''.join(_cell(value) for value in values)}</row>"
+
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    "</Types>"
+)
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Shifts" sheetId="1" r:id="rId1"/></sheets>'
+    "</workbook>"
+)
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    "</Relationships>"
+)
+_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0" quotePrefix="1"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    "</styleSheet>"
+)
+_SHEET_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_SHEET_END = "</sheetData></worksheet>"
+
+
+def stream_xlsx(rows):
+    """Yield an XLSX workbook of rows, with a header, a chunk of rows at a time.
+
+    The workbook is written with zipfile into a buffer that is emptied after
+    every chunk. Zip entries written to an unseekable stream carry their
+    sizes in data descriptors, so the sheet never has to be held whole.
+    Strings are stored inline rather than in a shared string table, which
+    would need every value up front. Inline strings are never evaluated, and
+    those that look like formulas get the quotePrefix style so they stay text
+    when edited.
+
+    :param rows: Iterable of tuples in COLUMNS order.
+    """
+    buffer = _Buffer()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as workbook:
+        workbook.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        workbook.writestr("_rels/.rels", _ROOT_RELS)
+        workbook.writestr("xl/workbook.xml", _WORKBOOK)
+        workbook.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+        workbook.writestr("xl/styles.xml", _STYLES)
+        with workbook.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            sheet.write((_SHEET_START + _sheet_row(COLUMNS)).encode())
+            for chunk in _chunks(rows):
+                sheet.write("".join(_sheet_row(row) for row in chunk).encode())
+                yield buffer.take()
+            sheet.write(_SHEET_END.encode())
+    yield buffer.take()
+
+
+async def stream_async(stream):
+    """Yield the chunks of a sync export stream to an ASGI server one at a time.
+
+    Given a sync iterator, Django's ASGI handler reads it whole into a list
+    before sending anything. Each chunk is instead pulled in the request's
+    sync thread, which owns the database connection and its server-side
+    cursor, so the export is sent as it is read.
+
+    :param stream: Iterator of bytes, such as stream_csv or stream_xlsx.
+    """
+    stream = iter(stream)
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    while (chunk := await next_chunk(stream, None)) is not None:
+        yield chunk
@@ -0,0 +1,236 @@
+"""iCalendar (RFC 5545) feeds of a member's or a workspace's shifts.
+
+Feeds are read by calendar clients that cannot send a JWT, so each feed URL
+carries a signed token naming the feed and the user it was issued to. Events
+are rendered once per version of a shift and kept in the "calendar" cache, so
+a poll only renders shifts that changed since the previous one.
+"""
+
+import hashlib
+from datetime import timezone as dt_timezone
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import caches
+from django.utils import timezone
+
+from .models import Shift
+from .utils.ranges import overlapping
+
+TOKEN_SALT = "api.ical"
+PRODID = "-//Schedulo//Shifts//EN"
+MEMBER_FEED = "member"
+WORKSPACE_FEED = "workspace"
+
+# Rows fetched, looked up in the cache and rendered at a time
+CHUNK_SIZE = 500
+
+
+def feed_token(kind: str, pk: int, user_id: int) -> str:
+    """Sign a token granting a user's calendar client access to a feed.
+
+    :param str kind: MEMBER_FEED or WORKSPACE_FEED.
+    :param int pk: Primary key of the member or workspace.
+    :param int user_id: Primary key of the user the feed is issued to.
+    :rtype: str
+    """
+    return signing.dumps([kind, pk, user_id], salt=TOKEN_SALT)
+
+
+def read_feed_token(token: str):
+    """Return the kind, primary key and user id signed into a feed token.
+
+    :param str token: Token from feed_token.
+    :return: (kind, pk, user_id), or None if the token is invalid.
+    :rtype: tuple or None
+    """
+    try:
+        kind, pk, user_id = signing.loads(token, salt=TOKEN_SALT)
+    except (signing.BadSignature, TypeError, ValueError):
+        return None
+    if kind not in (MEMBER_FEED, WORKSPACE_FEED):
+        return None
+    return kind, pk, user_id
+
+
+def escape_text(value: str) -> str:
+    """Escape a TEXT property value.
+
+    :param str value: Unescaped text.
+    :rtype: str
+    """
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold(line: str) -> str:
+    """Fold a content line to at most 75 octets per line, as RFC 5545 requires.
+
+    :param str line: Unfolded content line without its line break.
+    :return: The line, continued on further lines starting with a space.
+    :rtype: str
+    """
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line
+    parts = []
+    limit = 75
+    while encoded:
+        cut = min(limit, len(encoded))
+        # Do not split a multi-byte character
+        while cut < len(encoded) and encoded[cut] & 0xC0 == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode())
+        encoded = encoded[cut:]
+        limit = 74
+    return "\r\n ".join(parts)
+
+
+def format_datetime(value) -> str:
+    """Format an aware datetime as a UTC DATE-TIME value.
+
+    :rtype: str
+    """
+    return value.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def shift_summary(row: dict, kind: str) -> str:
+    """Return the title of a shift's event.
+
+    Member feeds are titled by role; workspace feeds also name who works the
+    shift, or mark it open.
+
+    :param dict row: Shift row from feed_rows.
+    :param str kind: MEMBER_FEED or WORKSPACE_FEED.
+    :rtype: str
+    """
+    role = row["role__name"]
+    if kind == MEMBER_FEED:
+        return role
+    if row["member_id"] is None:
+        return f"{role} (open)"
+    name = f"{row['member__user__first_name']} {row['member__user__last_name']}".strip()
+    return f"{role}: {name or row['member__user__email']}"
+
+
+def render_event(row: dict, summary: str) -> str:
+    """Render a shift as a VEVENT component.
+
+    :param dict row: Shift row from feed_rows.
+    :param str summary: Event title.
+    :return: Content lines, each ending with CRLF.
+    :rtype: str
+    """
+    modified = format_datetime(row["date_modified"])
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:shift-{row['id']}@{settings.CALENDAR_UID_DOMAIN}",
+        f"DTSTAMP:{modified}",
+        f"LAST-MODIFIED:{modified}",
+        f"DTSTART:{format_datetime(row['start_time'])}",
+        f"DTEND:{format_datetime(row['end_time'])}",
+        fold(f"SUMMARY:{escape_text(summary)}"),
+        "END:VEVENT",
+    ]
+    return "\r\n".join(lines) + "\r\n"
+
+
+def event_key(row: dict, summary: str) -> str:
+    """Return the cache key of a rendered shift.
+
+    Keyed by the shift's id and modification time; the title comes from the
+    role and member, so a digest of it is included for renames to show.
+
+    :param dict row: Shift row from feed_rows.
+    :param str summary: Event title.
+    :rtype: str
+    """
+    digest = hashlib.blake2b(summary.encode(), digest_size=8).hexdigest()
+    return f"ical:{row['id']}:{row['date_modified'].timestamp()}:{digest}"
+
+
+def feed_window():
+    """Return the [start, end) range of shifts included in feeds.
+
+    :rtype: tuple
+    """
+    now = timezone.now()
+    return now - settings.CALENDAR_FEED_PAST, now + settings.CALENDAR_FEED_FUTURE
+
+
+def feed_rows(kind: str, pk: int):
+    """Return the shifts of a feed as rows, ordered by start time.
+
+    Filters on the member or workspace and start time, so the query is served
+    by shift_member_start_idx or shift_workspace_start_idx.
+
+    :param str kind: MEMBER_FEED or WORKSPACE_FEED.
+    :param int pk: Primary key of the member or workspace.
+    :rtype: QuerySet
+    """
+    shifts = Shift.objects.filter(**{"member_id" if kind == MEMBER_FEED else "workspace_id": pk})
+    fields = ["id", "date_modified", "start_time", "end_time", "role__name", "member_id"]
+    if kind == WORKSPACE_FEED:
+        fields += ["member__user__first_name", "member__user__last_name", "member__user__email"]
+    return overlapping(shifts, *feed_window()).order_by("start_time", "id").values(*fields)
+
+
+def render_events(rows, kind: str):
+    """Yield the VEVENTs of rows, a chunk at a time, reusing cached renders.
+
+    Each chunk's events are fetched from the cache in one call and only the
+    missing ones are rendered and stored.
+
+    :param rows: Iterable of shift rows from feed_rows.
+    :param str kind: MEMBER_FEED or WORKSPACE_FEED.
+    """
+    cache = caches["calendar"]
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == CHUNK_SIZE:
+            yield _render_chunk(cache, chunk, kind)
+            chunk = []
+    if chunk:
+        yield _render_chunk(cache, chunk, kind)
+
+
+def _render_chunk(cache, rows, kind):
+    summaries = [shift_summary(row, kind) for row in rows]
+    keys = [event_key(row, summary) for row, summary in zip(rows, summaries)]
+    cached = cache.get_many(keys)
+    rendered = {}
+    for row, summary, key in zip(rows, summaries, keys):
+        if key not in cached:
+            rendered[key] = render_event(row, summary)
+    if rendered:
+        cache.set_many(rendered)
+    return "".join(cached.get(key) or rendered[key] for key in keys)
+
+
+def stream_calendar(name: str, rows, kind: str):
+    """Yield a VCALENDAR holding the events of rows.
+
+    :param str name: Calendar name shown by clients.
+    :param rows: Iterable of shift rows from feed_rows.
+    :param str kind: MEMBER_FEED or WORKSPACE_FEED.
+    """
+    refresh = int(settings.CALENDAR_FEED_REFRESH.total_seconds() // 60)
+    header = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        fold(f"X-WR-CALNAME:{escape_text(name)}"),
+        f"REFRESH-INTERVAL;VALUE=DURATION:PT{refresh}M",
+        f"X-PUBLISHED-TTL:PT{refresh}M",
+    ]
+    yield "\r\n".join(header) + "\r\n"
+    yield from render_events(rows, kind)
+    yield "END:VCALENDAR\r\n"
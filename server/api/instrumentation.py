@@ -0,0 +1,217 @@
+"""Per-request metrics: database queries per alias, database, serialization and render time,
+response size.
+"""
+
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+_current = ContextVar("request_metrics", default=None)
+_totals = Counter()
+_stats = {}
+_lock = threading.Lock()
+
+
+class RequestMetrics:
+    """Measurements of one request, filled in while it is served.
+
+    Times are in seconds. serialize_time covers building response data in the
+    view (serializer .data and shift_list_data), including any queries that
+    runs, so it overlaps db_time. render_time covers turning the view's
+    response into bytes (DRF renderers), measured from when the view returned.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = Counter()
+        self.db_time = 0.0
+        self.serialize_time = 0.0
+        self.render_time = 0.0
+        self.total_time = 0.0
+        self.size = 0
+        self.url_name = None
+        self._view_returned = None
+
+    @property
+    def query_count(self) -> int:
+        """Number of queries the request sent to all aliases."""
+        return sum(self.queries.values())
+
+    def view_returned(self):
+        """Mark the end of the view, where rendering starts."""
+        self._view_returned = time.perf_counter()
+
+    def finish(self, response):
+        """Record the render time, total time and size once the response is complete.
+
+        :param response: The rendered response.
+        :type response: django.http.HttpResponseBase
+        """
+        now = time.perf_counter()
+        if self._view_returned is not None:
+            self.render_time = now - self._view_returned
+        self.total_time = now - self.started
+        if not response.streaming:
+            self.size = len(response.content)
+
+
+def count_query(execute, sql, params, many, context):
+    """Execute wrapper counting and timing each query against its connection's alias."""
+    alias = context["connection"].alias
+    metrics = _current.get()
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        if metrics is not None:
+            metrics.queries[alias] += 1
+            metrics.db_time += time.perf_counter() - start
+        with _lock:
+            _totals[alias] += 1
+
+
+@receiver(connection_created)
+def install_query_counter(sender, connection, **kwargs):
+    """Count the queries of every database connection once it is opened."""
+    if count_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(count_query)
+
+
+def begin_request_metrics():
+    """Start measuring the current request.
+
+    :return: The request's metrics and a token for end_request_metrics.
+    :rtype: tuple
+    """
+    metrics = RequestMetrics()
+    return metrics, _current.set(metrics)
+
+
+def end_request_metrics(token):
+    """Stop measuring the request started with the given token."""
+    _current.reset(token)
+
+
+def current_metrics():
+    """Return the metrics of the request being served, or None outside requests.
+
+    :rtype: RequestMetrics or None
+    """
+    return _current.get()
+
+
+@contextmanager
+def measure_serialization():
+    """Add the time spent in the block to the current request's serialize_time.
+
+    Does nothing but run the block outside requests.
+    """
+    metrics = _current.get()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if metrics is not None:
+            metrics.serialize_time += time.perf_counter() - start
+
+
+def record(metrics: RequestMetrics):
+    """Add a finished request to this process's per-URL-name aggregates.
+
+    :param RequestMetrics metrics: Metrics of the finished request.
+    """
+    key = metrics.url_name or "unresolved"
+    with _lock:
+        stats = _stats.setdefault(
+            key,
+            {
+                "requests": 0,
+                "queries": 0,
+                "max_queries": 0,
+                "db_ms": 0.0,
+                "serialize_ms": 0.0,
+                "render_ms": 0.0,
+                "total_ms": 0.0,
+                "max_total_ms": 0.0,
+                "bytes": 0,
+            },
+        )
+        stats["requests"] += 1
+        stats["queries"] += metrics.query_count
+        stats["max_queries"] = max(stats["max_queries"], metrics.query_count)
+        stats["db_ms"] += metrics.db_time * 1000
+        stats["serialize_ms"] += metrics.serialize_time * 1000
+        stats["render_ms"] += metrics.render_time * 1000
+        stats["total_ms"] += metrics.total_time * 1000
+        stats["max_total_ms"] = max(stats["max_total_ms"], metrics.total_time * 1000)
+        stats["bytes"] += metrics.size
+
+
+def request_stats() -> dict:
+    """Return this process's request aggregates by URL name, with per-request means.
+
+    :return: Mapping of URL name to request count, query totals and means,
+        database, serialization, render and total milliseconds and response bytes.
+    :rtype: dict
+    """
+    with _lock:
+        snapshot = {name: dict(stats) for name, stats in _stats.items()}
+    for stats in snapshot.values():
+        count = stats["requests"]
+        stats["mean_queries"] = round(stats["queries"] / count, 2)
+        stats["mean_db_ms"] = round(stats["db_ms"] / count, 3)
+        stats["mean_serialize_ms"] = round(stats["serialize_ms"] / count, 3)
+        stats["mean_render_ms"] = round(stats["render_ms"] / count, 3)
+        stats["mean_total_ms"] = round(stats["total_ms"] / count, 3)
+        stats["mean_bytes"] = round(stats["bytes"] / count)
+        for field in ("db_ms", "serialize_ms", "render_ms", "total_ms", "max_total_ms"):
+            stats[field] = round(stats[field], 3)
+    return snapshot
+
+
+def reset_stats():
+    """Clear this process's request aggregates and query totals."""
+    with _lock:
+        _stats.clear()
+        _totals.clear()
+
+
+def query_totals() -> dict:
+    """Return the number of queries this process has sent to each alias.
+
+    :rtype: dict
+    """
+    with _lock:
+        return dict(_totals)
+
+
+def format_query_split(counts) -> str:
+    """Format per-alias query counts as "alias=count" pairs sorted by alias.
+
+    :param counts: Mapping of database alias to number of queries.
+    :return: Comma-separated pairs, e.g. "default=1, replica=4".
+    :rtype: str
+    """
+    return ", ".join(f"{alias}={count}" for alias, count in sorted(counts.items()))
+
+
+def format_server_timing(metrics: RequestMetrics) -> str:
+    """Format request metrics as a Server-Timing header value.
+
+    :param RequestMetrics metrics: Metrics of the finished request.
+    :return: db, serialize, render and total metrics with durations in milliseconds.
+    :rtype: str
+    """
+    return ", ".join(
+        [
+            f'db;dur={metrics.db_time * 1000:.1f};desc="{metrics.query_count} queries"',
+            f"serialize;dur={metrics.serialize_time * 1000:.1f}",
+            f"render;dur={metrics.render_time * 1000:.1f}",
+            f"total;dur={metrics.total_time * 1000:.1f}",
+        ]
+    )
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...models import Workspace
+from ...scheduling import apply_autofill, autofill
+from ...utils import parse_range_bound
+
+
+class Command(BaseCommand):
+    """Assign members to a workspace's open shifts in a date range."""
+
+    help = "Fill open shifts with eligible members, balancing hours."
+
+    def add_arguments(self, parser):
+        parser.add_argument("workspace_id", type=int)
+        parser.add_argument("range_start", help="Date (YYYY-MM-DD) or ISO 8601 datetime.")
+        parser.add_argument(
+            "range_end", help="Date (YYYY-MM-DD, inclusive) or ISO 8601 datetime (exclusive)."
+        )
+        parser.add_argument(
+            "--time-budget",
+            type=float,
+            help="Seconds to search; defaults to SHIFT_AUTOFILL_TIME_BUDGET.",
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Report the assignment without saving it."
+        )
+
+    def handle(self, *args, **options):
+        if not Workspace.objects.filter(pk=options["workspace_id"]).exists():
+            raise CommandError("Workspace does not exist.")
+        try:
+            start = parse_range_bound(options["range_start"])
+            end = parse_range_bound(options["range_end"], end=True)
+        except ValueError:
+            raise CommandError("Date range is invalid.")
+
+        result = autofill(options["workspace_id"], start, end, options["time_budget"])
+        saved = 0 if options["dry_run"] else apply_autofill(result)
+
+        self.stdout.write(
+            f"Assigned {len(result.assignments)} shift(s), {len(result.unfilled)} left open "
+            f"({result.iterations} iterations in {result.elapsed:.2f}s"
+            f"{'' if result.complete else ', time budget reached'})."
+        )
+        if not options["dry_run"]:
+            self.stdout.write(f"Saved {saved} assignment(s).")
@@ -0,0 +1,124 @@
+import threading
+from datetime import timedelta
+from itertools import cycle
+from urllib.parse import urlencode, urljoin
+
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+from django.utils import timezone
+
+from ...benchmarks import access_token, load_baseline, run_load, send_request, write_results
+from ...models import User, WorkspaceMember
+
+
+class Command(BaseCommand):
+    """Load test the hot endpoints of a running server as many seeded users.
+
+    Requests rotate across the first --users users generated by seed_data with
+    the given --prefix, each reading its own workspace over the current week,
+    so caches and indexes see a realistic spread of keys. Each endpoint is
+    reported with throughput, p50/p95/p99 latency and the queries per request
+    the server reported in its Server-Timing header. Save runs with --output
+    and compare commits by passing an earlier run as --baseline.
+    """
+
+    help = "Benchmark the hot read endpoints against seeded data and report latency percentiles."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", default="http://localhost:8000", help="Server base URL.")
+        parser.add_argument("--prefix", default="seed", help="Prefix given to seed_data.")
+        parser.add_argument("--users", type=int, default=20, help="Seeded users to rotate across.")
+        parser.add_argument(
+            "--concurrency", type=int, default=8, help="Number of concurrent requests."
+        )
+        parser.add_argument("--requests", type=int, default=500, help="Requests per endpoint.")
+        parser.add_argument("--label", default="", help="Name of the run.")
+        parser.add_argument("--output", help="File to write the results to as JSON.")
+        parser.add_argument("--baseline", help="Results file of an earlier run to compare with.")
+
+    def handle(self, *args, **options):
+        if min(options["users"], options["concurrency"], options["requests"]) < 1:
+            raise CommandError("--users, --concurrency and --requests must be positive.")
+
+        members = list(
+            WorkspaceMember.objects.filter(user__email__startswith=f"{options['prefix']}-")
+            .select_related("user")
+            .order_by("id")[: options["users"]]
+        )
+        if not members:
+            raise CommandError(f"No seeded users with prefix '{options['prefix']}'; run seed_data.")
+        clients = [(access_token(member.user), member.workspace_id) for member in members]
+
+        today = timezone.localdate()
+        monday = today - timedelta(days=today.weekday())
+        window = {
+            "range_start": monday.isoformat(),
+            "range_end": (monday + timedelta(days=6)).isoformat(),
+        }
+
+        endpoints = {
+            "user": lambda workspace_id: ("GET", reverse("get_user"), None),
+            "workspace_shifts": lambda workspace_id: (
+                "GET",
+                f"{reverse('workspace_shifts', args=[workspace_id])}?{urlencode(window)}",
+                None,
+            ),
+            "workspace_members": lambda workspace_id: (
+                "GET",
+                reverse("workspace_members", args=[workspace_id]),
+                None,
+            ),
+            "shift_filter": lambda workspace_id: (
+                "POST",
+                reverse("shift_filter"),
+                {"workspace_id": workspace_id, **window},
+            ),
+        }
+
+        baseline = {}
+        if options["baseline"]:
+            baseline = load_baseline(options["baseline"], "endpoint")
+
+        results = []
+        for name, build in endpoints.items():
+            rotation = cycle(clients)
+            lock = threading.Lock()
+
+            def send():
+                with lock:
+                    token, workspace_id = next(rotation)
+                method, path, body = build(workspace_id)
+                return send_request(urljoin(options["url"], path), method, token, body)
+
+            # Warm up connections, caches and the worker processes
+            run_load(send, options["concurrency"], min(len(clients), options["requests"]))
+            row = {
+                "endpoint": name,
+                "users": len(clients),
+                **run_load(send, options["concurrency"], options["requests"]),
+            }
+            results.append(row)
+
+            line = (
+                f"{name:<18} {row['throughput']:>8} req/s  p50={row['p50_ms']}ms  "
+                f"p95={row['p95_ms']}ms  p99={row['p99_ms']}ms  "
+                f"queries={row['mean_queries']}  errors={row['errors']}"
+            )
+            previous = baseline.get((name,))
+            if previous:
+                line += (
+                    f"  (baseline {previous['throughput']} req/s, p99={previous['p99_ms']}ms, "
+                    f"queries={previous.get('mean_queries')})"
+                )
+            self.stdout.write(line)
+
+        if options["output"]:
+            write_results(
+                options["output"],
+                results,
+                label=options["label"],
+                url=options["url"],
+                prefix=options["prefix"],
+                concurrency=options["concurrency"],
+            )
+            self.stdout.write(f"Wrote results to {options['output']}.")
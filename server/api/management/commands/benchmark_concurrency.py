@@ -0,0 +1,93 @@
+from functools import partial
+from urllib.parse import urljoin
+
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+
+from ...benchmarks import access_token, load_baseline, run_load, send_request, write_results
+from ...models import User, WorkspaceMember
+
+
+class Command(BaseCommand):
+    """Measure throughput and latency of the hot read endpoints at rising concurrency.
+
+    Run it against each deployment mode (SERVER_MODE=wsgi and SERVER_MODE=asgi
+    with the same GUNICORN_WORKERS), saving each run with --output, then pass
+    one run as --baseline to the other to compare p99 latency level by level.
+    """
+
+    help = "Load test the read endpoints of a running server and report p50/p99 latency."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", default="http://localhost:8000", help="Server base URL.")
+        parser.add_argument("--email", required=True, help="User to authenticate as.")
+        parser.add_argument(
+            "--workspace", type=int, help="Workspace to read; defaults to the user's first."
+        )
+        parser.add_argument(
+            "--concurrency",
+            default="1,4,16,64",
+            help="Comma-separated numbers of concurrent requests to test.",
+        )
+        parser.add_argument(
+            "--requests", type=int, default=200, help="Requests per endpoint and level."
+        )
+        parser.add_argument("--label", default="", help="Name of the setup under test.")
+        parser.add_argument("--output", help="File to write the results to as JSON.")
+        parser.add_argument("--baseline", help="Results file of another run to compare with.")
+
+    def handle(self, *args, **options):
+        try:
+            levels = [int(level) for level in options["concurrency"].split(",")]
+        except ValueError:
+            raise CommandError("--concurrency must be comma-separated integers.")
+        if not levels or min(levels) < 1 or options["requests"] < 1:
+            raise CommandError("--concurrency and --requests must be positive.")
+
+        user = User.objects.filter(email=options["email"]).first()
+        if user is None:
+            raise CommandError("User does not exist.")
+        workspace_id = options["workspace"]
+        if workspace_id is None:
+            workspace_id = (
+                WorkspaceMember.objects.filter(user=user)
+                .order_by("id")
+                .values_list("workspace_id", flat=True)
+                .first()
+            )
+        if workspace_id is None:
+            raise CommandError("User is not a member of any workspace.")
+
+        token = access_token(user)
+        endpoints = {
+            "user": ("GET", reverse("get_user"), None),
+            "workspace_shifts": ("GET", reverse("workspace_shifts", args=[workspace_id]), None),
+            "workspace_members": ("GET", reverse("workspace_members", args=[workspace_id]), None),
+            "shift_filter": ("POST", reverse("shift_filter"), {"workspace_id": workspace_id}),
+        }
+
+        baseline = {}
+        if options["baseline"]:
+            baseline = load_baseline(options["baseline"], "endpoint", "concurrency")
+
+        results = []
+        for name, (method, path, body) in endpoints.items():
+            send = partial(send_request, urljoin(options["url"], path), method, token, body)
+            # Warm up connections, caches and the worker processes
+            run_load(send, max(levels), max(levels))
+            for level in levels:
+                row = {"endpoint": name, **run_load(send, level, options["requests"])}
+                results.append(row)
+
+                line = (
+                    f"{name:<18} c={level:<4} {row['throughput']:>8} req/s  "
+                    f"p50={row['p50_ms']}ms  p99={row['p99_ms']}ms  errors={row['errors']}"
+                )
+                previous = baseline.get((name, level))
+                if previous:
+                    line += f"  (baseline p99={previous['p99_ms']}ms)"
+                self.stdout.write(line)
+
+        if options["output"]:
+            write_results(options["output"], results, label=options["label"], url=options["url"])
+            self.stdout.write(f"Wrote results to {options['output']}.")
@@ -0,0 +1,75 @@
+import copy
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.utils import load_backend
+
+from ...benchmarks import connection_cost
+
+
+class Command(BaseCommand):
+    """Compare the per-request cost of opening, reusing and pooling database connections.
+
+    Each mode is measured on a temporary copy of the default database settings:
+    "fresh" connects on every request (CONN_MAX_AGE=0, the old behaviour),
+    "persistent" reuses one health-checked connection, "pool" checks
+    connections out of a psycopg 3 pool (PostgreSQL with psycopg 3 only) and
+    "configured" uses the settings as deployed. Run it from a worker host so
+    network and TLS handshakes are included.
+    """
+
+    help = "Measure database connection setup cost per request for each connection mode."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations", type=int, default=200, help="Simulated requests per mode."
+        )
+        parser.add_argument("--output", help="File to write the results to as JSON.")
+
+    def handle(self, *args, **options):
+        if options["iterations"] < 1:
+            raise CommandError("--iterations must be positive.")
+
+        base = copy.deepcopy(connections[DEFAULT_DB_ALIAS].settings_dict)
+        base["OPTIONS"].pop("pool", None)
+        modes = {
+            "fresh": {**base, "CONN_MAX_AGE": 0},
+            "persistent": {**base, "CONN_MAX_AGE": 600, "CONN_HEALTH_CHECKS": True},
+            "configured": copy.deepcopy(connections[DEFAULT_DB_ALIAS].settings_dict),
+        }
+        if connections[DEFAULT_DB_ALIAS].vendor == "postgresql":
+            from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+            if is_psycopg3:
+                modes["pool"] = {
+                    **base,
+                    "CONN_MAX_AGE": 0,
+                    "OPTIONS": {**base["OPTIONS"], "pool": {"min_size": 1, "max_size": 2}},
+                }
+
+        results = []
+        for mode, settings_dict in modes.items():
+            db = load_backend(settings_dict["ENGINE"]).DatabaseWrapper(
+                settings_dict, f"benchmark_{mode}"
+            )
+            try:
+                row = {"mode": mode, **connection_cost(db, options["iterations"])}
+            finally:
+                db.close()
+                if getattr(db, "pool", None):
+                    db.close_pool()
+            results.append(row)
+            self.stdout.write(
+                f"{mode:<11} mean={row['mean_ms']}ms  p50={row['p50_ms']}ms  "
+                f"p99={row['p99_ms']}ms  connections={row['connections_opened']}"
+            )
+
+        if options["output"]:
+            with open(options["output"], "w") as file:
+                json.dump(
+                    {"vendor": connections[DEFAULT_DB_ALIAS].vendor, "results": results},
+                    file,
+                    indent=2,
+                )
+            self.stdout.write(f"Wrote results to {options['output']}.")
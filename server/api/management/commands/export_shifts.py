@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...exports import EXPORT_FORMATS, export_rows, stream_csv, stream_xlsx
+from ...models import Workspace
+from ...utils.ranges import parse_range_bound
+
+
+class Command(BaseCommand):
+    """Write a workspace's shifts with hours and cost to a CSV or XLSX file.
+
+    Rows are streamed from a server-side cursor, so memory use stays the same
+    for exports of any size.
+    """
+
+    help = "Export a workspace's shifts, with member names, roles, hours and cost."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workspace", type=int, required=True, help="Workspace to export.")
+        parser.add_argument(
+            "--format", dest="file_format", choices=sorted(EXPORT_FORMATS), default="csv"
+        )
+        parser.add_argument(
+            "--output", help="File to write; CSV is written to standard output without it."
+        )
+        parser.add_argument("--range-start", help="Only shifts ending after this date or time.")
+        parser.add_argument("--range-end", help="Only shifts starting up to this date or time.")
+
+    def handle(self, *args, **options):
+        if not Workspace.objects.filter(pk=options["workspace"]).exists():
+            raise CommandError("Workspace does not exist.")
+        if options["file_format"] == "xlsx" and not options["output"]:
+            raise CommandError("--output is required for xlsx exports.")
+        try:
+            range_start = options["range_start"] and parse_range_bound(options["range_start"])
+            range_end = options["range_end"] and parse_range_bound(options["range_end"], end=True)
+        except ValueError:
+            raise CommandError("Date range value is invalid.")
+
+        rows = export_rows(options["workspace"], range_start or None, range_end or None)
+        stream = stream_csv(rows) if options["file_format"] == "csv" else stream_xlsx(rows)
+        if options["output"]:
+            with open(options["output"], "wb") as file:
+                for chunk in stream:
+                    file.write(chunk)
+            self.stderr.write(f"Wrote {options['output']}.")
+        else:
+            for chunk in stream:
+                self.stdout.write(chunk.decode(), ending="")
@@ -0,0 +1,32 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...scheduling import horizon_end, materialize_all
+
+
+class Command(BaseCommand):
+    """Extend materialized shift template occurrences to the rolling horizon.
+
+    Meant to run daily (e.g. from cron) so Shift rows always cover
+    SHIFT_TEMPLATE_HORIZON_DAYS ahead of the current date.
+    """
+
+    help = "Create Shift rows for shift template occurrences up to the horizon."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--until",
+            help="Last date (YYYY-MM-DD) to materialize; defaults to the rolling horizon.",
+        )
+
+    def handle(self, *args, **options):
+        until = horizon_end()
+        if options["until"]:
+            try:
+                until = date.fromisoformat(options["until"])
+            except ValueError:
+                raise CommandError("--until must be a date in YYYY-MM-DD format.")
+
+        count = materialize_all(until)
+        self.stdout.write(f"Materialized {count} shift(s) through {until.isoformat()}.")
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from ...scheduling import prune_tombstones
+
+
+class Command(BaseCommand):
+    """Delete shift tombstones older than SHIFT_TOMBSTONE_RETENTION."""
+
+    help = "Delete shift tombstones past the retention period. Run daily."
+
+    def handle(self, *args, **options):
+        count = prune_tombstones()
+        self.stdout.write(f"Deleted {count} shift tombstone(s).")
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...scheduling import check_rollup, rebuild_rollup
+
+
+class Command(BaseCommand):
+    """Recompute the LaborRollup table from shifts, or report drift from it."""
+
+    help = "Rebuild the weekly labor rollup from shifts, or check it with --check."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workspace", type=int, help="Only this workspace.")
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Report rows that differ from the shifts without changing anything.",
+        )
+
+    def handle(self, *args, **options):
+        if options["check"]:
+            drift = check_rollup(options["workspace"])
+            for key, stored, expected in drift:
+                self.stdout.write(f"{key}: stored {stored}, expected {expected}")
+            if drift:
+                raise CommandError(f"{len(drift)} rollup row(s) drifted from shifts.")
+            self.stdout.write("Labor rollup matches shifts.")
+            return
+
+        count = rebuild_rollup(options["workspace"])
+        self.stdout.write(f"Rebuilt {count} labor rollup row(s).")
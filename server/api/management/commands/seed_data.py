@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...models import User
+from ...seeding import seed, seed_email
+
+
+class Command(BaseCommand):
+    """Fill the database with synthetic workspaces for load testing.
+
+    Creates --workspaces workspaces, each with --members members holding some
+    of --roles roles and --weeks weeks of shifts around the current week, plus
+    time-off requests and unavailability. Every generated user has the
+    password given by --password; the first member of each workspace owns it.
+    """
+
+    help = "Generate workspaces, members, roles, shifts, time off and unavailability."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workspaces", type=int, default=10, help="Number of workspaces.")
+        parser.add_argument("--members", type=int, default=25, help="Members per workspace.")
+        parser.add_argument("--roles", type=int, default=5, help="Roles per workspace.")
+        parser.add_argument("--weeks", type=int, default=8, help="Weeks of shifts per member.")
+        parser.add_argument(
+            "--prefix", default="seed", help="Prefix of generated emails, unique per run."
+        )
+        parser.add_argument(
+            "--password", default="password", help="Password of every generated user."
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Seed of the random choices.")
+
+    def handle(self, *args, **options):
+        for name in ("workspaces", "members", "roles", "weeks"):
+            if options[name] < 1:
+                raise CommandError(f"--{name} must be positive.")
+        if User.objects.filter(email=seed_email(options["prefix"], 0, 0)).exists():
+            raise CommandError(f"Data with prefix '{options['prefix']}' already exists.")
+
+        result = seed(
+            options["workspaces"],
+            options["members"],
+            options["roles"],
+            options["weeks"],
+            prefix=options["prefix"],
+            password=options["password"],
+            random_seed=options["seed"],
+        )
+        for name, count in result.counts.items():
+            self.stdout.write(f"{name}: {count}")
+        self.stdout.write(f"Log in as e.g. {result.emails[0]}.")
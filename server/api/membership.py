@@ -0,0 +1,197 @@
+"""Resolution of the requesting user's membership and permissions in a workspace."""
+
+from dataclasses import astuple, dataclass
+
+from django.core.cache import caches
+from django.db import transaction
+
+from .models import WorkspaceMember
+
+PERMISSION_FLAGS = (
+    "is_owner",
+    "manage_workspace_members",
+    "manage_workspace_roles",
+    "manage_schedules",
+    "manage_time_off",
+)
+
+
+@dataclass(frozen=True)
+class Membership:
+    """A user's membership in a workspace along with their permission flags.
+
+    Flags are False when the member has no MemberPermissions row.
+    """
+
+    member_id: int
+    workspace_id: int
+    is_owner: bool = False
+    manage_workspace_members: bool = False
+    manage_workspace_roles: bool = False
+    manage_schedules: bool = False
+    manage_time_off: bool = False
+
+
+def load_membership(user_id: int, workspace_id: int):
+    """Load a user's membership and permission flags in a single joined query.
+
+    :param int user_id: Primary key of the user.
+    :param int workspace_id: Primary key of the workspace.
+    :return: The user's membership, or None if they are not a member.
+    :rtype: Membership or None
+    """
+    row = (
+        WorkspaceMember.objects.filter(user_id=user_id, workspace_id=workspace_id)
+        .values_list("id", *(f"memberpermissions__{flag}" for flag in PERMISSION_FLAGS))
+        .first()
+    )
+    if row is None:
+        return None
+
+    member_id, *flags = row
+    return Membership(member_id, int(workspace_id), *(bool(flag) for flag in flags))
+
+
+async def aload_membership(user_id: int, workspace_id: int):
+    """Async version of load_membership.
+
+    :param int user_id: Primary key of the user.
+    :param int workspace_id: Primary key of the workspace.
+    :return: The user's membership, or None if they are not a member.
+    :rtype: Membership or None
+    """
+    row = (
+        await WorkspaceMember.objects.filter(user_id=user_id, workspace_id=workspace_id)
+        .values_list("id", *(f"memberpermissions__{flag}" for flag in PERMISSION_FLAGS))
+        .afirst()
+    )
+    if row is None:
+        return None
+
+    member_id, *flags = row
+    return Membership(member_id, int(workspace_id), *(bool(flag) for flag in flags))
+
+
+def _cache_key(user_id: int, workspace_id: int) -> str:
+    return f"membership:{int(workspace_id)}:{int(user_id)}"
+
+
+def get_membership(user_id: int, workspace_id: int):
+    """Return a user's membership in a workspace, using the permissions cache.
+
+    Entries live in the "permissions" cache alias, including negative entries
+    for non-members, and are dropped by invalidate_membership whenever a
+    membership or its permissions change.
+
+    :param int user_id: Primary key of the user.
+    :param int workspace_id: Primary key of the workspace.
+    :return: The user's membership, or None if they are not a member.
+    :rtype: Membership or None
+    """
+    cache = caches["permissions"]
+    key = _cache_key(user_id, workspace_id)
+    cached = cache.get(key)
+    if cached is not None:
+        return Membership(*cached) if cached else None
+
+    membership = load_membership(user_id, workspace_id)
+    cache.set(key, astuple(membership) if membership else ())
+    return membership
+
+
+async def aget_membership(user_id: int, workspace_id: int):
+    """Async version of get_membership.
+
+    :param int user_id: Primary key of the user.
+    :param int workspace_id: Primary key of the workspace.
+    :return: The user's membership, or None if they are not a member.
+    :rtype: Membership or None
+    """
+    cache = caches["permissions"]
+    key = _cache_key(user_id, workspace_id)
+    cached = await cache.aget(key)
+    if cached is not None:
+        return Membership(*cached) if cached else None
+
+    membership = await aload_membership(user_id, workspace_id)
+    await cache.aset(key, astuple(membership) if membership else ())
+    return membership
+
+
+def invalidate_membership(user_id: int, workspace_id: int):
+    """Drop a cached membership now and again once the current transaction commits.
+
+    The second delete stops a concurrent request from re-caching the old row
+    between this write and its commit.
+
+    :param int user_id: Primary key of the user.
+    :param int workspace_id: Primary key of the workspace.
+    """
+    cache = caches["permissions"]
+    key = _cache_key(user_id, workspace_id)
+    cache.delete(key)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+def resolve_membership(request, workspace_id: int):
+    """Return the requesting user's membership in a workspace, memoized per request.
+
+    :param request: Authenticated HTTP request.
+    :type request: rest_framework.request.Request
+    :param int workspace_id: Primary key of the workspace.
+    :return: The user's membership, or None if they are not a member.
+    :rtype: Membership or None
+    """
+    cache = getattr(request, "_memberships", None)
+    if cache is None:
+        cache = request._memberships = {}
+
+    workspace_id = int(workspace_id)
+    if workspace_id not in cache:
+        cache[workspace_id] = get_membership(request.user.id, workspace_id)
+    return cache[workspace_id]
+
+
+async def aresolve_membership(request, workspace_id: int):
+    """Async version of resolve_membership, sharing its per-request memo.
+
+    :param request: Authenticated HTTP request.
+    :type request: rest_framework.request.Request
+    :param int workspace_id: Primary key of the workspace.
+    :return: The user's membership, or None if they are not a member.
+    :rtype: Membership or None
+    """
+    cache = getattr(request, "_memberships", None)
+    if cache is None:
+        cache = request._memberships = {}
+
+    workspace_id = int(workspace_id)
+    if workspace_id not in cache:
+        cache[workspace_id] = await aget_membership(request.user.id, workspace_id)
+    return cache[workspace_id]
+
+
+class MembershipMixin:
+    """View mixin giving handlers access to the requesting user's workspace membership."""
+
+    def get_membership(self, request, workspace_id: int):
+        """Return the requesting user's membership in a workspace.
+
+        :param request: Authenticated HTTP request.
+        :type request: rest_framework.request.Request
+        :param int workspace_id: Primary key of the workspace.
+        :return: The user's membership, or None if they are not a member.
+        :rtype: Membership or None
+        """
+        return resolve_membership(request, workspace_id)
+
+    async def aget_membership(self, request, workspace_id: int):
+        """Async version of get_membership, for async handlers.
+
+        :param request: Authenticated HTTP request.
+        :type request: rest_framework.request.Request
+        :param int workspace_id: Primary key of the workspace.
+        :return: The user's membership, or None if they are not a member.
+        :rtype: Membership or None
+        """
+        return await aresolve_membership(request, workspace_id)
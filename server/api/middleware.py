@@ -0,0 +1,196 @@
+"""Request middleware for database routing, request instrumentation and static files.
+
+Each middleware here runs natively under both WSGI and ASGI. Django adapts
+sync-only middleware and hooks in an async chain by running them on the one
+thread shared by thread-sensitive sync_to_async calls, which would serialize
+every request an ASGI worker serves.
+"""
+
+import logging
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from .instrumentation import (
+    begin_request_metrics,
+    current_metrics,
+    end_request_metrics,
+    format_query_split,
+    format_server_timing,
+    record,
+)
+from .routers import begin_request, end_request, pin_user
+
+logger = logging.getLogger("api.requests")
+
+
+class RequestMetricsMiddleware:
+    """Measure each request's queries, database, serialization and render time and size.
+
+    Metrics are tagged with the request's URL name, aggregated per process
+    (see api.instrumentation.request_stats) and logged to "api.requests" at
+    INFO. With REQUEST_METRICS_SERVER_TIMING enabled responses carry them as a
+    Server-Timing header, and with DATABASE_QUERY_SPLIT_HEADER enabled an
+    X-Query-Split header counts the queries per database alias. Place it first
+    so the total covers the other middleware too.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+            self.process_template_response = self.aprocess_template_response
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics, token = begin_request_metrics()
+        try:
+            response = self.get_response(request)
+        finally:
+            end_request_metrics(token)
+        return self.report(request, response, metrics)
+
+    async def __acall__(self, request):
+        metrics, token = begin_request_metrics()
+        try:
+            response = await self.get_response(request)
+        finally:
+            end_request_metrics(token)
+        return self.report(request, response, metrics)
+
+    def report(self, request, response, metrics):
+        """Record and log a finished request's metrics, adding any headers."""
+        metrics.finish(response)
+        match = getattr(request, "resolver_match", None)
+        metrics.url_name = match.url_name if match else None
+        # Test clients expose it to query budget assertions
+        response.metrics = metrics
+        record(metrics)
+
+        if settings.REQUEST_METRICS_SERVER_TIMING:
+            response["Server-Timing"] = format_server_timing(metrics)
+        if settings.DATABASE_QUERY_SPLIT_HEADER:
+            response["X-Query-Split"] = format_query_split(metrics.queries)
+        logger.info(
+            "%s %s %s queries=%d db=%.1fms serialize=%.1fms render=%.1fms total=%.1fms bytes=%d",
+            request.method,
+            metrics.url_name or request.path,
+            response.status_code,
+            metrics.query_count,
+            metrics.db_time * 1000,
+            metrics.serialize_time * 1000,
+            metrics.render_time * 1000,
+            metrics.total_time * 1000,
+            metrics.size,
+        )
+        return response
+
+    def process_template_response(self, request, response):
+        metrics = current_metrics()
+        if metrics is not None:
+            metrics.view_returned()
+        return response
+
+    async def aprocess_template_response(self, request, response):
+        return RequestMetricsMiddleware.process_template_response(self, request, response)
+
+
+class ReplicaRoutingMiddleware:
+    """Route a request's reads to a replica when it cannot write.
+
+    Requests with safe methods, and views that set read_only = True for
+    handlers that only read (such as ShiftFilterView.post), read from a
+    replica. When a request writes, its user is pinned to the primary for
+    DATABASE_REPLICA_STICKY so their next requests see their own writes.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+            self.process_view = self.aprocess_view
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        routing, token = begin_request(request)
+        request.replica_routing = routing
+        try:
+            response = self.get_response(request)
+        finally:
+            end_request(token)
+
+        if routing.wrote:
+            self.pin_writer(request)
+        return response
+
+    async def __acall__(self, request):
+        routing, token = begin_request(request)
+        request.replica_routing = routing
+        try:
+            response = await self.get_response(request)
+        finally:
+            end_request(token)
+
+        if routing.wrote:
+            # A session user is loaded lazily, with a query
+            await sync_to_async(self.pin_writer)(request)
+        return response
+
+    @staticmethod
+    def pin_writer(request):
+        """Pin the user of a request that wrote to the primary."""
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            pin_user(user.id)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, "view_class", None)
+        if getattr(view_class, "read_only", False):
+            request.replica_routing.read_only = True
+        return None
+
+    async def aprocess_view(self, request, view_func, view_args, view_kwargs):
+        return ReplicaRoutingMiddleware.process_view(
+            self, request, view_func, view_args, view_kwargs
+        )
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """WhiteNoise, serving static files without blocking an ASGI worker.
+
+    WhiteNoiseMiddleware is sync-only. Under ASGI this finds and opens files
+    in the thread pool instead, and other requests pass straight through.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, settings=settings):
+        super().__init__(get_response, settings)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file, thread_sensitive=False)(
+                request.path_info
+            )
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve, thread_sensitive=False)(static_file, request)
+        return await self.get_response(request)
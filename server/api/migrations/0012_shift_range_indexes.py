@@ -0,0 +1,23 @@
+# Generated by Django 5.1.3 on 2026-10-18 21:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0011_alter_memberrole_member"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="shift",
+            index=models.Index(
+                fields=["workspace", "start_time"], name="shift_workspace_start_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="shift",
+            index=models.Index(fields=["member", "start_time"], name="shift_member_start_idx"),
+        ),
+    ]
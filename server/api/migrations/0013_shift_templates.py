@@ -0,0 +1,95 @@
+# Generated by Django 5.1.3 on 2026-10-18 21:12
+
+import django.core.validators
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0012_shift_range_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ShiftTemplate",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("date_created", models.DateTimeField(auto_now_add=True)),
+                ("date_modified", models.DateTimeField(auto_now=True)),
+                (
+                    "day_of_week",
+                    models.IntegerField(
+                        validators=[
+                            django.core.validators.MinValueValidator(0),
+                            django.core.validators.MaxValueValidator(6),
+                        ]
+                    ),
+                ),
+                ("start_time", models.TimeField()),
+                ("duration", models.DurationField()),
+                ("start_date", models.DateField()),
+                ("end_date", models.DateField(blank=True, null=True)),
+                ("materialized_until", models.DateField(blank=True, null=True)),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="created_shift_templates",
+                        to="api.workspacemember",
+                    ),
+                ),
+                (
+                    "member",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="api.workspacemember",
+                    ),
+                ),
+                (
+                    "role",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="api.workspacerole"
+                    ),
+                ),
+                (
+                    "workspace",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="api.workspace"
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name="shift",
+            name="template",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="shifts",
+                to="api.shifttemplate",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="shift",
+            constraint=models.UniqueConstraint(
+                fields=("template", "start_time"), name="shift_template_occurrence_unique"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="shifttemplate",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("day_of_week__gte", 0), ("day_of_week__lte", 6)),
+                name="template_day_of_week_valid",
+            ),
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.1.3 on 2026-10-18 21:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0013_shift_templates"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LaborRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("week_start", models.DateField()),
+                ("seconds", models.BigIntegerField(default=0)),
+                ("cost", models.DecimalField(decimal_places=4, default=0, max_digits=14)),
+                (
+                    "member",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="api.workspacemember",
+                    ),
+                ),
+                (
+                    "role",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="api.workspacerole"
+                    ),
+                ),
+                (
+                    "workspace",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="api.workspace"
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["workspace", "week_start"], name="labor_rollup_week_idx")
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("workspace", "member", "role", "week_start"),
+                        name="labor_rollup_key_unique",
+                        nulls_distinct=False,
+                    )
+                ],
+            },
+        ),
+    ]
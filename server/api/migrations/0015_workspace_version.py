@@ -0,0 +1,18 @@
+# Generated by Django 5.1.3 on 2026-10-18 21:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0014_labor_rollup"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="workspace",
+            name="version",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.1.3 on 2026-10-18 21:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0015_workspace_version"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ShiftTombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("date_deleted", models.DateTimeField(auto_now_add=True)),
+                ("shift_id", models.BigIntegerField()),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="shift",
+            index=models.Index(fields=["workspace", "date_modified"], name="shift_modified_idx"),
+        ),
+        migrations.AddField(
+            model_name="shifttombstone",
+            name="workspace",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="shift_tombstones",
+                to="api.workspace",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="shifttombstone",
+            index=models.Index(fields=["workspace", "date_deleted"], name="tombstone_deleted_idx"),
+        ),
+    ]
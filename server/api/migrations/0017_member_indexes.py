@@ -0,0 +1,128 @@
+# Generated by Django 5.1.3 on 2026-10-18 21:55
+
+from collections import defaultdict
+from datetime import timedelta
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+from django.utils import timezone
+
+
+def merge_duplicate_members(apps, schema_editor):
+    """Merge repeated memberships of a user in a workspace into the oldest.
+
+    Rows referencing a duplicate are moved to the kept member, except a
+    one-to-one row (its permissions) when the kept member has its own. The
+    kept members' labor rollup rows are rebuilt from their merged shifts.
+    """
+    WorkspaceMember = apps.get_model("api", "WorkspaceMember")
+    Shift = apps.get_model("api", "Shift")
+    LaborRollup = apps.get_model("api", "LaborRollup")
+
+    merged = {}
+    repeated = (
+        WorkspaceMember.objects.values("user", "workspace")
+        .annotate(keep=Min("id"), count=Count("id"))
+        .filter(count__gt=1)
+    )
+    for row in repeated:
+        duplicates = WorkspaceMember.objects.filter(
+            user=row["user"], workspace=row["workspace"]
+        ).exclude(pk=row["keep"])
+        for duplicate in duplicates.values_list("pk", flat=True):
+            merged[duplicate] = row["keep"]
+    if not merged:
+        return
+
+    for relation in WorkspaceMember._meta.related_objects:
+        if relation.many_to_many or relation.related_model is LaborRollup:
+            continue
+        model, field = relation.related_model, relation.field.name
+        for duplicate, keep in merged.items():
+            if relation.one_to_one and model.objects.filter(**{field: keep}).exists():
+                continue
+            model.objects.filter(**{field: duplicate}).update(**{field: keep})
+
+    kept = set(merged.values())
+    LaborRollup.objects.filter(member__in=kept | set(merged)).delete()
+    # The rollup rows as of this migration: per workspace, member, role and
+    # local week, the summed seconds and costs at four places, rounded half
+    # up, with the member's pay rate or else the role's.
+    totals = defaultdict(lambda: [0, Decimal(0)])
+    shifts = Shift.objects.filter(member__in=kept).values_list(
+        "workspace_id",
+        "member_id",
+        "role_id",
+        "start_time",
+        "end_time",
+        "member__pay_rate",
+        "role__pay_rate",
+    )
+    for workspace_id, member_id, role_id, start_time, end_time, member_rate, role_rate in shifts:
+        seconds = int((end_time - start_time).total_seconds())
+        rate = member_rate if member_rate is not None else role_rate
+        day = timezone.localtime(start_time).date()
+        key = (workspace_id, member_id, role_id, day - timedelta(days=day.weekday()))
+        totals[key][0] += seconds
+        if rate is not None:
+            cost = Decimal(seconds) * rate / 3600
+            totals[key][1] += cost.quantize(Decimal("0.0001"), ROUND_HALF_UP)
+    LaborRollup.objects.bulk_create(
+        LaborRollup(
+            workspace_id=workspace_id,
+            member_id=member_id,
+            role_id=role_id,
+            week_start=week_start,
+            seconds=seconds,
+            cost=cost,
+        )
+        for (workspace_id, member_id, role_id, week_start), (seconds, cost) in totals.items()
+    )
+    WorkspaceMember.objects.filter(pk__in=merged).delete()
+    # Runs the deferred foreign key checks, which would otherwise keep
+    # Postgres from altering these tables later in the migration
+    schema_editor.connection.check_constraints()
+
+
+def delete_duplicate_member_roles(apps, schema_editor):
+    """Keep the oldest of any repeated member role assignments."""
+    MemberRole = apps.get_model("api", "MemberRole")
+    keep = (
+        MemberRole.objects.values("member", "workspace_role")
+        .annotate(keep=Min("id"))
+        .values("keep")
+    )
+    MemberRole.objects.exclude(id__in=keep).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0016_shift_tombstones"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="shift",
+            index=models.Index(
+                condition=models.Q(("open", True)),
+                fields=["workspace", "start_time"],
+                name="shift_open_start_idx",
+            ),
+        ),
+        migrations.RunPython(merge_duplicate_members, migrations.RunPython.noop),
+        migrations.RunPython(delete_duplicate_member_roles, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="memberrole",
+            constraint=models.UniqueConstraint(
+                fields=("member", "workspace_role"), name="member_role_unique"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="workspacemember",
+            constraint=models.UniqueConstraint(
+                fields=("user", "workspace"), name="member_user_workspace_unique"
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.1.3 on 2026-10-18 22:20
+
+from django.conf import settings
+from django.db import migrations
+from django.db.models import F
+
+
+def long_shifts(Shift):
+    """Return the shifts longer than SHIFT_MAX_DURATION."""
+    return Shift.objects.filter(end_time__gt=F("start_time") + settings.SHIFT_MAX_DURATION)
+
+
+def check_shift_durations(apps, schema_editor):
+    """Stop if any shift is longer than range queries assume.
+
+    Range filters bound start_time by SHIFT_MAX_DURATION, so longer shifts
+    would silently drop out of them. They must be split or shortened first.
+    """
+    Shift = apps.get_model("api", "Shift")
+    ids = list(long_shifts(Shift).order_by("id").values_list("id", flat=True)[:20])
+    if ids:
+        raise RuntimeError(
+            f"{long_shifts(Shift).count()} shifts are longer than SHIFT_MAX_DURATION "
+            f"({settings.SHIFT_MAX_DURATION}), including ids {ids}. Split or shorten them, "
+            "or raise SHIFT_MAX_DURATION, before migrating."
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0017_member_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_shift_durations, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.3 on 2026-10-18 22:17
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0018_check_shift_durations"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="shifttemplate",
+            name="timezone",
+            field=models.CharField(
+                default=django.utils.timezone.get_default_timezone_name, max_length=64
+            ),
+        ),
+    ]
@@ -8,4 +8,12 @@ from .users import (
 )
 from .messages import Message, MessageRecipient, Announcement
 from .roles import WorkspaceRole, MemberRole, MemberPermissions
-from .schedules import Shift, ShiftRequest, TimeOffRequest, Unavailability
+from .schedules import (
+    Shift,
+    ShiftTemplate,
+    ShiftTombstone,
+    ShiftRequest,
+    TimeOffRequest,
+    Unavailability,
+    LaborRollup,
+)
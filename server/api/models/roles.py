@@ -22,6 +22,13 @@ class MemberRole(models.Model):
         WorkspaceMember, on_delete=models.CASCADE, related_name="member_roles"
     )
 
+    class Meta:
+        """Meta options for MemberRole."""
+
+        constraints = [
+            models.UniqueConstraint(fields=["member", "workspace_role"], name="member_role_unique")
+        ]
+
 
 class MemberPermissions(models.Model):
     """Permission flags controlling what actions a WorkspaceMember can perform."""
@@ -1,9 +1,47 @@
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.utils.timezone import get_default_timezone_name
 from .users import WorkspaceMember, Workspace
 from .roles import WorkspaceRole
 
 
+class ShiftTemplate(models.Model):
+    """A weekly recurring shift, expanded into Shift rows over a rolling horizon.
+
+    Occurrences start at start_time on day_of_week (0 is Monday) of every week
+    between start_date and end_date, as wall-clock time in the template's IANA
+    timezone, so they keep their local time across daylight saving changes.
+    Shift rows exist for dates up to materialized_until; later occurrences are
+    computed on read.
+    """
+
+    date_created = models.DateTimeField(auto_now_add=True)
+    date_modified = models.DateTimeField(auto_now=True)
+    workspace = models.ForeignKey(Workspace, on_delete=models.CASCADE)
+    role = models.ForeignKey(WorkspaceRole, on_delete=models.CASCADE)
+    member = models.ForeignKey(WorkspaceMember, null=True, blank=True, on_delete=models.CASCADE)
+    created_by = models.ForeignKey(
+        WorkspaceMember, on_delete=models.CASCADE, related_name="created_shift_templates"
+    )
+    day_of_week = models.IntegerField(validators=[MinValueValidator(0), MaxValueValidator(6)])
+    start_time = models.TimeField()
+    duration = models.DurationField()
+    start_date = models.DateField()
+    end_date = models.DateField(null=True, blank=True)
+    materialized_until = models.DateField(null=True, blank=True)
+    timezone = models.CharField(max_length=64, default=get_default_timezone_name)
+
+    class Meta:
+        """Meta options for ShiftTemplate."""
+
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(day_of_week__gte=0) & models.Q(day_of_week__lte=6),
+                name="template_day_of_week_valid",
+            )
+        ]
+
+
 class Shift(models.Model):
     """A scheduled shift within a workspace, optionally assigned to a member."""
 
@@ -18,6 +56,52 @@ class Shift(models.Model):
         WorkspaceMember, on_delete=models.CASCADE, related_name="created_shifts"
     )
     open = models.BooleanField(default=False)
+    template = models.ForeignKey(
+        ShiftTemplate,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="shifts",
+    )
+
+    class Meta:
+        """Meta options for Shift."""
+
+        indexes = [
+            models.Index(fields=["workspace", "start_time"], name="shift_workspace_start_idx"),
+            models.Index(fields=["member", "start_time"], name="shift_member_start_idx"),
+            # Serves the changes feed: shifts modified after a cursor
+            models.Index(fields=["workspace", "date_modified"], name="shift_modified_idx"),
+            # Serves autofill and open-shift filters, which only want unassigned shifts
+            models.Index(
+                fields=["workspace", "start_time"],
+                condition=models.Q(open=True),
+                name="shift_open_start_idx",
+            ),
+        ]
+        constraints = [
+            # Makes materialization idempotent: one row per template occurrence
+            models.UniqueConstraint(
+                fields=["template", "start_time"], name="shift_template_occurrence_unique"
+            )
+        ]
+
+
+class ShiftTombstone(models.Model):
+    """Record of a deleted shift, so the changes feed can report deletions."""
+
+    date_deleted = models.DateTimeField(auto_now_add=True)
+    workspace = models.ForeignKey(
+        Workspace, on_delete=models.CASCADE, related_name="shift_tombstones"
+    )
+    shift_id = models.BigIntegerField()
+
+    class Meta:
+        """Meta options for ShiftTombstone."""
+
+        indexes = [
+            models.Index(fields=["workspace", "date_deleted"], name="tombstone_deleted_idx"),
+        ]
 
 
 class ShiftRequest(models.Model):
@@ -78,3 +162,33 @@ class Unavailability(models.Model):
                 name="day_of_week_valid",
             )
         ]
+
+
+class LaborRollup(models.Model):
+    """Scheduled seconds and labor cost per workspace, member, role and week.
+
+    Maintained incrementally from Shift writes (see api.scheduling.rollup);
+    week_start is the Monday of the week a shift starts in and member is
+    null for open shifts.
+    """
+
+    workspace = models.ForeignKey(Workspace, on_delete=models.CASCADE)
+    member = models.ForeignKey(WorkspaceMember, null=True, blank=True, on_delete=models.CASCADE)
+    role = models.ForeignKey(WorkspaceRole, on_delete=models.CASCADE)
+    week_start = models.DateField()
+    seconds = models.BigIntegerField(default=0)
+    cost = models.DecimalField(max_digits=14, decimal_places=4, default=0)
+
+    class Meta:
+        """Meta options for LaborRollup."""
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["workspace", "member", "role", "week_start"],
+                name="labor_rollup_key_unique",
+                nulls_distinct=False,
+            )
+        ]
+        indexes = [
+            models.Index(fields=["workspace", "week_start"], name="labor_rollup_week_idx"),
+        ]
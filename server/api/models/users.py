@@ -65,6 +65,8 @@ class Workspace(models.Model):
     )
     owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name="owned_workspaces")
     name = models.CharField(max_length=30, default="Unnamed Workspace")
+    # Bumped on every write to the workspace's shifts, members or roles
+    version = models.PositiveBigIntegerField(default=0)
 
 
 class WorkspaceMember(models.Model):
@@ -77,6 +79,16 @@ class WorkspaceMember(models.Model):
     added_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name="added_members")
     pay_rate = models.DecimalField(max_digits=10, decimal_places=2, null=True)
 
+    class Meta:
+        """Meta options for WorkspaceMember."""
+
+        constraints = [
+            # Also serves membership lookups by (user, workspace) and a user's workspaces
+            models.UniqueConstraint(
+                fields=["user", "workspace"], name="member_user_workspace_unique"
+            )
+        ]
+
 
 class Group(models.Model):
     """A messaging group that can contain multiple users."""
@@ -0,0 +1,52 @@
+"""Response renderers."""
+
+import json
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+SHORT_SEPARATORS = (",", ":")
+LONG_SEPARATORS = (", ", ": ")
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer that encodes plain JSON data without DRF's encoder class.
+
+    Output is byte-for-byte what JSONRenderer produces. Data containing
+    types only DRF's encoder understands (dates, Decimals, lazy strings...)
+    and indented output fall back to JSONRenderer.
+    """
+
+    encoder = json.JSONEncoder(
+        ensure_ascii=not api_settings.UNICODE_JSON,
+        allow_nan=not api_settings.STRICT_JSON,
+        separators=SHORT_SEPARATORS if api_settings.COMPACT_JSON else LONG_SEPARATORS,
+    )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render data into JSON bytes.
+
+        :param data: Response data.
+        :param str accepted_media_type: Negotiated media type, possibly with an indent parameter.
+        :param dict renderer_context: View, request and response of the render.
+        :return: Encoded JSON.
+        :rtype: bytes
+        """
+        if data is None:
+            return b""
+        if (
+            self.encoder_class is not JSONEncoder
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = self.encoder.encode(data)
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Escaped like JSONRenderer so output stays a strict JavaScript subset
+        if "\u2028" in ret or "\u2029" in ret:
+            ret = ret.replace("\u2028", "\\u2028").replace("\u2029", "\\u2029")
+        return ret.encode()
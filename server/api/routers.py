@@ -0,0 +1,122 @@
+"""Database routing of read-only requests to replicas, with read-your-writes stickiness."""
+
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, connections
+from rest_framework.permissions import SAFE_METHODS
+
+_routing = ContextVar("replica_routing", default=None)
+
+
+class RequestRouting:
+    """Replica routing state of the request being served.
+
+    A request may read from a replica when its method is safe (or its view
+    declares read_only = True), it has made no writes yet and its user has not
+    written within DATABASE_REPLICA_STICKY. Once a replica is chosen the whole
+    request reads from it, so it sees one consistent snapshot.
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self.read_only = request.method in SAFE_METHODS
+        self.wrote = False
+        self.replica = None
+        self._pinned = None
+
+    def pinned(self) -> bool:
+        """Return whether the requesting user wrote recently, checking once per request."""
+        if self._pinned is None:
+            user = getattr(self.request, "user", None)
+            if user is None or not user.is_authenticated:
+                # Authentication has not run yet, or the request is anonymous
+                return False
+            self._pinned = is_pinned(user.id)
+        return self._pinned
+
+    def read_alias(self):
+        """Return the replica this request should read from, or None for the primary."""
+        replicas = settings.DATABASE_REPLICAS
+        if not replicas or not self.read_only or self.wrote:
+            return None
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            # Reads inside a transaction must see its writes
+            return None
+        if self.pinned():
+            return None
+        if self.replica is None:
+            self.replica = random.choice(replicas)
+        return self.replica
+
+
+def begin_request(request):
+    """Start tracking replica routing for a request.
+
+    :param request: Incoming Django request.
+    :type request: django.http.HttpRequest
+    :return: The request's routing state and a token for end_request.
+    :rtype: tuple
+    """
+    routing = RequestRouting(request)
+    return routing, _routing.set(routing)
+
+
+def end_request(token):
+    """Stop tracking the request started with the given token."""
+    _routing.reset(token)
+
+
+def _pin_key(user_id: int) -> str:
+    return f"replica-pin:{int(user_id)}"
+
+
+def pin_user(user_id: int):
+    """Send a user's reads to the primary for DATABASE_REPLICA_STICKY.
+
+    :param int user_id: Primary key of the user who wrote.
+    """
+    caches["replica_pins"].set(
+        _pin_key(user_id), True, settings.DATABASE_REPLICA_STICKY.total_seconds()
+    )
+
+
+def is_pinned(user_id: int) -> bool:
+    """Return whether a user's reads currently go to the primary.
+
+    :param int user_id: Primary key of the user.
+    :rtype: bool
+    """
+    return bool(caches["replica_pins"].get(_pin_key(user_id)))
+
+
+class ReplicaRouter:
+    """Router sending reads of read-only requests to DATABASE_REPLICAS.
+
+    Writes, reads outside a request (commands, signals run by them) and reads
+    of requests that may write always use the default database. Replicas are
+    read-only copies of it, so migrations never run against them.
+    """
+
+    def db_for_read(self, model, **hints):
+        routing = _routing.get()
+        if routing is None:
+            return None
+        return routing.read_alias()
+
+    def db_for_write(self, model, **hints):
+        routing = _routing.get()
+        if routing is not None:
+            routing.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Every alias holds the same data
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
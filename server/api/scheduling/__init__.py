@@ -0,0 +1,28 @@
+from .rollup import (
+    add_shifts,
+    apply_rows,
+    check_rollup,
+    rebuild_rollup,
+    rollup_summary,
+    shift_rows,
+    week_start,
+)
+from .recurrence import (
+    occurrence_dates,
+    build_shift,
+    horizon_end,
+    materialize,
+    materialize_all,
+    expand,
+)
+from .conflicts import Conflict, ConflictIndex, find_conflicts
+from .solver import AutofillResult, autofill, apply_autofill
+from .labor import LABOR_GROUPS, labor_summary
+from .changes import (
+    Changes,
+    CursorExpired,
+    encode_change_cursor,
+    decode_change_cursor,
+    shift_changes,
+    prune_tombstones,
+)
@@ -0,0 +1,154 @@
+"""Incremental feed of shifts created, modified or deleted since a cursor."""
+
+import base64
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from ..models import Shift, ShiftTombstone
+from ..serializers import SHIFT_VALUES
+
+# Position of each stream in the (timestamp, kind, id) order of the feed
+SHIFT = 0
+TOMBSTONE = 1
+
+
+class CursorExpired(Exception):
+    """Raised when a cursor predates the tombstones still retained."""
+
+
+@dataclass
+class Changes:
+    """One page of the changes feed.
+
+    shifts are shift_values() rows of created or modified shifts, deleted the
+    ids of deleted shifts, in the order they changed.
+    """
+
+    shifts: list = field(default_factory=list)
+    deleted: list = field(default_factory=list)
+    cursor: str = None
+    has_more: bool = False
+
+
+def encode_change_cursor(timestamp, kind: int, pk: int) -> str:
+    """Encode the position of a change in the feed into an opaque cursor.
+
+    :param datetime timestamp: When the change happened.
+    :param int kind: SHIFT or TOMBSTONE.
+    :param int pk: Primary key of the shift or tombstone.
+    :return: URL-safe cursor string.
+    :rtype: str
+    """
+    raw = f"{timestamp.isoformat()}|{kind}|{pk}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_change_cursor(cursor: str) -> tuple:
+    """Decode a cursor produced by encode_change_cursor.
+
+    :param str cursor: Cursor from a previous page of the feed.
+    :return: The (timestamp, kind, pk) position the next page starts after.
+    :rtype: tuple
+    :raises ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        timestamp, kind, pk = base64.urlsafe_b64decode(padded.encode()).decode().split("|")
+        timestamp = parse_datetime(timestamp)
+        kind = int(kind)
+        pk = int(pk)
+    except Exception as exc:
+        raise ValueError("Invalid cursor.") from exc
+    if timestamp is None or kind not in (SHIFT, TOMBSTONE):
+        raise ValueError("Invalid cursor.")
+    return timestamp, kind, pk
+
+
+def _after(column: str, kind: int, position) -> Q:
+    """Return a filter for rows of one stream ordered after a feed position."""
+    timestamp, cursor_kind, pk = position
+    if kind > cursor_kind:
+        return Q(**{f"{column}__gte": timestamp})
+    if kind < cursor_kind:
+        return Q(**{f"{column}__gt": timestamp})
+    return Q(**{f"{column}__gt": timestamp}) | Q(**{column: timestamp, "id__gt": pk})
+
+
+def shift_changes(workspace_id: int, cursor: str = None, page_size: int = None) -> Changes:
+    """Return the shifts of a workspace that changed after a cursor.
+
+    Shifts and tombstones are merged into one stream ordered by (timestamp,
+    kind, id), read from the (workspace, date_modified) and (workspace,
+    date_deleted) indexes. Without a cursor every shift is returned and no
+    tombstones, as an empty replica has nothing to delete. Changes newer than
+    SHIFT_CHANGES_SETTLE are held back until the next call.
+
+    :param int workspace_id: Primary key of the workspace.
+    :param str cursor: Cursor from the previous call, or None for a full sync.
+    :param int page_size: Maximum number of changes to return.
+    :return: The page of changes and the cursor to continue from.
+    :rtype: Changes
+    :raises ValueError: If the cursor is malformed.
+    :raises CursorExpired: If tombstones after the cursor may have been pruned.
+    """
+    page_size = page_size or settings.SHIFT_PAGE_SIZE
+    now = timezone.now()
+    until = now - settings.SHIFT_CHANGES_SETTLE
+
+    shifts = Shift.objects.filter(workspace_id=workspace_id, date_modified__lte=until)
+    tombstones = ShiftTombstone.objects.filter(workspace_id=workspace_id, date_deleted__lte=until)
+    if cursor:
+        position = decode_change_cursor(cursor)
+        if position[0] < now - settings.SHIFT_TOMBSTONE_RETENTION:
+            raise CursorExpired()
+        shifts = shifts.filter(_after("date_modified", SHIFT, position))
+        tombstones = tombstones.filter(_after("date_deleted", TOMBSTONE, position))
+    else:
+        tombstones = tombstones.none()
+
+    shift_rows = shifts.order_by("date_modified", "id").values(*SHIFT_VALUES, "date_modified")
+    tombstone_rows = tombstones.order_by("date_deleted", "id").values(
+        "id", "shift_id", "date_deleted"
+    )
+    merged = sorted(
+        [((row["date_modified"], SHIFT, row["id"]), row) for row in shift_rows[: page_size + 1]]
+        + [
+            ((row["date_deleted"], TOMBSTONE, row["id"]), row)
+            for row in tombstone_rows[: page_size + 1]
+        ],
+        key=lambda item: item[0],
+    )
+
+    changes = Changes(has_more=len(merged) > page_size)
+    merged = merged[:page_size]
+    for (_, kind, _), row in merged:
+        if kind == SHIFT:
+            changes.shifts.append(row)
+        else:
+            changes.deleted.append(row["shift_id"])
+
+    if merged:
+        changes.cursor = encode_change_cursor(*merged[-1][0])
+    else:
+        # Nothing changed up to until, so an idle replica's cursor keeps moving
+        # and does not expire
+        changes.cursor = encode_change_cursor(until, TOMBSTONE, 0)
+    return changes
+
+
+def prune_tombstones(before=None) -> int:
+    """Delete tombstones older than the retention period.
+
+    :param datetime before: Delete tombstones older than this; defaults to
+        SHIFT_TOMBSTONE_RETENTION ago.
+    :return: Number of tombstones deleted.
+    :rtype: int
+    """
+    if before is None:
+        before = timezone.now() - settings.SHIFT_TOMBSTONE_RETENTION
+    deleted, _ = ShiftTombstone.objects.filter(date_deleted__lt=before).delete()
+    return deleted
@@ -0,0 +1,233 @@
+"""Detection of scheduling conflicts for shift assignments."""
+
+from bisect import bisect_left, insort
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from ..models import Shift, TimeOffRequest, Unavailability
+from ..utils import overlapping
+
+DAY = timedelta(days=1)
+
+
+@dataclass(frozen=True)
+class Conflict:
+    """A reason a member cannot work a proposed shift.
+
+    kind is "shift" (double booking), "unavailability" or "time_off"; id is
+    the primary key of the conflicting row, or None for a shift proposed in
+    the same batch.
+    """
+
+    kind: str
+    id: int = None
+
+
+class MemberSchedule:
+    """One member's busy intervals, kept sorted so lookups are binary searches.
+
+    Shifts are keyed on start time; since none is longer than
+    SHIFT_MAX_DURATION, only the shifts starting within that distance before
+    a proposed start can overlap it.
+    """
+
+    def __init__(self):
+        self.shifts = []
+        self.time_off = []
+        self.unavailability = defaultdict(list)
+
+    def add_shift(self, start: datetime, end: datetime, shift_id: int = None):
+        """Record a shift the member is assigned to; unsaved shifts have no id."""
+        insort(self.shifts, (start, end, shift_id or 0))
+
+    def add_time_off(self, start: datetime, end: datetime, request_id: int):
+        """Record an approved time off interval."""
+        insort(self.time_off, (start, end, request_id))
+
+    def add_unavailability(self, day_of_week: int, start: time, end: time, unavailability_id):
+        """Record a weekly window; an end at or before the start wraps past midnight."""
+        self.unavailability[day_of_week].append((start, end, unavailability_id))
+
+    def conflicts(self, start: datetime, end: datetime):
+        """Return everything overlapping [start, end).
+
+        :param datetime start: Proposed shift start.
+        :param datetime end: Proposed shift end.
+        :return: Conflicts in the order shifts, time off, unavailability.
+        :rtype: list[Conflict]
+        """
+        found = []
+
+        lo = bisect_left(self.shifts, (start - settings.SHIFT_MAX_DURATION,))
+        hi = bisect_left(self.shifts, (end,))
+        for shift_start, shift_end, shift_id in self.shifts[lo:hi]:
+            if shift_end > start:
+                found.append(Conflict("shift", shift_id or None))
+
+        hi = bisect_left(self.time_off, (end,))
+        for off_start, off_end, request_id in self.time_off[:hi]:
+            if off_end > start:
+                found.append(Conflict("time_off", request_id))
+
+        found.extend(self._unavailable(start, end))
+        return found
+
+    def blocked(self, start: datetime, end: datetime):
+        """Yield every busy interval of the member that overlaps [start, end).
+
+        Weekly unavailability is expanded into one interval per occurrence.
+
+        :param datetime start: Span start.
+        :param datetime end: Span end.
+        :return: (start, end) pairs in no particular order.
+        :rtype: Iterator[tuple[datetime, datetime]]
+        """
+        for intervals in (self.shifts, self.time_off):
+            for busy_start, busy_end, _ in intervals:
+                if busy_start < end and busy_end > start:
+                    yield busy_start, busy_end
+        for opens, closes, _ in self._windows(start, end):
+            yield opens, closes
+
+    def _unavailable(self, start: datetime, end: datetime):
+        seen = set()
+        for _, _, unavailability_id in self._windows(start, end):
+            if unavailability_id not in seen:
+                seen.add(unavailability_id)
+                yield Conflict("unavailability", unavailability_id)
+
+    def _windows(self, start: datetime, end: datetime):
+        """Yield the unavailability windows overlapping [start, end) as aware datetimes."""
+        if not self.unavailability:
+            return
+        # A window on the previous day may wrap into the start day
+        day = timezone.localtime(start).date() - DAY
+        last = timezone.localtime(end).date()
+        while day <= last:
+            for window_start, window_end, unavailability_id in self.unavailability.get(
+                day.weekday(), ()
+            ):
+                opens = timezone.make_aware(datetime.combine(day, window_start))
+                closes = timezone.make_aware(
+                    datetime.combine(day if window_end > window_start else day + DAY, window_end)
+                )
+                if opens < end and closes > start:
+                    yield opens, closes, unavailability_id
+            day += DAY
+
+
+class ConflictIndex:
+    """Per-member busy intervals for answering many conflict checks at once.
+
+    Build one with load() for the members and time span of a batch of
+    proposed shifts; each check is then a few binary searches with no
+    queries. Call add() after accepting a proposed shift so later shifts in
+    the same batch are checked against it.
+    """
+
+    def __init__(self):
+        self.members = defaultdict(MemberSchedule)
+
+    @classmethod
+    def load(cls, member_ids, start: datetime, end: datetime, exclude_shift_ids=()):
+        """Load the members' shifts, approved time off and unavailability around a span.
+
+        Runs three queries regardless of how many members or shifts are involved.
+
+        :param member_ids: Members to load.
+        :type member_ids: Iterable[int]
+        :param datetime start: Earliest proposed shift start.
+        :param datetime end: Latest proposed shift end.
+        :param exclude_shift_ids: Shifts to leave out, e.g. the ones being edited.
+        :type exclude_shift_ids: Iterable[int]
+        :return: Index covering the members over [start, end).
+        :rtype: ConflictIndex
+        """
+        index = cls()
+        member_ids = set(member_ids)
+        if not member_ids:
+            return index
+
+        shifts = overlapping(Shift.objects.filter(member_id__in=member_ids), start, end).exclude(
+            pk__in=list(exclude_shift_ids)
+        )
+        for member_id, shift_start, shift_end, shift_id in shifts.values_list(
+            "member_id", "start_time", "end_time", "id"
+        ):
+            index.members[member_id].add_shift(shift_start, shift_end, shift_id)
+
+        time_off = TimeOffRequest.objects.filter(
+            member_id__in=member_ids,
+            approved=True,
+            start_date__lte=timezone.localtime(end).date(),
+            end_date__gte=timezone.localtime(start).date(),
+        )
+        for member_id, first, last, request_id in time_off.values_list(
+            "member_id", "start_date", "end_date", "id"
+        ):
+            index.members[member_id].add_time_off(
+                timezone.make_aware(datetime.combine(first, time.min)),
+                timezone.make_aware(datetime.combine(last + DAY, time.min)),
+                request_id,
+            )
+
+        for (
+            member_id,
+            day_of_week,
+            window_start,
+            window_end,
+            unavailability_id,
+        ) in Unavailability.objects.filter(member_id__in=member_ids).values_list(
+            "member_id", "day_of_week", "start_time", "end_time", "id"
+        ):
+            index.members[member_id].add_unavailability(
+                day_of_week,
+                timezone.localtime(window_start).time(),
+                timezone.localtime(window_end).time(),
+                unavailability_id,
+            )
+
+        return index
+
+    def conflicts(self, member_id: int, start: datetime, end: datetime):
+        """Return the conflicts of assigning a member to [start, end).
+
+        :param int member_id: Member being assigned.
+        :param datetime start: Proposed shift start.
+        :param datetime end: Proposed shift end.
+        :return: Conflicts, empty if the assignment is free.
+        :rtype: list[Conflict]
+        """
+        schedule = self.members.get(member_id)
+        if schedule is None:
+            return []
+        return schedule.conflicts(start, end)
+
+    def add(self, member_id: int, start: datetime, end: datetime, shift_id: int = None):
+        """Record an accepted shift so later checks see it.
+
+        :param int member_id: Member assigned to the shift.
+        :param datetime start: Shift start.
+        :param datetime end: Shift end.
+        :param int shift_id: Id of the shift if it is saved.
+        """
+        self.members[member_id].add_shift(start, end, shift_id)
+
+
+def find_conflicts(member_id: int, start: datetime, end: datetime, ignore_shift: int = None):
+    """Return the conflicts of assigning one member to [start, end).
+
+    :param int member_id: Member being assigned.
+    :param datetime start: Proposed shift start.
+    :param datetime end: Proposed shift end.
+    :param int ignore_shift: Id of the shift being edited, if any.
+    :return: Conflicts, empty if the assignment is free.
+    :rtype: list[Conflict]
+    """
+    exclude = [ignore_shift] if ignore_shift is not None else []
+    index = ConflictIndex.load([member_id], start, end, exclude)
+    return index.conflicts(member_id, start, end)
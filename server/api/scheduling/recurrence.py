@@ -0,0 +1,197 @@
+"""Expansion of weekly shift templates into shifts."""
+
+from datetime import datetime, timedelta, timezone as dt_timezone
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from ..events import publish
+from ..models import Shift, ShiftTemplate
+from ..versioning import bump_version
+from .conflicts import ConflictIndex
+from .rollup import add_shifts
+
+WEEK = timedelta(days=7)
+
+
+def occurrence_dates(template: ShiftTemplate, first, last):
+    """Yield the dates a template occurs on between two dates.
+
+    :param ShiftTemplate template: Template to expand.
+    :param date first: First date to consider (inclusive).
+    :param date last: Last date to consider (inclusive).
+    :return: Occurrence dates in ascending order.
+    :rtype: Iterator[date]
+    """
+    first = max(first, template.start_date)
+    if template.end_date is not None:
+        last = min(last, template.end_date)
+
+    day = first + timedelta(days=(template.day_of_week - first.weekday()) % 7)
+    while day <= last:
+        yield day
+        day += WEEK
+
+
+def build_shift(template: ShiftTemplate, day) -> Shift:
+    """Build the unsaved Shift for one occurrence of a template.
+
+    The start is the template's wall-clock time in its timezone; the end adds
+    the duration as elapsed time, so a shift spanning a daylight saving change
+    still lasts its full duration.
+
+    :param ShiftTemplate template: Template the shift belongs to.
+    :param date day: Occurrence date.
+    :return: Unsaved shift linked to the template.
+    :rtype: Shift
+    """
+    start_time = datetime.combine(
+        day, template.start_time, tzinfo=ZoneInfo(template.timezone)
+    ).astimezone(dt_timezone.utc)
+    return Shift(
+        workspace_id=template.workspace_id,
+        role_id=template.role_id,
+        member_id=template.member_id,
+        created_by_id=template.created_by_id,
+        start_time=start_time,
+        end_time=start_time + template.duration,
+        open=template.member_id is None,
+        template=template,
+    )
+
+
+def horizon_end(today=None):
+    """Return the last date the materializer keeps Shift rows for.
+
+    :param date today: Date the horizon starts from; defaults to the current date.
+    :return: today plus SHIFT_TEMPLATE_HORIZON_DAYS.
+    :rtype: date
+    """
+    if today is None:
+        today = timezone.localdate()
+    return today + timedelta(days=settings.SHIFT_TEMPLATE_HORIZON_DAYS)
+
+
+def materialize(template: ShiftTemplate, until=None) -> int:
+    """Create Shift rows for a template's occurrences up to a date.
+
+    Only dates after the template's materialized_until are expanded, and
+    occurrences that already have a row are skipped. The template row is
+    locked while expanding, so it is safe to call repeatedly and concurrently.
+
+    Occurrences the template's member cannot work, because they overlap one of
+    the member's shifts, approved time off or unavailability, are created as
+    open shifts instead.
+
+    :param ShiftTemplate template: Template to materialize.
+    :param date until: Last date to create shifts for; defaults to horizon_end().
+    :return: Number of shifts created.
+    :rtype: int
+    """
+    if until is None:
+        until = horizon_end()
+    if template.materialized_until is not None and template.materialized_until >= until:
+        return 0
+
+    with transaction.atomic():
+        materialized_until = (
+            ShiftTemplate.objects.select_for_update()
+            .filter(pk=template.pk)
+            .values_list("materialized_until", flat=True)
+            .get()
+        )
+        first = template.start_date
+        if materialized_until is not None:
+            first = max(first, materialized_until + timedelta(days=1))
+        shifts = [build_shift(template, day) for day in occurrence_dates(template, first, until)]
+
+        if shifts:
+            existing = set(
+                template.shifts.filter(
+                    start_time__gte=shifts[0].start_time, start_time__lte=shifts[-1].start_time
+                ).values_list("start_time", flat=True)
+            )
+            shifts = [shift for shift in shifts if shift.start_time not in existing]
+            if template.member_id is not None and shifts:
+                open_conflicting(template.member_id, shifts)
+            # bulk_create skips signals, so the labor rollup, version and
+            # subscribers are updated here
+            created = [shift.pk for shift in Shift.objects.bulk_create(shifts)]
+            add_shifts(created)
+            if created:
+                bump_version(template.workspace_id)
+                publish(template.workspace_id, "shift", "saved", created)
+
+        if materialized_until is None or materialized_until < until:
+            ShiftTemplate.objects.filter(pk=template.pk).update(materialized_until=until)
+    template.materialized_until = max(until, materialized_until or until)
+
+    return len(shifts)
+
+
+def open_conflicting(member_id: int, shifts):
+    """Unassign the shifts a member cannot work, leaving them open.
+
+    :param int member_id: Member the shifts are assigned to.
+    :param shifts: Unsaved shifts ordered by start_time.
+    :type shifts: list[Shift]
+    """
+    index = ConflictIndex.load([member_id], shifts[0].start_time, shifts[-1].end_time)
+    for shift in shifts:
+        if index.conflicts(member_id, shift.start_time, shift.end_time):
+            shift.member_id = None
+            shift.open = True
+        else:
+            index.add(member_id, shift.start_time, shift.end_time)
+
+
+def materialize_all(until=None) -> int:
+    """Materialize every template whose rows stop short of a date.
+
+    :param date until: Last date to create shifts for; defaults to horizon_end().
+    :return: Number of occurrences expanded across all templates.
+    :rtype: int
+    """
+    if until is None:
+        until = horizon_end()
+
+    templates = ShiftTemplate.objects.filter(
+        Q(materialized_until__isnull=True) | Q(materialized_until__lt=until)
+    ).exclude(end_date__lte=F("materialized_until"))
+
+    return sum(materialize(template, until) for template in templates.iterator())
+
+
+def expand(templates, start, end):
+    """Compute the not yet materialized occurrences overlapping a datetime range.
+
+    Nothing is saved. Occurrences on or before a template's materialized_until
+    are left out since they exist as Shift rows.
+
+    :param templates: Templates to expand, ideally with member__user and role selected.
+    :type templates: Iterable[ShiftTemplate]
+    :param datetime start: Range start (inclusive).
+    :param datetime end: Range end (exclusive).
+    :return: Unsaved shifts ordered by start_time.
+    :rtype: list[Shift]
+    """
+    shifts = []
+    for template in templates:
+        zone = ZoneInfo(template.timezone)
+        first = (start - template.duration).astimezone(zone).date()
+        if template.materialized_until is not None:
+            first = max(first, template.materialized_until + timedelta(days=1))
+        last = end.astimezone(zone).date()
+
+        for day in occurrence_dates(template, first, last):
+            shift = build_shift(template, day)
+            if shift.start_time < end and shift.end_time > start:
+                shift.member = template.member
+                shift.role = template.role
+                shifts.append(shift)
+
+    shifts.sort(key=lambda shift: (shift.start_time, shift.template_id))
+    return shifts
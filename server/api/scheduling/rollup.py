@@ -0,0 +1,304 @@
+"""Incremental maintenance of the per-week LaborRollup table."""
+
+from collections import defaultdict
+from datetime import timedelta
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db import IntegrityError, transaction
+from django.db.models import BigIntegerField, Case, DecimalField, F, Sum, Value, When
+from django.utils import timezone
+
+from ..models import LaborRollup, Shift
+
+# Shift costs are rounded half up to COST_PLACES, as Postgres round() does in
+# labor_summary, and totals to CENT, so every report agrees on the same shifts
+COST_PLACES = Decimal("0.0001")
+CENT = Decimal("0.01")
+
+# Shift columns a contribution is computed from, rates included
+SHIFT_FIELDS = (
+    "workspace_id",
+    "member_id",
+    "role_id",
+    "start_time",
+    "end_time",
+    "member__pay_rate",
+    "role__pay_rate",
+)
+
+
+def week_start(moment):
+    """Return the Monday of the week a datetime falls in, in TIME_ZONE.
+
+    :param datetime moment: Aware datetime.
+    :return: Date of that week's Monday.
+    :rtype: date
+    """
+    day = timezone.localtime(moment).date()
+    return day - timedelta(days=day.weekday())
+
+
+def shift_cost(seconds: int, rate):
+    """Return the labor cost of a shift.
+
+    :param int seconds: Length of the shift in whole seconds.
+    :param Decimal rate: Hourly pay rate, or None.
+    :return: Cost rounded to COST_PLACES, or None without a rate.
+    :rtype: Decimal or None
+    """
+    if rate is None:
+        return None
+    return (Decimal(seconds) * rate / 3600).quantize(COST_PLACES, ROUND_HALF_UP)
+
+
+def total_cost(cost) -> Decimal:
+    """Round a sum of shift costs to cents for reporting.
+
+    :param cost: Sum of shift costs, or None for no shifts.
+    :rtype: Decimal
+    """
+    return Decimal(cost or 0).quantize(CENT, ROUND_HALF_UP)
+
+
+def contribution(row):
+    """Return what one shift adds to the rollup.
+
+    :param tuple row: Shift values in SHIFT_FIELDS order.
+    :return: The rollup key (workspace_id, member_id, role_id, week_start),
+        seconds and cost. Cost is zero when neither member nor role has a rate.
+    :rtype: tuple[tuple, int, Decimal]
+    """
+    workspace_id, member_id, role_id, start_time, end_time, member_rate, role_rate = row
+    seconds = int((end_time - start_time).total_seconds())
+    rate = member_rate if member_rate is not None else role_rate
+    cost = shift_cost(seconds, rate)
+    key = (workspace_id, member_id, role_id, week_start(start_time))
+    return key, seconds, cost if cost is not None else Decimal(0)
+
+
+def shift_rows(queryset):
+    """Return the SHIFT_FIELDS values of a shift queryset, rates joined in one query."""
+    return queryset.values_list(*SHIFT_FIELDS)
+
+
+def apply_rows(added=(), removed=()):
+    """Add and subtract shifts from the rollup in a fixed number of queries.
+
+    Passing a shift's values before and after an edit as removed and added
+    nets out to nothing when the contribution did not change. Existing rows
+    are adjusted with one UPDATE; missing rows are created together, but
+    never for a negative delta: that means the rows it applies to were
+    removed, e.g. by a cascade delete of their member or role.
+
+    :param added: Values (SHIFT_FIELDS order) of shifts to add.
+    :type added: Iterable[tuple]
+    :param removed: Values (SHIFT_FIELDS order) of shifts to subtract.
+    :type removed: Iterable[tuple]
+    """
+    deltas = defaultdict(lambda: [0, Decimal(0)])
+    for rows, sign in ((added, 1), (removed, -1)):
+        for row in rows:
+            key, seconds, cost = contribution(row)
+            deltas[key][0] += sign * seconds
+            deltas[key][1] += sign * cost
+    deltas = {key: delta for key, delta in deltas.items() if delta[0] or delta[1]}
+    if not deltas:
+        return
+
+    existing = {
+        (workspace, member, role, week): pk
+        for pk, workspace, member, role, week in LaborRollup.objects.filter(
+            workspace_id__in={key[0] for key in deltas},
+            role_id__in={key[2] for key in deltas},
+            week_start__in={key[3] for key in deltas},
+        ).values_list("pk", "workspace_id", "member_id", "role_id", "week_start")
+    }
+    _update(existing, {key: delta for key, delta in deltas.items() if key in existing})
+
+    missing = [
+        LaborRollup(
+            workspace_id=key[0],
+            member_id=key[1],
+            role_id=key[2],
+            week_start=key[3],
+            seconds=seconds,
+            cost=cost,
+        )
+        for key, (seconds, cost) in deltas.items()
+        if key not in existing and seconds >= 0 and cost >= 0
+    ]
+    if missing:
+        try:
+            with transaction.atomic():
+                LaborRollup.objects.bulk_create(missing)
+        except IntegrityError:
+            # Some keys were created concurrently; fall back to one key at a time
+            for row in missing:
+                key = (row.workspace_id, row.member_id, row.role_id, row.week_start)
+                _add_to_key(key, row.seconds, row.cost)
+
+
+def _update(existing, deltas):
+    """Add deltas to existing rollup rows with a single UPDATE."""
+    if not deltas:
+        return
+    LaborRollup.objects.filter(pk__in=[existing[key] for key in deltas]).update(
+        seconds=F("seconds")
+        + Case(
+            *(When(pk=existing[key], then=Value(seconds)) for key, (seconds, _) in deltas.items()),
+            output_field=BigIntegerField(),
+        ),
+        cost=F("cost")
+        + Case(
+            *(When(pk=existing[key], then=Value(cost)) for key, (_, cost) in deltas.items()),
+            output_field=DecimalField(max_digits=14, decimal_places=4),
+        ),
+    )
+
+
+def _add_to_key(key, seconds: int, cost: Decimal):
+    """Add to one rollup row, creating it if it still does not exist."""
+    workspace_id, member_id, role_id, week = key
+    rows = LaborRollup.objects.filter(
+        workspace_id=workspace_id, member_id=member_id, role_id=role_id, week_start=week
+    )
+    if not rows.update(seconds=F("seconds") + seconds, cost=F("cost") + cost):
+        LaborRollup.objects.create(
+            workspace_id=workspace_id,
+            member_id=member_id,
+            role_id=role_id,
+            week_start=week,
+            seconds=seconds,
+            cost=cost,
+        )
+
+
+def add_shifts(shift_ids):
+    """Add shifts created without signals (e.g. by bulk_create) to the rollup.
+
+    :param shift_ids: Primary keys of the new shifts.
+    :type shift_ids: Iterable[int]
+    """
+    apply_rows(added=shift_rows(Shift.objects.filter(pk__in=list(shift_ids))))
+
+
+def _scope(queryset, workspace_id=None, member_id=None, role_id=None):
+    for field, value in (
+        ("workspace_id", workspace_id),
+        ("member_id", member_id),
+        ("role_id", role_id),
+    ):
+        if value is not None:
+            queryset = queryset.filter(**{field: value})
+    return queryset
+
+
+def compute_rollup(workspace_id: int = None, member_id: int = None, role_id: int = None):
+    """Recompute rollup totals from the shifts themselves.
+
+    :param int workspace_id: Limit to one workspace; all workspaces when None.
+    :param int member_id: Limit to one member's shifts.
+    :param int role_id: Limit to one role's shifts.
+    :return: Seconds and cost per rollup key.
+    :rtype: dict[tuple, tuple[int, Decimal]]
+    """
+    shifts = _scope(Shift.objects.all(), workspace_id, member_id, role_id)
+
+    totals = defaultdict(lambda: [0, Decimal(0)])
+    for row in shift_rows(shifts).iterator(chunk_size=2000):
+        key, seconds, cost = contribution(row)
+        totals[key][0] += seconds
+        totals[key][1] += cost
+    return {key: (seconds, cost) for key, (seconds, cost) in totals.items() if seconds or cost}
+
+
+def stored_rollup(workspace_id: int = None):
+    """Return the rollup rows as stored, in the shape of compute_rollup."""
+    rows = _scope(LaborRollup.objects.all(), workspace_id)
+    return {
+        (workspace, member, role, week): (seconds, Decimal(cost).quantize(COST_PLACES))
+        for workspace, member, role, week, seconds, cost in rows.values_list(
+            "workspace_id", "member_id", "role_id", "week_start", "seconds", "cost"
+        )
+        if seconds or cost
+    }
+
+
+def check_rollup(workspace_id: int = None):
+    """Compare the stored rollup with one recomputed from shifts.
+
+    :param int workspace_id: Limit to one workspace; all workspaces when None.
+    :return: (key, stored, expected) for every key that differs; stored or
+        expected is None when the row is missing on that side.
+    :rtype: list[tuple]
+    """
+    expected = compute_rollup(workspace_id)
+    stored = stored_rollup(workspace_id)
+    return [
+        (key, stored.get(key), expected.get(key))
+        for key in sorted(set(expected) | set(stored), key=str)
+        if stored.get(key) != expected.get(key)
+    ]
+
+
+def rebuild_rollup(workspace_id: int = None, member_id: int = None, role_id: int = None):
+    """Replace rollup rows with totals recomputed from shifts.
+
+    :param int workspace_id: Limit to one workspace; all workspaces when None.
+    :param int member_id: Limit to one member's rows, e.g. after a pay rate change.
+    :param int role_id: Limit to one role's rows, e.g. after a pay rate change.
+    :return: Number of rows written.
+    :rtype: int
+    """
+    totals = compute_rollup(workspace_id, member_id, role_id)
+    with transaction.atomic():
+        _scope(LaborRollup.objects.all(), workspace_id, member_id, role_id).delete()
+        LaborRollup.objects.bulk_create(
+            LaborRollup(
+                workspace_id=workspace,
+                member_id=member,
+                role_id=role,
+                week_start=week,
+                seconds=seconds,
+                cost=cost,
+            )
+            for (workspace, member, role, week), (seconds, cost) in totals.items()
+        )
+    return len(totals)
+
+
+def rollup_summary(workspace_id: int, first_week, last_week, group_by: str):
+    """Sum rollup rows for the weeks starting between two Mondays.
+
+    Reads O(weeks × members × roles) rows rather than every shift.
+
+    :param int workspace_id: Primary key of the workspace.
+    :param date first_week: Monday of the first week (inclusive).
+    :param date last_week: Monday of the last week (inclusive).
+    :param str group_by: member, role or week.
+    :return: One dict per group with hours and cost, shaped like labor_summary.
+    :rtype: list[dict]
+    :raises ValueError: If group_by is not member, role or week.
+    """
+    fields = {"member": "member_id", "role": "role_id", "week": "week_start"}
+    if group_by not in fields:
+        raise ValueError(f"Unsupported grouping '{group_by}'.")
+    key = "week" if group_by == "week" else fields[group_by]
+
+    rows = (
+        LaborRollup.objects.filter(
+            workspace_id=workspace_id, week_start__gte=first_week, week_start__lte=last_week
+        )
+        .values(fields[group_by])
+        .annotate(total_seconds=Sum("seconds"), total_cost=Sum("cost"))
+        .order_by(F(fields[group_by]).asc(nulls_last=True))
+    )
+    return [
+        {
+            key: row[fields[group_by]],
+            "hours": round(row["total_seconds"] / 3600.0, 2),
+            "cost": total_cost(row["total_cost"]),
+        }
+        for row in rows
+        if row["total_seconds"] or row["total_cost"]
+    ]
@@ -0,0 +1,329 @@
+"""Automatic assignment of members to a workspace's open shifts."""
+
+import random
+from bisect import bisect_left
+import time as clock
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from ..events import publish
+from ..models import MemberRole, Shift, WorkspaceMember
+from ..utils import overlapping
+from ..versioning import bump_version
+from .conflicts import ConflictIndex
+from .rollup import apply_rows, shift_rows
+
+
+@dataclass
+class AutofillResult:
+    """Outcome of an autofill run.
+
+    assignments maps shift ids to the member chosen for them; unfilled lists
+    the open shifts no eligible member could take. complete is False when the
+    time budget ran out before local search finished.
+    """
+
+    assignments: dict = field(default_factory=dict)
+    unfilled: list = field(default_factory=list)
+    iterations: int = 0
+    elapsed: float = 0.0
+    complete: bool = True
+
+
+def _bits(mask: int):
+    """Yield the positions of the set bits of mask."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class Solver:
+    """Greedy assignment followed by time-boxed local search.
+
+    Members are numbered and held in int bitsets: eligible[s] is everyone
+    holding the shift's role with no saved shift, approved time off or
+    unavailability in the way, and busy[s] is everyone already given a shift
+    that overlaps s in this run. Candidates for s are eligible[s] & ~busy[s].
+    The objective is to fill as many shifts as possible, then to minimise
+    the sum of squared worked seconds per member, which balances hours and
+    can be updated in constant time per move.
+    """
+
+    def __init__(self, shifts, eligible, worked, seed=0):
+        """
+        :param shifts: Open shifts as (id, start, end) tuples.
+        :type shifts: list[tuple[int, datetime, datetime]]
+        :param eligible: Bitset of eligible member numbers per shift.
+        :type eligible: list[int]
+        :param worked: Seconds each member already works in the range.
+        :type worked: list[int]
+        :param int seed: Seed for the local search's random choices.
+        """
+        self.shifts = shifts
+        self.eligible = eligible
+        self.worked = list(worked)
+        self.duration = [int((end - start).total_seconds()) for _, start, end in shifts]
+        self.assigned = [None] * len(shifts)
+        self.busy = [0] * len(shifts)
+        self.random = random.Random(seed)
+        self.overlaps = self._overlaps()
+
+    def _overlaps(self):
+        """Return, for each shift, the other shifts overlapping it."""
+        order = sorted(range(len(self.shifts)), key=lambda s: self.shifts[s][1])
+        overlaps = [[] for _ in self.shifts]
+        active = []
+        for s in order:
+            start = self.shifts[s][1]
+            active = [o for o in active if self.shifts[o][2] > start]
+            for o in active:
+                overlaps[s].append(o)
+                overlaps[o].append(s)
+            active.append(s)
+        return overlaps
+
+    def candidates(self, s: int) -> int:
+        """Bitset of members who can take shift s right now."""
+        return self.eligible[s] & ~self.busy[s]
+
+    def assign(self, s: int, m: int):
+        """Give shift s to member m."""
+        self.assigned[s] = m
+        self.worked[m] += self.duration[s]
+        bit = 1 << m
+        for o in self.overlaps[s]:
+            self.busy[o] |= bit
+
+    def unassign(self, s: int):
+        """Take shift s away from its member."""
+        m = self.assigned[s]
+        self.assigned[s] = None
+        self.worked[m] -= self.duration[s]
+        bit = 1 << m
+        for o in self.overlaps[s]:
+            if not any(self.assigned[x] == m for x in self.overlaps[o]):
+                self.busy[o] &= ~bit
+
+    def _least_worked(self, mask: int):
+        return min(_bits(mask), key=lambda m: self.worked[m], default=None)
+
+    def greedy(self):
+        """Fill the most constrained shifts first, each with its least worked candidate."""
+        order = sorted(
+            range(len(self.shifts)),
+            key=lambda s: (self.eligible[s].bit_count(), self.shifts[s][1]),
+        )
+        for s in order:
+            m = self._least_worked(self.candidates(s))
+            if m is not None:
+                self.assign(s, m)
+
+    def _rebalance(self, s: int) -> bool:
+        """Move an assigned shift to a candidate with fewer worked seconds if that lowers the cost."""
+        m = self.assigned[s]
+        best = self._least_worked(self.candidates(s) & ~(1 << m))
+        if best is None:
+            return False
+        d = self.duration[s]
+        # Change in sum of squares from moving d seconds from m to best
+        if 2 * d * (self.worked[best] - self.worked[m] + d) >= 0:
+            return False
+        self.unassign(s)
+        self.assign(s, best)
+        return True
+
+    def _augment(self, s: int) -> bool:
+        """Fill an unassigned shift by moving one blocking shift to another member."""
+        for m in _bits(self.eligible[s] & self.busy[s]):
+            blocking = [o for o in self.overlaps[s] if self.assigned[o] == m]
+            if len(blocking) != 1:
+                continue
+            o = blocking[0]
+            self.unassign(o)
+            replacement = self._least_worked(self.candidates(o) & ~(1 << m))
+            if replacement is None:
+                self.assign(o, m)
+                continue
+            self.assign(o, replacement)
+            self.assign(s, m)
+            return True
+        return False
+
+    def improve(self, deadline: float):
+        """Run local search moves until nothing improves or the deadline passes.
+
+        :param float deadline: time.monotonic() value to stop at.
+        :return: Number of moves tried and whether search converged in time.
+        :rtype: tuple[int, bool]
+        """
+        iterations = 0
+        while True:
+            improved = False
+            order = list(range(len(self.shifts)))
+            self.random.shuffle(order)
+            for s in order:
+                if iterations % 64 == 0 and clock.monotonic() >= deadline:
+                    return iterations, False
+                iterations += 1
+                if self.assigned[s] is None:
+                    improved |= self._augment(s)
+                else:
+                    improved |= self._rebalance(s)
+            if not improved:
+                return iterations, True
+
+
+def autofill(workspace_id: int, start: datetime, end: datetime, time_budget: float = None):
+    """Choose members for a workspace's open shifts overlapping [start, end).
+
+    A member is eligible for a shift if they hold its role through
+    MemberRole and have no overlapping shift, approved time off or
+    unavailability. Nothing is saved; pass the result to apply_autofill.
+
+    :param int workspace_id: Primary key of the workspace.
+    :param datetime start: Range start (inclusive).
+    :param datetime end: Range end (exclusive).
+    :param float time_budget: Seconds to spend; defaults to SHIFT_AUTOFILL_TIME_BUDGET.
+    :return: The best assignment found within the budget.
+    :rtype: AutofillResult
+    """
+    started = clock.monotonic()
+    if time_budget is None:
+        time_budget = settings.SHIFT_AUTOFILL_TIME_BUDGET
+
+    shifts = list(
+        overlapping(
+            Shift.objects.filter(workspace_id=workspace_id, open=True, member__isnull=True),
+            start,
+            end,
+        )
+        .order_by("start_time", "id")
+        .values_list("id", "role_id", "start_time", "end_time")
+    )
+    if not shifts:
+        return AutofillResult(elapsed=clock.monotonic() - started)
+
+    member_ids = list(
+        WorkspaceMember.objects.filter(workspace_id=workspace_id)
+        .order_by("id")
+        .values_list("id", flat=True)
+    )
+    number = {member_id: m for m, member_id in enumerate(member_ids)}
+
+    role_bits = {}
+    for member_id, role_id in MemberRole.objects.filter(
+        member__workspace_id=workspace_id
+    ).values_list("member_id", "workspace_role_id"):
+        role_bits[role_id] = role_bits.get(role_id, 0) | 1 << number[member_id]
+
+    span_start = min(shift[2] for shift in shifts)
+    span_end = max(shift[3] for shift in shifts)
+    index = ConflictIndex.load(member_ids, span_start, span_end)
+
+    worked = [0] * len(member_ids)
+    for member_id, schedule in index.members.items():
+        worked[number[member_id]] = sum(
+            int((min(shift_end, end) - max(shift_start, start)).total_seconds())
+            for shift_start, shift_end, _ in schedule.shifts
+            if shift_start < end and shift_end > start
+        )
+
+    # Block members from shifts overlapping their busy intervals, found by
+    # binary search over the shift start times rather than pair by pair
+    starts = [shift[2] for shift in shifts]
+    blocked = [0] * len(shifts)
+    for member_id, schedule in index.members.items():
+        bit = 1 << number[member_id]
+        for busy_start, busy_end in schedule.blocked(span_start, span_end):
+            lo = bisect_left(starts, busy_start - settings.SHIFT_MAX_DURATION)
+            for s in range(lo, bisect_left(starts, busy_end)):
+                if shifts[s][3] > busy_start:
+                    blocked[s] |= bit
+
+    eligible = [
+        role_bits.get(role_id, 0) & ~blocked[s] for s, (_, role_id, _, _) in enumerate(shifts)
+    ]
+
+    solver = Solver(
+        [(shift_id, shift_start, shift_end) for shift_id, _, shift_start, shift_end in shifts],
+        eligible,
+        worked,
+    )
+    solver.greedy()
+    iterations, complete = solver.improve(started + time_budget)
+
+    result = AutofillResult(
+        iterations=iterations, elapsed=clock.monotonic() - started, complete=complete
+    )
+    for (shift_id, _, _, _), m in zip(shifts, solver.assigned):
+        if m is None:
+            result.unfilled.append(shift_id)
+        else:
+            result.assignments[shift_id] = member_ids[m]
+    return result
+
+
+def apply_autofill(result: AutofillResult) -> int:
+    """Save an autofill result, re-checking each assignment under lock.
+
+    Shifts filled in the meantime are skipped and dropped from
+    result.assignments. Assignments that now conflict with one of the
+    member's shifts, approved time off or unavailability, or whose member
+    has left the workspace, are left open and moved to result.unfilled.
+
+    :param AutofillResult result: Assignments from autofill.
+    :return: Number of shifts assigned.
+    :rtype: int
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        shifts = list(
+            Shift.objects.select_for_update()
+            .filter(pk__in=list(result.assignments), open=True, member__isnull=True)
+            .order_by("start_time", "id")
+        )
+        for shift_id in set(result.assignments) - {shift.id for shift in shifts}:
+            del result.assignments[shift_id]
+
+        assigned = []
+        if shifts:
+            chosen = {result.assignments[shift.id] for shift in shifts}
+            members = set(
+                WorkspaceMember.objects.filter(
+                    pk__in=chosen, workspace_id=shifts[0].workspace_id
+                ).values_list("id", flat=True)
+            )
+            index = ConflictIndex.load(
+                members, shifts[0].start_time, max(shift.end_time for shift in shifts)
+            )
+            for shift in shifts:
+                member_id = result.assignments[shift.id]
+                if member_id not in members or index.conflicts(
+                    member_id, shift.start_time, shift.end_time
+                ):
+                    del result.assignments[shift.id]
+                    result.unfilled.append(shift.id)
+                    continue
+                index.add(member_id, shift.start_time, shift.end_time, shift.id)
+                shift.member_id = member_id
+                shift.open = False
+                # bulk_update does not apply auto_now
+                shift.date_modified = now
+                assigned.append(shift)
+        shifts = assigned
+
+        # bulk_update skips signals, so the labor rollup, version and
+        # subscribers are updated here
+        changed = Shift.objects.filter(pk__in=[shift.pk for shift in shifts])
+        before = list(shift_rows(changed))
+        Shift.objects.bulk_update(shifts, ["member", "open", "date_modified"])
+        apply_rows(added=shift_rows(changed), removed=before)
+        if shifts:
+            bump_version(shifts[0].workspace_id)
+            publish(shifts[0].workspace_id, "shift", "saved", [shift.pk for shift in shifts])
+    return len(shifts)
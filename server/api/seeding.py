@@ -0,0 +1,232 @@
+"""Generation of synthetic workspaces, members and schedules for load testing."""
+
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+from .models import (
+    MemberPermissions,
+    MemberRole,
+    Shift,
+    TimeOffRequest,
+    Unavailability,
+    User,
+    Workspace,
+    WorkspaceMember,
+    WorkspaceRole,
+)
+from .scheduling import rebuild_rollup
+
+# Share of generated shifts left open, without a member
+OPEN_SHIFT_RATIO = 0.05
+# Shift start hours
+SHIFT_STARTS = (6, 9, 14, 17)
+
+
+@dataclass
+class SeedResult:
+    """Primary keys and row counts of one seeding run."""
+
+    workspace_ids: list = field(default_factory=list)
+    emails: list = field(default_factory=list)
+    counts: dict = field(default_factory=dict)
+
+
+def seed_email(prefix: str, workspace: int, member: int) -> str:
+    """Return the email of a generated member.
+
+    :param str prefix: Prefix of the seeding run.
+    :param int workspace: Index of the workspace in the run.
+    :param int member: Index of the member in the workspace; 0 is the owner.
+    :rtype: str
+    """
+    return f"{prefix}-w{workspace}-m{member}@example.com"
+
+
+def seed(
+    workspaces: int,
+    members: int,
+    roles: int,
+    weeks: int,
+    prefix: str = "seed",
+    password: str = "password",
+    start=None,
+    random_seed: int = 0,
+    batch_size: int = 2000,
+) -> SeedResult:
+    """Create workspaces with members, roles, weeks of shifts, time off and unavailability.
+
+    Every workspace gets its own members, the first of whom owns it with all
+    permissions. Each member holds up to two roles and works five shifts a
+    week, a few of which are left open. Rows are written with bulk_create,
+    which skips the signals, so the labor rollup is rebuilt per workspace.
+    The same arguments produce the same data.
+
+    :param int workspaces: Number of workspaces.
+    :param int members: Members per workspace, including the owner.
+    :param int roles: Roles per workspace.
+    :param int weeks: Weeks of shifts per member.
+    :param str prefix: Prefix of generated emails; must not have been used before.
+    :param str password: Password of every generated user.
+    :param date start: Monday of the first week; defaults to centring the
+        weeks on the current one.
+    :param int random_seed: Seed of the random choices.
+    :param int batch_size: Rows per bulk insert.
+    :return: The generated workspace ids, member emails and row counts.
+    :rtype: SeedResult
+    """
+    rng = random.Random(random_seed)
+    if start is None:
+        today = timezone.localdate()
+        start = today - timedelta(days=today.weekday(), weeks=weeks // 2)
+    tz = timezone.get_current_timezone()
+    hashed = make_password(password)
+    result = SeedResult(
+        counts={
+            "workspaces": 0,
+            "members": 0,
+            "roles": 0,
+            "shifts": 0,
+            "time_off_requests": 0,
+            "unavailabilities": 0,
+        }
+    )
+
+    for index in range(workspaces):
+        with transaction.atomic():
+            emails = [seed_email(prefix, index, number) for number in range(members)]
+            users = User.objects.bulk_create(
+                [
+                    User(
+                        email=email,
+                        password=hashed,
+                        first_name=f"Member{number}",
+                        last_name=f"Workspace{index}",
+                    )
+                    for number, email in enumerate(emails)
+                ],
+                batch_size=batch_size,
+            )
+            owner = users[0]
+            workspace = Workspace.objects.create(
+                name=f"{prefix} {index}"[:30], owner=owner, created_by=owner
+            )
+            workspace_roles = WorkspaceRole.objects.bulk_create(
+                [
+                    WorkspaceRole(
+                        workspace=workspace,
+                        name=f"Role {number}",
+                        pay_rate=Decimal(15 + 5 * (number % 4)),
+                    )
+                    for number in range(roles)
+                ]
+            )
+            workspace_members = WorkspaceMember.objects.bulk_create(
+                [
+                    WorkspaceMember(
+                        workspace=workspace,
+                        user=user,
+                        added_by=owner,
+                        pay_rate=Decimal(rng.randint(15, 40)) if rng.random() < 0.5 else None,
+                    )
+                    for user in users
+                ],
+                batch_size=batch_size,
+            )
+            MemberPermissions.objects.bulk_create(
+                [
+                    MemberPermissions(
+                        workspace=workspace,
+                        member=member,
+                        is_owner=number == 0,
+                        manage_workspace_members=number == 0,
+                        manage_workspace_roles=number == 0,
+                        manage_schedules=number == 0,
+                        manage_time_off=number == 0,
+                    )
+                    for number, member in enumerate(workspace_members)
+                ],
+                batch_size=batch_size,
+            )
+
+            member_roles = {
+                member.id: rng.sample(workspace_roles, min(2, len(workspace_roles)))
+                for member in workspace_members
+            }
+            MemberRole.objects.bulk_create(
+                [
+                    MemberRole(member_id=member_id, workspace_role=role)
+                    for member_id, held in member_roles.items()
+                    for role in held
+                ],
+                batch_size=batch_size,
+            )
+
+            shifts = []
+            time_off = []
+            unavailable = []
+            for member in workspace_members:
+                held = member_roles[member.id]
+                for week in range(weeks):
+                    monday = start + timedelta(weeks=week)
+                    for day in rng.sample(range(7), 5):
+                        begin = datetime.combine(
+                            monday + timedelta(days=day),
+                            time(rng.choice(SHIFT_STARTS)),
+                            tzinfo=tz,
+                        )
+                        open_shift = rng.random() < OPEN_SHIFT_RATIO
+                        shifts.append(
+                            Shift(
+                                workspace=workspace,
+                                member=None if open_shift else member,
+                                role=rng.choice(held),
+                                created_by=workspace_members[0],
+                                start_time=begin,
+                                end_time=begin + timedelta(hours=rng.choice((4, 6, 8))),
+                                open=open_shift,
+                            )
+                        )
+                    if week % 4 == 3:
+                        first = monday + timedelta(days=rng.randrange(7))
+                        time_off.append(
+                            TimeOffRequest(
+                                member=member,
+                                workspace=workspace,
+                                start_date=first,
+                                end_date=first + timedelta(days=rng.randrange(3)),
+                                approved=rng.random() < 0.5,
+                                reason="Generated",
+                            )
+                        )
+                for _ in range(rng.randint(1, 2)):
+                    day = rng.randrange(7)
+                    begin = datetime.combine(start + timedelta(days=day), time(8), tzinfo=tz)
+                    unavailable.append(
+                        Unavailability(
+                            member=member,
+                            day_of_week=day,
+                            start_time=begin,
+                            end_time=begin + timedelta(hours=rng.choice((4, 8))),
+                        )
+                    )
+
+            Shift.objects.bulk_create(shifts, batch_size=batch_size)
+            TimeOffRequest.objects.bulk_create(time_off, batch_size=batch_size)
+            Unavailability.objects.bulk_create(unavailable, batch_size=batch_size)
+            rebuild_rollup(workspace_id=workspace.id)
+
+        result.workspace_ids.append(workspace.id)
+        result.emails.extend(emails)
+        result.counts["workspaces"] += 1
+        result.counts["members"] += len(workspace_members)
+        result.counts["roles"] += len(workspace_roles)
+        result.counts["shifts"] += len(shifts)
+        result.counts["time_off_requests"] += len(time_off)
+        result.counts["unavailabilities"] += len(unavailable)
+    return result
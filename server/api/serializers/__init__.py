@@ -10,3 +10,9 @@ from .role import RoleSerializer, MemberRoleReadSerializer, RoleReadSerializer
 from .shift import ShiftSerializer, ModifyShiftSerializer, ShiftReadSerializer
 from .member import MemberReadSerializer, MemberDetailedReadSerializer
 from .permissions import PermissionsReadSerializer
+from .template import (
+    ShiftTemplateSerializer,
+    ShiftTemplateReadSerializer,
+    ShiftOccurrenceSerializer,
+)
+from .fast import SHIFT_VALUES, shift_values, shift_list_data
@@ -1,12 +1,91 @@
+import copy
+
 from rest_framework import serializers
 
+from ..instrumentation import measure_serialization
+
+# Resolved, unbound field maps keyed by (serializer class, restriction)
+_field_cache = {}
+
 
 class DynamicFieldsSerializer(serializers.ModelSerializer):
+    """ModelSerializer whose output can be restricted with a fields argument.
+
+    Entries may use "__" to restrict a nested DynamicFieldsSerializer, e.g.
+    fields=["id", "member__id", "member__user"] keeps id and member, and only
+    id and user within member. Names that don't match a field are ignored.
+
+    The field map for each (class, fields) pair is built once and deep copied
+    into each instance, so construction does not repeat model introspection.
+    """
+
     def __init__(self, *args, **kwargs):
         fields = kwargs.pop("fields", None)
         super().__init__(*args, **kwargs)
-        if fields:
-            allowed = set(fields)
-            existing = set(self.fields)
-            for field in existing - allowed:
-                self.fields.pop(field)
+        self._restriction = frozenset(fields) if fields else None
+
+    def __init_subclass__(cls, **kwargs):
+        # many=True instances time their data too, unless Meta picks a list class
+        super().__init_subclass__(**kwargs)
+        meta = getattr(cls, "Meta", None)
+        if meta is not None and not hasattr(meta, "list_serializer_class"):
+            meta.list_serializer_class = DynamicFieldsListSerializer
+
+    @property
+    def data(self):
+        """The serialized representation, timed as the request's serialization."""
+        with measure_serialization():
+            return super().data
+
+    def get_fields(self):
+        """Return fresh copies of this serializer's resolved fields.
+
+        :return: Unbound fields by name, in declaration order.
+        :rtype: dict
+        """
+        key = (type(self), self._restriction)
+        resolved = _field_cache.get(key)
+        if resolved is None:
+            resolved = _field_cache[key] = self._resolve_fields()
+        return {name: copy.deepcopy(field) for name, field in resolved.items()}
+
+    def _resolve_fields(self) -> dict:
+        fields = super().get_fields()
+        if self._restriction is None:
+            return fields
+
+        nested = {}
+        for path in self._restriction:
+            name, _, rest = path.partition("__")
+            if rest:
+                nested.setdefault(name, []).append(rest)
+
+        allowed = {path.partition("__")[0] for path in self._restriction}
+        resolved = {}
+        for name, field in fields.items():
+            if name not in allowed:
+                continue
+            if name in nested:
+                field = _restrict(field, nested[name])
+            resolved[name] = field
+        return resolved
+
+
+class DynamicFieldsListSerializer(serializers.ListSerializer):
+    """ListSerializer of DynamicFieldsSerializer children, timing its data."""
+
+    @property
+    def data(self):
+        """The serialized list, timed as the request's serialization."""
+        with measure_serialization():
+            return super().data
+
+
+def _restrict(field, fields):
+    """Return a copy of a nested serializer field limited to the given fields."""
+    if isinstance(field, serializers.ListSerializer):
+        child = _restrict(field.child, fields)
+        return type(field)(*field._args, **{**field._kwargs, "child": child})
+    if not isinstance(field, DynamicFieldsSerializer):
+        return field
+    return type(field)(*field._args, **{**field._kwargs, "fields": fields})
@@ -0,0 +1,105 @@
+"""Serializer-free representation of shift lists built from values() rows.
+
+ShiftReadSerializer nests member and role serializers per row; for long
+lists that costs far more than the query. These helpers produce the same
+output from flat rows with plain dict construction. Any change to
+ShiftReadSerializer's output must be mirrored here; the parity tests in
+api/tests/unit/serializers/test_fast_serializers.py enforce it.
+"""
+
+from django.conf import settings
+from django.utils import timezone
+
+from ..instrumentation import measure_serialization
+
+# Fields of ShiftReadSerializer, in its output order
+SHIFT_FIELDS = ("id", "member", "role", "start_time", "end_time", "open")
+
+# Columns shift_values() fetches to build every SHIFT_FIELDS entry
+SHIFT_VALUES = (
+    "id",
+    "member_id",
+    "member__user__first_name",
+    "member__user__last_name",
+    "role_id",
+    "role__name",
+    "start_time",
+    "end_time",
+    "open",
+)
+
+
+def shift_values(queryset, fields=None):
+    """Return a shift queryset as the flat rows shift_list_data expects.
+
+    :param QuerySet queryset: Queryset over Shift.
+    :param fields: Subset of SHIFT_FIELDS that will be rendered; member names
+        are only joined when "member" is among them.
+    :type fields: Iterable[str] or None
+    :return: values() queryset with the needed SHIFT_VALUES columns.
+    :rtype: QuerySet
+    """
+    columns = SHIFT_VALUES
+    if fields and "member" not in fields:
+        columns = [column for column in SHIFT_VALUES if not column.startswith("member__")]
+    return queryset.values(*columns)
+
+
+def _datetime_formatter():
+    """Return a function formatting datetimes exactly like DRF's DateTimeField."""
+    tz = timezone.get_current_timezone() if settings.USE_TZ else None
+
+    def format_datetime(value):
+        if not value:
+            return None
+        if tz is not None:
+            value = value.astimezone(tz)
+        value = value.isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+
+    return format_datetime
+
+
+def shift_list_data(rows, fields=None):
+    """Build ShiftReadSerializer(many=True) output from shift_values() rows.
+
+    :param rows: Rows from shift_values().
+    :type rows: Iterable[dict]
+    :param fields: Subset of SHIFT_FIELDS to keep, as with the serializer's fields argument.
+    :type fields: Iterable[str] or None
+    :return: One dict per row, identical to the serializer's representation.
+    :rtype: list[dict]
+    """
+    with measure_serialization():
+        return _shift_list_data(rows, fields)
+
+
+def _shift_list_data(rows, fields):
+    format_datetime = _datetime_formatter()
+    keep = [field for field in SHIFT_FIELDS if field in fields] if fields else None
+
+    data = []
+    for row in rows:
+        member_id = row["member_id"]
+        item = {
+            "id": row["id"],
+            "member": (
+                None
+                if member_id is None
+                else {
+                    "id": member_id,
+                    "first_name": row.get("member__user__first_name"),
+                    "last_name": row.get("member__user__last_name"),
+                }
+            ),
+            "role": {"id": row["role_id"], "name": row["role__name"]},
+            "start_time": format_datetime(row["start_time"]),
+            "end_time": format_datetime(row["end_time"]),
+            "open": row["open"],
+        }
+        if keep is not None:
+            item = {field: item[field] for field in keep}
+        data.append(item)
+    return data
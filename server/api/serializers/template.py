@@ -0,0 +1,60 @@
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from rest_framework import serializers
+from ..models import ShiftTemplate
+from .base import DynamicFieldsSerializer
+from .member import MemberReadSerializer
+from .role import RoleReadSerializer
+from .shift import ShiftReadSerializer
+
+
+class ShiftTemplateSerializer(serializers.ModelSerializer):
+    """Serializer for ShiftTemplate creation.
+
+    Role and member are passed as role_id and member_id in the request body
+    and validated against the workspace by the view. timezone defaults to
+    TIME_ZONE.
+    """
+
+    class Meta:
+        """Meta options for ShiftTemplateSerializer."""
+
+        model = ShiftTemplate
+        fields = ["day_of_week", "start_time", "duration", "start_date", "end_date", "timezone"]
+
+        extra_kwargs = {"end_date": {"required": False}}
+
+    def validate_timezone(self, value):
+        """Require an IANA timezone name such as Europe/Paris."""
+        try:
+            ZoneInfo(value)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise serializers.ValidationError("Unknown timezone.")
+        return value
+
+
+class ShiftTemplateReadSerializer(DynamicFieldsSerializer):
+    member = MemberReadSerializer(read_only=True, fields=["id", "user"])
+    role = RoleReadSerializer(read_only=True, fields=["id", "name"])
+
+    class Meta:
+        model = ShiftTemplate
+        fields = [
+            "id",
+            "member",
+            "role",
+            "day_of_week",
+            "start_time",
+            "duration",
+            "start_date",
+            "end_date",
+            "materialized_until",
+            "timezone",
+        ]
+
+
+class ShiftOccurrenceSerializer(ShiftReadSerializer):
+    """Read serializer for template occurrences computed on the fly (id is null)."""
+
+    class Meta(ShiftReadSerializer.Meta):
+        fields = ShiftReadSerializer.Meta.fields + ["template"]
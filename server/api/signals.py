@@ -0,0 +1,290 @@
+"""Model signal handlers keeping derived data in sync with writes."""
+
+from collections import defaultdict
+
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .events import publish
+from .membership import invalidate_membership
+from .models import (
+    MemberPermissions,
+    MemberRole,
+    Shift,
+    ShiftTombstone,
+    User,
+    Workspace,
+    WorkspaceMember,
+    WorkspaceRole,
+)
+from .scheduling import apply_rows, rebuild_rollup, shift_rows
+from .versioning import bump_version
+
+
+def cascaded(instance, origin) -> bool:
+    """Return whether an instance is deleted by a delete() call on something else.
+
+    :param instance: The instance a delete signal was sent for.
+    :param origin: The model instance or queryset whose delete() was called.
+    :rtype: bool
+    """
+    return origin is not None and origin is not instance
+
+
+def deleting_workspace(origin) -> bool:
+    """Return whether a delete() call deletes whole workspaces.
+
+    Everything derived from a workspace's rows cascades with it, so nothing
+    needs to be kept in sync for them.
+
+    :param origin: The model instance or queryset whose delete() was called.
+    :rtype: bool
+    """
+    if isinstance(origin, QuerySet):
+        return origin.model is Workspace
+    return isinstance(origin, Workspace)
+
+
+class ShiftDeletes:
+    """Shifts deleted by one delete() call on a queryset or a related row.
+
+    Django sends every pre_delete signal of a delete() before removing any
+    row, then the post_delete signals model by model. Shifts cascaded from a
+    member, role or workspace, or deleted through a queryset, are collected
+    in pre_delete and handled together on the first post_delete: a fixed
+    number of queries instead of several per shift.
+    """
+
+    def __init__(self, origin):
+        self.workspace_deleted = deleting_workspace(origin)
+        self.shifts = {}
+        self.flushed = False
+
+    @classmethod
+    def collect(cls, instance, origin):
+        """Add a shift to the batch of the delete() call deleting it."""
+        batch = getattr(origin, "_shift_deletes", None)
+        if batch is None or batch.flushed:
+            batch = origin._shift_deletes = cls(origin)
+        batch.shifts[instance.pk] = instance
+        instance._shift_deletes = batch
+
+    def flush(self):
+        """Update the rollup, tombstones, versions and event streams once."""
+        self.flushed = True
+        if self.workspace_deleted:
+            return
+        shifts = list(self.shifts.values())
+        # Shifts are deleted before the members and roles they reference
+        member_rates = dict(
+            WorkspaceMember.objects.filter(
+                pk__in={shift.member_id for shift in shifts}
+            ).values_list("id", "pay_rate")
+        )
+        role_rates = dict(
+            WorkspaceRole.objects.filter(pk__in={shift.role_id for shift in shifts}).values_list(
+                "id", "pay_rate"
+            )
+        )
+        apply_rows(
+            removed=[
+                (
+                    shift.workspace_id,
+                    shift.member_id,
+                    shift.role_id,
+                    shift.start_time,
+                    shift.end_time,
+                    member_rates.get(shift.member_id),
+                    role_rates.get(shift.role_id),
+                )
+                for shift in shifts
+            ]
+        )
+        ShiftTombstone.objects.bulk_create(
+            ShiftTombstone(workspace_id=shift.workspace_id, shift_id=shift.pk) for shift in shifts
+        )
+        by_workspace = defaultdict(list)
+        for shift in shifts:
+            by_workspace[shift.workspace_id].append(shift.pk)
+        bump_version(list(by_workspace))
+        for workspace_id, shift_ids in by_workspace.items():
+            publish(workspace_id, "shift", "deleted", shift_ids)
+
+
+def batched_shift_delete(instance) -> bool:
+    """Handle a shift deleted as part of a batch, flushing it on first use.
+
+    :return: Whether the shift belongs to a batch, so per-shift work is skipped.
+    :rtype: bool
+    """
+    batch = getattr(instance, "_shift_deletes", None)
+    if batch is None:
+        return False
+    if not batch.flushed:
+        batch.flush()
+    return True
+
+
+@receiver([post_save, post_delete], sender=WorkspaceMember)
+def invalidate_member(sender, instance, **kwargs):
+    """Drop the cached membership of a member that was added, changed or removed."""
+    invalidate_membership(instance.user_id, instance.workspace_id)
+
+
+@receiver([post_save, post_delete], sender=MemberPermissions)
+def invalidate_member_permissions(sender, instance, origin=None, **kwargs):
+    """Drop the cached membership of a member whose permissions changed."""
+    # Permissions only cascade from their member or workspace, whose own
+    # signal invalidates the membership.
+    if kwargs["signal"] is post_delete and cascaded(instance, origin):
+        return
+    member = (
+        WorkspaceMember.objects.filter(pk=instance.member_id)
+        .values_list("user_id", "workspace_id")
+        .first()
+    )
+    # A missing member is being deleted too; its own signal invalidates it.
+    if member is not None:
+        invalidate_membership(*member)
+
+
+@receiver([pre_save, pre_delete], sender=Shift)
+def capture_shift_labor(sender, instance, raw=False, origin=None, **kwargs):
+    """Remember a shift's stored values so its old labor contribution can be removed."""
+    instance._labor_before = None
+    if kwargs["signal"] is pre_delete and cascaded(instance, origin):
+        ShiftDeletes.collect(instance, origin)
+        return
+    if not raw and instance.pk is not None:
+        instance._labor_before = shift_rows(Shift.objects.filter(pk=instance.pk)).first()
+
+
+@receiver(post_save, sender=Shift)
+def update_shift_labor(sender, instance, raw=False, **kwargs):
+    """Move a created or edited shift's contribution in the labor rollup."""
+    if raw:
+        return
+    before = getattr(instance, "_labor_before", None)
+    after = shift_rows(Shift.objects.filter(pk=instance.pk)).first()
+    if before != after:
+        apply_rows(added=[after], removed=[before] if before else [])
+
+
+@receiver(post_delete, sender=Shift)
+def remove_shift_labor(sender, instance, **kwargs):
+    """Subtract a deleted shift from the labor rollup."""
+    if batched_shift_delete(instance):
+        return
+    before = getattr(instance, "_labor_before", None)
+    if before:
+        apply_rows(removed=[before])
+
+
+@receiver(pre_save, sender=WorkspaceMember)
+@receiver(pre_save, sender=WorkspaceRole)
+def capture_pay_rate(sender, instance, raw=False, **kwargs):
+    """Remember the stored pay rate so a change can be detected after saving."""
+    instance._pay_rate_before = None
+    if not raw and instance.pk is not None:
+        instance._pay_rate_before = (
+            sender.objects.filter(pk=instance.pk).values_list("pay_rate", flat=True).first()
+        )
+
+
+@receiver(post_save, sender=WorkspaceMember)
+@receiver(post_save, sender=WorkspaceRole)
+def rebuild_pay_rate_labor(sender, instance, created, raw=False, **kwargs):
+    """Recompute the rollup rows costed with a member's or role's changed pay rate."""
+    if raw or created or getattr(instance, "_pay_rate_before", None) == instance.pay_rate:
+        return
+    if sender is WorkspaceMember:
+        rebuild_rollup(member_id=instance.pk)
+    else:
+        rebuild_rollup(role_id=instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Shift)
+@receiver([post_save, post_delete], sender=WorkspaceMember)
+@receiver([post_save, post_delete], sender=WorkspaceRole)
+def bump_workspace_version(sender, instance, raw=False, origin=None, **kwargs):
+    """Invalidate ETags of the workspace whose shifts, members or roles changed."""
+    if raw or batched_shift_delete(instance) or deleting_workspace(origin):
+        return
+    bump_version(instance.workspace_id)
+
+
+@receiver([post_save, post_delete], sender=MemberRole)
+def bump_member_role_version(sender, instance, raw=False, origin=None, **kwargs):
+    """Invalidate ETags of the workspace whose member roles changed."""
+    # Member roles cascade from a member, role or workspace, whose own
+    # signal bumps the version.
+    if not raw and not cascaded(instance, origin):
+        bump_version(
+            WorkspaceRole.objects.filter(pk=instance.workspace_role_id).values("workspace_id")
+        )
+
+
+@receiver(post_save, sender=User)
+def bump_user_workspace_versions(
+    sender, instance, created, raw=False, update_fields=None, **kwargs
+):
+    """Invalidate ETags of every workspace listing a user whose name may have changed."""
+    if raw or created:
+        return
+    if update_fields is not None and not {"first_name", "last_name"} & set(update_fields):
+        return
+    bump_version(WorkspaceMember.objects.filter(user=instance).values("workspace_id"))
+
+
+@receiver(post_delete, sender=Shift)
+def record_shift_tombstone(sender, instance, **kwargs):
+    """Record a deleted shift, including cascaded deletes, for the changes feed."""
+    if batched_shift_delete(instance):
+        return
+    ShiftTombstone.objects.create(workspace_id=instance.workspace_id, shift_id=instance.pk)
+
+
+EVENT_TYPES = {Shift: "shift", WorkspaceMember: "member", WorkspaceRole: "role"}
+
+
+@receiver([post_save, post_delete], sender=Shift)
+@receiver([post_save, post_delete], sender=WorkspaceMember)
+@receiver([post_save, post_delete], sender=WorkspaceRole)
+def publish_change(sender, instance, raw=False, origin=None, **kwargs):
+    """Push a change to the workspace's event stream subscribers."""
+    if raw or batched_shift_delete(instance) or deleting_workspace(origin):
+        return
+    action = "saved" if kwargs["signal"] is post_save else "deleted"
+    publish(instance.workspace_id, EVENT_TYPES[sender], action, [instance.pk])
+
+
+@receiver([post_save, post_delete], sender=MemberRole)
+def publish_member_role_change(sender, instance, raw=False, origin=None, **kwargs):
+    """Push a change to a member's roles as a change to the member."""
+    if raw or deleting_workspace(origin) or isinstance(origin, WorkspaceMember):
+        return
+    if isinstance(origin, WorkspaceRole):
+        publish(origin.workspace_id, "member", "saved", [instance.member_id])
+        return
+    workspace_id = (
+        WorkspaceMember.objects.filter(pk=instance.member_id)
+        .values_list("workspace_id", flat=True)
+        .first()
+    )
+    # A missing member is being deleted too; its own signal publishes it.
+    if workspace_id is not None:
+        publish(workspace_id, "member", "saved", [instance.member_id])
+
+
+@receiver(post_save, sender=User)
+def publish_user_change(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """Push a user's name change to every workspace listing them."""
+    if raw or created:
+        return
+    if update_fields is not None and not {"first_name", "last_name"} & set(update_fields):
+        return
+    for member_id, workspace_id in WorkspaceMember.objects.filter(user=instance).values_list(
+        "id", "workspace_id"
+    ):
+        publish(workspace_id, "member", "saved", [member_id])
@@ -0,0 +1,57 @@
+"""Query budgets of the API views and a test mixin enforcing them.
+
+Budgets are the most queries one request may issue, whatever the number of
+rows involved, so an N+1 pattern fails the suite instead of slipping in. They
+are counted under the test settings, where the permissions cache is disabled
+so every request looks up the membership, for a client authenticated with
+force_authenticate.
+"""
+
+# (URL name, method): maximum queries per request
+QUERY_BUDGETS = {
+    ("get_user", "GET"): 1,
+    ("workspace_parameters", "GET"): 2,
+    ("workspace_members", "GET"): 5,
+    ("workspace_roles", "GET"): 3,
+    ("workspace_shifts", "GET"): 3,
+    ("workspace_shift_changes", "GET"): 2,
+    ("workspace_labor", "GET"): 2,
+    ("workspace_templates", "GET"): 2,
+    ("workspace_template_occurrences", "GET"): 2,
+    ("member", "GET"): 4,
+    ("member_permissions", "GET"): 3,
+    ("member_roles", "GET"): 4,
+    ("member_shifts", "GET"): 3,
+    ("member_calendar", "GET"): 2,
+    ("workspace_calendar", "GET"): 1,
+    ("shift", "GET"): 4,
+    ("shift_filter", "POST"): 1,
+    ("role", "GET"): 2,
+    ("template", "GET"): 2,
+}
+
+
+class QueryBudgetMixin:
+    """Test case mixin asserting that responses stayed within their query budget.
+
+    Relies on RequestMetricsMiddleware, which attaches each response's metrics.
+    """
+
+    def assertQueryBudget(self, response, budget=None):
+        """Assert a response's request issued no more queries than its view's budget.
+
+        :param response: Response returned by the test client.
+        :param int budget: Budget to enforce instead of the one in QUERY_BUDGETS.
+        """
+        metrics = response.metrics
+        key = (metrics.url_name, response.wsgi_request.method)
+        if budget is None:
+            if key not in QUERY_BUDGETS:
+                self.fail(f"No query budget for {key[1]} {key[0]}.")
+            budget = QUERY_BUDGETS[key]
+        self.assertLessEqual(
+            metrics.query_count,
+            budget,
+            f"{key[1]} {key[0]} issued {metrics.query_count} queries, over its budget of "
+            f"{budget}.",
+        )
@@ -0,0 +1,172 @@
+from datetime import timedelta
+from urllib.parse import urlparse
+
+from django.core.cache import caches
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework import status
+from ....models import (
+    Workspace,
+    WorkspaceMember,
+    User,
+    MemberPermissions,
+    WorkspaceRole,
+    Shift,
+)
+
+
+class CalendarFeedTests(APITestCase):
+    """Integration tests for the iCalendar feeds of members and workspaces."""
+
+    def setUp(self):
+        """Create a workspace with a scheduler, a plain member and their shifts."""
+        caches["calendar"].clear()
+        self.manager = User.objects.create_user(
+            email="manager@example.com", password="password", first_name="Grace", last_name="Hopper"
+        )
+        self.user = User.objects.create_user(
+            email="member@example.com", password="password", first_name="Ada", last_name="Lovelace"
+        )
+        self.outsider = User.objects.create_user(email="outsider@example.com", password="password")
+        self.workspace = Workspace.objects.create(
+            name="Cafe", owner=self.manager, created_by=self.manager
+        )
+        self.manager_member = WorkspaceMember.objects.create(
+            user=self.manager, workspace=self.workspace, added_by=self.manager
+        )
+        MemberPermissions.objects.create(
+            workspace=self.workspace, member=self.manager_member, manage_schedules=True
+        )
+        self.member = WorkspaceMember.objects.create(
+            user=self.user, workspace=self.workspace, added_by=self.manager
+        )
+        MemberPermissions.objects.create(workspace=self.workspace, member=self.member)
+        self.role = WorkspaceRole.objects.create(workspace=self.workspace, name="Barista")
+
+        start = timezone.now().replace(microsecond=0) + timedelta(days=1)
+        self.shift = self.create_shift(self.member, start)
+        self.open_shift = self.create_shift(None, start + timedelta(days=1))
+        self.old_shift = self.create_shift(self.member, start - timedelta(days=365))
+
+    def create_shift(self, member, start):
+        return Shift.objects.create(
+            workspace=self.workspace,
+            member=member,
+            open=member is None,
+            role=self.role,
+            created_by=self.manager_member,
+            start_time=start,
+            end_time=start + timedelta(hours=8),
+        )
+
+    def issue(self, user, name, **kwargs):
+        """Return the feed path issued to a user, checking the response."""
+        self.client.force_authenticate(user=user)
+        response = self.client.get(reverse(name, kwargs=kwargs))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.client.force_authenticate(user=None)
+        return urlparse(response.data["result"]["url"]).path
+
+    def fetch(self, path, **headers):
+        response = self.client.get(path, headers=headers)
+        if response.status_code == status.HTTP_200_OK:
+            response.text = b"".join(response.streaming_content).decode()
+        return response
+
+    def test_member_feed(self):
+        """Verify that a member's feed lists their shifts in the window as VEVENTs."""
+        path = self.issue(self.user, "member_calendar", member_id=self.member.id)
+        response = self.fetch(path)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/calendar"))
+        self.assertIn("ETag", response)
+        text = response.text
+        self.assertTrue(text.startswith("BEGIN:VCALENDAR\r\n"))
+        self.assertTrue(text.endswith("END:VCALENDAR\r\n"))
+        self.assertIn("X-WR-CALNAME:Cafe shifts\r\n", text)
+        self.assertIn(f"UID:shift-{self.shift.id}@", text)
+        self.assertIn("SUMMARY:Barista\r\n", text)
+        self.assertNotIn(f"UID:shift-{self.open_shift.id}@", text)
+        self.assertNotIn(f"UID:shift-{self.old_shift.id}@", text)
+
+    def test_workspace_feed(self):
+        """Verify that a workspace feed lists every shift with who works it."""
+        path = self.issue(self.user, "workspace_calendar", workspace_id=self.workspace.id)
+        text = self.fetch(path).text
+
+        self.assertIn("X-WR-CALNAME:Cafe schedule\r\n", text)
+        self.assertIn("SUMMARY:Barista: Ada Lovelace\r\n", text)
+        self.assertIn("SUMMARY:Barista (open)\r\n", text)
+        self.assertEqual(text.count("BEGIN:VEVENT"), 2)
+
+    def test_not_modified_until_schedule_changes(self):
+        """Verify that If-None-Match gets a 304 until a shift changes."""
+        path = self.issue(self.user, "member_calendar", member_id=self.member.id)
+        etag = self.fetch(path)["ETag"]
+
+        response = self.fetch(path, **{"If-None-Match": etag})
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.shift.end_time += timedelta(hours=1)
+        self.shift.save()
+        response = self.fetch(path, **{"If-None-Match": etag})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_changed_shift_is_rendered_again(self):
+        """Verify that an edited shift shows its new times while others come from the cache."""
+        path = self.issue(self.user, "workspace_calendar", workspace_id=self.workspace.id)
+        self.fetch(path)
+
+        self.shift.end_time = self.shift.start_time + timedelta(hours=2)
+        self.shift.save()
+        text = self.fetch(path).text
+        self.assertIn(f"DTEND:{self.shift.end_time.strftime('%Y%m%dT%H%M%SZ')}\r\n", text)
+
+        self.user.first_name = "Augusta"
+        self.user.save()
+        self.assertIn("SUMMARY:Barista: Augusta Lovelace\r\n", self.fetch(path).text)
+
+    def test_manager_may_issue_member_feed(self):
+        """Verify that a scheduler can subscribe to another member's shifts."""
+        path = self.issue(self.manager, "member_calendar", member_id=self.member.id)
+        self.assertEqual(self.fetch(path).status_code, status.HTTP_200_OK)
+
+    def test_member_may_not_issue_others_feed(self):
+        """Verify that a plain member cannot get a feed of another member's shifts."""
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(
+            reverse("member_calendar", kwargs={"member_id": self.manager_member.id})
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_outsider_may_not_issue_feeds(self):
+        """Verify that users outside the workspace get 403 and unknown objects 404."""
+        self.client.force_authenticate(user=self.outsider)
+        response = self.client.get(
+            reverse("workspace_calendar", kwargs={"workspace_id": self.workspace.id})
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        response = self.client.get(reverse("member_calendar", kwargs={"member_id": 999}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_feed_requires_authentication_to_issue(self):
+        """Verify that issuing a feed URL needs a logged-in user."""
+        response = self.client.get(
+            reverse("workspace_calendar", kwargs={"workspace_id": self.workspace.id})
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_feed_stops_when_access_is_lost(self):
+        """Verify that a feed URL stops working once its user leaves the workspace."""
+        path = self.issue(self.user, "workspace_calendar", workspace_id=self.workspace.id)
+        self.member.delete()
+        self.assertEqual(self.fetch(path).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_invalid_token(self):
+        """Verify that a tampered token returns 404."""
+        path = self.issue(self.user, "member_calendar", member_id=self.member.id)
+        response = self.fetch(path.replace(".ics", "x.ics"))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -212,7 +212,10 @@ class GetMemberShiftsTests(APITestCase):
         )
 
         self.client.force_authenticate(user=self.user)
-        self.url = reverse("member_shifts", kwargs={"member_id": self.member2.id})
+        self.url = (
+            reverse("member_shifts", kwargs={"member_id": self.member2.id})
+            + "?range_start=2026-01-01&range_end=2026-01-31"
+        )
 
     def test_invalid_member(self):
         """Verify that a nonexistent member_id returns 404."""
@@ -265,6 +268,16 @@ class GetMemberShiftsTests(APITestCase):
         self.assertEqual(result[0], expected_shift1)
         self.assertEqual(result[1], expected_shift2)
 
+    def test_get_member_shifts_paginated(self):
+        """Verify that member shifts are paged by start time using next_cursor."""
+        response = self.client.get(self.url + "&page_size=1")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row["id"] for row in response.data["result"]], [self.shift1.id])
+
+        response = self.client.get(self.url + "&page_size=1&cursor=" + response.data["next_cursor"])
+        self.assertEqual([row["id"] for row in response.data["result"]], [self.shift2.id])
+        self.assertIsNone(response.data["next_cursor"])
+
     def test_get_member_shifts_empty(self):
         """Verify that an empty list is returned when the member has no shifts."""
         Shift.objects.all().delete()
@@ -0,0 +1,60 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import LiveServerTestCase
+
+from ....seeding import seed
+
+
+class BenchmarkApiTests(LiveServerTestCase):
+    """Integration tests running the API benchmark against a live test server."""
+
+    def setUp(self):
+        """Seed two small workspaces."""
+        seed(2, 3, 2, 2, prefix="bench")
+
+    def benchmark(self, directory, name, **options):
+        output = os.path.join(directory, name)
+        out = StringIO()
+        call_command(
+            "benchmark_api",
+            url=self.live_server_url,
+            prefix="bench",
+            users=4,
+            concurrency=2,
+            requests=8,
+            output=output,
+            stdout=out,
+            **options,
+        )
+        with open(output) as file:
+            return json.load(file), out.getvalue()
+
+    def test_reports_every_endpoint(self):
+        """Verify that every hot endpoint is served without errors and reports its queries."""
+        with tempfile.TemporaryDirectory() as directory:
+            data, _ = self.benchmark(directory, "run.json", label="first")
+
+        self.assertEqual(data["label"], "first")
+        self.assertIn("commit", data)
+        self.assertEqual(
+            [row["endpoint"] for row in data["results"]],
+            ["user", "workspace_shifts", "workspace_members", "shift_filter"],
+        )
+        for row in data["results"]:
+            self.assertEqual(row["errors"], 0, row)
+            self.assertEqual(row["requests"], 8)
+            self.assertGreater(row["mean_queries"], 0)
+            self.assertLessEqual(row["p50_ms"], row["p95_ms"])
+
+    def test_compares_with_baseline(self):
+        """Verify that a run passed as --baseline is shown next to the new results."""
+        with tempfile.TemporaryDirectory() as directory:
+            self.benchmark(directory, "before.json")
+            _, out = self.benchmark(
+                directory, "after.json", baseline=os.path.join(directory, "before.json")
+            )
+        self.assertIn("baseline", out)
@@ -0,0 +1,128 @@
+from datetime import date, datetime, time, timedelta, timezone
+
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from ...budgets import QueryBudgetMixin
+from ....models import (
+    Workspace,
+    WorkspaceMember,
+    User,
+    MemberPermissions,
+    WorkspaceRole,
+    MemberRole,
+    Shift,
+    ShiftTemplate,
+)
+
+
+class QueryBudgetTests(QueryBudgetMixin, APITestCase):
+    """Integration tests holding each read endpoint to its query budget.
+
+    The workspace has several members, roles, shifts and templates, so a
+    per-row query would push an endpoint over its budget.
+    """
+
+    size = 5
+
+    def setUp(self):
+        """Create a workspace the owner manages, with rows of every kind."""
+        self.owner = User.objects.create_user(email="owner@example.com", password="password123")
+        self.workspace = Workspace.objects.create(owner=self.owner, created_by=self.owner)
+        self.member = WorkspaceMember.objects.create(
+            user=self.owner, workspace=self.workspace, added_by=self.owner
+        )
+        MemberPermissions.objects.create(
+            workspace=self.workspace,
+            member=self.member,
+            is_owner=True,
+            manage_workspace_members=True,
+            manage_workspace_roles=True,
+            manage_schedules=True,
+        )
+
+        self.roles = [
+            WorkspaceRole.objects.create(workspace=self.workspace, name=f"Role {index}")
+            for index in range(self.size)
+        ]
+        self.members = [self.member]
+        for index in range(self.size):
+            user = User.objects.create_user(email=f"user{index}@example.com", password="password")
+            member = WorkspaceMember.objects.create(
+                user=user, workspace=self.workspace, added_by=self.owner
+            )
+            MemberPermissions.objects.create(workspace=self.workspace, member=member)
+            self.members.append(member)
+        for member in self.members:
+            for role in self.roles[:2]:
+                MemberRole.objects.create(member=member, workspace_role=role)
+
+        start = datetime(2026, 1, 5, 9, tzinfo=timezone.utc)
+        self.shifts = [
+            Shift.objects.create(
+                workspace=self.workspace,
+                member=member,
+                role=self.roles[index % self.size],
+                created_by=self.member,
+                start_time=start + timedelta(days=index),
+                end_time=start + timedelta(days=index, hours=8),
+            )
+            for index, member in enumerate(self.members)
+        ]
+        self.templates = [
+            ShiftTemplate.objects.create(
+                workspace=self.workspace,
+                role=role,
+                member=self.members[index],
+                created_by=self.member,
+                day_of_week=index % 7,
+                start_time=time(9),
+                duration=timedelta(hours=8),
+                start_date=date(2026, 3, 1),
+            )
+            for index, role in enumerate(self.roles)
+        ]
+
+        self.client.force_authenticate(user=self.owner)
+        self.range = {"range_start": "2026-01-01", "range_end": "2026-01-31"}
+
+    def requests(self):
+        """Yield (method, url, params) for each budgeted endpoint."""
+        workspace = {"workspace_id": self.workspace.id}
+        member = {"member_id": self.members[1].id}
+        yield "get", reverse("get_user"), None
+        yield "get", reverse("workspace_parameters", kwargs=workspace), None
+        yield "get", reverse("workspace_members", kwargs=workspace), None
+        yield "get", reverse("workspace_roles", kwargs=workspace), None
+        yield "get", reverse("workspace_shifts", kwargs=workspace), self.range
+        yield "get", reverse("workspace_shift_changes", kwargs=workspace), None
+        yield "get", reverse("workspace_labor", kwargs=workspace), self.range
+        yield "get", reverse("workspace_templates", kwargs=workspace), None
+        yield "get", reverse("workspace_template_occurrences", kwargs=workspace), {
+            "range_start": "2026-03-01",
+            "range_end": "2026-04-30",
+        }
+        yield "get", reverse("member", kwargs=member), None
+        yield "get", reverse("member_permissions", kwargs=member), None
+        yield "get", reverse("member_roles", kwargs=member), None
+        yield "get", reverse("member_shifts", kwargs=member), self.range
+        yield "get", reverse("member_calendar", kwargs=member), None
+        yield "get", reverse("workspace_calendar", kwargs=workspace), None
+        yield "get", reverse("shift", kwargs={"shift_id": self.shifts[1].id}), None
+        yield "post", reverse("shift_filter"), {
+            "workspace_id": self.workspace.id,
+            **self.range,
+        }
+        yield "get", reverse("role", kwargs={"role_id": self.roles[0].id}), None
+        yield "get", reverse("template", kwargs={"template_id": self.templates[0].id}), None
+
+    def test_read_endpoints_stay_within_budget(self):
+        """Verify that every budgeted read endpoint succeeds within its query budget."""
+        for method, url, params in self.requests():
+            with self.subTest(method=method, url=url):
+                if method == "get":
+                    response = self.client.get(url, params)
+                else:
+                    response = self.client.post(url, params, format="json")
+                self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+                self.assertQueryBudget(response)
@@ -0,0 +1,102 @@
+from datetime import date, time, timedelta
+from unittest import skipUnless
+
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve, reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from ...plans import QueryPlanMixin, save_plan_baselines
+from ....models import Shift, ShiftTemplate, WorkspaceMember, WorkspaceRole
+from ....seeding import seed
+
+
+@skipUnless(connection.vendor == "postgresql", "Query plans are checked on Postgres.")
+class QueryPlanTests(QueryPlanMixin, APITestCase):
+    """Integration tests holding the queries behind each read view to index-backed plans.
+
+    Runs with the server.settings.plans settings. The seeded members are few
+    enough that reading them whole can be the cheapest plan, so each query is
+    planned again with sequential scans disabled: a sequential scan that
+    remains means no index serves the query. The data is analyzed so the
+    estimated costs compared with the baselines are stable.
+    """
+
+    start = date(2026, 1, 5)
+
+    @classmethod
+    def setUpTestData(cls):
+        """Seed 50 workspaces of 30 members with eight weeks of shifts, then analyze them."""
+        result = seed(50, 30, 5, 8, prefix="plans", start=cls.start)
+        cls.workspace_id = result.workspace_ids[len(result.workspace_ids) // 2]
+        cls.members = list(
+            WorkspaceMember.objects.filter(workspace_id=cls.workspace_id)
+            .select_related("user")
+            .order_by("id")
+        )
+        cls.owner = cls.members[0]
+        cls.role = WorkspaceRole.objects.filter(workspace_id=cls.workspace_id).first()
+        cls.shift = Shift.objects.filter(member=cls.members[1]).first()
+        cls.template = ShiftTemplate.objects.create(
+            workspace_id=cls.workspace_id,
+            role=cls.role,
+            member=cls.members[1],
+            created_by=cls.owner,
+            day_of_week=0,
+            start_time=time(9),
+            duration=timedelta(hours=8),
+            start_date=cls.start,
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.owner.user)
+        self.range = {
+            "range_start": (self.start + timedelta(weeks=3)).isoformat(),
+            "range_end": (self.start + timedelta(weeks=4)).isoformat(),
+        }
+
+    def requests(self):
+        """Yield (method, url, params) for each read view."""
+        workspace = {"workspace_id": self.workspace_id}
+        member = {"member_id": self.members[1].id}
+        yield "get", reverse("get_user"), None
+        yield "get", reverse("workspace_parameters", kwargs=workspace), None
+        yield "get", reverse("workspace_members", kwargs=workspace), None
+        yield "get", reverse("workspace_roles", kwargs=workspace), None
+        yield "get", reverse("workspace_shifts", kwargs=workspace), self.range
+        yield "get", reverse("workspace_shift_changes", kwargs=workspace), None
+        yield "get", reverse("workspace_labor", kwargs=workspace), self.range
+        yield "get", reverse("workspace_templates", kwargs=workspace), None
+        yield "get", reverse("workspace_template_occurrences", kwargs=workspace), self.range
+        yield "get", reverse("member", kwargs=member), None
+        yield "get", reverse("member_permissions", kwargs=member), None
+        yield "get", reverse("member_roles", kwargs=member), None
+        yield "get", reverse("member_shifts", kwargs=member), self.range
+        yield "get", reverse("shift", kwargs={"shift_id": self.shift.id}), None
+        yield "post", reverse("shift_filter"), {"workspace_id": self.workspace_id, **self.range}
+        yield "post", reverse("shift_filter"), self.range
+        yield "get", reverse("role", kwargs={"role_id": self.role.id}), None
+        yield "get", reverse("template", kwargs={"template_id": self.template.id}), None
+
+    def test_read_views_use_indexes(self):
+        """Verify that no read view scans shifts or members sequentially or grows in cost."""
+        seen = {}
+        for method, url, params in self.requests():
+            name = f"{method.upper()} {resolve(url).url_name}"
+            seen[name] = seen.get(name, 0) + 1
+            if seen[name] > 1:
+                name = f"{name} ({seen[name]})"
+            with self.subTest(request=name):
+                with CaptureQueriesContext(connection) as queries:
+                    if method == "get":
+                        response = self.client.get(url, params)
+                    else:
+                        response = self.client.post(url, params, format="json")
+                self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+                self.assertQueryPlans(name, queries.captured_queries)
+
+        if getattr(settings, "QUERY_PLAN_UPDATE_BASELINES", False) and self.plan_costs:
+            save_plan_baselines(self.plan_costs)
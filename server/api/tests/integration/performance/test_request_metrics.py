@@ -0,0 +1,70 @@
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from ...budgets import QueryBudgetMixin
+from ....instrumentation import reset_stats
+from ....models import User
+
+
+class RequestMetricsTests(QueryBudgetMixin, APITestCase):
+    """Integration tests for request metrics headers, logs and the stats endpoint."""
+
+    def setUp(self):
+        reset_stats()
+        self.user = User.objects.create_user(email="test@example.com", password="password123")
+        self.admin = User.objects.create_user(
+            email="admin@example.com", password="password123", is_staff=True
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_server_timing_header(self):
+        """Verify that responses carry their query count and timings."""
+        response = self.client.get(reverse("get_user"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertRegex(
+            response["Server-Timing"],
+            r'^db;dur=[\d.]+;desc="1 queries", serialize;dur=[\d.]+, render;dur=[\d.]+, '
+            r"total;dur=[\d.]+$",
+        )
+        self.assertGreater(response.metrics.serialize_time, 0)
+        self.assertEqual(response.metrics.url_name, "get_user")
+        self.assertEqual(response.metrics.size, len(response.content))
+
+    @override_settings(REQUEST_METRICS_SERVER_TIMING=False)
+    def test_server_timing_header_disabled(self):
+        """Verify that the Server-Timing header can be turned off."""
+        response = self.client.get(reverse("get_user"))
+        self.assertFalse(response.has_header("Server-Timing"))
+
+    def test_request_is_logged(self):
+        """Verify that each request logs one line tagged with its URL name."""
+        with self.assertLogs("api.requests", "INFO") as logs:
+            self.client.get(reverse("get_user"))
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("GET get_user 200 queries=1", logs.output[0])
+
+    def test_query_budget_assertion_fails_over_budget(self):
+        """Verify that the budget helper fails a response over its budget."""
+        response = self.client.get(reverse("get_user"))
+        self.assertQueryBudget(response)
+        with self.assertRaises(AssertionError):
+            self.assertQueryBudget(response, budget=0)
+
+    def test_stats_endpoint(self):
+        """Verify that staff users can read the aggregated stats."""
+        self.client.get(reverse("get_user"))
+        self.client.get(reverse("get_user"))
+
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(reverse("request_stats"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        stats = response.data["result"]["views"]["get_user"]
+        self.assertEqual(stats["requests"], 2)
+        self.assertEqual(stats["mean_queries"], 1)
+        self.assertIn("default", response.data["result"]["queries"])
+
+    def test_stats_endpoint_requires_staff(self):
+        """Verify that non-staff users cannot read the stats."""
+        response = self.client.get(reverse("request_stats"))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,72 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from ....models import MemberPermissions, WorkspaceMember, Workspace, User
+
+
+@override_settings(
+    CACHES={
+        **settings.CACHES,
+        "permissions": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-permission-cache",
+        },
+    }
+)
+class PermissionCacheTests(APITestCase):
+    """Integration tests for revoking access while memberships are cached."""
+
+    def setUp(self):
+        """Create a workspace with an owner and a scheduler, and warm the scheduler's cache."""
+        caches["permissions"].clear()
+        self.user = User.objects.create_user(email="owner@example.com", password="password")
+        self.user2 = User.objects.create_user(email="scheduler@example.com", password="password")
+        self.workspace = Workspace.objects.create(owner=self.user, created_by=self.user)
+        self.owner = WorkspaceMember.objects.create(
+            user=self.user, workspace=self.workspace, added_by=self.user
+        )
+        MemberPermissions.objects.create(
+            workspace=self.workspace,
+            member=self.owner,
+            is_owner=True,
+            manage_workspace_members=True,
+        )
+        self.member = WorkspaceMember.objects.create(
+            user=self.user2, workspace=self.workspace, added_by=self.user
+        )
+        MemberPermissions.objects.create(
+            workspace=self.workspace, member=self.member, manage_schedules=True
+        )
+        self.labor_url = reverse("workspace_labor", kwargs={"workspace_id": self.workspace.id})
+        self.range = {"range_start": "2026-01-01", "range_end": "2026-01-31"}
+        self.members_url = reverse("workspace_members", kwargs={"workspace_id": self.workspace.id})
+
+        self.client.force_authenticate(user=self.user2)
+        self.assertEqual(
+            self.client.get(self.labor_url, self.range).status_code, status.HTTP_200_OK
+        )
+        self.assertEqual(self.client.get(self.members_url).status_code, status.HTTP_200_OK)
+
+    def test_revoked_permission(self):
+        """Verify that a revoked permission is refused on the next request."""
+        self.client.force_authenticate(user=self.user)
+        url = reverse("member_permissions", kwargs={"member_id": self.member.id})
+        response = self.client.put(url, {"manage_schedules": False}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.client.force_authenticate(user=self.user2)
+        response = self.client.get(self.labor_url, self.range)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_removed_member(self):
+        """Verify that a removed member loses access on the next request."""
+        self.client.force_authenticate(user=self.user)
+        response = self.client.delete(reverse("member", kwargs={"member_id": self.member.id}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.client.force_authenticate(user=self.user2)
+        response = self.client.get(self.members_url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -125,6 +125,18 @@ class AddMemberRoleTests(APITestCase):
         self.assertEqual(roles[1].workspace_role.id, self.role2.id)
         self.assertEqual(roles[2].workspace_role.id, self.role3.id)
 
+    def test_add_duplicate(self):
+        """Verify that assigning a role the member already has returns 409 and keeps one MemberRole."""
+        data = {"workspace_role_id": self.role.id}
+        self.client.post(self.url, data, format="json")
+
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data["error"]["message"], "Member already has this role.")
+        self.assertEqual(
+            MemberRole.objects.filter(workspace_role=self.role, member=self.member2).count(), 1
+        )
+
     def test_add_without_permissions(self):
         """Verify that a member without manage_workspace_roles permission receives 403 and no role is assigned."""
         self.client.force_authenticate(user=self.member2.user)
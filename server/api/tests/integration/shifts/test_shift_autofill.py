@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta, timezone
+
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from ....models import (
+    Workspace,
+    WorkspaceMember,
+    User,
+    MemberPermissions,
+    WorkspaceRole,
+    MemberRole,
+    Shift,
+)
+
+
+class AutofillShiftTests(APITestCase):
+    """Integration tests for the open shift autofill endpoint."""
+
+    def setUp(self):
+        """Create a scheduler holding a role, a plain member, and two open shifts."""
+        self.user = User.objects.create_user(
+            email="testuser@example.com",
+            password="testpassword",
+            first_name="Test",
+            last_name="User",
+            phone="1234567890",
+        )
+        self.user2 = User.objects.create_user(
+            email="testuser2@example.com",
+            password="testpassword",
+            first_name="Test2",
+            last_name="User2",
+            phone="1234567890",
+        )
+        self.workspace = Workspace.objects.create(owner=self.user, created_by=self.user)
+        self.member = WorkspaceMember.objects.create(
+            user=self.user, workspace=self.workspace, added_by=self.user
+        )
+        MemberPermissions.objects.create(
+            workspace=self.workspace, member=self.member, manage_schedules=True
+        )
+        self.member2 = WorkspaceMember.objects.create(
+            user=self.user2, workspace=self.workspace, added_by=self.user
+        )
+        MemberPermissions.objects.create(workspace=self.workspace, member=self.member2)
+        self.role = WorkspaceRole.objects.create(workspace=self.workspace, name="test name")
+        MemberRole.objects.create(member=self.member, workspace_role=self.role)
+
+        start = datetime(2026, 1, 5, 9, tzinfo=timezone.utc)
+        self.shifts = [
+            Shift.objects.create(
+                workspace=self.workspace,
+                role=self.role,
+                created_by=self.member,
+                start_time=start + timedelta(hours=hours),
+                end_time=start + timedelta(hours=hours + 8),
+                open=True,
+            )
+            for hours in (0, 4)
+        ]
+
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("workspace_shifts_autofill", kwargs={"workspace_id": self.workspace.id})
+        self.data = {"range_start": "2026-01-05", "range_end": "2026-01-11"}
+
+    def test_autofill(self):
+        """Verify that eligible shifts are assigned and overlapping ones stay open."""
+        response = self.client.post(self.url, self.data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["result"]["assignments"],
+            [{"shift_id": self.shifts[0].id, "member_id": self.member.id}],
+        )
+        self.assertEqual(response.data["result"]["unfilled"], [self.shifts[1].id])
+        self.shifts[0].refresh_from_db()
+        self.assertEqual(self.shifts[0].member_id, self.member.id)
+        self.assertFalse(self.shifts[0].open)
+
+    def test_dry_run(self):
+        """Verify that dry_run returns assignments without saving them."""
+        response = self.client.post(self.url, {**self.data, "dry_run": True}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["result"]["assignments"]), 1)
+        self.assertEqual(Shift.objects.filter(open=True).count(), 2)
+
+    def test_missing_range(self):
+        """Verify that a missing range returns 400."""
+        response = self.client.post(self.url, {"range_start": "2026-01-05"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invalid_time_budget(self):
+        """Verify that a time budget that is not a finite positive number returns 400."""
+        for time_budget in ("nan", "inf", -1, 0, "soon"):
+            with self.subTest(time_budget=time_budget):
+                response = self.client.post(
+                    self.url, {**self.data, "time_budget": time_budget}, format="json"
+                )
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Shift.objects.filter(open=True).count(), 2)
+
+    def test_no_permissions(self):
+        """Verify that a member without manage_schedules receives 403."""
+        self.client.force_authenticate(user=self.user2)
+        response = self.client.post(self.url, self.data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,147 @@
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from datetime import datetime, timedelta, timezone
+from ....models import (
+    Workspace,
+    WorkspaceMember,
+    User,
+    MemberPermissions,
+    WorkspaceRole,
+    Shift,
+)
+
+
+class BulkCreateShiftTests(APITestCase):
+    """Integration tests for the bulk shift creation endpoint."""
+
+    def setUp(self):
+        """Create a workspace with a scheduler, a plain member, a role, and a second workspace."""
+        self.user = User.objects.create_user(
+            email="testuser@example.com",
+            password="testpassword",
+            first_name="Test",
+            last_name="User",
+            phone="1234567890",
+        )
+        self.user2 = User.objects.create_user(
+            email="testuser2@example.com",
+            password="testpassword",
+            first_name="Test2",
+            last_name="User2",
+            phone="1234567890",
+        )
+
+        self.workspace = Workspace.objects.create(owner=self.user, created_by=self.user)
+        self.other_workspace = Workspace.objects.create(owner=self.user2, created_by=self.user2)
+
+        self.member = WorkspaceMember.objects.create(
+            user=self.user, workspace=self.workspace, added_by=self.user
+        )
+        MemberPermissions.objects.create(
+            workspace=self.workspace, member=self.member, manage_schedules=True
+        )
+        self.member2 = WorkspaceMember.objects.create(
+            user=self.user2, workspace=self.workspace, added_by=self.user
+        )
+        MemberPermissions.objects.create(workspace=self.workspace, member=self.member2)
+        self.other_member = WorkspaceMember.objects.create(
+            user=self.user2, workspace=self.other_workspace, added_by=self.user2
+        )
+
+        self.role = WorkspaceRole.objects.create(workspace=self.workspace, name="test name")
+        self.other_role = WorkspaceRole.objects.create(workspace=self.other_workspace, name="other")
+
+        self.start = datetime(2026, 1, 5, 9, tzinfo=timezone.utc)
+
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("workspace_shifts_bulk", kwargs={"workspace_id": self.workspace.id})
+
+    def _shift(self, day, **extra):
+        start = self.start + timedelta(days=day)
+        return {
+            "role_id": self.role.id,
+            "start_time": start,
+            "end_time": start + timedelta(hours=8),
+            **extra,
+        }
+
+    def test_create_shifts(self):
+        """Verify that every shift is created and their ids are returned."""
+        data = {
+            "shifts": [self._shift(0), self._shift(1, member_id=self.member2.id), self._shift(2)]
+        }
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        ids = response.data["result"]["ids"]
+        self.assertEqual(len(ids), 3)
+        shifts = Shift.objects.filter(pk__in=ids).order_by("start_time")
+        self.assertEqual([shift.open for shift in shifts], [True, False, True])
+        self.assertEqual(shifts[1].member_id, self.member2.id)
+        self.assertTrue(all(shift.created_by_id == self.member.id for shift in shifts))
+
+    def test_query_count_independent_of_size(self):
+        """Verify that validation and insertion use a fixed number of queries."""
+        data = {"shifts": [self._shift(day, member_id=self.member2.id) for day in range(50)]}
+        # membership, roles, members, three conflict loads, the insert with its savepoint,
+        # and the labor rollup: shift rates, existing rows, and one insert with its savepoint
+        with self.assertNumQueries(15):
+            response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Shift.objects.count(), 50)
+
+    def test_item_errors(self):
+        """Verify that invalid items are reported by index and nothing is created."""
+        data = {
+            "shifts": [
+                self._shift(0),
+                self._shift(1, role_id=self.other_role.id),
+                self._shift(2, member_id=self.other_member.id),
+                {"role_id": self.role.id},
+                self._shift(4, end_time=self.start),
+                {"start_time": self.start, "end_time": self.start + timedelta(hours=1)},
+                self._shift(6, end_time=self.start + timedelta(days=6, hours=25)),
+            ]
+        }
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            [item["index"] for item in response.data["error"]["items"]], [1, 2, 3, 4, 5, 6]
+        )
+        self.assertEqual(
+            response.data["error"]["items"][0]["message"],
+            "Workspace role does not exist or is not part of workspace.",
+        )
+        self.assertEqual(
+            response.data["error"]["items"][1]["message"],
+            "Member does not exist or is not part of workspace.",
+        )
+        self.assertFalse(Shift.objects.exists())
+
+    def test_missing_or_empty_list(self):
+        """Verify that a missing or empty shift list returns a 400 error."""
+        for data in ({}, {"shifts": []}, {"shifts": "nope"}):
+            response = self.client.post(self.url, data, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(SHIFT_BULK_MAX_ITEMS=2)
+    def test_too_many_items(self):
+        """Verify that a batch larger than SHIFT_BULK_MAX_ITEMS returns a 400 error."""
+        data = {"shifts": [self._shift(day) for day in range(3)]}
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Shift.objects.exists())
+
+    def test_no_permissions(self):
+        """Verify that a member without manage_schedules receives 403."""
+        self.client.force_authenticate(user=self.user2)
+        response = self.client.post(self.url, {"shifts": [self._shift(0)]}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_invalid_workspace(self):
+        """Verify that a non-existent workspace_id returns a 404 error."""
+        url = reverse("workspace_shifts_bulk", kwargs={"workspace_id": 999})
+        response = self.client.post(url, {"shifts": [self._shift(0)]}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
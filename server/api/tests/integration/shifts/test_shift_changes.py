@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta, timezone
+
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from ....models import (
+    Workspace,
+    WorkspaceMember,
+    User,
+    MemberPermissions,
+    WorkspaceRole,
+    Shift,
+)
+from ....scheduling import encode_change_cursor
+
+
+@override_settings(SHIFT_CHANGES_SETTLE=timedelta(0))
+class ShiftChangesTests(APITestCase):
+    """Integration tests for the shift changes feed endpoint."""
+
+    def setUp(self):
+        """Create a scheduler with one shift and an outsider."""
+        self.user = User.objects.create_user(
+            email="testuser@example.com",
+            password="testpassword",
+            first_name="Test",
+            last_name="User",
+            phone="1234567890",
+        )
+        self.outsider = User.objects.create_user(
+            email="outsider@example.com", password="testpassword"
+        )
+        self.workspace = Workspace.objects.create(owner=self.user, created_by=self.user)
+        self.member = WorkspaceMember.objects.create(
+            user=self.user, workspace=self.workspace, added_by=self.user
+        )
+        MemberPermissions.objects.create(
+            workspace=self.workspace, member=self.member, manage_schedules=True
+        )
+        self.role = WorkspaceRole.objects.create(workspace=self.workspace, name="test name")
+        start = datetime(2026, 1, 5, 9, tzinfo=timezone.utc)
+        self.shift = Shift.objects.create(
+            workspace=self.workspace,
+            member=self.member,
+            role=self.role,
+            created_by=self.member,
+            start_time=start,
+            end_time=start + timedelta(hours=8),
+        )
+
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("workspace_shift_changes", kwargs={"workspace_id": self.workspace.id})
+
+    def test_full_then_incremental_sync(self):
+        """Verify that a full sync lists shifts and the next call lists only the deletion."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.json()
+        self.assertEqual(
+            body["result"]["shifts"],
+            [
+                {
+                    "id": self.shift.id,
+                    "member": {"id": self.member.id, "first_name": "Test", "last_name": "User"},
+                    "role": {"id": self.role.id, "name": "test name"},
+                    "start_time": "2026-01-05T09:00:00Z",
+                    "end_time": "2026-01-05T17:00:00Z",
+                    "open": False,
+                }
+            ],
+        )
+        self.assertFalse(body["has_more"])
+
+        response = self.client.delete(reverse("shift", kwargs={"shift_id": self.shift.id}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(self.url, {"since": body["next_cursor"]})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["result"], {"shifts": [], "deleted": [self.shift.id]})
+
+    def test_invalid_cursor(self):
+        """Verify that a malformed cursor is rejected."""
+        response = self.client.get(self.url, {"since": "garbage"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_expired_cursor(self):
+        """Verify that a cursor older than tombstone retention asks for a resync."""
+        since = encode_change_cursor(datetime(2000, 1, 1, tzinfo=timezone.utc), 0, 0)
+        response = self.client.get(self.url, {"since": since})
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+
+    def test_non_member(self):
+        """Verify that non-members cannot read the feed."""
+        self.client.force_authenticate(user=self.outsider)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
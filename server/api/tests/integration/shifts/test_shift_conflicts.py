@@ -0,0 +1,175 @@
+from datetime import date, datetime, timedelta, timezone
+
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from ....models import (
+    Workspace,
+    WorkspaceMember,
+    User,
+    MemberPermissions,
+    WorkspaceRole,
+    Shift,
+    TimeOffRequest,
+)
+
+
+class ShiftConflictTests(APITestCase):
+    """Integration tests for conflict checks on shift creation, update, and in batches."""
+
+    def setUp(self):
+        """Create a scheduler, a member with one shift and approved time off, and a role."""
+        self.user = User.objects.create_user(
+            email="testuser@example.com",
+            password="testpassword",
+            first_name="Test",
+            last_name="User",
+            phone="1234567890",
+        )
+        self.user2 = User.objects.create_user(
+            email="testuser2@example.com",
+            password="testpassword",
+            first_name="Test2",
+            last_name="User2",
+            phone="1234567890",
+        )
+        self.workspace = Workspace.objects.create(owner=self.user, created_by=self.user)
+        self.member = WorkspaceMember.objects.create(
+            user=self.user, workspace=self.workspace, added_by=self.user
+        )
+        MemberPermissions.objects.create(
+            workspace=self.workspace, member=self.member, manage_schedules=True
+        )
+        self.member2 = WorkspaceMember.objects.create(
+            user=self.user2, workspace=self.workspace, added_by=self.user
+        )
+        self.role = WorkspaceRole.objects.create(workspace=self.workspace, name="test name")
+
+        self.start = datetime(2026, 1, 5, 9, tzinfo=timezone.utc)
+        self.shift = Shift.objects.create(
+            workspace=self.workspace,
+            member=self.member2,
+            role=self.role,
+            created_by=self.member,
+            start_time=self.start,
+            end_time=self.start + timedelta(hours=8),
+        )
+        self.time_off = TimeOffRequest.objects.create(
+            member=self.member2,
+            workspace=self.workspace,
+            start_date=date(2026, 1, 7),
+            end_date=date(2026, 1, 7),
+            approved=True,
+        )
+
+        self.client.force_authenticate(user=self.user)
+
+    def _shift(self, start, hours=8, **extra):
+        return {
+            "role_id": self.role.id,
+            "member_id": self.member2.id,
+            "start_time": start,
+            "end_time": start + timedelta(hours=hours),
+            **extra,
+        }
+
+    def test_create_double_booking(self):
+        """Verify that assigning an overlapping shift returns 409 with the conflict."""
+        url = reverse("workspace_shifts", kwargs={"workspace_id": self.workspace.id})
+        response = self.client.post(
+            url, self._shift(self.start + timedelta(hours=4)), format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(
+            response.data["error"]["conflicts"], [{"kind": "shift", "id": self.shift.id}]
+        )
+        self.assertEqual(Shift.objects.count(), 1)
+
+    def test_create_during_time_off(self):
+        """Verify that assigning a shift during approved time off returns 409."""
+        url = reverse("workspace_shifts", kwargs={"workspace_id": self.workspace.id})
+        response = self.client.post(url, self._shift(self.start + timedelta(days=2)), format="json")
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data["error"]["conflicts"][0]["kind"], "time_off")
+
+    def test_update_conflict_saves_nothing(self):
+        """Verify that moving a shift onto another one returns 409 and leaves it unchanged."""
+        other = Shift.objects.create(
+            workspace=self.workspace,
+            member=self.member2,
+            role=self.role,
+            created_by=self.member,
+            start_time=self.start + timedelta(days=1),
+            end_time=self.start + timedelta(days=1, hours=8),
+        )
+        url = reverse("shift", kwargs={"shift_id": other.id})
+        response = self.client.put(
+            url,
+            {
+                "start_time": self.start + timedelta(hours=4),
+                "end_time": self.start + timedelta(hours=12),
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        other.refresh_from_db()
+        self.assertEqual(other.start_time, self.start + timedelta(days=1))
+
+    def test_update_own_times(self):
+        """Verify that a shift does not conflict with its own previous times."""
+        url = reverse("shift", kwargs={"shift_id": self.shift.id})
+        response = self.client.put(
+            url, {"end_time": self.start + timedelta(hours=10)}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_bulk_conflicts_within_batch(self):
+        """Verify that bulk creation rejects items overlapping each other or saved shifts."""
+        url = reverse("workspace_shifts_bulk", kwargs={"workspace_id": self.workspace.id})
+        day = self.start + timedelta(days=3)
+        data = {
+            "shifts": [
+                self._shift(day),
+                self._shift(day + timedelta(hours=2)),
+                self._shift(self.start),
+                self._shift(day, member_id=self.member.id),
+            ]
+        }
+        response = self.client.post(url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual([item["index"] for item in response.data["error"]["items"]], [1, 2])
+        self.assertEqual(Shift.objects.count(), 1)
+
+    def test_batch_check(self):
+        """Verify that the conflicts endpoint reports every item without saving."""
+        url = reverse("workspace_shift_conflicts", kwargs={"workspace_id": self.workspace.id})
+        day = self.start + timedelta(days=3)
+        data = {
+            "shifts": [
+                self._shift(self.start, member_id=self.member.id),
+                self._shift(self.start + timedelta(hours=1), shift_id=self.shift.id),
+                self._shift(self.start + timedelta(hours=4)),
+                self._shift(day),
+            ]
+        }
+        response = self.client.post(url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["result"],
+            [
+                {"index": 0, "conflicts": []},
+                {"index": 1, "conflicts": []},
+                {"index": 2, "conflicts": [{"kind": "shift", "id": None}]},
+                {"index": 3, "conflicts": []},
+            ],
+        )
+        self.assertEqual(Shift.objects.count(), 1)
+
+    def test_batch_check_invalid_member(self):
+        """Verify that members outside the workspace are reported by index."""
+        url = reverse("workspace_shift_conflicts", kwargs={"workspace_id": self.workspace.id})
+        response = self.client.post(
+            url, {"shifts": [self._shift(self.start, member_id=999)]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["error"]["items"][0]["index"], 0)
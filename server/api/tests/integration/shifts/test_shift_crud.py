@@ -116,6 +116,17 @@ class CreateShiftTests(APITestCase):
         response = self.client.post(self.url, data, format="json")
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_longer_than_max_duration(self):
+        """Verify that a shift longer than SHIFT_MAX_DURATION returns a 400 error."""
+        data = {
+            "role_id": self.role.id,
+            "start_time": self.time1,
+            "end_time": self.time1 + timedelta(hours=25),
+        }
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Shift.objects.filter(workspace=self.workspace).exists())
+
     def test_without_permissions(self):
         """Verify that a member without manage_schedules permission cannot create a shift."""
         self.client.force_authenticate(user=self.member2.user)
@@ -467,6 +478,17 @@ class ModifyShiftTests(APITestCase):
             ).exists()
         )
 
+    def test_end_longer_than_max_duration(self):
+        """Verify that an end_time making the shift too long returns a 400 error."""
+        data = {"end_time": self.time1 + timedelta(hours=25)}
+        response = self.client.put(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertTrue(
+            Shift.objects.filter(
+                pk=self.shift.id, start_time=self.time1, end_time=self.time2
+            ).exists()
+        )
+
     def test_valid_start_and_end(self):
         """Verify that updating both start_time and end_time succeeds and persists the changes."""
         data = {"start_time": self.time4, "end_time": self.time3}
@@ -0,0 +1,178 @@
+import csv
+import io
+import os
+import tempfile
+import warnings
+import zipfile
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import AsyncClient
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+from ....models import (
+    Workspace,
+    WorkspaceMember,
+    User,
+    MemberPermissions,
+    WorkspaceRole,
+    Shift,
+)
+
+
+class ShiftExportTests(APITestCase):
+    """Integration tests for exporting a workspace's shifts as CSV and XLSX."""
+
+    def setUp(self):
+        """Create a workspace with a scheduler, a paid member and a few shifts."""
+        self.user = User.objects.create_user(
+            email="manager@example.com", password="password", first_name="Grace", last_name="Hopper"
+        )
+        self.other = User.objects.create_user(
+            email="member@example.com", password="password", first_name="Ada", last_name="Lovelace"
+        )
+        self.workspace = Workspace.objects.create(owner=self.user, created_by=self.user)
+        self.manager = WorkspaceMember.objects.create(
+            user=self.user, workspace=self.workspace, added_by=self.user
+        )
+        MemberPermissions.objects.create(
+            workspace=self.workspace, member=self.manager, manage_schedules=True
+        )
+        self.member = WorkspaceMember.objects.create(
+            user=self.other, workspace=self.workspace, added_by=self.user, pay_rate=Decimal("30")
+        )
+        MemberPermissions.objects.create(workspace=self.workspace, member=self.member)
+        self.role = WorkspaceRole.objects.create(
+            workspace=self.workspace, name="Cashier", pay_rate=Decimal("20")
+        )
+
+        self.start = datetime(2025, 3, 3, 9, tzinfo=timezone.utc)
+        self.shifts = [
+            self.create_shift(self.member, self.start, hours=8),
+            self.create_shift(self.manager, self.start + timedelta(days=1), hours=4),
+            self.create_shift(None, self.start + timedelta(days=400), hours=6),
+        ]
+        self.client.force_authenticate(user=self.user)
+
+    def create_shift(self, member, start, hours):
+        return Shift.objects.create(
+            workspace=self.workspace,
+            member=member,
+            open=member is None,
+            role=self.role,
+            created_by=self.manager,
+            start_time=start,
+            end_time=start + timedelta(hours=hours),
+        )
+
+    def url(self, file_format="csv"):
+        return reverse(
+            "workspace_shifts_export",
+            kwargs={"workspace_id": self.workspace.id, "file_format": file_format},
+        )
+
+    def read_csv(self, response):
+        data = b"".join(response.streaming_content).decode()
+        return list(csv.DictReader(io.StringIO(data)))
+
+    def test_csv_export(self):
+        """Verify that every shift is exported oldest first with names, hours and cost."""
+        response = self.client.get(self.url())
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertTrue(response["Content-Type"].startswith("text/csv"))
+        self.assertIn("attachment", response["Content-Disposition"])
+
+        rows = self.read_csv(response)
+        self.assertEqual([int(row["shift_id"]) for row in rows], [s.id for s in self.shifts])
+        self.assertEqual(rows[0]["member_name"], "Ada Lovelace")
+        self.assertEqual(rows[0]["member_email"], "member@example.com")
+        self.assertEqual(rows[0]["role"], "Cashier")
+        self.assertEqual(rows[0]["hours"], "8.0")
+        # Member rate wins over the role's
+        self.assertEqual(rows[0]["cost"], "240.0000")
+        self.assertEqual(rows[1]["cost"], "80.0000")
+        self.assertEqual(rows[2]["member_id"], "")
+        self.assertEqual(rows[2]["member_name"], "")
+
+    def test_range(self):
+        """Verify that range_start and range_end limit the exported shifts."""
+        response = self.client.get(
+            self.url(), {"range_start": "2025-03-01", "range_end": "2025-03-31"}
+        )
+        self.assertEqual(len(self.read_csv(response)), 2)
+
+        response = self.client.get(self.url(), {"range_start": "not a date"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_xlsx_export(self):
+        """Verify that the XLSX export is a workbook holding a header and every shift."""
+        response = self.client.get(self.url("xlsx"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = b"".join(response.streaming_content)
+        with zipfile.ZipFile(io.BytesIO(data)) as workbook:
+            sheet = workbook.read("xl/worksheets/sheet1.xml").decode()
+        self.assertEqual(sheet.count("<row>"), 4)
+        self.assertIn("Ada Lovelace", sheet)
+
+    async def test_asgi_export_streams(self):
+        """Verify that under ASGI the export is sent a chunk at a time, not buffered."""
+        with patch("api.exports.CHUNK_SIZE", 1), warnings.catch_warnings():
+            # Django warns when it has to read a sync iterator whole
+            warnings.filterwarnings("error", "StreamingHttpResponse must consume")
+            response = await AsyncClient().get(
+                self.url(), headers={"Authorization": f"Bearer {AccessToken.for_user(self.user)}"}
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertTrue(response.is_async)
+            chunks = [chunk async for chunk in response.streaming_content]
+        # The header with the first row, one chunk per other row, then the tail
+        self.assertEqual(len(chunks), 4)
+        rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+        self.assertEqual([int(row["shift_id"]) for row in rows], [s.id for s in self.shifts])
+
+    def test_unknown_format(self):
+        """Verify that formats other than csv and xlsx return 404."""
+        response = self.client.get(self.url("pdf"))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_requires_manage_schedules(self):
+        """Verify that members without manage_schedules cannot export."""
+        self.client.force_authenticate(user=self.other)
+        response = self.client.get(self.url())
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_outsider(self):
+        """Verify that non-members get 403 and unknown workspaces 404."""
+        outsider = User.objects.create_user(email="outsider@example.com", password="password")
+        self.client.force_authenticate(user=outsider)
+        self.assertEqual(self.client.get(self.url()).status_code, status.HTTP_403_FORBIDDEN)
+        response = self.client.get(
+            reverse("workspace_shifts_export", kwargs={"workspace_id": 999, "file_format": "csv"})
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_command(self):
+        """Verify that export_shifts writes CSV to stdout and XLSX to a file."""
+        out = io.StringIO()
+        call_command("export_shifts", workspace=self.workspace.id, stdout=out)
+        rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+        self.assertEqual(len(rows), 3)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "shifts.xlsx")
+            call_command(
+                "export_shifts",
+                workspace=self.workspace.id,
+                file_format="xlsx",
+                output=path,
+                range_end="2025-12-31",
+                stderr=io.StringIO(),
+            )
+            with zipfile.ZipFile(path) as workbook:
+                sheet = workbook.read("xl/worksheets/sheet1.xml").decode()
+        self.assertEqual(sheet.count("<row>"), 3)
@@ -77,7 +77,7 @@ class GetShiftsTest(APITestCase):
             manage_time_off=False,
         )
         self.member3 = WorkspaceMember.objects.create(
-            user=self.user2, workspace=self.workspace, added_by=self.user
+            user=self.user3, workspace=self.workspace, added_by=self.user
         )
         self.permissions3 = MemberPermissions.objects.create(
             workspace=self.workspace,
@@ -238,6 +238,37 @@ class GetShiftsTest(APITestCase):
         self.assertTrue(self.shift4.id in ids)
         self.assertTrue(self.shift5.id in ids)
 
+    def test_date_range_includes_overlapping_shift(self):
+        """Verify that a shift starting before the range but ending inside it is returned."""
+        overnight = Shift.objects.create(
+            workspace=self.workspace,
+            start_time=self.time5 - timedelta(hours=3),
+            end_time=self.time5 + timedelta(hours=3),
+            role=self.role2,
+            created_by=self.member,
+            open=True,
+        )
+
+        data = {"range_start": self.time5.date(), "range_end": self.time5.date()}
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        ids = [row["id"] for row in response.data["result"]]
+        self.assertEqual(ids, [overnight.id])
+
+    def test_datetime_range_is_half_open(self):
+        """Verify that datetime bounds exclude shifts starting exactly at range_end."""
+        data = {
+            "range_start": self.time2.isoformat(),
+            "range_end": self.time3.isoformat(),
+        }
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        ids = [row["id"] for row in response.data["result"]]
+        self.assertNotIn(self.shift1.id, ids)
+        self.assertCountEqual(ids, [self.shift2.id, self.shift3.id, self.shift4.id])
+
     def test_within_user_workspaces(self):
         """Verify that shifts from workspaces the requester does not belong to are excluded."""
         self.workspace2 = Workspace.objects.create(owner=self.user4, created_by=self.user4)
@@ -0,0 +1,243 @@
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone as django_timezone
+from rest_framework.test import APITestCase
+from rest_framework import status
+from ....models import (
+    Workspace,
+    WorkspaceMember,
+    User,
+    MemberPermissions,
+    WorkspaceRole,
+    Shift,
+    ShiftTemplate,
+)
+
+
+class TemplateTestCase(APITestCase):
+    """Shared fixtures: a scheduler, a plain member and a role."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="testuser@example.com",
+            password="testpassword",
+            first_name="Test",
+            last_name="User",
+            phone="1234567890",
+        )
+        self.user2 = User.objects.create_user(
+            email="testuser2@example.com",
+            password="testpassword",
+            first_name="Test2",
+            last_name="User2",
+            phone="1234567890",
+        )
+        self.workspace = Workspace.objects.create(owner=self.user, created_by=self.user)
+        self.member = WorkspaceMember.objects.create(
+            user=self.user, workspace=self.workspace, added_by=self.user
+        )
+        MemberPermissions.objects.create(
+            workspace=self.workspace, member=self.member, manage_schedules=True
+        )
+        self.member2 = WorkspaceMember.objects.create(
+            user=self.user2, workspace=self.workspace, added_by=self.user
+        )
+        MemberPermissions.objects.create(workspace=self.workspace, member=self.member2)
+        self.role = WorkspaceRole.objects.create(workspace=self.workspace, name="test name")
+
+        self.today = django_timezone.localdate()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("workspace_templates", kwargs={"workspace_id": self.workspace.id})
+
+    def _template_data(self, **extra):
+        return {
+            "role_id": self.role.id,
+            "day_of_week": self.today.weekday(),
+            "start_time": "09:00",
+            "duration": "08:00:00",
+            "start_date": self.today.isoformat(),
+            **extra,
+        }
+
+
+@override_settings(SHIFT_TEMPLATE_HORIZON_DAYS=21)
+class CreateTemplateTests(TemplateTestCase):
+    """Integration tests for template creation."""
+
+    def test_create_materializes_horizon(self):
+        """Verify that a template creates shifts for the horizon only."""
+        response = self.client.post(
+            self.url, self._template_data(member_id=self.member2.id), format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        template = ShiftTemplate.objects.get(pk=response.data["result"]["id"])
+        self.assertEqual(template.materialized_until, self.today + timedelta(days=21))
+        shifts = Shift.objects.filter(template=template)
+        self.assertEqual(shifts.count(), 4)
+        self.assertTrue(all(shift.member_id == self.member2.id for shift in shifts))
+        self.assertFalse(any(shift.open for shift in shifts))
+
+    def test_create_with_timezone(self):
+        """Verify that occurrences start at the template's local time in its timezone."""
+        response = self.client.post(
+            self.url, self._template_data(timezone="America/New_York"), format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        template = ShiftTemplate.objects.get(pk=response.data["result"]["id"])
+        self.assertEqual(template.timezone, "America/New_York")
+        for shift in Shift.objects.filter(template=template):
+            local = shift.start_time.astimezone(ZoneInfo("America/New_York"))
+            self.assertEqual((local.hour, local.minute), (9, 0))
+
+    def test_create_opens_conflicting_occurrences(self):
+        """Verify that occurrences the member is already booked for are created open."""
+        start = django_timezone.make_aware(
+            datetime.combine(self.today + timedelta(days=7), time(12))
+        )
+        Shift.objects.create(
+            workspace=self.workspace,
+            member=self.member2,
+            role=self.role,
+            created_by=self.member,
+            start_time=start,
+            end_time=start + timedelta(hours=4),
+        )
+        response = self.client.post(
+            self.url, self._template_data(member_id=self.member2.id), format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        shifts = Shift.objects.filter(template_id=response.data["result"]["id"])
+        opened = shifts.filter(open=True)
+        self.assertEqual(opened.count(), 1)
+        self.assertIsNone(opened.get().member_id)
+        self.assertEqual(opened.get().start_time.date(), start.date())
+        self.assertEqual(shifts.filter(member=self.member2).count(), 3)
+
+    def test_invalid_data(self):
+        """Verify that missing fields, bad durations and inverted dates return 400."""
+        for data in (
+            {"role_id": self.role.id},
+            self._template_data(duration="25:00:00"),
+            self._template_data(duration="00:00:00"),
+            self._template_data(day_of_week=7),
+            self._template_data(timezone="Mars/Olympus_Mons"),
+            self._template_data(end_date=(self.today - timedelta(days=1)).isoformat()),
+        ):
+            response = self.client.post(self.url, data, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(ShiftTemplate.objects.exists())
+
+    def test_no_role(self):
+        """Verify that omitting role_id returns a 400 error."""
+        data = self._template_data()
+        del data["role_id"]
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_no_permissions(self):
+        """Verify that a member without manage_schedules receives 403."""
+        self.client.force_authenticate(user=self.user2)
+        response = self.client.post(self.url, self._template_data(), format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_list(self):
+        """Verify that members can list the workspace templates."""
+        self.client.post(self.url, self._template_data(), format="json")
+        self.client.force_authenticate(user=self.user2)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["result"]), 1)
+        self.assertEqual(response.data["result"][0]["role"]["id"], self.role.id)
+
+
+@override_settings(SHIFT_TEMPLATE_HORIZON_DAYS=7)
+class TemplateOccurrencesTests(TemplateTestCase):
+    """Integration tests for on-the-fly template occurrences."""
+
+    def setUp(self):
+        super().setUp()
+        self.client.post(self.url, self._template_data(), format="json")
+        self.occurrences_url = reverse(
+            "workspace_template_occurrences", kwargs={"workspace_id": self.workspace.id}
+        )
+
+    def test_far_future_window(self):
+        """Verify that occurrences past the horizon are returned without being saved."""
+        shift_count = Shift.objects.count()
+        first = self.today + timedelta(days=70)
+        last = first + timedelta(days=27)
+        response = self.client.get(
+            self.occurrences_url,
+            {"range_start": first.isoformat(), "range_end": last.isoformat()},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["result"]), 4)
+        self.assertIsNone(response.data["result"][0]["id"])
+        self.assertIsNotNone(response.data["result"][0]["template"])
+        self.assertEqual(Shift.objects.count(), shift_count)
+
+    def test_materialized_dates_excluded(self):
+        """Verify that occurrences inside the horizon come from the shifts endpoint instead."""
+        response = self.client.get(
+            self.occurrences_url,
+            {
+                "range_start": self.today.isoformat(),
+                "range_end": (self.today + timedelta(days=7)).isoformat(),
+            },
+        )
+        self.assertEqual(response.data["result"], [])
+
+    def test_range_required(self):
+        """Verify that a missing or oversized range returns 400."""
+        response = self.client.get(self.occurrences_url, {"range_start": "2026-01-01"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(
+            self.occurrences_url, {"range_start": "2026-01-01", "range_end": "2028-01-01"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@override_settings(SHIFT_TEMPLATE_HORIZON_DAYS=7)
+class TemplateViewTests(TemplateTestCase):
+    """Integration tests for retrieving and deleting a template."""
+
+    def setUp(self):
+        super().setUp()
+        data = self._template_data(start_date=(self.today - timedelta(days=14)).isoformat())
+        response = self.client.post(self.url, data, format="json")
+        self.template_url = reverse(
+            "template", kwargs={"template_id": response.data["result"]["id"]}
+        )
+
+    def test_get(self):
+        """Verify that members can retrieve a template."""
+        self.client.force_authenticate(user=self.user2)
+        response = self.client.get(self.template_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["result"]["duration"], "08:00:00")
+
+    def test_delete_keeps_past_shifts(self):
+        """Verify that deleting removes upcoming shifts and detaches past ones."""
+        now = django_timezone.now()
+        response = self.client.delete(self.template_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(ShiftTemplate.objects.exists())
+        self.assertFalse(Shift.objects.filter(start_time__gte=now).exists())
+        self.assertTrue(Shift.objects.filter(template__isnull=True).exists())
+
+    def test_delete_no_permissions(self):
+        """Verify that a member without manage_schedules cannot delete a template."""
+        self.client.force_authenticate(user=self.user2)
+        response = self.client.delete(self.template_url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_not_found(self):
+        """Verify that an unknown template_id returns 404."""
+        response = self.client.get(reverse("template", kwargs={"template_id": 999}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
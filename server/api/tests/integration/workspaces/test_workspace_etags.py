@@ -0,0 +1,150 @@
+from datetime import datetime, timedelta, timezone
+
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from ....models import (
+    Workspace,
+    WorkspaceMember,
+    User,
+    MemberPermissions,
+    WorkspaceRole,
+    MemberRole,
+    Shift,
+)
+
+
+class WorkspaceETagTests(APITestCase):
+    """Integration tests for conditional GETs of workspace shifts, members and roles."""
+
+    def setUp(self):
+        """Create a workspace with a member, a role and a shift."""
+        self.user = User.objects.create_user(
+            email="testuser@example.com",
+            password="testpassword",
+            first_name="Test",
+            last_name="User",
+            phone="1234567890",
+        )
+        self.workspace = Workspace.objects.create(owner=self.user, created_by=self.user)
+        self.member = WorkspaceMember.objects.create(
+            user=self.user, workspace=self.workspace, added_by=self.user
+        )
+        MemberPermissions.objects.create(
+            workspace=self.workspace, member=self.member, manage_schedules=True
+        )
+        self.role = WorkspaceRole.objects.create(workspace=self.workspace, name="test name")
+        start = datetime(2026, 1, 5, 9, tzinfo=timezone.utc)
+        self.shift = Shift.objects.create(
+            workspace=self.workspace,
+            member=self.member,
+            role=self.role,
+            created_by=self.member,
+            start_time=start,
+            end_time=start + timedelta(hours=8),
+        )
+
+        self.client.force_authenticate(user=self.user)
+        kwargs = {"workspace_id": self.workspace.id}
+        self.shifts_url = reverse("workspace_shifts", kwargs=kwargs)
+        self.members_url = reverse("workspace_members", kwargs=kwargs)
+        self.roles_url = reverse("workspace_roles", kwargs=kwargs)
+        self.params = {"range_start": "2026-01-01", "range_end": "2026-01-31"}
+
+    def revalidate(self, url, params=None):
+        """Fetch a collection, then repeat the request with its ETag."""
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response["ETag"]
+        return etag, self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+
+    def test_unchanged_collections_return_304(self):
+        """Verify that each collection answers a matching If-None-Match with 304."""
+        for url, params in (
+            (self.shifts_url, self.params),
+            (self.members_url, None),
+            (self.roles_url, None),
+        ):
+            etag, response = self.revalidate(url, params)
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+            self.assertEqual(response["ETag"], etag)
+            self.assertEqual(response.content, b"")
+
+    def test_304_skips_collection_query(self):
+        """Verify that a 304 is answered with only the membership and version lookups."""
+        etag = self.client.get(self.shifts_url, self.params)["ETag"]
+        with self.assertNumQueries(2):
+            response = self.client.get(self.shifts_url, self.params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_etag_depends_on_params(self):
+        """Verify that a different window or page is a different representation."""
+        etag = self.client.get(self.shifts_url, self.params)["ETag"]
+        response = self.client.get(
+            self.shifts_url, {**self.params, "page_size": 1}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_default_window_is_stable(self):
+        """Verify that polling without a range can be revalidated."""
+        _, response = self.revalidate(self.shifts_url)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_shift_write_changes_etag(self):
+        """Verify that editing a shift invalidates the shift list ETag."""
+        etag = self.client.get(self.shifts_url, self.params)["ETag"]
+        self.shift.open = True
+        self.shift.save()
+        response = self.client.get(self.shifts_url, self.params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_bulk_create_changes_etag(self):
+        """Verify that shifts created in bulk invalidate the shift list ETag."""
+        etag = self.client.get(self.shifts_url, self.params)["ETag"]
+        response = self.client.post(
+            reverse("workspace_shifts_bulk", kwargs={"workspace_id": self.workspace.id}),
+            {
+                "shifts": [
+                    {
+                        "role_id": self.role.id,
+                        "start_time": "2026-01-10T09:00:00Z",
+                        "end_time": "2026-01-10T17:00:00Z",
+                    }
+                ]
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        response = self.client.get(self.shifts_url, self.params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_member_role_and_name_changes_change_member_etag(self):
+        """Verify that role assignments and user names invalidate the member list ETag."""
+        etag = self.client.get(self.members_url)["ETag"]
+        MemberRole.objects.create(member=self.member, workspace_role=self.role)
+        response = self.client.get(self.members_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        etag = response["ETag"]
+        self.user.first_name = "Renamed"
+        self.user.save()
+        response = self.client.get(self.members_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["result"][0]["first_name"], "Renamed")
+
+    def test_role_write_changes_etag(self):
+        """Verify that renaming a role invalidates the role list ETag."""
+        etag = self.client.get(self.roles_url)["ETag"]
+        self.role.name = "renamed"
+        self.role.save()
+        response = self.client.get(self.roles_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_non_member_gets_403_not_304(self):
+        """Verify that the membership check runs before the ETag comparison."""
+        etag = self.client.get(self.roles_url)["ETag"]
+        outsider = User.objects.create_user(email="outsider@example.com", password="testpassword")
+        self.client.force_authenticate(user=outsider)
+        response = self.client.get(self.roles_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,76 @@
+import asyncio
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from ....events import get_backend
+from ....models import Workspace, WorkspaceMember, User
+
+
+class WorkspaceEventsTests(APITestCase):
+    """Integration tests for the workspace event stream."""
+
+    def setUp(self):
+        """Create a workspace member and an outsider."""
+        self.user = User.objects.create_user(
+            email="testuser@example.com",
+            password="testpassword",
+            first_name="Test",
+            last_name="User",
+            phone="1234567890",
+        )
+        self.outsider = User.objects.create_user(
+            email="outsider@example.com", password="testpassword"
+        )
+        self.workspace = Workspace.objects.create(owner=self.user, created_by=self.user)
+        WorkspaceMember.objects.create(user=self.user, workspace=self.workspace, added_by=self.user)
+        self.url = reverse("workspace_events", kwargs={"workspace_id": self.workspace.id})
+
+    def auth(self, user):
+        return {"headers": {"Authorization": f"Bearer {AccessToken.for_user(user)}"}}
+
+    async def test_stream_delivers_events(self):
+        """Verify that published events arrive on an open stream."""
+        response = await self.async_client.get(self.url, **self.auth(self.user))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+
+        content = aiter(response.streaming_content)
+        self.assertTrue((await anext(content)).startswith(b"retry: "))
+        get_backend().dispatch(self.workspace.id, {"type": "shift", "action": "saved", "ids": [7]})
+        self.assertEqual(
+            await anext(content),
+            b'event: shift\ndata: {"type":"shift","action":"saved","ids":[7]}\n\n',
+        )
+        self.assertEqual(get_backend().subscriber_count(self.workspace.id), 1)
+
+        # A client disconnect cancels the task streaming the response
+        waiting = asyncio.ensure_future(anext(content))
+        await asyncio.sleep(0)
+        waiting.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiting
+        self.assertEqual(get_backend().subscriber_count(self.workspace.id), 0)
+
+    async def test_requires_token(self):
+        """Verify that unauthenticated requests are rejected."""
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_non_member(self):
+        """Verify that non-members cannot open a stream."""
+        response = await self.async_client.get(self.url, **self.auth(self.outsider))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    async def test_missing_workspace(self):
+        """Verify that a missing workspace is reported as not found."""
+        url = reverse("workspace_events", kwargs={"workspace_id": 999})
+        response = await self.async_client.get(url, **self.auth(self.user))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_requires_asgi(self):
+        """Verify that a stream is refused instead of pinning a WSGI worker."""
+        response = self.client.get(self.url, **self.auth(self.user))
+        self.assertEqual(response.status_code, status.HTTP_501_NOT_IMPLEMENTED)
@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from ....models import (
+    Workspace,
+    WorkspaceMember,
+    User,
+    MemberPermissions,
+    WorkspaceRole,
+    Shift,
+)
+
+
+class WorkspaceLaborTests(APITestCase):
+    """Integration tests for the labor aggregation endpoint."""
+
+    def setUp(self):
+        """Create a scheduler, a plain member, a rated role and three shifts."""
+        self.user = User.objects.create_user(
+            email="testuser@example.com",
+            password="testpassword",
+            first_name="Test",
+            last_name="User",
+            phone="1234567890",
+        )
+        self.user2 = User.objects.create_user(
+            email="testuser2@example.com",
+            password="testpassword",
+            first_name="Test2",
+            last_name="User2",
+            phone="1234567890",
+        )
+        self.workspace = Workspace.objects.create(owner=self.user, created_by=self.user)
+        self.member = WorkspaceMember.objects.create(
+            user=self.user, workspace=self.workspace, added_by=self.user
+        )
+        MemberPermissions.objects.create(
+            workspace=self.workspace, member=self.member, manage_schedules=True
+        )
+        self.member2 = WorkspaceMember.objects.create(
+            user=self.user2, workspace=self.workspace, added_by=self.user, pay_rate=Decimal("30")
+        )
+        MemberPermissions.objects.create(workspace=self.workspace, member=self.member2)
+        self.role = WorkspaceRole.objects.create(
+            workspace=self.workspace, name="test name", pay_rate=Decimal("10")
+        )
+
+        start = datetime(2026, 1, 5, 9, tzinfo=timezone.utc)
+        for member, day in ((self.member, 0), (self.member2, 0), (self.member2, 8)):
+            Shift.objects.create(
+                workspace=self.workspace,
+                member=member,
+                role=self.role,
+                created_by=self.member,
+                start_time=start + timedelta(days=day),
+                end_time=start + timedelta(days=day, hours=8),
+            )
+
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("workspace_labor", kwargs={"workspace_id": self.workspace.id})
+        self.params = {"range_start": "2026-01-05", "range_end": "2026-01-18"}
+
+    def test_by_member(self):
+        """Verify that hours and cost are returned per member with totals."""
+        response = self.client.get(self.url, self.params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()["result"],
+            {
+                "rows": [
+                    {"member_id": self.member.id, "hours": 8.0, "cost": "80.00"},
+                    {"member_id": self.member2.id, "hours": 16.0, "cost": "480.00"},
+                ],
+                "total_hours": 24.0,
+                "total_cost": "560.00",
+            },
+        )
+
+    def test_by_week(self):
+        """Verify that week rows are keyed by their Monday."""
+        response = self.client.get(self.url, {**self.params, "group_by": "week"})
+        self.assertEqual(
+            [(row["week"], row["hours"]) for row in response.json()["result"]["rows"]],
+            [("2026-01-05", 16.0), ("2026-01-12", 8.0)],
+        )
+
+    def test_invalid_params(self):
+        """Verify that a missing range or unknown grouping returns 400."""
+        response = self.client.get(self.url, {"range_start": "2026-01-05"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(self.url, {**self.params, "group_by": "year"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_no_permissions(self):
+        """Verify that a member without manage_schedules receives 403."""
+        self.client.force_authenticate(user=self.user2)
+        response = self.client.get(self.url, self.params)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_from_rollup(self):
+        """Verify that source=rollup returns the same totals for whole weeks."""
+        params = {**self.params, "group_by": "week"}
+        response = self.client.get(self.url, params)
+        rollup_response = self.client.get(self.url, {**params, "source": "rollup"})
+        self.assertEqual(rollup_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(rollup_response.json()["result"], response.json()["result"])
+
+    def test_rollup_by_day(self):
+        """Verify that the rollup rejects day grouping."""
+        response = self.client.get(self.url, {**self.params, "group_by": "day", "source": "rollup"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -2,6 +2,7 @@ from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken
+from datetime import datetime, timedelta, timezone
 from ....models import (
     Workspace,
     WorkspaceMember,
@@ -311,7 +312,10 @@ class GetWorkspaceShiftsTests(APITestCase):
         )
 
         self.client.force_authenticate(user=self.user)
-        self.url = reverse("workspace_shifts", kwargs={"workspace_id": self.workspace.id})
+        self.url = (
+            reverse("workspace_shifts", kwargs={"workspace_id": self.workspace.id})
+            + "?range_start=2026-01-01&range_end=2026-01-31"
+        )
 
     def test_invalid_workspace(self):
         """Verify that a nonexistent workspace_id returns 404."""
@@ -357,6 +361,40 @@ class GetWorkspaceShiftsTests(APITestCase):
         self.assertEqual(result[0], expected_shift1)
         self.assertEqual(result[1], expected_shift2)
 
+    def test_get_shifts_paginated(self):
+        """Verify that page_size limits results and next_cursor returns the following page."""
+        response = self.client.get(self.url + "&page_size=1")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row["id"] for row in response.data["result"]], [self.shift1.id])
+        self.assertIsNotNone(response.data["next_cursor"])
+
+        response = self.client.get(self.url + "&page_size=1&cursor=" + response.data["next_cursor"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row["id"] for row in response.data["result"]], [self.shift2.id])
+        self.assertIsNone(response.data["next_cursor"])
+
+    def test_get_shifts_invalid_cursor(self):
+        """Verify that a malformed cursor returns 400."""
+        response = self.client.get(self.url + "&cursor=not-a-cursor")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_get_shifts_default_window(self):
+        """Verify that without a range only shifts near the current time are returned."""
+        now = datetime.now(timezone.utc)
+        current = Shift.objects.create(
+            workspace=self.workspace,
+            member=None,
+            role=self.role,
+            created_by=self.member,
+            start_time=now,
+            end_time=now + timedelta(hours=8),
+            open=True,
+        )
+        url = reverse("workspace_shifts", kwargs={"workspace_id": self.workspace.id})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row["id"] for row in response.data["result"]], [current.id])
+
     def test_get_shifts_empty(self):
         """Verify that an empty list is returned when no shifts exist in the workspace."""
         Shift.objects.all().delete()
@@ -0,0 +1,129 @@
+from datetime import datetime, timedelta, timezone
+
+from django.core.cache import caches
+from django.test import AsyncClient, override_settings
+from django.urls import reverse
+from rest_framework.test import APITransactionTestCase
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+from ....models import (
+    Workspace,
+    WorkspaceMember,
+    User,
+    MemberPermissions,
+    WorkspaceRole,
+    Shift,
+)
+
+
+@override_settings(DATABASE_REPLICAS=["replica"], DATABASE_QUERY_SPLIT_HEADER=True)
+class WorkspaceReplicaTests(APITransactionTestCase):
+    """Integration tests for routing read-only requests to a replica.
+
+    The "replica" alias mirrors the test database, so the X-Query-Split header
+    is what tells which alias served each request.
+    """
+
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        """Create a workspace with a scheduler and a plain member."""
+        caches["replica_pins"].clear()
+        self.user = User.objects.create_user(email="testuser@example.com", password="testpassword")
+        self.other = User.objects.create_user(email="other@example.com", password="testpassword")
+        self.workspace = Workspace.objects.create(owner=self.user, created_by=self.user)
+        self.member = WorkspaceMember.objects.create(
+            user=self.user, workspace=self.workspace, added_by=self.user
+        )
+        MemberPermissions.objects.create(
+            workspace=self.workspace, member=self.member, manage_schedules=True
+        )
+        WorkspaceMember.objects.create(
+            user=self.other, workspace=self.workspace, added_by=self.user
+        )
+        self.role = WorkspaceRole.objects.create(workspace=self.workspace, name="Cashier")
+        self.start = datetime(2026, 1, 5, 9, tzinfo=timezone.utc)
+        Shift.objects.create(
+            workspace=self.workspace,
+            member=self.member,
+            role=self.role,
+            created_by=self.member,
+            start_time=self.start,
+            end_time=self.start + timedelta(hours=8),
+        )
+
+        self.shifts_url = reverse("workspace_shifts", kwargs={"workspace_id": self.workspace.id})
+        self.params = {"range_start": "2026-01-01", "range_end": "2026-01-31"}
+
+    def query_split(self, response):
+        """Return the response's query counts as {alias: count}."""
+        pairs = [pair.split("=") for pair in response["X-Query-Split"].split(", ") if pair]
+        return {alias: int(count) for alias, count in pairs}
+
+    def get_shifts(self, user, count=1):
+        self.client.force_authenticate(user=user)
+        response = self.client.get(self.shifts_url, self.params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["result"]), count)
+        return self.query_split(response)
+
+    def create_shift(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(
+            self.shifts_url,
+            {
+                "role_id": self.role.id,
+                "start_time": (self.start + timedelta(days=1)).isoformat(),
+                "end_time": (self.start + timedelta(days=1, hours=8)).isoformat(),
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return self.query_split(response)
+
+    def test_get_reads_from_replica(self):
+        """Verify that a GET sends all of its queries to the replica."""
+        split = self.get_shifts(self.user)
+        self.assertNotIn("default", split)
+        self.assertGreater(split["replica"], 0)
+
+    def test_write_uses_primary(self):
+        """Verify that a request that writes reads and writes on the primary."""
+        split = self.create_shift()
+        self.assertNotIn("replica", split)
+
+    def test_writer_reads_own_writes_from_primary(self):
+        """Verify that after writing, the writer reads from the primary but others do not."""
+        self.create_shift()
+        self.assertNotIn("replica", self.get_shifts(self.user, count=2))
+        self.assertNotIn("default", self.get_shifts(self.other, count=2))
+
+    @override_settings(DATABASE_REPLICA_STICKY=timedelta(0))
+    def test_stickiness_expires(self):
+        """Verify that the writer returns to the replica once the sticky window ends."""
+        self.create_shift()
+        self.assertNotIn("default", self.get_shifts(self.user, count=2))
+
+    def test_shift_filter_reads_from_replica(self):
+        """Verify that the read-only filter POST is served by the replica."""
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(
+            reverse("shift_filter"), {"workspace_id": self.workspace.id}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("default", self.query_split(response))
+
+    async def test_async_views_read_from_replica(self):
+        """Verify that async views served by the ASGI handler also read from the replica."""
+        response = await AsyncClient().get(
+            self.shifts_url,
+            self.params,
+            headers={"Authorization": f"Bearer {AccessToken.for_user(self.user)}"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("default", self.query_split(response))
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_without_replicas_everything_uses_primary(self):
+        """Verify that with no replicas configured, GETs read from the primary."""
+        self.assertNotIn("replica", self.get_shifts(self.user))
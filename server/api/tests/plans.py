@@ -0,0 +1,140 @@
+"""Query plan checks for the API views and a test mixin enforcing them.
+
+Each query a view issues is run again under EXPLAIN (ANALYZE, BUFFERS) on
+Postgres. A query fails when it still sequentially scans one of the tables
+that grow with usage once sequential scans are disabled, which means no index
+serves it, or when its estimated total cost exceeds the stored baseline by
+more than PLAN_COST_TOLERANCE, so a plan that only stays fast on small tables
+fails the suite instead of an incident.
+"""
+
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connection, transaction
+
+# Tables that must always be read through an index
+INDEXED_TABLES = {"api_shift", "api_workspacemember"}
+
+# Estimated costs may grow by this factor before a plan is reported
+PLAN_COST_TOLERANCE = 1.25
+
+PLAN_BASELINES = Path(__file__).with_name("plan_baselines.json")
+
+
+def explain(sql: str, seqscan: bool = True) -> dict:
+    """Run a query under EXPLAIN (ANALYZE, BUFFERS) and return its plan.
+
+    With seqscan=False the planner only falls back to a sequential scan of a
+    table when no index can serve the query. Small tables are often cheapest
+    to read whole, so this shows whether an index exists at any size.
+
+    :param str sql: Executed SQL, with parameters interpolated.
+    :param bool seqscan: Whether the planner may choose sequential scans.
+    :return: The top plan node, with nested nodes under "Plans".
+    :rtype: dict
+    """
+    prefix = connection.ops.explain_query_prefix(format="json", analyze=True, buffers=True)
+    with transaction.atomic(), connection.cursor() as cursor:
+        if not seqscan:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        cursor.execute(f"{prefix} {sql}")
+        (result,) = cursor.fetchone()
+        # Rolling back the savepoint also reverts SET LOCAL
+        transaction.set_rollback(True)
+    if isinstance(result, str):
+        result = json.loads(result)
+    return result[0]["Plan"]
+
+
+def plan_nodes(plan: dict):
+    """Yield a plan node and all of the nodes below it.
+
+    :param dict plan: Plan node as returned by explain.
+    """
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def sequential_scans(plan: dict, tables=INDEXED_TABLES) -> list:
+    """Return the tables among tables that a plan reads with a sequential scan.
+
+    :param dict plan: Plan node as returned by explain.
+    :param tables: Names of the tables to look for.
+    :rtype: list
+    """
+    return [
+        node["Relation Name"]
+        for node in plan_nodes(plan)
+        if node["Node Type"] == "Seq Scan" and node.get("Relation Name") in tables
+    ]
+
+
+def load_plan_baselines() -> dict:
+    """Return the stored estimated costs keyed by "METHOD url_name #query".
+
+    :rtype: dict
+    """
+    if not PLAN_BASELINES.exists():
+        return {}
+    with open(PLAN_BASELINES) as file:
+        return json.load(file)
+
+
+def save_plan_baselines(costs: dict):
+    """Store estimated costs, keeping the baselines of queries not measured.
+
+    :param dict costs: Estimated total costs keyed like load_plan_baselines.
+    """
+    baselines = {**load_plan_baselines(), **costs}
+    with open(PLAN_BASELINES, "w") as file:
+        json.dump(dict(sorted(baselines.items())), file, indent=2)
+        file.write("\n")
+
+
+class QueryPlanMixin:
+    """Test case mixin asserting that a request's queries have acceptable plans.
+
+    Used with CaptureQueriesContext around the request. Costs measured while
+    QUERY_PLAN_UPDATE_BASELINES is enabled are collected in plan_costs for the
+    test to save instead of being compared.
+    """
+
+    plan_costs = None
+
+    def assertQueryPlans(self, name: str, queries):
+        """Assert the SELECT queries of a request have index plans and stay within cost.
+
+        :param str name: Request key, e.g. "GET workspace_shifts".
+        :param queries: Queries captured by CaptureQueriesContext.
+        """
+        update = getattr(settings, "QUERY_PLAN_UPDATE_BASELINES", False)
+        baselines = load_plan_baselines()
+        selects = [query["sql"] for query in queries if query["sql"].startswith("SELECT")]
+        for index, sql in enumerate(selects, start=1):
+            key = f"{name} #{index}"
+            indexed = explain(sql, seqscan=False)
+            scans = sequential_scans(indexed)
+            self.assertFalse(
+                scans,
+                f"{key} has no index plan for {scans}:\n{sql}\n{json.dumps(indexed, indent=2)}",
+            )
+
+            plan = explain(sql)
+            summary = json.dumps(plan, indent=2)
+
+            cost = plan["Total Cost"]
+            if update:
+                if self.plan_costs is None:
+                    self.plan_costs = {}
+                self.plan_costs[key] = cost
+            elif key in baselines:
+                limit = baselines[key] * PLAN_COST_TOLERANCE
+                self.assertLessEqual(
+                    cost,
+                    limit,
+                    f"{key} is estimated at {cost}, over its baseline of {baselines[key]}:\n"
+                    f"{sql}\n{summary}",
+                )
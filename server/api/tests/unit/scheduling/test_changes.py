@@ -0,0 +1,143 @@
+from datetime import datetime, timedelta, timezone
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone as django_timezone
+
+from ....models import (
+    Workspace,
+    WorkspaceMember,
+    User,
+    WorkspaceRole,
+    Shift,
+    ShiftTombstone,
+)
+from ....scheduling import (
+    CursorExpired,
+    decode_change_cursor,
+    encode_change_cursor,
+    prune_tombstones,
+    shift_changes,
+)
+
+
+@override_settings(SHIFT_CHANGES_SETTLE=timedelta(0))
+class ShiftChangesTest(TestCase):
+    """Test cases for the shift changes feed"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="test@example.com",
+            password="password123",
+            first_name="Test",
+            last_name="User",
+            phone="1234567890",
+        )
+        self.workspace = Workspace.objects.create(owner=self.user, created_by=self.user)
+        self.member = WorkspaceMember.objects.create(
+            user=self.user, workspace=self.workspace, added_by=self.user
+        )
+        self.role = WorkspaceRole.objects.create(workspace=self.workspace, name="Cashier")
+        self.start = datetime(2026, 1, 5, 9, tzinfo=timezone.utc)
+        self.shifts = [self.create_shift(day) for day in range(3)]
+
+    def create_shift(self, day, member=None):
+        return Shift.objects.create(
+            workspace=self.workspace,
+            member=member,
+            role=self.role,
+            created_by=self.member,
+            start_time=self.start + timedelta(days=day),
+            end_time=self.start + timedelta(days=day, hours=8),
+            open=member is None,
+        )
+
+    def sync(self, cursor=None, page_size=None):
+        """Follow the feed until has_more is false, collecting every change."""
+        shifts, deleted = [], []
+        while True:
+            changes = shift_changes(self.workspace.id, cursor, page_size)
+            shifts += [row["id"] for row in changes.shifts]
+            deleted += changes.deleted
+            cursor = changes.cursor
+            if not changes.has_more:
+                return shifts, deleted, cursor
+
+    def test_full_sync_returns_every_shift(self):
+        ShiftTombstone.objects.create(workspace=self.workspace, shift_id=999)
+        shifts, deleted, _ = self.sync()
+        self.assertEqual(shifts, [shift.id for shift in self.shifts])
+        self.assertEqual(deleted, [])
+
+    def test_paging_covers_every_shift_once(self):
+        shifts, _, _ = self.sync(page_size=2)
+        self.assertEqual(shifts, [shift.id for shift in self.shifts])
+
+    def test_incremental_changes(self):
+        _, _, cursor = self.sync()
+        self.assertEqual(self.sync(cursor)[:2], ([], []))
+
+        self.shifts[1].member = self.member
+        self.shifts[1].save()
+        added = self.create_shift(5)
+        deleted_id = self.shifts[0].id
+        self.shifts[0].delete()
+
+        shifts, deleted, cursor = self.sync(cursor, page_size=1)
+        self.assertEqual(shifts, [self.shifts[1].id, added.id])
+        self.assertEqual(deleted, [deleted_id])
+        self.assertEqual(self.sync(cursor)[:2], ([], []))
+
+    def test_cascaded_deletes_are_recorded(self):
+        self.create_shift(4, member=self.member)
+        _, _, cursor = self.sync()
+        # the member created every shift, so all of them cascade
+        shift_ids = list(Shift.objects.values_list("id", flat=True))
+        self.member.delete()
+        _, deleted, _ = self.sync(cursor)
+        self.assertEqual(sorted(deleted), sorted(shift_ids))
+
+    def test_cascaded_deletes_are_set_based(self):
+        for day in range(200):
+            self.create_shift(day, member=self.member)
+        version = Workspace.objects.get().version
+        with CaptureQueriesContext(connection) as queries:
+            self.member.delete()
+        self.assertLess(len(queries), 30, [query["sql"] for query in queries])
+        self.assertEqual(ShiftTombstone.objects.count(), 203)
+        self.assertEqual(Workspace.objects.get().version, version + 1)
+
+    def test_queryset_deletes_are_recorded(self):
+        _, _, cursor = self.sync()
+        Shift.objects.filter(pk__in=[shift.id for shift in self.shifts[1:]]).delete()
+        _, deleted, _ = self.sync(cursor)
+        self.assertEqual(sorted(deleted), [shift.id for shift in self.shifts[1:]])
+
+    def test_workspace_delete_leaves_no_tombstones(self):
+        self.workspace.delete()
+        self.assertFalse(ShiftTombstone.objects.exists())
+
+    @override_settings(SHIFT_CHANGES_SETTLE=timedelta(hours=1))
+    def test_recent_changes_are_held_back(self):
+        shifts, _, _ = self.sync()
+        self.assertEqual(shifts, [])
+
+    def test_expired_cursor(self):
+        cursor = encode_change_cursor(django_timezone.now() - timedelta(days=365), 0, 0)
+        with self.assertRaises(CursorExpired):
+            shift_changes(self.workspace.id, cursor)
+
+    def test_idle_cursor_advances(self):
+        _, _, cursor = self.sync()
+        _, _, idle = self.sync(cursor)
+        self.assertGreaterEqual(decode_change_cursor(idle)[0], decode_change_cursor(cursor)[0])
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(ValueError):
+            shift_changes(self.workspace.id, "not-a-cursor")
+
+    def test_prune_tombstones(self):
+        self.shifts[0].delete()
+        self.assertEqual(prune_tombstones(django_timezone.now() - timedelta(days=1)), 0)
+        self.assertEqual(prune_tombstones(django_timezone.now() + timedelta(seconds=1)), 1)
@@ -0,0 +1,120 @@
+from datetime import date, datetime, timedelta, timezone
+
+from django.test import TestCase
+
+from ....models import (
+    Workspace,
+    WorkspaceMember,
+    User,
+    WorkspaceRole,
+    Shift,
+    TimeOffRequest,
+    Unavailability,
+)
+from ....scheduling import Conflict, ConflictIndex, find_conflicts
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+class ConflictTest(TestCase):
+    """Test cases for ConflictIndex and find_conflicts"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="test@example.com",
+            password="password123",
+            first_name="Test",
+            last_name="User",
+            phone="1234567890",
+        )
+        self.workspace = Workspace.objects.create(owner=self.user, created_by=self.user)
+        self.member = WorkspaceMember.objects.create(
+            user=self.user, workspace=self.workspace, added_by=self.user
+        )
+        self.role = WorkspaceRole.objects.create(workspace=self.workspace, name="Cashier")
+        # Monday 2026-01-05 09:00-17:00
+        self.shift = Shift.objects.create(
+            workspace=self.workspace,
+            member=self.member,
+            role=self.role,
+            created_by=self.member,
+            start_time=utc(2026, 1, 5, 9),
+            end_time=utc(2026, 1, 5, 17),
+        )
+
+    def test_double_booking(self):
+        """Test that overlapping shifts conflict and adjacent ones do not"""
+        self.assertEqual(
+            find_conflicts(self.member.id, utc(2026, 1, 5, 16), utc(2026, 1, 5, 20)),
+            [Conflict("shift", self.shift.id)],
+        )
+        self.assertEqual(
+            find_conflicts(self.member.id, utc(2026, 1, 5, 17), utc(2026, 1, 5, 20)), []
+        )
+
+    def test_ignore_shift(self):
+        """Test that a shift being edited does not conflict with itself"""
+        self.assertEqual(
+            find_conflicts(
+                self.member.id,
+                utc(2026, 1, 5, 10),
+                utc(2026, 1, 5, 18),
+                ignore_shift=self.shift.id,
+            ),
+            [],
+        )
+
+    def test_approved_time_off(self):
+        """Test that only approved time off conflicts, for whole days"""
+        request = TimeOffRequest.objects.create(
+            member=self.member,
+            workspace=self.workspace,
+            start_date=date(2026, 1, 7),
+            end_date=date(2026, 1, 8),
+            approved=True,
+        )
+        TimeOffRequest.objects.create(
+            member=self.member,
+            workspace=self.workspace,
+            start_date=date(2026, 1, 10),
+            end_date=date(2026, 1, 10),
+        )
+        self.assertEqual(
+            find_conflicts(self.member.id, utc(2026, 1, 8, 22), utc(2026, 1, 9, 2)),
+            [Conflict("time_off", request.id)],
+        )
+        self.assertEqual(
+            find_conflicts(self.member.id, utc(2026, 1, 10, 9), utc(2026, 1, 10, 17)), []
+        )
+
+    def test_weekly_unavailability(self):
+        """Test that unavailability repeats on its weekday, including overnight windows"""
+        # Tuesdays 18:00 to 02:00 the next morning
+        unavailable = Unavailability.objects.create(
+            member=self.member,
+            day_of_week=1,
+            start_time=utc(2026, 1, 6, 18),
+            end_time=utc(2026, 1, 6, 2),
+        )
+        self.assertEqual(
+            find_conflicts(self.member.id, utc(2026, 3, 4, 0), utc(2026, 3, 4, 4)),
+            [Conflict("unavailability", unavailable.id)],
+        )
+        self.assertEqual(
+            find_conflicts(self.member.id, utc(2026, 3, 3, 9), utc(2026, 3, 3, 17)), []
+        )
+
+    def test_batch_sees_earlier_items(self):
+        """Test that added shifts conflict with later checks and loading is three queries"""
+        start = utc(2026, 1, 12, 9)
+        with self.assertNumQueries(3):
+            index = ConflictIndex.load([self.member.id], start, start + timedelta(days=7))
+        with self.assertNumQueries(0):
+            self.assertEqual(index.conflicts(self.member.id, start, start + timedelta(hours=8)), [])
+            index.add(self.member.id, start, start + timedelta(hours=8))
+            self.assertEqual(
+                index.conflicts(self.member.id, start, start + timedelta(hours=4)),
+                [Conflict("shift")],
+            )
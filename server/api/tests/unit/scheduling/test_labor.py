@@ -0,0 +1,154 @@
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from django.test import TestCase
+
+from ....models import (
+    Workspace,
+    WorkspaceMember,
+    User,
+    WorkspaceRole,
+    Shift,
+)
+from ....exports import export_rows
+from ....scheduling import labor_summary, rollup_summary
+from ....utils import DurationSeconds
+
+
+class LaborSummaryTest(TestCase):
+    """Test cases for labor_summary and DurationSeconds"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="test@example.com",
+            password="password123",
+            first_name="Test",
+            last_name="User",
+            phone="1234567890",
+        )
+        self.user2 = User.objects.create_user(
+            email="test2@example.com",
+            password="password123",
+            first_name="Test2",
+            last_name="User2",
+            phone="1234567890",
+        )
+        self.workspace = Workspace.objects.create(owner=self.user, created_by=self.user)
+        # member has its own rate, member2 falls back to the role's
+        self.member = WorkspaceMember.objects.create(
+            user=self.user, workspace=self.workspace, added_by=self.user, pay_rate=Decimal("20")
+        )
+        self.member2 = WorkspaceMember.objects.create(
+            user=self.user2, workspace=self.workspace, added_by=self.user
+        )
+        self.role = WorkspaceRole.objects.create(
+            workspace=self.workspace, name="Cashier", pay_rate=Decimal("15.50")
+        )
+        self.unrated = WorkspaceRole.objects.create(workspace=self.workspace, name="Volunteer")
+
+        self.start = datetime(2026, 1, 5, tzinfo=timezone.utc)
+        for member, role, day, hours in (
+            (self.member, self.role, 0, 8),
+            (self.member, self.role, 1, 4.5),
+            (self.member2, self.role, 0, 6),
+            (self.member2, self.unrated, 7, 2),
+            (None, self.role, 2, 3),
+        ):
+            shift_start = self.start + timedelta(days=day, hours=9)
+            Shift.objects.create(
+                workspace=self.workspace,
+                member=member,
+                role=role,
+                created_by=self.member,
+                start_time=shift_start,
+                end_time=shift_start + timedelta(hours=hours),
+                open=member is None,
+            )
+
+    def summary(self, group_by):
+        return labor_summary(
+            self.workspace.id, self.start, self.start + timedelta(days=14), group_by
+        )
+
+    def test_duration_seconds(self):
+        """Test that the database computes shift lengths in seconds"""
+        seconds = (
+            Shift.objects.annotate(seconds=DurationSeconds("start_time", "end_time"))
+            .order_by("start_time", "id")
+            .values_list("seconds", flat=True)
+        )
+        self.assertEqual(list(seconds), [28800, 21600, 16200, 10800, 7200])
+
+    def test_by_member_single_query(self):
+        """Test that per-member totals use the effective rate and one query"""
+        with self.assertNumQueries(1):
+            rows = self.summary("member")
+        self.assertEqual(
+            rows,
+            [
+                {"member_id": self.member.id, "hours": 12.5, "cost": Decimal("250.00")},
+                {"member_id": self.member2.id, "hours": 8.0, "cost": Decimal("93.00")},
+                {"member_id": None, "hours": 3.0, "cost": Decimal("46.50")},
+            ],
+        )
+
+    def test_by_role(self):
+        """Test that shifts without any rate add hours but no cost"""
+        rows = self.summary("role")
+        self.assertEqual(
+            rows[1], {"role_id": self.unrated.id, "hours": 2.0, "cost": Decimal("0.00")}
+        )
+
+    def test_by_day_and_week(self):
+        """Test grouping by start date and by Monday-based week"""
+        self.assertEqual(
+            [(row["date"], row["hours"]) for row in self.summary("day")],
+            [
+                (date(2026, 1, 5), 14.0),
+                (date(2026, 1, 6), 4.5),
+                (date(2026, 1, 7), 3.0),
+                (date(2026, 1, 12), 2.0),
+            ],
+        )
+        self.assertEqual(
+            [(row["week"], row["hours"]) for row in self.summary("week")],
+            [(date(2026, 1, 5), 21.5), (date(2026, 1, 12), 2.0)],
+        )
+
+    def test_range_by_start_time(self):
+        """Test that only shifts starting inside the range count"""
+        rows = labor_summary(
+            self.workspace.id, self.start, self.start + timedelta(days=1, hours=10), "member"
+        )
+        self.assertEqual(sum(row["hours"] for row in rows), 18.5)
+
+    def test_cost_agrees_with_rollup_and_export(self):
+        """Test that uneven rates and lengths give the same cents in every report"""
+        self.member.pay_rate = Decimal("17.33")
+        self.member.save()
+        shift_start = self.start + timedelta(days=3, hours=9)
+        for n in range(40):
+            Shift.objects.create(
+                workspace=self.workspace,
+                member=self.member,
+                role=self.role,
+                created_by=self.member,
+                start_time=shift_start + timedelta(minutes=n),
+                end_time=shift_start + timedelta(hours=7, minutes=13 + 2 * n, seconds=7),
+            )
+
+        summary = self.summary("member")
+        self.assertIsInstance(summary[0]["cost"], Decimal)
+        rollup = rollup_summary(self.workspace.id, date(2026, 1, 5), date(2026, 1, 12), "member")
+        self.assertEqual([row["cost"] for row in summary], [row["cost"] for row in rollup])
+        exported = sum(
+            row[-1]
+            for row in export_rows(self.workspace.id)
+            if row[4] == self.member.id and row[-1] is not None
+        )
+        self.assertEqual(summary[0]["cost"], exported.quantize(Decimal("0.01")))
+
+    def test_invalid_grouping(self):
+        """Test that unknown groupings raise ValueError"""
+        with self.assertRaises(ValueError):
+            self.summary("month")
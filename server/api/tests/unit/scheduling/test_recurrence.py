@@ -0,0 +1,176 @@
+from datetime import date, datetime, time, timedelta, timezone
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from ....models import (
+    Workspace,
+    WorkspaceMember,
+    User,
+    WorkspaceRole,
+    Shift,
+    ShiftTemplate,
+    TimeOffRequest,
+)
+from ....scheduling import occurrence_dates, build_shift, materialize, materialize_all, expand
+
+
+class RecurrenceTestCase(TestCase):
+    """Shared fixtures: a workspace with a Monday 09:00-17:00 template starting 2026-01-05."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="test@example.com",
+            password="password123",
+            first_name="Test",
+            last_name="User",
+            phone="1234567890",
+        )
+        self.workspace = Workspace.objects.create(owner=self.user, created_by=self.user)
+        self.member = WorkspaceMember.objects.create(
+            user=self.user, workspace=self.workspace, added_by=self.user
+        )
+        self.role = WorkspaceRole.objects.create(workspace=self.workspace, name="Cashier")
+        self.template = ShiftTemplate.objects.create(
+            workspace=self.workspace,
+            role=self.role,
+            created_by=self.member,
+            day_of_week=0,
+            start_time=time(9),
+            duration=timedelta(hours=8),
+            start_date=date(2026, 1, 5),
+        )
+
+
+class OccurrenceDatesTest(RecurrenceTestCase):
+    """Test cases for occurrence_dates and build_shift"""
+
+    def test_weekly_dates(self):
+        """Test that occurrences fall on the template weekday within the range"""
+        dates = list(occurrence_dates(self.template, date(2026, 1, 1), date(2026, 1, 31)))
+        self.assertEqual(dates, [date(2026, 1, d) for d in (5, 12, 19, 26)])
+
+    def test_bounded_by_end_date(self):
+        """Test that no occurrence is produced after end_date"""
+        self.template.end_date = date(2026, 1, 15)
+        dates = list(occurrence_dates(self.template, date(2026, 1, 1), date(2026, 1, 31)))
+        self.assertEqual(dates, [date(2026, 1, 5), date(2026, 1, 12)])
+
+    def test_build_shift(self):
+        """Test that a built shift carries the template's time, role and open state"""
+        shift = build_shift(self.template, date(2026, 1, 5))
+        self.assertEqual(shift.start_time, datetime(2026, 1, 5, 9, tzinfo=timezone.utc))
+        self.assertEqual(shift.end_time, datetime(2026, 1, 5, 17, tzinfo=timezone.utc))
+        self.assertEqual(shift.role_id, self.role.id)
+        self.assertTrue(shift.open)
+
+    def test_build_shift_keeps_local_time_across_dst(self):
+        """Test that occurrences keep their wall-clock start when the offset changes"""
+        self.template.timezone = "Europe/Paris"
+        self.template.start_time = time(20)
+        winter = build_shift(self.template, date(2026, 3, 23))
+        summer = build_shift(self.template, date(2026, 3, 30))
+        self.assertEqual(winter.start_time, datetime(2026, 3, 23, 19, tzinfo=timezone.utc))
+        self.assertEqual(summer.start_time, datetime(2026, 3, 30, 18, tzinfo=timezone.utc))
+        self.assertEqual(summer.end_time - summer.start_time, timedelta(hours=8))
+
+
+class MaterializeTest(RecurrenceTestCase):
+    """Test cases for materialize and materialize_all"""
+
+    def test_materialize_up_to_date(self):
+        """Test that shifts are created through the given date and the watermark advances"""
+        self.assertEqual(materialize(self.template, date(2026, 1, 19)), 3)
+        self.assertEqual(Shift.objects.filter(template=self.template).count(), 3)
+        self.template.refresh_from_db()
+        self.assertEqual(self.template.materialized_until, date(2026, 1, 19))
+
+    def test_materialize_is_incremental(self):
+        """Test that a second call only expands dates after the watermark"""
+        materialize(self.template, date(2026, 1, 19))
+        with self.assertNumQueries(0):
+            self.assertEqual(materialize(self.template, date(2026, 1, 19)), 0)
+        self.assertEqual(materialize(self.template, date(2026, 2, 2)), 2)
+        self.assertEqual(Shift.objects.filter(template=self.template).count(), 5)
+
+    def test_materialize_skips_existing_rows(self):
+        """Test that occurrences already saved are not duplicated"""
+        materialize(self.template, date(2026, 1, 19))
+        ShiftTemplate.objects.filter(pk=self.template.pk).update(materialized_until=None)
+        self.template.refresh_from_db()
+        materialize(self.template, date(2026, 1, 19))
+        self.assertEqual(Shift.objects.filter(template=self.template).count(), 3)
+
+    def test_materialize_opens_conflicting_occurrences(self):
+        """Test that occurrences over the member's time off or shifts are left open"""
+        self.template.member = self.member
+        self.template.save()
+        TimeOffRequest.objects.create(
+            member=self.member,
+            workspace=self.workspace,
+            approved_by=self.member,
+            start_date=date(2026, 1, 12),
+            end_date=date(2026, 1, 12),
+            approved=True,
+        )
+        Shift.objects.create(
+            workspace=self.workspace,
+            member=self.member,
+            role=self.role,
+            created_by=self.member,
+            start_time=datetime(2026, 1, 19, 16, tzinfo=timezone.utc),
+            end_time=datetime(2026, 1, 19, 20, tzinfo=timezone.utc),
+        )
+
+        self.assertEqual(materialize(self.template, date(2026, 1, 26)), 4)
+        shifts = Shift.objects.filter(template=self.template).order_by("start_time")
+        self.assertEqual(
+            [shift.member_id for shift in shifts], [self.member.id, None, None, self.member.id]
+        )
+        self.assertEqual([shift.open for shift in shifts], [False, True, True, False])
+
+    def test_materialize_all(self):
+        """Test that every template behind the horizon is extended, once"""
+        self.assertEqual(materialize_all(date(2026, 1, 12)), 2)
+        self.assertEqual(materialize_all(date(2026, 1, 12)), 0)
+
+    def test_materialize_all_skips_ended_templates(self):
+        """Test that templates whose end_date is materialized are not loaded again"""
+        self.template.end_date = date(2026, 1, 12)
+        self.template.save()
+        materialize_all(date(2026, 1, 31))
+        with self.assertNumQueries(1):
+            self.assertEqual(materialize_all(date(2026, 3, 31)), 0)
+
+    @override_settings(SHIFT_TEMPLATE_HORIZON_DAYS=14)
+    def test_command(self):
+        """Test that materialize_shifts expands templates through --until"""
+        out = StringIO()
+        call_command("materialize_shifts", until="2026-01-19", stdout=out)
+        self.assertIn("Materialized 3 shift(s) through 2026-01-19.", out.getvalue())
+
+
+class ExpandTest(RecurrenceTestCase):
+    """Test cases for expand"""
+
+    def test_expand_does_not_save(self):
+        """Test that occurrences overlapping the range are returned unsaved"""
+        start = datetime(2026, 1, 12, 12, tzinfo=timezone.utc)
+        end = datetime(2026, 1, 26, 9, tzinfo=timezone.utc)
+        shifts = expand([self.template], start, end)
+        self.assertEqual(
+            [shift.start_time.day for shift in shifts], [12, 19]
+        )  # 26th starts at the exclusive end
+        self.assertTrue(all(shift.pk is None for shift in shifts))
+        self.assertFalse(Shift.objects.exists())
+
+    def test_expand_skips_materialized_dates(self):
+        """Test that occurrences with Shift rows are left out"""
+        materialize(self.template, date(2026, 1, 12))
+        shifts = expand(
+            [self.template],
+            datetime(2026, 1, 1, tzinfo=timezone.utc),
+            datetime(2026, 2, 1, tzinfo=timezone.utc),
+        )
+        self.assertEqual([shift.start_time.day for shift in shifts], [19, 26])
@@ -0,0 +1,205 @@
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from ....models import (
+    Workspace,
+    WorkspaceMember,
+    User,
+    WorkspaceRole,
+    MemberRole,
+    Shift,
+    ShiftTemplate,
+    LaborRollup,
+)
+from ....scheduling import (
+    add_shifts,
+    apply_autofill,
+    autofill,
+    check_rollup,
+    labor_summary,
+    materialize,
+    rollup_summary,
+    week_start,
+)
+
+MONDAY = datetime(2026, 1, 5, 9, tzinfo=timezone.utc)
+
+
+class LaborRollupTest(TestCase):
+    """Test cases for incremental LaborRollup maintenance"""
+
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(
+                email=f"user{i}@example.com",
+                password="password123",
+                first_name="Test",
+                last_name=str(i),
+                phone="1234567890",
+            )
+            for i in range(3)
+        ]
+        self.workspace = Workspace.objects.create(owner=self.users[0], created_by=self.users[0])
+        self.owner, self.member, self.member2 = [
+            WorkspaceMember.objects.create(
+                user=user, workspace=self.workspace, added_by=self.users[0]
+            )
+            for user in self.users
+        ]
+        self.member.pay_rate = Decimal("20")
+        self.member.save()
+        self.role = WorkspaceRole.objects.create(
+            workspace=self.workspace, name="Cashier", pay_rate=Decimal("15")
+        )
+
+    def create_shift(self, member, start=MONDAY, hours=8, created_by=None):
+        return Shift.objects.create(
+            workspace=self.workspace,
+            member=member,
+            role=self.role,
+            created_by=created_by or self.owner,
+            start_time=start,
+            end_time=start + timedelta(hours=hours),
+            open=member is None,
+        )
+
+    def rollup(self):
+        return list(
+            LaborRollup.objects.filter(seconds__gt=0)
+            .order_by("week_start", "member_id")
+            .values_list("member_id", "week_start", "seconds", "cost")
+        )
+
+    def test_week_start(self):
+        """Test that weeks start on Monday"""
+        self.assertEqual(week_start(MONDAY + timedelta(days=6)), date(2026, 1, 5))
+        self.assertEqual(week_start(MONDAY + timedelta(days=7)), date(2026, 1, 12))
+
+    def test_create(self):
+        """Test that a new shift adds its seconds and cost at the effective rate"""
+        self.create_shift(self.member)
+        self.create_shift(self.member2, hours=4)
+        self.assertEqual(
+            self.rollup(),
+            [
+                (self.member.id, date(2026, 1, 5), 28800, Decimal("160")),
+                (self.member2.id, date(2026, 1, 5), 14400, Decimal("60")),
+            ],
+        )
+
+    def test_edit_moves_contribution(self):
+        """Test that reassigning and moving a shift moves its contribution"""
+        shift = self.create_shift(self.member)
+        shift.member = self.member2
+        shift.start_time += timedelta(days=7)
+        shift.end_time += timedelta(days=7, hours=1)
+        shift.save()
+        self.assertEqual(
+            self.rollup(), [(self.member2.id, date(2026, 1, 12), 32400, Decimal("135"))]
+        )
+        self.assertEqual(check_rollup(), [])
+
+    def test_delete(self):
+        """Test that deleting a shift subtracts it"""
+        self.create_shift(self.member).delete()
+        self.assertEqual(self.rollup(), [])
+        self.assertEqual(check_rollup(), [])
+
+    def test_cascade_delete(self):
+        """Test that cascades from member deletion keep the rollup consistent"""
+        self.create_shift(self.member)
+        # created_by member2, assigned to member: cascades when member2 is deleted
+        self.create_shift(self.member, start=MONDAY + timedelta(days=1), created_by=self.member2)
+        self.create_shift(self.member2, start=MONDAY + timedelta(days=2))
+        self.member2.delete()
+        self.assertEqual(self.rollup(), [(self.member.id, date(2026, 1, 5), 28800, Decimal("160"))])
+        self.assertEqual(check_rollup(), [])
+
+        self.role.delete()
+        self.assertFalse(LaborRollup.objects.exists())
+
+    def test_pay_rate_change(self):
+        """Test that changing a pay rate re-costs the rows it applies to"""
+        self.create_shift(self.member2)
+        self.role.pay_rate = Decimal("10")
+        self.role.save()
+        self.assertEqual(self.rollup(), [(self.member2.id, date(2026, 1, 5), 28800, Decimal("80"))])
+        self.member2.pay_rate = Decimal("12.50")
+        self.member2.save()
+        self.assertEqual(check_rollup(), [])
+
+    def test_bulk_paths(self):
+        """Test that bulk creation, materialization and autofill update the rollup"""
+        created = Shift.objects.bulk_create(
+            [
+                Shift(
+                    workspace=self.workspace,
+                    role=self.role,
+                    created_by=self.owner,
+                    start_time=MONDAY + timedelta(days=day),
+                    end_time=MONDAY + timedelta(days=day, hours=8),
+                    open=True,
+                )
+                for day in range(3)
+            ]
+        )
+        add_shifts(shift.id for shift in created)
+        self.assertEqual(check_rollup(), [])
+
+        MemberRole.objects.create(member=self.member, workspace_role=self.role)
+        apply_autofill(autofill(self.workspace.id, MONDAY, MONDAY + timedelta(days=7)))
+        self.assertEqual(self.rollup(), [(self.member.id, date(2026, 1, 5), 86400, Decimal("480"))])
+        self.assertEqual(check_rollup(), [])
+
+        template = ShiftTemplate.objects.create(
+            workspace=self.workspace,
+            role=self.role,
+            created_by=self.owner,
+            day_of_week=4,
+            start_time=time(9),
+            duration=timedelta(hours=6),
+            start_date=date(2026, 1, 5),
+        )
+        materialize(template, date(2026, 1, 31))
+        self.assertEqual(check_rollup(), [])
+
+    def test_rollup_summary_matches_shifts(self):
+        """Test that weekly reads from the rollup agree with aggregating shifts"""
+        for day in (0, 3, 8, 15):
+            self.create_shift(self.member, start=MONDAY + timedelta(days=day))
+        self.create_shift(self.member2, start=MONDAY + timedelta(days=9))
+        self.create_shift(None, start=MONDAY + timedelta(days=10))
+
+        for group_by in ("member", "role", "week"):
+            with self.assertNumQueries(1):
+                rows = rollup_summary(
+                    self.workspace.id, date(2026, 1, 5), date(2026, 1, 19), group_by
+                )
+            self.assertEqual(
+                rows,
+                labor_summary(
+                    self.workspace.id,
+                    MONDAY - timedelta(hours=9),
+                    MONDAY + timedelta(days=21),
+                    group_by,
+                ),
+            )
+
+    def test_command(self):
+        """Test that rebuild_labor_rollup --check reports drift and a rebuild fixes it"""
+        self.create_shift(self.member)
+        LaborRollup.objects.update(seconds=1)
+        out = StringIO()
+        with self.assertRaises(CommandError):
+            call_command("rebuild_labor_rollup", check=True, stdout=out)
+        self.assertIn("expected (28800", out.getvalue())
+
+        call_command("rebuild_labor_rollup", stdout=out)
+        self.assertIn("Rebuilt 1 labor rollup row(s).", out.getvalue())
+        call_command("rebuild_labor_rollup", check=True, workspace=self.workspace.id, stdout=out)
+        self.assertIn("Labor rollup matches shifts.", out.getvalue())
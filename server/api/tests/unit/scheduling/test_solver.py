@@ -0,0 +1,186 @@
+import time
+from datetime import date, datetime, timedelta, timezone
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+
+from ....models import (
+    Workspace,
+    WorkspaceMember,
+    User,
+    WorkspaceRole,
+    MemberRole,
+    Shift,
+    TimeOffRequest,
+)
+from ....scheduling import apply_autofill, autofill
+from ....scheduling.solver import Solver
+
+BASE = datetime(2026, 1, 5, tzinfo=timezone.utc)
+
+
+def shift(shift_id, day, hour, hours=8):
+    start = BASE + timedelta(days=day, hours=hour)
+    return (shift_id, start, start + timedelta(hours=hours))
+
+
+class SolverTest(SimpleTestCase):
+    """Test cases for the in-memory Solver"""
+
+    def test_balances_hours(self):
+        """Test that shifts are spread across equally eligible members"""
+        shifts = [shift(i, i, 9) for i in range(6)]
+        solver = Solver(shifts, [0b111] * 6, [0, 0, 0])
+        solver.greedy()
+        solver.improve(time.monotonic() + 5)
+        self.assertEqual(sorted(solver.worked), [2 * 8 * 3600] * 3)
+
+    def test_respects_existing_hours(self):
+        """Test that members who already work in the range get fewer shifts"""
+        solver = Solver([shift(1, 0, 9), shift(2, 1, 9)], [0b11] * 2, [40 * 3600, 0])
+        solver.greedy()
+        solver.improve(time.monotonic() + 5)
+        self.assertEqual(solver.assigned, [1, 1])
+
+    def test_no_overlapping_assignments(self):
+        """Test that one member never gets two overlapping shifts"""
+        solver = Solver([shift(1, 0, 9), shift(2, 0, 12)], [0b1, 0b1], [0])
+        solver.greedy()
+        solver.improve(time.monotonic() + 5)
+        self.assertEqual(solver.assigned.count(None), 1)
+
+    def test_augment_fills_blocked_shift(self):
+        """Test that local search moves a shift to free a member for a harder one"""
+        # Shift 0 can go to either member, shift 1 only to member 0; both overlap.
+        solver = Solver([shift(1, 0, 9), shift(2, 0, 10)], [0b11, 0b01], [0, 0])
+        solver.assign(0, 0)
+        solver.improve(time.monotonic() + 5)
+        self.assertEqual(solver.assigned, [1, 0])
+
+    def test_time_budget(self):
+        """Test that search stops at the deadline and reports it"""
+        shifts = [shift(i, i % 28, 9) for i in range(500)]
+        solver = Solver(shifts, [(1 << 50) - 1] * 500, [0] * 50)
+        solver.greedy()
+        iterations, complete = solver.improve(time.monotonic() - 1)
+        self.assertFalse(complete)
+        self.assertEqual(iterations, 0)
+        self.assertTrue(all(member is not None for member in solver.assigned))
+
+
+class AutofillTest(TestCase):
+    """Test cases for autofill, apply_autofill and the autofill_shifts command"""
+
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(
+                email=f"user{i}@example.com",
+                password="password123",
+                first_name="Test",
+                last_name=str(i),
+                phone="1234567890",
+            )
+            for i in range(3)
+        ]
+        self.workspace = Workspace.objects.create(owner=self.users[0], created_by=self.users[0])
+        self.members = [
+            WorkspaceMember.objects.create(
+                user=user, workspace=self.workspace, added_by=self.users[0]
+            )
+            for user in self.users
+        ]
+        self.cashier = WorkspaceRole.objects.create(workspace=self.workspace, name="Cashier")
+        self.cook = WorkspaceRole.objects.create(workspace=self.workspace, name="Cook")
+        MemberRole.objects.create(member=self.members[0], workspace_role=self.cashier)
+        MemberRole.objects.create(member=self.members[1], workspace_role=self.cashier)
+        MemberRole.objects.create(member=self.members[2], workspace_role=self.cook)
+
+        self.shifts = [
+            Shift.objects.create(
+                workspace=self.workspace,
+                role=self.cashier,
+                created_by=self.members[0],
+                start_time=BASE + timedelta(days=day, hours=9),
+                end_time=BASE + timedelta(days=day, hours=17),
+                open=True,
+            )
+            for day in range(4)
+        ]
+
+    def test_autofill_role_and_time_off(self):
+        """Test that only role holders without time off are assigned"""
+        TimeOffRequest.objects.create(
+            member=self.members[1],
+            workspace=self.workspace,
+            start_date=date(2026, 1, 5),
+            end_date=date(2026, 1, 6),
+            approved=True,
+        )
+        result = autofill(self.workspace.id, BASE, BASE + timedelta(days=7))
+        self.assertTrue(result.complete)
+        self.assertEqual(result.unfilled, [])
+        self.assertEqual(result.assignments[self.shifts[0].id], self.members[0].id)
+        self.assertEqual(result.assignments[self.shifts[1].id], self.members[0].id)
+        # member 1 takes the rest, evening out hours at two shifts each
+        self.assertEqual(result.assignments[self.shifts[2].id], self.members[1].id)
+        self.assertEqual(result.assignments[self.shifts[3].id], self.members[1].id)
+        self.assertFalse(Shift.objects.filter(open=False).exists())
+
+    def test_apply_skips_filled_shifts(self):
+        """Test that shifts assigned since the run are left alone"""
+        result = autofill(self.workspace.id, BASE, BASE + timedelta(days=7))
+        Shift.objects.filter(pk=self.shifts[0].pk).update(member=self.members[2], open=False)
+        self.assertEqual(apply_autofill(result), 3)
+        self.shifts[0].refresh_from_db()
+        self.assertEqual(self.shifts[0].member_id, self.members[2].id)
+        self.assertFalse(Shift.objects.filter(open=True).exists())
+
+    def test_apply_skips_new_conflicts(self):
+        """Test that assignments conflicting since the run are left open"""
+        result = autofill(self.workspace.id, BASE, BASE + timedelta(days=7))
+        member_id = result.assignments[self.shifts[0].id]
+        TimeOffRequest.objects.create(
+            member_id=member_id,
+            workspace=self.workspace,
+            start_date=date(2026, 1, 5),
+            end_date=date(2026, 1, 5),
+            approved=True,
+        )
+
+        self.assertEqual(apply_autofill(result), 3)
+        self.shifts[0].refresh_from_db()
+        self.assertTrue(self.shifts[0].open)
+        self.assertIsNone(self.shifts[0].member_id)
+        self.assertNotIn(self.shifts[0].id, result.assignments)
+        self.assertEqual(result.unfilled, [self.shifts[0].id])
+
+    def test_apply_skips_removed_members(self):
+        """Test that assignments to members who left the workspace are left open"""
+        result = autofill(self.workspace.id, BASE, BASE + timedelta(days=7))
+        removed = result.assignments[self.shifts[3].id]
+        kept = [shift.id for shift in self.shifts if result.assignments[shift.id] != removed]
+        WorkspaceMember.objects.filter(pk=removed).delete()
+
+        self.assertEqual(apply_autofill(result), len(kept))
+        self.assertEqual(
+            set(Shift.objects.filter(open=False).values_list("id", flat=True)), set(kept)
+        )
+
+    def test_command(self):
+        """Test that autofill_shifts saves unless --dry-run is given"""
+        out = StringIO()
+        call_command(
+            "autofill_shifts",
+            self.workspace.id,
+            "2026-01-05",
+            "2026-01-11",
+            dry_run=True,
+            stdout=out,
+        )
+        self.assertIn("Assigned 4 shift(s), 0 left open", out.getvalue())
+        self.assertEqual(Shift.objects.filter(open=True).count(), 4)
+
+        call_command("autofill_shifts", self.workspace.id, "2026-01-05", "2026-01-11", stdout=out)
+        self.assertIn("Saved 4 assignment(s).", out.getvalue())
+        self.assertFalse(Shift.objects.filter(open=True).exists())
@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta, timezone
+
+from django.test import TestCase
+
+from ....models import (
+    Workspace,
+    WorkspaceMember,
+    User,
+    WorkspaceRole,
+    MemberRole,
+    Shift,
+)
+from ....serializers import ShiftReadSerializer, MemberReadSerializer
+
+
+class DynamicFieldsSerializerTest(TestCase):
+    """Test cases for DynamicFieldsSerializer field restriction and caching"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="test@example.com",
+            password="password123",
+            first_name="Test",
+            last_name="User",
+            phone="1234567890",
+        )
+        self.workspace = Workspace.objects.create(owner=self.user, created_by=self.user)
+        self.member = WorkspaceMember.objects.create(
+            user=self.user, workspace=self.workspace, added_by=self.user
+        )
+        self.role = WorkspaceRole.objects.create(workspace=self.workspace, name="Cashier")
+        MemberRole.objects.create(member=self.member, workspace_role=self.role)
+        start = datetime(2026, 1, 5, 9, tzinfo=timezone.utc)
+        self.shift = Shift.objects.create(
+            workspace=self.workspace,
+            member=self.member,
+            role=self.role,
+            created_by=self.member,
+            start_time=start,
+            end_time=start + timedelta(hours=8),
+        )
+
+    def test_restriction_keeps_declaration_order(self):
+        data = ShiftReadSerializer(self.shift, fields=["end_time", "id"]).data
+        self.assertEqual(list(data), ["id", "end_time"])
+
+    def test_unknown_fields_are_ignored(self):
+        data = ShiftReadSerializer(self.shift, fields=["id", "missing"]).data
+        self.assertEqual(list(data), ["id"])
+
+    def test_nested_restriction(self):
+        data = ShiftReadSerializer(self.shift, fields=["id", "member__id", "role__name"]).data
+        self.assertEqual(data["member"], {"id": self.member.id})
+        self.assertEqual(data["role"], {"name": "Cashier"})
+
+    def test_nested_restriction_through_list(self):
+        data = MemberReadSerializer(
+            self.member, fields=["id", "member_roles__workspace_role__id"]
+        ).data
+        self.assertEqual(data, {"id": self.member.id, "member_roles": [{"id": self.role.id}]})
+
+    def test_many_with_restriction(self):
+        data = ShiftReadSerializer([self.shift], many=True, fields=["id"]).data
+        self.assertEqual(data, [{"id": self.shift.id}])
+
+    def test_instances_do_not_share_fields(self):
+        first = ShiftReadSerializer(fields=["id", "role"])
+        second = ShiftReadSerializer(fields=["role", "id"])
+        self.assertEqual(list(first.fields), list(second.fields))
+        self.assertIsNot(first.fields["role"], second.fields["role"])
+        self.assertIs(first.fields["role"].parent, first)
+
+    def test_unrestricted_output_unchanged(self):
+        data = ShiftReadSerializer(self.shift).data
+        self.assertEqual(list(data), ["id", "member", "role", "start_time", "end_time", "open"])
+        self.assertEqual(
+            data["member"], {"id": self.member.id, "first_name": "Test", "last_name": "User"}
+        )
+        self.assertEqual(data["role"], {"id": self.role.id, "name": "Cashier"})
@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from django.test import TestCase, override_settings
+from rest_framework.renderers import JSONRenderer
+
+from ....models import (
+    Workspace,
+    WorkspaceMember,
+    User,
+    WorkspaceRole,
+    Shift,
+)
+from ....renderers import FastJSONRenderer
+from ....serializers import ShiftReadSerializer, shift_list_data, shift_values
+
+
+class FastShiftSerializerTest(TestCase):
+    """shift_list_data and FastJSONRenderer must match ShiftReadSerializer and JSONRenderer"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="test@example.com",
+            password="password123",
+            first_name='Zoë\u2028"Quote"',
+            last_name="Ünïcode </script>",
+            phone="1234567890",
+        )
+        self.workspace = Workspace.objects.create(owner=self.user, created_by=self.user)
+        self.member = WorkspaceMember.objects.create(
+            user=self.user, workspace=self.workspace, added_by=self.user, pay_rate=Decimal("20")
+        )
+        self.role = WorkspaceRole.objects.create(workspace=self.workspace, name="Café\u2029")
+
+        start = datetime(2026, 1, 5, 9, tzinfo=timezone.utc)
+        Shift.objects.create(
+            workspace=self.workspace,
+            member=self.member,
+            role=self.role,
+            created_by=self.member,
+            start_time=start,
+            end_time=start + timedelta(hours=8),
+        )
+        # open shift with sub-second times
+        Shift.objects.create(
+            workspace=self.workspace,
+            role=self.role,
+            created_by=self.member,
+            start_time=start + timedelta(days=1, microseconds=123456),
+            end_time=start + timedelta(days=1, hours=4, microseconds=500),
+            open=True,
+        )
+
+    def queryset(self):
+        return Shift.objects.filter(workspace=self.workspace).order_by("start_time", "id")
+
+    def assert_parity(self, fields=None):
+        expected = ShiftReadSerializer(self.queryset(), many=True, fields=fields).data
+        data = shift_list_data(shift_values(self.queryset(), fields), fields)
+        self.assertEqual(data, expected)
+
+        response = {"error": {}, "result": expected, "next_cursor": "abc"}
+        fast = {"error": {}, "result": data, "next_cursor": "abc"}
+        self.assertEqual(FastJSONRenderer().render(fast), JSONRenderer().render(response))
+
+    def test_all_fields(self):
+        self.assert_parity()
+
+    def test_field_subset(self):
+        self.assert_parity(["id", "role", "start_time", "end_time"])
+
+    @override_settings(TIME_ZONE="America/New_York")
+    def test_non_utc_time_zone(self):
+        self.assert_parity()
+
+    def test_subset_skips_member_join(self):
+        columns = shift_values(self.queryset(), ["id", "role"]).query.values_select
+        self.assertNotIn("member__user__first_name", columns)
+
+    def test_empty_list(self):
+        self.assertEqual(shift_list_data([]), [])
+
+
+class FastJSONRendererTest(TestCase):
+    """Test cases for FastJSONRenderer"""
+
+    def test_none_renders_empty(self):
+        self.assertEqual(FastJSONRenderer().render(None), b"")
+
+    def test_falls_back_for_types_needing_drf_encoder(self):
+        data = {"pay_rate": Decimal("12.50"), "when": datetime(2026, 1, 1, tzinfo=timezone.utc)}
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_indent_matches_json_renderer(self):
+        data = {"result": [1, {"a": "b"}]}
+        media_type = "application/json; indent=2"
+        self.assertEqual(
+            FastJSONRenderer().render(data, media_type),
+            JSONRenderer().render(data, media_type),
+        )
@@ -0,0 +1,67 @@
+from django.test import TestCase, override_settings
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+
+from ...authentication import ClaimsJWTAuthentication, load_user
+from ...models import User
+from ...serializers import CustomTokenObtainPairSerializer
+
+
+class ClaimsJWTAuthenticationTest(TestCase):
+    """Test cases for ClaimsJWTAuthentication"""
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.user = User.objects.create_user(
+            email="test@example.com",
+            password="password123",
+            first_name="Test",
+            last_name="User",
+            phone="1234567890",
+        )
+
+    def _authenticate(self, token):
+        request = self.factory.get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        return ClaimsJWTAuthentication().authenticate(request)
+
+    def test_authenticate_without_query(self):
+        """Test that the user is built from id and email claims"""
+        token = CustomTokenObtainPairSerializer.get_token(self.user).access_token
+
+        with self.assertNumQueries(0):
+            user, _ = self._authenticate(token)
+
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertEqual(user.email, self.user.email)
+        self.assertTrue(user.is_authenticated)
+        self.assertEqual(user, self.user)
+
+    def test_profile_fields_load_lazily(self):
+        """Test that unloaded fields are read from the database on access"""
+        user, _ = self._authenticate(AccessToken.for_user(self.user))
+
+        with self.assertNumQueries(1):
+            self.assertEqual(user.first_name, "Test")
+
+    def test_load_user_single_query(self):
+        """Test that load_user loads every deferred field at once"""
+        user, _ = self._authenticate(AccessToken.for_user(self.user))
+
+        with self.assertNumQueries(1):
+            load_user(user)
+            self.assertEqual(
+                (user.first_name, user.last_name, user.phone, user.email),
+                ("Test", "User", "1234567890", "test@example.com"),
+            )
+
+    def test_load_user_already_loaded(self):
+        """Test that a fully loaded user is returned without querying"""
+        with self.assertNumQueries(0):
+            self.assertIs(load_user(self.user), self.user)
+
+    @override_settings(JWT_CLAIMS_USER=False)
+    def test_database_user_mode(self):
+        """Test that disabling claims users loads the full row"""
+        with self.assertNumQueries(1):
+            user, _ = self._authenticate(AccessToken.for_user(self.user))
+        self.assertEqual(user.get_deferred_fields(), set())
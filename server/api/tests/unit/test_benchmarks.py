@@ -0,0 +1,64 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from ...benchmarks import percentile, run_load, timing_queries
+
+
+class BenchmarkHelpersTest(SimpleTestCase):
+    """Test cases for the load testing helpers"""
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile(values, 100), 100)
+        self.assertEqual(percentile([7], 99), 7)
+        self.assertEqual(percentile([], 99), 0)
+
+    def test_run_load_counts_errors(self):
+        codes = iter([(200, None), (500, None), (200, None), (404, None)])
+        result = run_load(lambda: next(codes), 1, 4)
+        self.assertEqual(result["requests"], 4)
+        self.assertEqual(result["errors"], 2)
+        self.assertEqual(result["concurrency"], 1)
+        self.assertLessEqual(result["p50_ms"], result["p95_ms"])
+        self.assertLessEqual(result["p95_ms"], result["p99_ms"])
+        self.assertIsNone(result["mean_queries"])
+
+    def test_run_load_summarizes_queries(self):
+        samples = iter([(200, 2), (200, 4), (200, None)])
+        result = run_load(lambda: next(samples), 1, 3)
+        self.assertEqual(result["mean_queries"], 3)
+        self.assertEqual(result["max_queries"], 4)
+
+    def test_timing_queries(self):
+        header = 'db;dur=1.2;desc="5 queries", render;dur=0.3, total;dur=2.0'
+        self.assertEqual(timing_queries(header), 5)
+        self.assertIsNone(timing_queries("total;dur=2.0"))
+        self.assertIsNone(timing_queries(None))
+
+    def test_run_load_counts_connection_errors(self):
+        def send():
+            raise ConnectionRefusedError()
+
+        result = run_load(send, 2, 3)
+        self.assertEqual(result["errors"], 3)
+
+
+class BenchmarkConnectionsCommandTest(SimpleTestCase):
+    """Test cases for the benchmark_connections command"""
+
+    def test_reports_each_mode(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "connections.json")
+            call_command("benchmark_connections", iterations=5, output=output, stdout=StringIO())
+            with open(output) as file:
+                results = json.load(file)["results"]
+
+        self.assertEqual([row["mode"] for row in results], ["fresh", "persistent", "configured"])
+        self.assertTrue(all(row["iterations"] == 5 for row in results))
@@ -0,0 +1,102 @@
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from ...events import InProcessBackend, get_backend
+from ...models import User, Workspace, WorkspaceMember, WorkspaceRole, Shift
+
+
+class HubTest(SimpleTestCase):
+    """Test cases for subscription fan-out in the event hub"""
+
+    async def test_dispatch_reaches_workspace_subscribers(self):
+        backend = InProcessBackend()
+        first = backend.subscribe(1)
+        second = backend.subscribe(1)
+        other = backend.subscribe(2)
+
+        backend.dispatch(1, {"type": "shift"})
+        self.assertEqual(await first.get(), {"type": "shift"})
+        self.assertEqual(await second.get(), {"type": "shift"})
+        self.assertTrue(other.queue.empty())
+
+    async def test_dispatch_from_another_thread(self):
+        backend = InProcessBackend()
+        subscription = backend.subscribe(1)
+        thread = threading.Thread(target=backend.dispatch, args=(1, {"type": "role"}))
+        thread.start()
+        self.assertEqual(await asyncio.wait_for(subscription.get(), 1), {"type": "role"})
+        thread.join()
+
+    async def test_unsubscribe(self):
+        backend = InProcessBackend()
+        subscription = backend.subscribe(1)
+        backend.unsubscribe(subscription)
+        self.assertEqual(backend.subscriber_count(1), 0)
+        backend.dispatch(1, {"type": "shift"})
+        await asyncio.sleep(0)
+        self.assertTrue(subscription.queue.empty())
+
+    @override_settings(SCHEDULE_EVENTS_QUEUE_SIZE=2)
+    async def test_slow_subscriber_gets_resync(self):
+        backend = InProcessBackend()
+        subscription = backend.subscribe(1)
+        for index in range(3):
+            backend.dispatch(1, {"type": "shift", "ids": [index]})
+        await asyncio.sleep(0)
+        self.assertEqual(await subscription.get(), {"type": "resync"})
+        self.assertTrue(subscription.queue.empty())
+
+
+class PublishTest(TestCase):
+    """Test cases for events published by model writes"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="owner@example.com", password="password123")
+        self.workspace = Workspace.objects.create(created_by=self.user, owner=self.user)
+        self.member = WorkspaceMember.objects.create(
+            workspace=self.workspace, user=self.user, added_by=self.user
+        )
+        self.role = WorkspaceRole.objects.create(workspace=self.workspace, name="Cashier")
+
+    def published(self, write):
+        """Run a write and return the events it published after commit."""
+        with patch.object(get_backend(), "dispatch") as dispatch:
+            with self.captureOnCommitCallbacks(execute=True):
+                write()
+        return [call.args for call in dispatch.call_args_list]
+
+    def test_shift_save_and_delete(self):
+        start = datetime(2026, 1, 5, 9, tzinfo=timezone.utc)
+        shift = Shift(
+            workspace=self.workspace,
+            role=self.role,
+            created_by=self.member,
+            start_time=start,
+            end_time=start + timedelta(hours=8),
+        )
+        self.assertEqual(
+            self.published(shift.save),
+            [(self.workspace.id, {"type": "shift", "action": "saved", "ids": [shift.id]})],
+        )
+        shift_id = shift.id
+        self.assertEqual(
+            self.published(shift.delete),
+            [(self.workspace.id, {"type": "shift", "action": "deleted", "ids": [shift_id]})],
+        )
+
+    def test_user_rename_publishes_member(self):
+        self.user.first_name = "Renamed"
+        self.assertEqual(
+            self.published(self.user.save),
+            [(self.workspace.id, {"type": "member", "action": "saved", "ids": [self.member.id]})],
+        )
+
+    def test_rolled_back_write_publishes_nothing(self):
+        with patch.object(get_backend(), "dispatch") as dispatch:
+            with self.captureOnCommitCallbacks(execute=False):
+                self.role.save()
+        dispatch.assert_not_called()
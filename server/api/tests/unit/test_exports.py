@@ -0,0 +1,122 @@
+import csv
+import io
+import tracemalloc
+import zipfile
+from decimal import Decimal
+from unittest.mock import patch
+from xml.etree import ElementTree
+
+from django.test import SimpleTestCase
+
+from ... import exports
+from ...exports import COLUMNS, stream_csv, stream_xlsx
+
+SHEET = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+
+def rows(count):
+    """Yield export rows without touching the database."""
+    for pk in range(count):
+        yield (
+            pk,
+            "2026-01-05T09:00:00+00:00",
+            "2026-01-05T17:00:00+00:00",
+            8.0,
+            pk % 50,
+            f"Member {pk % 50} <&>",
+            f"member{pk % 50}@example.com",
+            "Cashier",
+            Decimal("20.00"),
+            Decimal("160.00"),
+        )
+
+
+def sheet_rows(data):
+    """Return the cell texts of each row of an exported workbook's sheet."""
+    with zipfile.ZipFile(io.BytesIO(data)) as workbook:
+        root = ElementTree.fromstring(workbook.read("xl/worksheets/sheet1.xml"))
+    return [["".join(cell.itertext()) for cell in row] for row in root.iter(f"{SHEET}row")]
+
+
+class StreamCsvTest(SimpleTestCase):
+    """Test cases for streaming CSV exports"""
+
+    def test_content(self):
+        data = b"".join(stream_csv(rows(3))).decode()
+        parsed = list(csv.reader(io.StringIO(data)))
+        self.assertEqual(parsed[0], list(COLUMNS))
+        self.assertEqual(len(parsed), 4)
+        self.assertEqual(parsed[1][5], "Member 0 <&>")
+        self.assertEqual(parsed[1][9], "160.00")
+
+    def test_none_is_empty(self):
+        row = (1, "a", "b", 1.0, None, "", "", "Cashier", None, None)
+        data = b"".join(stream_csv([row])).decode()
+        self.assertEqual(data.splitlines()[1], "1,a,b,1.0,,,,Cashier,,")
+
+    def test_streams_in_chunks(self):
+        with patch.object(exports, "CHUNK_SIZE", 10):
+            chunks = list(stream_csv(rows(25)))
+        self.assertGreaterEqual(len(chunks), 3)
+
+    def test_formulas_are_quoted(self):
+        row = (1, "a", "b", 1.0, 2, "=HYPERLINK(1)", "@SUM(1)", "-2+3", Decimal("-1"), None)
+        parsed = list(csv.reader(io.StringIO(b"".join(stream_csv([row])).decode())))
+        self.assertEqual(parsed[1][5:9], ["'=HYPERLINK(1)", "'@SUM(1)", "'-2+3", "-1"])
+
+
+class StreamXlsxTest(SimpleTestCase):
+    """Test cases for streaming XLSX exports"""
+
+    def test_is_a_workbook(self):
+        data = b"".join(stream_xlsx(rows(3)))
+        with zipfile.ZipFile(io.BytesIO(data)) as workbook:
+            self.assertIsNone(workbook.testzip())
+            self.assertIn("xl/workbook.xml", workbook.namelist())
+        parsed = sheet_rows(data)
+        self.assertEqual(parsed[0], list(COLUMNS))
+        self.assertEqual(len(parsed), 4)
+        self.assertEqual(parsed[1][5], "Member 0 <&>")
+        self.assertEqual(parsed[2][0], "1")
+
+    def test_streams_in_chunks(self):
+        with patch.object(exports, "CHUNK_SIZE", 10):
+            chunks = list(stream_xlsx(rows(25)))
+        self.assertGreaterEqual(len(chunks), 3)
+        self.assertEqual(len(sheet_rows(b"".join(chunks))), 26)
+
+    def test_formulas_stay_text(self):
+        row = (1, "a", "b", 1.0, 2, "=HYPERLINK(1)", "+1", "Cashier", Decimal("-1"), None)
+        data = b"".join(stream_xlsx([row]))
+        with zipfile.ZipFile(io.BytesIO(data)) as workbook:
+            styles = ElementTree.fromstring(workbook.read("xl/styles.xml"))
+            root = ElementTree.fromstring(workbook.read("xl/worksheets/sheet1.xml"))
+        xf = list(styles.iter(f"{SHEET}cellXfs"))[0][1]
+        self.assertEqual(xf.get("quotePrefix"), "1")
+        cells = list(root.iter(f"{SHEET}row"))[1]
+        self.assertEqual([cell.get("s") for cell in cells[5:9]], ["1", "1", None, None])
+        self.assertEqual("".join(cells[5].itertext()), "=HYPERLINK(1)")
+
+
+class ExportMemoryTest(SimpleTestCase):
+    """Test cases holding exports to constant memory"""
+
+    def peak(self, stream, count):
+        """Return the output size and peak traced memory of consuming an export."""
+        size = 0
+        tracemalloc.start()
+        try:
+            for chunk in stream(rows(count)):
+                size += len(chunk)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return size, peak
+
+    def test_memory_does_not_grow_with_rows(self):
+        for stream in (stream_csv, stream_xlsx):
+            with self.subTest(stream=stream.__name__):
+                small_size, small_peak = self.peak(stream, 5000)
+                large_size, large_peak = self.peak(stream, 50000)
+                self.assertGreater(large_size, 5 * small_size)
+                self.assertLess(large_peak, 2 * small_peak)
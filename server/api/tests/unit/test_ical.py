@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.core.signing import dumps
+from django.test import SimpleTestCase
+
+from ... import ical
+from ...ical import (
+    MEMBER_FEED,
+    WORKSPACE_FEED,
+    escape_text,
+    feed_token,
+    fold,
+    read_feed_token,
+    render_events,
+    shift_summary,
+)
+
+
+def shift_row(pk=1, **overrides):
+    """Return a shift row as feed_rows yields it for a workspace feed."""
+    start = datetime(2026, 1, 5, 9, tzinfo=timezone.utc)
+    row = {
+        "id": pk,
+        "date_modified": datetime(2026, 1, 1, 12, 30, tzinfo=timezone.utc),
+        "start_time": start,
+        "end_time": start + timedelta(hours=8),
+        "role__name": "Cashier",
+        "member_id": 3,
+        "member__user__first_name": "Ada",
+        "member__user__last_name": "Lovelace",
+        "member__user__email": "ada@example.com",
+    }
+    row.update(overrides)
+    return row
+
+
+class FeedTokenTest(SimpleTestCase):
+    """Test cases for signing calendar feed tokens"""
+
+    def test_round_trip(self):
+        token = feed_token(MEMBER_FEED, 5, 7)
+        self.assertEqual(read_feed_token(token), (MEMBER_FEED, 5, 7))
+
+    def test_rejects_tampered_tokens(self):
+        token = feed_token(WORKSPACE_FEED, 5, 7)
+        self.assertIsNone(read_feed_token(token[:-1] + ("A" if token[-1] != "A" else "B")))
+        self.assertIsNone(read_feed_token("garbage"))
+
+    def test_rejects_other_salts_and_kinds(self):
+        self.assertIsNone(read_feed_token(dumps([MEMBER_FEED, 5, 7])))
+        self.assertIsNone(read_feed_token(dumps(["user", 5, 7], salt=ical.TOKEN_SALT)))
+
+
+class RenderTest(SimpleTestCase):
+    """Test cases for rendering iCalendar content"""
+
+    def setUp(self):
+        caches["calendar"].clear()
+
+    def test_escape_text(self):
+        self.assertEqual(escape_text("a,b;c\\d\ne"), "a\\,b\\;c\\\\d\\ne")
+
+    def test_fold(self):
+        line = "SUMMARY:" + "é" * 60
+        folded = fold(line)
+        parts = folded.split("\r\n ")
+        self.assertGreater(len(parts), 1)
+        self.assertTrue(all(len(part.encode()) <= 75 for part in parts))
+        self.assertEqual("".join(parts), line)
+        self.assertEqual(fold("SUMMARY:short"), "SUMMARY:short")
+
+    def test_summaries(self):
+        self.assertEqual(shift_summary(shift_row(), MEMBER_FEED), "Cashier")
+        self.assertEqual(shift_summary(shift_row(), WORKSPACE_FEED), "Cashier: Ada Lovelace")
+        self.assertEqual(shift_summary(shift_row(member_id=None), WORKSPACE_FEED), "Cashier (open)")
+
+    def test_render_event(self):
+        (text,) = render_events([shift_row()], WORKSPACE_FEED)
+        self.assertIn("DTSTART:20260105T090000Z\r\n", text)
+        self.assertIn("DTEND:20260105T170000Z\r\n", text)
+        self.assertIn("LAST-MODIFIED:20260101T123000Z\r\n", text)
+        self.assertIn("SUMMARY:Cashier: Ada Lovelace\r\n", text)
+        self.assertTrue(text.startswith("BEGIN:VEVENT\r\n"))
+        self.assertTrue(text.endswith("END:VEVENT\r\n"))
+
+    def test_unchanged_shifts_are_not_rendered_again(self):
+        rows = [shift_row(pk) for pk in range(1, 4)]
+        first = "".join(render_events(rows, MEMBER_FEED))
+
+        with patch.object(ical, "render_event", wraps=ical.render_event) as render:
+            again = "".join(render_events(rows, MEMBER_FEED))
+            self.assertEqual(render.call_count, 0)
+            self.assertEqual(again, first)
+
+            modified = shift_row(2, date_modified=datetime(2026, 1, 2, tzinfo=timezone.utc))
+            renamed = shift_row(3, role__name="Stocker")
+            "".join(render_events([rows[0], modified, renamed], MEMBER_FEED))
+            self.assertEqual(render.call_count, 2)
+
+    def test_renders_in_chunks(self):
+        rows = [shift_row(pk) for pk in range(1, 6)]
+        with patch.object(ical, "CHUNK_SIZE", 2):
+            chunks = list(render_events(rows, MEMBER_FEED))
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual("".join(chunks).count("BEGIN:VEVENT"), 5)
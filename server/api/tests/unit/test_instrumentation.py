@@ -0,0 +1,95 @@
+from unittest.mock import Mock
+
+from django.test import TestCase
+
+from ...instrumentation import (
+    RequestMetrics,
+    begin_request_metrics,
+    end_request_metrics,
+    format_query_split,
+    format_server_timing,
+    measure_serialization,
+    query_totals,
+    record,
+    request_stats,
+    reset_stats,
+)
+from ...models import User
+from ...serializers import UserDetailedReadSerializer, shift_list_data
+
+
+class RequestMetricsTest(TestCase):
+    """Test cases for per-request query counting and aggregation"""
+
+    def setUp(self):
+        reset_stats()
+
+    def test_counts_request_queries_per_alias(self):
+        metrics, token = begin_request_metrics()
+        try:
+            User.objects.count()
+            User.objects.exists()
+        finally:
+            end_request_metrics(token)
+        User.objects.count()
+        self.assertEqual(metrics.queries, {"default": 2})
+        self.assertEqual(metrics.query_count, 2)
+        self.assertGreater(metrics.db_time, 0)
+        self.assertEqual(query_totals(), {"default": 3})
+
+    def test_finish_measures_response(self):
+        metrics = RequestMetrics()
+        metrics.view_returned()
+        metrics.finish(Mock(streaming=False, content=b"12345"))
+        self.assertEqual(metrics.size, 5)
+        self.assertGreaterEqual(metrics.total_time, metrics.render_time)
+
+    def test_measures_serialization(self):
+        user = User.objects.create_user(email="test@example.com", password="password123")
+        metrics, token = begin_request_metrics()
+        try:
+            UserDetailedReadSerializer(user).data
+            single = metrics.serialize_time
+            UserDetailedReadSerializer([user], many=True).data
+            listed = metrics.serialize_time
+            shift_list_data([])
+        finally:
+            end_request_metrics(token)
+        self.assertGreater(single, 0)
+        self.assertGreater(listed, single)
+        total = metrics.serialize_time
+        self.assertGreater(total, listed)
+
+        # Outside a request the block runs unmeasured
+        with measure_serialization():
+            UserDetailedReadSerializer(user).data
+        self.assertEqual(metrics.serialize_time, total)
+
+    def test_request_stats_aggregate_by_url_name(self):
+        for count in (1, 3):
+            metrics = RequestMetrics()
+            metrics.url_name = "workspace_shifts"
+            metrics.queries["default"] = count
+            metrics.size = 100
+            record(metrics)
+        record(RequestMetrics())
+
+        stats = request_stats()
+        self.assertEqual(set(stats), {"workspace_shifts", "unresolved"})
+        self.assertEqual(stats["workspace_shifts"]["requests"], 2)
+        self.assertEqual(stats["workspace_shifts"]["queries"], 4)
+        self.assertEqual(stats["workspace_shifts"]["max_queries"], 3)
+        self.assertEqual(stats["workspace_shifts"]["mean_queries"], 2)
+        self.assertEqual(stats["workspace_shifts"]["mean_bytes"], 100)
+
+    def test_format_headers(self):
+        metrics = RequestMetrics()
+        metrics.queries.update({"replica": 4, "default": 1})
+        metrics.db_time = 0.0123
+        self.assertEqual(format_query_split(metrics.queries), "default=1, replica=4")
+        self.assertEqual(format_query_split({}), "")
+        self.assertTrue(
+            format_server_timing(metrics).startswith(
+                'db;dur=12.3;desc="5 queries", serialize;dur=0.0, render;dur='
+            )
+        )
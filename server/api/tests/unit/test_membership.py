@@ -0,0 +1,165 @@
+from unittest.mock import MagicMock
+
+from django.conf import settings
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+
+from ...checks import check_permissions_cache
+from ...membership import Membership, get_membership, load_membership, resolve_membership
+from ...models import User, Workspace, WorkspaceMember, MemberPermissions
+
+
+class MembershipResolverTest(TestCase):
+    """Test cases for load_membership and resolve_membership"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="owner@example.com", password="password123")
+        self.workspace = Workspace.objects.create(created_by=self.user, owner=self.user)
+        self.member = WorkspaceMember.objects.create(
+            workspace=self.workspace, user=self.user, added_by=self.user
+        )
+        MemberPermissions.objects.create(
+            workspace=self.workspace,
+            member=self.member,
+            manage_schedules=True,
+        )
+
+    def test_load_membership_single_query(self):
+        """Test membership and permission flags are loaded with one query"""
+        with self.assertNumQueries(1):
+            membership = load_membership(self.user.id, self.workspace.id)
+
+        self.assertEqual(
+            membership,
+            Membership(self.member.id, self.workspace.id, manage_schedules=True),
+        )
+
+    def test_load_membership_non_member(self):
+        """Test None is returned when the user is not a member"""
+        other = Workspace.objects.create(created_by=self.user, owner=self.user)
+        self.assertIsNone(load_membership(self.user.id, other.id))
+
+    def test_load_membership_without_permissions(self):
+        """Test all flags are False when the member has no permissions row"""
+        MemberPermissions.objects.all().delete()
+        membership = load_membership(self.user.id, self.workspace.id)
+        self.assertEqual(membership, Membership(self.member.id, self.workspace.id))
+
+    def test_resolve_membership_memoized_per_request(self):
+        """Test repeated lookups within a request do not query again"""
+        request = MagicMock(spec=["user"])
+        request.user = self.user
+
+        with self.assertNumQueries(1):
+            first = resolve_membership(request, self.workspace.id)
+            second = resolve_membership(request, str(self.workspace.id))
+
+        self.assertIs(first, second)
+
+
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "permissions": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-permissions",
+        },
+    }
+)
+class MembershipCacheTest(TestCase):
+    """Test cases for the cross-request permissions cache"""
+
+    def setUp(self):
+        caches["permissions"].clear()
+        self.user = User.objects.create_user(email="owner@example.com", password="password123")
+        self.user2 = User.objects.create_user(email="member@example.com", password="password123")
+        self.workspace = Workspace.objects.create(created_by=self.user, owner=self.user)
+        self.member = WorkspaceMember.objects.create(
+            workspace=self.workspace, user=self.user2, added_by=self.user
+        )
+        self.permissions = MemberPermissions.objects.create(
+            workspace=self.workspace, member=self.member
+        )
+
+    def test_cached_across_calls(self):
+        """Test that a cached membership is served without querying"""
+        get_membership(self.user2.id, self.workspace.id)
+        with self.assertNumQueries(0):
+            membership = get_membership(self.user2.id, self.workspace.id)
+        self.assertEqual(membership, Membership(self.member.id, self.workspace.id))
+
+    def test_non_member_cached(self):
+        """Test that non-membership is cached too"""
+        self.assertIsNone(get_membership(self.user.id, self.workspace.id))
+        with self.assertNumQueries(0):
+            self.assertIsNone(get_membership(self.user.id, self.workspace.id))
+
+    def test_invalidated_on_permissions_update(self):
+        """Test that saving permissions drops the cached flags"""
+        get_membership(self.user2.id, self.workspace.id)
+        self.permissions.manage_schedules = True
+        self.permissions.save()
+
+        membership = get_membership(self.user2.id, self.workspace.id)
+        self.assertTrue(membership.manage_schedules)
+
+    def test_invalidated_on_permissions_revoked(self):
+        """Test that revoking a permission drops the cached grant"""
+        self.permissions.manage_schedules = True
+        self.permissions.save()
+        self.assertTrue(get_membership(self.user2.id, self.workspace.id).manage_schedules)
+
+        self.permissions.manage_schedules = False
+        self.permissions.save()
+        self.assertFalse(get_membership(self.user2.id, self.workspace.id).manage_schedules)
+
+    def test_invalidated_on_permissions_deleted(self):
+        """Test that deleting a permissions row drops the cached flags"""
+        self.permissions.manage_schedules = True
+        self.permissions.save()
+        get_membership(self.user2.id, self.workspace.id)
+
+        self.permissions.delete()
+        self.assertFalse(get_membership(self.user2.id, self.workspace.id).manage_schedules)
+
+    def test_invalidated_on_member_added(self):
+        """Test that adding a member drops a cached non-membership"""
+        self.assertIsNone(get_membership(self.user.id, self.workspace.id))
+        member = WorkspaceMember.objects.create(
+            workspace=self.workspace, user=self.user, added_by=self.user
+        )
+
+        membership = get_membership(self.user.id, self.workspace.id)
+        self.assertEqual(membership.member_id, member.id)
+
+    def test_invalidated_on_member_removed(self):
+        """Test that deleting a member drops the cached membership"""
+        get_membership(self.user2.id, self.workspace.id)
+        self.member.delete()
+        self.assertIsNone(get_membership(self.user2.id, self.workspace.id))
+
+    def test_invalidated_on_workspace_deleted(self):
+        """Test that deleting a workspace drops memberships removed by cascade"""
+        get_membership(self.user2.id, self.workspace.id)
+        workspace_id = self.workspace.id
+        self.workspace.delete()
+        self.assertIsNone(get_membership(self.user2.id, workspace_id))
+
+
+class PermissionsCacheCheckTest(TestCase):
+    """Test cases for the per-process permissions cache deploy check"""
+
+    def test_disabled_by_default(self):
+        """Test that the default settings do not cache memberships across requests"""
+        self.assertEqual(
+            settings.CACHES["permissions"]["BACKEND"],
+            "django.core.cache.backends.dummy.DummyCache",
+        )
+        self.assertEqual(check_permissions_cache(None), [])
+
+    @override_settings(
+        CACHES={"permissions": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_warns_on_local_memory(self):
+        """Test that a per-process backend is reported"""
+        self.assertEqual([w.id for w in check_permissions_cache(None)], ["api.W001"])
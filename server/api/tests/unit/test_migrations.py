@@ -0,0 +1,116 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from importlib import import_module
+
+from django.apps import apps
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase
+
+from ...models import User, Workspace, WorkspaceMember, WorkspaceRole, Shift
+
+check_shift_durations = import_module(
+    "api.migrations.0018_check_shift_durations"
+).check_shift_durations
+
+
+class CheckShiftDurationsTest(TestCase):
+    """Test cases for the migration guarding SHIFT_MAX_DURATION"""
+
+    def setUp(self):
+        user = User.objects.create_user(email="test@example.com", password="password123")
+        self.workspace = Workspace.objects.create(created_by=user, owner=user)
+        self.member = WorkspaceMember.objects.create(
+            workspace=self.workspace, user=user, added_by=user
+        )
+        self.role = WorkspaceRole.objects.create(workspace=self.workspace, name="Test Role")
+
+    def create_shift(self, hours):
+        start = datetime(2025, 1, 1, 9, tzinfo=timezone.utc)
+        return Shift.objects.create(
+            workspace=self.workspace,
+            member=self.member,
+            role=self.role,
+            created_by=self.member,
+            start_time=start,
+            end_time=start + timedelta(hours=hours),
+        )
+
+    def test_passes_within_limit(self):
+        """Test that shifts up to SHIFT_MAX_DURATION pass"""
+        self.create_shift(24)
+        check_shift_durations(apps, None)
+
+    def test_fails_on_longer_shifts(self):
+        """Test that a longer shift stops the migration, naming it"""
+        shift = self.create_shift(30)
+        with self.assertRaisesMessage(RuntimeError, f"ids [{shift.id}]"):
+            check_shift_durations(apps, None)
+
+
+class MergeDuplicateMembersTest(TransactionTestCase):
+    """Test cases for merging repeated memberships before their unique constraint"""
+
+    before = [("api", "0016_shift_tombstones")]
+    after = [("api", "0017_member_indexes")]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        self.migrate(MigrationExecutor(connection).loader.graph.leaf_nodes())
+
+    def test_duplicates_are_merged_into_the_oldest(self):
+        old = self.migrate(self.before)
+        User = old.get_model("api", "User")
+        user = User.objects.create(email="test@example.com")
+        workspace = old.get_model("api", "Workspace").objects.create(created_by=user, owner=user)
+        Member = old.get_model("api", "WorkspaceMember")
+        kept, duplicate = [
+            Member.objects.create(workspace=workspace, user=user, added_by=user, pay_rate=rate)
+            for rate in (Decimal("20"), Decimal("30"))
+        ]
+        role = old.get_model("api", "WorkspaceRole").objects.create(
+            workspace=workspace, name="Cashier"
+        )
+        old.get_model("api", "MemberRole").objects.create(member=kept, workspace_role=role)
+        old.get_model("api", "MemberRole").objects.create(member=duplicate, workspace_role=role)
+        Permissions = old.get_model("api", "MemberPermissions")
+        Permissions.objects.create(workspace=workspace, member=kept)
+        Permissions.objects.create(workspace=workspace, member=duplicate)
+        start = datetime(2026, 1, 5, 9, tzinfo=timezone.utc)
+        shift = old.get_model("api", "Shift").objects.create(
+            workspace=workspace,
+            member=duplicate,
+            role=role,
+            created_by=duplicate,
+            start_time=start,
+            end_time=start + timedelta(hours=8),
+        )
+        old.get_model("api", "LaborRollup").objects.create(
+            workspace=workspace,
+            member=duplicate,
+            role=role,
+            week_start=start.date(),
+            seconds=28800,
+            cost=Decimal("240"),
+        )
+
+        new = self.migrate(self.after)
+        self.assertEqual(
+            list(new.get_model("api", "WorkspaceMember").objects.values_list("pk", flat=True)),
+            [kept.pk],
+        )
+        shift = new.get_model("api", "Shift").objects.get(pk=shift.pk)
+        self.assertEqual((shift.member_id, shift.created_by_id), (kept.pk, kept.pk))
+        self.assertEqual(new.get_model("api", "MemberRole").objects.count(), 1)
+        self.assertEqual(new.get_model("api", "MemberPermissions").objects.count(), 1)
+        self.assertEqual(
+            list(
+                new.get_model("api", "LaborRollup").objects.values_list("member", "seconds", "cost")
+            ),
+            [(kept.pk, 28800, Decimal("160"))],
+        )
@@ -0,0 +1,63 @@
+from django.core.cache import caches
+from django.db import transaction
+from django.test import RequestFactory, TransactionTestCase, override_settings
+
+from ...models import User
+from ...routers import ReplicaRouter, begin_request, end_request, is_pinned, pin_user
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+class ReplicaRouterTest(TransactionTestCase):
+    """Test cases for routing reads to replicas"""
+
+    def setUp(self):
+        caches["replica_pins"].clear()
+        self.factory = RequestFactory()
+        self.router = ReplicaRouter()
+        self.user = User.objects.create_user(email="test@example.com", password="password123")
+
+    def route(self, method="get", user=None, write=False):
+        """Return the read alias chosen for a request."""
+        request = getattr(self.factory, method)("/")
+        if user is not None:
+            request.user = user
+        _, token = begin_request(request)
+        try:
+            if write:
+                self.router.db_for_write(User)
+            return self.router.db_for_read(User)
+        finally:
+            end_request(token)
+
+    def test_outside_requests_read_primary(self):
+        self.assertIsNone(self.router.db_for_read(User))
+
+    def test_safe_request_reads_replica(self):
+        self.assertEqual(self.route(), "replica")
+        self.assertEqual(self.route(user=self.user), "replica")
+
+    def test_unsafe_request_reads_primary(self):
+        self.assertIsNone(self.route("post"))
+
+    def test_reads_after_write_use_primary(self):
+        self.assertIsNone(self.route(write=True))
+
+    def test_pinned_user_reads_primary(self):
+        pin_user(self.user.id)
+        self.assertTrue(is_pinned(self.user.id))
+        self.assertIsNone(self.route(user=self.user))
+
+    def test_reads_in_transaction_use_primary(self):
+        with transaction.atomic():
+            self.assertIsNone(self.route())
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_no_replicas(self):
+        self.assertIsNone(self.route())
+
+    def test_writes_use_primary(self):
+        self.assertEqual(self.router.db_for_write(User), "default")
+
+    def test_replicas_are_not_migrated(self):
+        self.assertFalse(self.router.allow_migrate("replica", "api"))
+        self.assertIsNone(self.router.allow_migrate("default", "api"))
@@ -0,0 +1,91 @@
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from ...models import (
+    LaborRollup,
+    MemberPermissions,
+    MemberRole,
+    Shift,
+    TimeOffRequest,
+    Unavailability,
+    User,
+    Workspace,
+    WorkspaceMember,
+)
+from ...seeding import seed
+
+
+class SeedTest(TestCase):
+    """Test cases for generating synthetic data"""
+
+    def setUp(self):
+        self.result = seed(2, 3, 2, 4, prefix="test", start=date(2026, 1, 5))
+
+    def test_counts(self):
+        self.assertEqual(
+            self.result.counts,
+            {
+                "workspaces": 2,
+                "members": 6,
+                "roles": 4,
+                "shifts": 6 * 4 * 5,
+                "time_off_requests": 6,
+                "unavailabilities": Unavailability.objects.count(),
+            },
+        )
+        self.assertEqual(Workspace.objects.count(), 2)
+        self.assertEqual(Shift.objects.count(), 120)
+        self.assertEqual(TimeOffRequest.objects.count(), 6)
+        self.assertEqual(MemberRole.objects.count(), 12)
+        self.assertEqual(len(self.result.emails), 6)
+
+    def test_first_member_owns_workspace(self):
+        for workspace in Workspace.objects.all():
+            self.assertTrue(workspace.owner.email.endswith("-m0@example.com"))
+            owners = MemberPermissions.objects.filter(workspace=workspace, is_owner=True)
+            self.assertEqual(owners.get().member.user, workspace.owner)
+        self.assertEqual(MemberPermissions.objects.count(), WorkspaceMember.objects.count())
+
+    def test_users_can_log_in(self):
+        user = User.objects.get(email=self.result.emails[1])
+        self.assertTrue(user.check_password("password"))
+
+    def test_shifts_fall_in_weeks(self):
+        self.assertFalse(Shift.objects.filter(start_time__date__lt=date(2026, 1, 5)).exists())
+        self.assertFalse(Shift.objects.filter(start_time__date__gt=date(2026, 2, 1)).exists())
+        self.assertFalse(Shift.objects.filter(open=True, member__isnull=False).exists())
+
+    def test_rollup_is_built(self):
+        self.assertTrue(LaborRollup.objects.exists())
+        out = StringIO()
+        call_command("rebuild_labor_rollup", check=True, stdout=out)
+        self.assertIn("matches", out.getvalue())
+
+    def test_same_seed_same_data(self):
+        first = list(Shift.objects.order_by("id").values_list("start_time", "end_time", "open"))
+        seed(2, 3, 2, 4, prefix="again", start=date(2026, 1, 5))
+        second = list(
+            Shift.objects.filter(workspace__name__startswith="again")
+            .order_by("id")
+            .values_list("start_time", "end_time", "open")
+        )
+        self.assertEqual(first, second)
+
+
+class SeedDataCommandTest(TestCase):
+    """Test cases for the seed_data command"""
+
+    def test_seeds_and_rejects_used_prefix(self):
+        options = {"workspaces": 1, "members": 2, "roles": 1, "weeks": 1, "stdout": StringIO()}
+        call_command("seed_data", **options)
+        self.assertEqual(WorkspaceMember.objects.count(), 2)
+        with self.assertRaises(CommandError):
+            call_command("seed_data", **options)
+
+    def test_rejects_empty_sizes(self):
+        with self.assertRaises(CommandError):
+            call_command("seed_data", roles=0, stdout=StringIO())
@@ -6,13 +6,13 @@ from django.conf import settings
 class WhiteNoiseSettingsTest(TestCase):
     def test_whitenoise_in_middleware(self):
         self.assertIn(
-            "whitenoise.middleware.WhiteNoiseMiddleware",
+            "api.middleware.StaticFilesMiddleware",
             settings.MIDDLEWARE,
         )
 
     def test_whitenoise_after_security_middleware(self):
         idx_security = settings.MIDDLEWARE.index("django.middleware.security.SecurityMiddleware")
-        idx_whitenoise = settings.MIDDLEWARE.index("whitenoise.middleware.WhiteNoiseMiddleware")
+        idx_whitenoise = settings.MIDDLEWARE.index("api.middleware.StaticFilesMiddleware")
         self.assertLess(idx_security, idx_whitenoise)
 
     def test_static_root_configured(self):
@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+from ....utils import encode_cursor, decode_cursor, parse_page_size, parse_window
+
+
+class CursorTest(TestCase):
+    """Test cases for encode_cursor and decode_cursor"""
+
+    def test_round_trip(self):
+        """Test that a decoded cursor matches the encoded sort key"""
+        start = datetime(2025, 2, 16, 9, 30, tzinfo=timezone.utc)
+        self.assertEqual(decode_cursor(encode_cursor(start, 42)), (start, 42))
+
+    def test_invalid(self):
+        """Test that malformed cursors raise ValueError"""
+        for cursor in ["", "not-a-cursor", encode_cursor(datetime.now(timezone.utc), 1)[:-4]]:
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(ValueError):
+                    decode_cursor(cursor)
+
+
+@override_settings(SHIFT_PAGE_SIZE=50, SHIFT_PAGE_SIZE_MAX=100)
+class ParsePageSizeTest(TestCase):
+    """Test cases for parse_page_size"""
+
+    def test_values(self):
+        test_cases = [
+            (None, 50),  # Default
+            ("10", 10),  # Requested
+            (500, 100),  # Capped
+        ]
+        for value, expected in test_cases:
+            with self.subTest(value=value):
+                self.assertEqual(parse_page_size(value), expected)
+
+    def test_invalid(self):
+        for value in ["0", "-1", "ten"]:
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    parse_page_size(value)
+
+
+class ParseWindowTest(TestCase):
+    """Test cases for parse_window"""
+
+    @override_settings(SHIFT_WINDOW_PAST=timedelta(days=7), SHIFT_WINDOW_FUTURE=timedelta(days=35))
+    @patch("django.utils.timezone.now")
+    def test_default_window(self, mock_now):
+        """Test that the default window surrounds the current day"""
+        today = datetime(2025, 2, 16, tzinfo=timezone.utc)
+        mock_now.return_value = today + timedelta(hours=13, microseconds=1)
+        window = (today - timedelta(days=7), today + timedelta(days=36))
+        self.assertEqual(parse_window({}), window)
+        mock_now.return_value = today + timedelta(hours=23, minutes=59)
+        self.assertEqual(parse_window({}), window)
+
+    def test_open_ended(self):
+        """Test that a single bound leaves the other side unbounded"""
+        start, end = parse_window({"range_start": "2025-02-16"})
+        self.assertEqual(start, datetime(2025, 2, 16, tzinfo=timezone.utc))
+        self.assertIsNone(end)
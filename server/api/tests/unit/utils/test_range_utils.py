@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from django.test import TestCase
+
+from ....utils import parse_range_bound, overlapping, exceeds_max_shift_duration
+
+
+class ParseRangeBoundTest(TestCase):
+    """Test cases for parse_range_bound"""
+
+    def test_date_start(self):
+        """Test that a date lower bound is midnight of that day"""
+        self.assertEqual(
+            parse_range_bound("2025-02-16"),
+            datetime(2025, 2, 16, tzinfo=timezone.utc),
+        )
+
+    def test_date_end_is_exclusive(self):
+        """Test that a date upper bound is midnight of the following day"""
+        self.assertEqual(
+            parse_range_bound("2025-02-16", end=True),
+            datetime(2025, 2, 17, tzinfo=timezone.utc),
+        )
+
+    def test_unpadded_date(self):
+        """Test that dates are recognized by parsing rather than by their length"""
+        self.assertEqual(
+            parse_range_bound("2025-2-6", end=True),
+            datetime(2025, 2, 7, tzinfo=timezone.utc),
+        )
+
+    def test_datetime(self):
+        """Test that datetimes are returned unchanged, with or without end"""
+        value = "2025-02-16T09:30:00+00:00"
+        expected = datetime(2025, 2, 16, 9, 30, tzinfo=timezone.utc)
+        self.assertEqual(parse_range_bound(value), expected)
+        self.assertEqual(parse_range_bound(value, end=True), expected)
+
+    def test_invalid(self):
+        """Test invalid values raise ValueError"""
+        for value in ["999", 999, "2025-13-01", "not a date"]:
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    parse_range_bound(value)
+
+
+class OverlappingTest(TestCase):
+    """Test cases for overlapping"""
+
+    def test_bounds_start_time_by_max_duration(self):
+        """Test that a lower bound also limits start_time for index range scans"""
+        queryset = MagicMock()
+        queryset.filter.return_value = queryset
+        start = datetime(2025, 2, 16, tzinfo=timezone.utc)
+        end = start + timedelta(days=7)
+
+        overlapping(queryset, start, end)
+
+        queryset.filter.assert_any_call(
+            start_time__gt=start - timedelta(hours=24), end_time__gt=start
+        )
+        queryset.filter.assert_any_call(start_time__lt=end)
+
+    def test_unbounded(self):
+        """Test that no filters are applied without bounds"""
+        queryset = MagicMock()
+        self.assertIs(overlapping(queryset), queryset)
+        queryset.filter.assert_not_called()
+
+
+class ExceedsMaxShiftDurationTest(TestCase):
+    """Test cases for exceeds_max_shift_duration"""
+
+    def test_limits(self):
+        start = datetime(2025, 2, 16, tzinfo=timezone.utc)
+        self.assertFalse(exceeds_max_shift_duration(start, start + timedelta(hours=24)))
+        self.assertTrue(exceeds_max_shift_duration(start, start + timedelta(hours=24, seconds=1)))
@@ -0,0 +1,171 @@
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.test import AsyncClient, SimpleTestCase, TestCase, override_settings
+from django.urls import path, reverse
+from django.utils.module_loading import import_string
+from rest_framework import status
+from rest_framework.exceptions import NotFound
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+
+from ....benchmarks import access_token
+from ....models import User, Workspace, WorkspaceMember
+from ....views.base import AsyncAPIView
+
+
+class ExampleView(AsyncAPIView):
+    """View mixing async and sync handlers"""
+
+    authentication_classes = []
+    permission_classes = []
+
+    async def get(self, request):
+        count = await User.objects.acount()
+        return Response({"count": count})
+
+    def post(self, request):
+        return Response({"count": User.objects.count()}, status=status.HTTP_201_CREATED)
+
+    async def delete(self, request):
+        raise NotFound("Nothing to delete.")
+
+
+class ProtectedView(AsyncAPIView):
+    """Async view requiring authentication"""
+
+    permission_classes = [IsAuthenticated]
+
+    async def get(self, request):
+        return Response({})
+
+
+class SleepView(AsyncAPIView):
+    async def get(self, request):
+        await asyncio.sleep(0.2)
+        return Response({})
+
+
+urlpatterns = [path("sleep/", SleepView.as_view(), name="sleep")]
+
+
+class AsyncAPIViewTest(TestCase):
+    """Test cases for dispatching DRF views as coroutines"""
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.user = User.objects.create_user(email="test@example.com", password="password123")
+
+    def call(self, view, request):
+        response = async_to_sync(view.as_view())(request)
+        response.render()
+        return response
+
+    def test_view_is_async(self):
+        self.assertTrue(ExampleView.view_is_async)
+
+    def test_async_handler(self):
+        response = self.call(ExampleView, self.factory.get("/"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"count": 1})
+
+    def test_sync_handler(self):
+        response = self.call(ExampleView, self.factory.post("/"))
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data, {"count": 1})
+
+    def test_exception_is_handled(self):
+        response = self.call(ExampleView, self.factory.delete("/"))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_method_not_allowed(self):
+        response = self.call(ExampleView, self.factory.put("/"))
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+
+    def test_permissions_are_checked(self):
+        response = self.call(ProtectedView, self.factory.get("/"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class AsyncReadViewsTest(TestCase):
+    """Test cases for the async read endpoints served through the ASGI handler"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="test@example.com", password="password123")
+        self.workspace = Workspace.objects.create(owner=self.user, created_by=self.user)
+        WorkspaceMember.objects.create(user=self.user, workspace=self.workspace, added_by=self.user)
+        self.client = AsyncClient()
+        self.headers = {"Authorization": f"Bearer {access_token(self.user)}"}
+
+    async def test_get_user(self):
+        response = await self.client.get(reverse("get_user"), headers=self.headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["result"]["user"]["email"], "test@example.com")
+        self.assertEqual(len(response.json()["result"]["workspaces"]), 1)
+
+    async def test_workspace_members(self):
+        url = reverse("workspace_members", args=[self.workspace.id])
+        response = await self.client.get(url, headers=self.headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["result"]), 1)
+
+        response = await self.client.get(
+            url, headers={**self.headers, "If-None-Match": response["ETag"]}
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    async def test_workspace_shifts(self):
+        response = await self.client.get(
+            reverse("workspace_shifts", args=[self.workspace.id]), headers=self.headers
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["result"], [])
+
+    async def test_workspace_shifts_not_found(self):
+        response = await self.client.get(
+            reverse("workspace_shifts", args=[0]), headers=self.headers
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    async def test_shift_filter(self):
+        response = await self.client.post(
+            reverse("shift_filter"),
+            {"workspace_id": self.workspace.id},
+            content_type="application/json",
+            headers=self.headers,
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["result"], [])
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class AsyncMiddlewareTest(SimpleTestCase):
+    """Test cases for serving concurrent requests through the ASGI middleware chain"""
+
+    def test_middleware_is_async_capable(self):
+        for middleware in settings.MIDDLEWARE:
+            with self.subTest(middleware=middleware):
+                self.assertTrue(getattr(import_string(middleware), "async_capable", False))
+
+    async def test_requests_are_not_serialized(self):
+        client = AsyncClient()
+        started = time.monotonic()
+        responses = await asyncio.gather(*(client.get("/sleep/") for _ in range(5)))
+        # A sync-only middleware would run the five requests one at a time
+        self.assertLess(time.monotonic() - started, 0.6)
+        for response in responses:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.metrics.url_name, "sleep")
+
+    async def test_static_files(self):
+        with tempfile.TemporaryDirectory() as root:
+            Path(root, "robots.txt").write_text("User-agent: *\n")
+            with override_settings(WHITENOISE_ROOT=root):
+                response = await AsyncClient().get("/robots.txt")
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(b"".join(response.streaming_content), b"User-agent: *\n")
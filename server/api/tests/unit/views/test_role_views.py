@@ -3,6 +3,7 @@ from rest_framework.test import APIRequestFactory
 from rest_framework import status
 from unittest.mock import patch, MagicMock
 from ....views.role import RoleView
+from ....membership import Membership
 from ....models import Workspace, WorkspaceMember, WorkspaceRole, MemberPermissions
 
 
@@ -34,14 +35,14 @@ class RoleViewTest(TestCase):
     # -------------------------
 
     @patch("api.views.role.WorkspaceRole.objects.get")
-    @patch("api.views.role.WorkspaceMember.objects.get")
+    @patch("api.views.role.RoleView.get_membership")
     @patch("api.views.role.RoleReadSerializer")
-    def test_get_role_successful(self, mock_serializer, mock_member_get, mock_role_get):
+    def test_get_role_successful(self, mock_serializer, mock_get_membership, mock_role_get):
         """Test successful role retrieval"""
         mock_role = MagicMock()
         mock_role_get.return_value = mock_role
 
-        mock_member_get.return_value = MagicMock()
+        mock_get_membership.return_value = Membership(1, 1)
 
         mock_serializer_instance = MagicMock()
         mock_serializer_instance.data = {"id": 1, "name": "Manager", "pay_rate": 25.50}
@@ -65,11 +66,11 @@ class RoleViewTest(TestCase):
         self.assertEqual(response.data["error"]["message"], "Workspace role does not exist.")
 
     @patch("api.views.role.WorkspaceRole.objects.get")
-    @patch("api.views.role.WorkspaceMember.objects.get")
-    def test_get_role_not_workspace_member(self, mock_member_get, mock_role_get):
+    @patch("api.views.role.RoleView.get_membership")
+    def test_get_role_not_workspace_member(self, mock_get_membership, mock_role_get):
         """Test get when user is not a member of the workspace"""
         mock_role_get.return_value = MagicMock()
-        mock_member_get.side_effect = WorkspaceMember.DoesNotExist
+        mock_get_membership.return_value = None
 
         request = self._create_drf_request("/roles/1/", method="get")
         response = self.view.get(request, role_id=1)
@@ -86,11 +87,8 @@ class RoleViewTest(TestCase):
 
     @patch("api.views.role.RoleSerializer")
     @patch("api.views.role.WorkspaceRole.objects.get")
-    @patch("api.views.role.WorkspaceMember.objects.get")
-    @patch("api.views.role.MemberPermissions.objects.get")
-    def test_put_role_successful(
-        self, mock_permissions_get, mock_member_get, mock_role_get, mock_serializer
-    ):
+    @patch("api.views.role.RoleView.get_membership")
+    def test_put_role_successful(self, mock_get_membership, mock_role_get, mock_serializer):
         """Test successful role update"""
         mock_serializer_instance = MagicMock()
         mock_serializer_instance.is_valid.return_value = True
@@ -101,8 +99,7 @@ class RoleViewTest(TestCase):
         mock_workspace_role.workspace.id = 1
         mock_role_get.return_value = mock_workspace_role
 
-        mock_member_get.return_value = MagicMock()
-        mock_permissions_get.return_value = MagicMock()
+        mock_get_membership.return_value = Membership(1, 1, manage_workspace_roles=True)
 
         request = self._create_drf_request(
             "/roles/1/", {"name": "Updated Manager", "pay_rate": 30.00}, method="put"
@@ -146,10 +143,9 @@ class RoleViewTest(TestCase):
 
     @patch("api.views.role.RoleSerializer")
     @patch("api.views.role.WorkspaceRole.objects.get")
-    @patch("api.views.role.WorkspaceMember.objects.get")
-    @patch("api.views.role.MemberPermissions.objects.get")
+    @patch("api.views.role.RoleView.get_membership")
     def test_put_role_insufficient_permissions(
-        self, mock_permissions_get, mock_member_get, mock_role_get, mock_serializer
+        self, mock_get_membership, mock_role_get, mock_serializer
     ):
         """Test role update without manage_workspace_roles permission"""
         mock_serializer_instance = MagicMock()
@@ -157,8 +153,7 @@ class RoleViewTest(TestCase):
         mock_serializer.return_value = mock_serializer_instance
 
         mock_role_get.return_value = MagicMock()
-        mock_member_get.return_value = MagicMock()
-        mock_permissions_get.side_effect = MemberPermissions.DoesNotExist
+        mock_get_membership.return_value = Membership(1, 1)
 
         request = self._create_drf_request("/roles/1/", {"name": "Name"}, method="put")
         response = self.view.put(request, role_id=1)
@@ -171,15 +166,17 @@ class RoleViewTest(TestCase):
 
     @patch("api.views.role.RoleSerializer")
     @patch("api.views.role.WorkspaceRole.objects.get")
-    @patch("api.views.role.WorkspaceMember.objects.get")
-    def test_put_role_not_workspace_member(self, mock_member_get, mock_role_get, mock_serializer):
+    @patch("api.views.role.RoleView.get_membership")
+    def test_put_role_not_workspace_member(
+        self, mock_get_membership, mock_role_get, mock_serializer
+    ):
         """Test role update when user is not a member of the workspace"""
         mock_serializer_instance = MagicMock()
         mock_serializer_instance.is_valid.return_value = True
         mock_serializer.return_value = mock_serializer_instance
 
         mock_role_get.return_value = MagicMock()
-        mock_member_get.side_effect = WorkspaceMember.DoesNotExist
+        mock_get_membership.return_value = None
 
         request = self._create_drf_request("/roles/1/", {"name": "Name"}, method="put")
         response = self.view.put(request, role_id=1)
@@ -191,11 +188,8 @@ class RoleViewTest(TestCase):
 
     @patch("api.views.role.RoleSerializer")
     @patch("api.views.role.WorkspaceRole.objects.get")
-    @patch("api.views.role.WorkspaceMember.objects.get")
-    @patch("api.views.role.MemberPermissions.objects.get")
-    def test_put_role_partial_update(
-        self, mock_permissions_get, mock_member_get, mock_role_get, mock_serializer
-    ):
+    @patch("api.views.role.RoleView.get_membership")
+    def test_put_role_partial_update(self, mock_get_membership, mock_role_get, mock_serializer):
         """Test role update with only name (no pay_rate)"""
         mock_serializer_instance = MagicMock()
         mock_serializer_instance.is_valid.return_value = True
@@ -207,8 +201,7 @@ class RoleViewTest(TestCase):
         mock_workspace_role.pay_rate = 25.00
         mock_role_get.return_value = mock_workspace_role
 
-        mock_member_get.return_value = MagicMock()
-        mock_permissions_get.return_value = MagicMock()
+        mock_get_membership.return_value = Membership(1, 1, manage_workspace_roles=True)
 
         request = self._create_drf_request("/roles/1/", {"name": "New Name Only"}, method="put")
         response = self.view.put(request, role_id=1)
@@ -223,14 +216,12 @@ class RoleViewTest(TestCase):
     # -------------------------
 
     @patch("api.views.role.WorkspaceRole.objects.get")
-    @patch("api.views.role.WorkspaceMember.objects.get")
-    @patch("api.views.role.MemberPermissions.objects.get")
-    def test_delete_role_successful(self, mock_permissions_get, mock_member_get, mock_role_get):
+    @patch("api.views.role.RoleView.get_membership")
+    def test_delete_role_successful(self, mock_get_membership, mock_role_get):
         """Test successful role deletion"""
         mock_role = MagicMock()
         mock_role_get.return_value = mock_role
-        mock_member_get.return_value = MagicMock()
-        mock_permissions_get.return_value = MagicMock()
+        mock_get_membership.return_value = Membership(1, 1, manage_workspace_roles=True)
 
         request = self._create_drf_request("/roles/1/", method="delete")
         response = self.view.delete(request, role_id=1)
@@ -253,15 +244,11 @@ class RoleViewTest(TestCase):
         )
 
     @patch("api.views.role.WorkspaceRole.objects.get")
-    @patch("api.views.role.WorkspaceMember.objects.get")
-    @patch("api.views.role.MemberPermissions.objects.get")
-    def test_delete_role_insufficient_permissions(
-        self, mock_permissions_get, mock_member_get, mock_role_get
-    ):
+    @patch("api.views.role.RoleView.get_membership")
+    def test_delete_role_insufficient_permissions(self, mock_get_membership, mock_role_get):
         """Test role deletion without manage_workspace_roles permission"""
         mock_role_get.return_value = MagicMock()
-        mock_member_get.return_value = MagicMock()
-        mock_permissions_get.side_effect = MemberPermissions.DoesNotExist
+        mock_get_membership.return_value = Membership(1, 1)
 
         request = self._create_drf_request("/roles/1/", method="delete")
         response = self.view.delete(request, role_id=1)
@@ -273,11 +260,11 @@ class RoleViewTest(TestCase):
         )
 
     @patch("api.views.role.WorkspaceRole.objects.get")
-    @patch("api.views.role.WorkspaceMember.objects.get")
-    def test_delete_role_not_workspace_member(self, mock_member_get, mock_role_get):
+    @patch("api.views.role.RoleView.get_membership")
+    def test_delete_role_not_workspace_member(self, mock_get_membership, mock_role_get):
         """Test role deletion when user is not a member of the workspace"""
         mock_role_get.return_value = MagicMock()
-        mock_member_get.side_effect = WorkspaceMember.DoesNotExist
+        mock_get_membership.return_value = None
 
         request = self._create_drf_request("/roles/1/", method="delete")
         response = self.view.delete(request, role_id=1)
@@ -8,6 +8,13 @@ from .views import (
     WorkspaceMembersView,
     WorkspaceRolesView,
     WorkspaceShiftsView,
+    WorkspaceShiftsBulkView,
+    WorkspaceShiftChangesView,
+    WorkspaceEventsView,
+    WorkspaceShiftConflictsView,
+    WorkspaceShiftsAutofillView,
+    WorkspaceLaborView,
+    WorkspaceShiftsExportView,
     MemberView,
     MemberPermissionsView,
     MemberRolesView,
@@ -15,6 +22,13 @@ from .views import (
     ShiftView,
     ShiftFilterView,
     RoleView,
+    WorkspaceTemplatesView,
+    WorkspaceTemplateOccurrencesView,
+    TemplateView,
+    RequestStatsView,
+    MemberCalendarView,
+    WorkspaceCalendarView,
+    CalendarFeedView,
 )
 
 urlpatterns = [
@@ -38,11 +52,61 @@ urlpatterns = [
         WorkspaceShiftsView.as_view(),
         name="workspace_shifts",
     ),
+    path(
+        "workspace/<int:workspace_id>/shifts/bulk/",
+        WorkspaceShiftsBulkView.as_view(),
+        name="workspace_shifts_bulk",
+    ),
+    path(
+        "workspace/<int:workspace_id>/shifts/changes/",
+        WorkspaceShiftChangesView.as_view(),
+        name="workspace_shift_changes",
+    ),
+    path(
+        "workspace/<int:workspace_id>/events/",
+        WorkspaceEventsView.as_view(),
+        name="workspace_events",
+    ),
+    path(
+        "workspace/<int:workspace_id>/shifts/conflicts/",
+        WorkspaceShiftConflictsView.as_view(),
+        name="workspace_shift_conflicts",
+    ),
+    path(
+        "workspace/<int:workspace_id>/shifts/autofill/",
+        WorkspaceShiftsAutofillView.as_view(),
+        name="workspace_shifts_autofill",
+    ),
+    path(
+        "workspace/<int:workspace_id>/labor/",
+        WorkspaceLaborView.as_view(),
+        name="workspace_labor",
+    ),
+    path(
+        "workspace/<int:workspace_id>/shifts/export.<str:file_format>",
+        WorkspaceShiftsExportView.as_view(),
+        name="workspace_shifts_export",
+    ),
+    path(
+        "workspace/<int:workspace_id>/calendar/",
+        WorkspaceCalendarView.as_view(),
+        name="workspace_calendar",
+    ),
     path(
         "workspace/<int:workspace_id>/roles/",
         WorkspaceRolesView.as_view(),
         name="workspace_roles",
     ),
+    path(
+        "workspace/<int:workspace_id>/templates/",
+        WorkspaceTemplatesView.as_view(),
+        name="workspace_templates",
+    ),
+    path(
+        "workspace/<int:workspace_id>/templates/occurrences/",
+        WorkspaceTemplateOccurrencesView.as_view(),
+        name="workspace_template_occurrences",
+    ),
     path("member/<int:member_id>/", MemberView.as_view(), name="member"),
     path(
         "member/<int:member_id>/permissions/",
@@ -55,7 +119,15 @@ urlpatterns = [
         MemberShiftsView.as_view(),
         name="member_shifts",
     ),
+    path(
+        "member/<int:member_id>/calendar/",
+        MemberCalendarView.as_view(),
+        name="member_calendar",
+    ),
     path("shift/<int:shift_id>/", ShiftView.as_view(), name="shift"),
     path("shift/filter/", ShiftFilterView.as_view(), name="shift_filter"),
     path("role/<int:role_id>/", RoleView.as_view(), name="role"),
+    path("template/<int:template_id>/", TemplateView.as_view(), name="template"),
+    path("metrics/", RequestStatsView.as_view(), name="request_stats"),
+    path("calendar/<str:token>.ics", CalendarFeedView.as_view(), name="calendar_feed"),
 ]
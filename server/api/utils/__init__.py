@@ -0,0 +1,10 @@
+from .ranges import parse_range_bound, overlapping, exceeds_max_shift_duration
+from .pagination import (
+    encode_cursor,
+    decode_cursor,
+    parse_page_size,
+    parse_window,
+    paginate,
+    apaginate,
+)
+from .expressions import DurationSeconds
@@ -0,0 +1,52 @@
+"""Database expressions shared by aggregate queries."""
+
+from django.db.models import BigIntegerField, Func
+
+
+class DurationSeconds(Func):
+    """Seconds between two datetime expressions, computed by the database.
+
+    Whole seconds, truncated like int(timedelta.total_seconds()) so the
+    result matches what Python computes for the same shift. Postgres extracts
+    the epoch of the interval; SQLite has no interval type, so the difference
+    of Julian day numbers is rounded to milliseconds, absorbing its floating
+    point error, then truncated to seconds.
+
+    Usage: DurationSeconds("start_time", "end_time")
+    """
+
+    arity = 2
+    output_field = BigIntegerField()
+
+    def as_sql(self, compiler, connection, **extra_context):
+        return super().as_sql(
+            compiler,
+            connection,
+            template="TIMESTAMPDIFF(SECOND, %(expressions)s)",
+            **extra_context,
+        )
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        start, end = self.source_expressions
+        return self._compile_template(
+            compiler,
+            connection,
+            "(CAST(ROUND((julianday(%s) - julianday(%s)) * 86400000.0) AS INTEGER) / 1000)",
+            end,
+            start,
+        )
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        start, end = self.source_expressions
+        return self._compile_template(
+            compiler, connection, "FLOOR(EXTRACT(EPOCH FROM (%s - %s)))::bigint", end, start
+        )
+
+    def _compile_template(self, compiler, connection, template, *expressions):
+        sqls = []
+        params = []
+        for expression in expressions:
+            sql, expression_params = compiler.compile(expression)
+            sqls.append(sql)
+            params.extend(expression_params)
+        return template % tuple(sqls), params
@@ -0,0 +1,142 @@
+"""Keyset (cursor) pagination and default windows for shift lists."""
+
+import base64
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .ranges import parse_range_bound
+
+
+def encode_cursor(start_time: datetime, pk: int) -> str:
+    """Encode the sort key of the last row on a page into an opaque cursor.
+
+    :param datetime start_time: start_time of the last row returned.
+    :param int pk: Primary key of the last row returned.
+    :return: URL-safe cursor string.
+    :rtype: str
+    """
+    raw = f"{start_time.isoformat()}|{pk}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """Decode a cursor produced by encode_cursor.
+
+    :param str cursor: Cursor string from a previous page.
+    :return: The (start_time, pk) sort key the next page starts after.
+    :rtype: tuple
+    :raises ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        start, pk = base64.urlsafe_b64decode(padded.encode()).decode().split("|")
+        start_time = parse_datetime(start)
+        pk = int(pk)
+    except Exception as exc:
+        raise ValueError("Invalid cursor.") from exc
+    if start_time is None:
+        raise ValueError("Invalid cursor.")
+    return start_time, pk
+
+
+def parse_page_size(value=None) -> int:
+    """Return the requested page size, capped at SHIFT_PAGE_SIZE_MAX.
+
+    :param value: Raw page_size from the request, or None for the default.
+    :return: Number of rows to return per page.
+    :rtype: int
+    :raises ValueError: If the value is not a positive integer.
+    """
+    if value is None:
+        return settings.SHIFT_PAGE_SIZE
+    page_size = int(value)
+    if page_size < 1:
+        raise ValueError("Page size must be positive.")
+    return min(page_size, settings.SHIFT_PAGE_SIZE_MAX)
+
+
+def parse_window(params) -> tuple:
+    """Return the [start, end) window requested in params.
+
+    When neither range_start nor range_end is present the window defaults to
+    SHIFT_WINDOW_PAST before today through SHIFT_WINDOW_FUTURE after today, in
+    TIME_ZONE. It only moves at midnight, so polls share a window (and ETag).
+
+    :param params: Query params or request body containing optional bounds.
+    :return: (start, end) datetimes; either may be None when unbounded.
+    :rtype: tuple
+    :raises ValueError: If a bound is not a valid date or datetime.
+    """
+    if "range_start" not in params and "range_end" not in params:
+        today = timezone.make_aware(datetime.combine(timezone.localdate(), time.min))
+        return (
+            today - settings.SHIFT_WINDOW_PAST,
+            today + timedelta(days=1) + settings.SHIFT_WINDOW_FUTURE,
+        )
+
+    start = None
+    end = None
+    if "range_start" in params:
+        start = parse_range_bound(params["range_start"])
+    if "range_end" in params:
+        end = parse_range_bound(params["range_end"], end=True)
+    return start, end
+
+
+def _page_queryset(queryset: QuerySet, cursor: str, page_size: int) -> QuerySet:
+    """Return the query fetching one page plus one row to detect a next page."""
+    queryset = queryset.order_by("start_time", "id")
+    if cursor:
+        start_time, pk = decode_cursor(cursor)
+        queryset = queryset.filter(
+            Q(start_time__gt=start_time) | Q(start_time=start_time, id__gt=pk)
+        )
+    return queryset[: page_size + 1]
+
+
+def _split_page(rows: list, page_size: int) -> tuple:
+    """Trim the extra row fetched by _page_queryset and build the next cursor."""
+    if len(rows) <= page_size:
+        return rows, None
+
+    rows = rows[:page_size]
+    last = rows[-1]
+    if isinstance(last, dict):
+        return rows, encode_cursor(last["start_time"], last["id"])
+    return rows, encode_cursor(last.start_time, last.id)
+
+
+def paginate(queryset: QuerySet, cursor: str = None, page_size: int = None) -> tuple:
+    """Return one page of a shift queryset ordered by (start_time, id).
+
+    :param QuerySet queryset: Queryset over a model with start_time; values()
+        querysets must include start_time and id.
+    :param str cursor: Cursor returned with the previous page, or None.
+    :param int page_size: Maximum number of rows to return.
+    :return: (rows, next_cursor) where next_cursor is None on the last page.
+    :rtype: tuple
+    :raises ValueError: If the cursor is malformed.
+    """
+    page_size = page_size or settings.SHIFT_PAGE_SIZE
+    rows = list(_page_queryset(queryset, cursor, page_size))
+    return _split_page(rows, page_size)
+
+
+async def apaginate(queryset: QuerySet, cursor: str = None, page_size: int = None) -> tuple:
+    """Async version of paginate, fetching the page with the async ORM.
+
+    :param QuerySet queryset: Queryset over a model with start_time; values()
+        querysets must include start_time and id.
+    :param str cursor: Cursor returned with the previous page, or None.
+    :param int page_size: Maximum number of rows to return.
+    :return: (rows, next_cursor) where next_cursor is None on the last page.
+    :rtype: tuple
+    :raises ValueError: If the cursor is malformed.
+    """
+    page_size = page_size or settings.SHIFT_PAGE_SIZE
+    rows = [row async for row in _page_queryset(queryset, cursor, page_size)]
+    return _split_page(rows, page_size)
@@ -0,0 +1,68 @@
+"""Helpers for querying shifts by time range."""
+
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.db.models import QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+
+def parse_range_bound(value, end: bool = False) -> datetime:
+    """Parse a range bound from a request into an aware datetime.
+
+    Accepts either a date (Y-m-d) or an ISO 8601 datetime. A date used as an
+    upper bound covers that whole day, so it is returned as the following
+    midnight to keep ranges half-open.
+
+    :param value: Raw value from the request body or query string.
+    :param bool end: Whether the value is the upper bound of the range.
+    :return: Timezone-aware datetime for the bound.
+    :rtype: datetime
+    :raises ValueError: If the value is not a valid date or datetime.
+    """
+    value = str(value) if not isinstance(value, str) else value
+    day = parse_date(value)
+    if day is not None:
+        bound = datetime.combine(day + timedelta(days=1) if end else day, time.min)
+    else:
+        bound = parse_datetime(value)
+        if bound is None:
+            raise ValueError(f"Invalid range bound '{value}'.")
+    if timezone.is_naive(bound):
+        bound = timezone.make_aware(bound)
+    return bound
+
+
+def overlapping(queryset: QuerySet, start: datetime = None, end: datetime = None) -> QuerySet:
+    """Filter a shift queryset to rows overlapping the half-open range [start, end).
+
+    The lower bound on start_time lets the (workspace, start_time) and
+    (member, start_time) indexes serve the scan as a tight range; it relies
+    on no shift being longer than SHIFT_MAX_DURATION.
+
+    :param QuerySet queryset: Queryset over a model with start_time and end_time.
+    :param datetime start: Inclusive lower bound, or None for unbounded.
+    :param datetime end: Exclusive upper bound, or None for unbounded.
+    :return: The filtered queryset.
+    :rtype: QuerySet
+    """
+    if start is not None:
+        queryset = queryset.filter(
+            start_time__gt=start - settings.SHIFT_MAX_DURATION,
+            end_time__gt=start,
+        )
+    if end is not None:
+        queryset = queryset.filter(start_time__lt=end)
+    return queryset
+
+
+def exceeds_max_shift_duration(start_time: datetime, end_time: datetime) -> bool:
+    """Return whether a shift spanning start_time to end_time is too long.
+
+    :param datetime start_time: Start of the shift.
+    :param datetime end_time: End of the shift.
+    :return: True if the shift is longer than SHIFT_MAX_DURATION.
+    :rtype: bool
+    """
+    return end_time - start_time > settings.SHIFT_MAX_DURATION
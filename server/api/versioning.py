@@ -0,0 +1,79 @@
+"""Per-workspace version counter backing conditional GETs of workspace collections."""
+
+import hashlib
+
+from django.db.models import F
+from django.utils.cache import parse_etags
+
+from .models import Workspace
+
+
+def bump_version(workspaces):
+    """Increment the version of one or more workspaces.
+
+    Runs in the caller's transaction, so the new version commits together with
+    the write that caused it.
+
+    :param workspaces: A workspace primary key, or workspace ids as a list or queryset.
+    :type workspaces: int or list[int] or QuerySet
+    """
+    if isinstance(workspaces, int):
+        workspaces = [workspaces]
+    Workspace.objects.filter(pk__in=workspaces).update(version=F("version") + 1)
+
+
+def get_version(workspace_id: int):
+    """Return a workspace's current version.
+
+    :param int workspace_id: Primary key of the workspace.
+    :return: The version, or None if the workspace does not exist.
+    :rtype: int or None
+    """
+    return Workspace.objects.filter(pk=workspace_id).values_list("version", flat=True).first()
+
+
+async def aget_version(workspace_id: int):
+    """Async version of get_version.
+
+    :param int workspace_id: Primary key of the workspace.
+    :return: The version, or None if the workspace does not exist.
+    :rtype: int or None
+    """
+    return (
+        await Workspace.objects.filter(pk=workspace_id).values_list("version", flat=True).afirst()
+    )
+
+
+def collection_etag(collection: str, workspace_id: int, version: int, *params) -> str:
+    """Return the weak ETag of one representation of a workspace collection.
+
+    :param str collection: Name of the collection, e.g. "shifts".
+    :param int workspace_id: Primary key of the workspace.
+    :param int version: Current version of the workspace.
+    :param params: Request parameters the representation depends on.
+    :return: Quoted weak entity tag.
+    :rtype: str
+    """
+    raw = "|".join(str(part) for part in (collection, workspace_id, version, *params))
+    digest = hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def not_modified(request, etag: str) -> bool:
+    """Return whether the request's If-None-Match matches an ETag.
+
+    Comparison is weak, as required for If-None-Match.
+
+    :param request: HTTP request.
+    :type request: rest_framework.request.Request
+    :param str etag: Current entity tag of the representation.
+    :return: True if a 304 response should be sent.
+    :rtype: bool
+    """
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    etags = parse_etags(header)
+    if "*" in etags:
+        return True
+    return etag.removeprefix("W/") in {tag.removeprefix("W/") for tag in etags}
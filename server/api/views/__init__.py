@@ -4,9 +4,21 @@ from .workspace import (
     WorkspaceView,
     WorkspaceMembersView,
     WorkspaceShiftsView,
+    WorkspaceShiftsBulkView,
+    WorkspaceShiftChangesView,
+    WorkspaceShiftConflictsView,
+    WorkspaceShiftsAutofillView,
+    WorkspaceLaborView,
+    WorkspaceShiftsExportView,
     WorkspaceRolesView,
+    WorkspaceTemplatesView,
+    WorkspaceTemplateOccurrencesView,
 )
 
 from .member import MemberView, MemberPermissionsView, MemberRolesView, MemberShiftsView
 from .shift import ShiftView, ShiftFilterView
 from .role import RoleView
+from .template import TemplateView
+from .events import WorkspaceEventsView
+from .ical import MemberCalendarView, WorkspaceCalendarView, CalendarFeedView
+from .metrics import RequestStatsView
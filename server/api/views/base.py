@@ -0,0 +1,57 @@
+from asyncio import iscoroutinefunction
+
+from asgiref.sync import sync_to_async
+from django.utils.functional import classproperty
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """APIView dispatched as a coroutine, so handlers may be async.
+
+    DRF's dispatch is synchronous; this runs the same steps (request
+    initialization, authentication, permission checks, exception handling and
+    response finalization) but awaits async handlers. Sync handlers, and
+    authentication (which may read the user row), run through sync_to_async,
+    so a view can make only its hot read handlers async.
+
+    Under an ASGI server an awaiting handler frees the worker for other
+    requests; under WSGI Django runs the coroutine to completion per request.
+    """
+
+    @classproperty
+    def view_is_async(cls):
+        # Django requires all handlers to match; dispatch adapts sync ones
+        return True
+
+    async def dispatch(self, request, *args, **kwargs):
+        """Dispatch a request to its handler, awaiting it if it is async.
+
+        :param request: Incoming Django request.
+        :type request: django.http.HttpRequest
+        :return: Finalized response, rendered later by Django.
+        :rtype: rest_framework.response.Response
+        """
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
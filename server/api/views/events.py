@@ -0,0 +1,104 @@
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views import View
+from rest_framework import status
+from rest_framework.exceptions import AuthenticationFailed
+
+from ..authentication import ClaimsJWTAuthentication
+from ..events import get_backend
+from ..membership import get_membership
+from ..models import Workspace
+
+
+def format_event(event: dict) -> str:
+    """Encode an event as a server-sent event message.
+
+    :param dict event: Event from the backend.
+    :return: Message with the event type as its name and the event as JSON data.
+    :rtype: str
+    """
+    return f"event: {event['type']}\ndata: {json.dumps(event, separators=(',', ':'))}\n\n"
+
+
+async def stream_events(workspace_id: int):
+    """Yield a workspace's events as they are published, with keepalive comments.
+
+    Runs on the ASGI event loop without a thread per client; the subscription
+    is dropped when the client disconnects and the generator is closed.
+
+    :param int workspace_id: Primary key of the workspace.
+    """
+    backend = get_backend()
+    subscription = backend.subscribe(workspace_id)
+    try:
+        yield f"retry: {settings.SCHEDULE_EVENTS_KEEPALIVE * 1000}\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    subscription.get(), settings.SCHEDULE_EVENTS_KEEPALIVE
+                )
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield format_event(event)
+    finally:
+        backend.unsubscribe(subscription)
+
+
+class WorkspaceEventsView(View):
+    """Server-sent event stream of a workspace's shift, member and role changes.
+
+    A plain async Django view rather than a DRF APIView, so a connection holds
+    no thread while idle. Requires an ASGI server: under WSGI the stream would
+    hold a sync worker for as long as the client stays connected, so it is
+    refused with 501.
+    """
+
+    async def get(self, request, workspace_id):
+        """Stream change events for a workspace the user is a member of.
+
+        Each message is named after what changed ("shift", "member" or "role")
+        and carries {"type", "action", "ids"}; a "resync" message means events
+        were dropped and the client should refetch.
+
+        :param request: HTTP request with a JWT bearer token in the Authorization header.
+        :type request: django.http.HttpRequest
+        :return: text/event-stream response, or an error response.
+        :rtype: django.http.HttpResponse
+        """
+        response = {"error": {}}
+
+        if not isinstance(request, ASGIRequest):
+            response["error"]["message"] = "Event streams require an ASGI server."
+            return JsonResponse(response, status=status.HTTP_501_NOT_IMPLEMENTED)
+
+        try:
+            authenticated = await sync_to_async(ClaimsJWTAuthentication().authenticate)(request)
+        except AuthenticationFailed as exc:
+            response["error"]["message"] = str(exc.detail)
+            return JsonResponse(response, status=status.HTTP_401_UNAUTHORIZED)
+        if authenticated is None:
+            response["error"]["message"] = "Authentication credentials were not provided."
+            return JsonResponse(response, status=status.HTTP_401_UNAUTHORIZED)
+        user, _ = authenticated
+
+        # Verify user is part of workspace
+        if await sync_to_async(get_membership)(user.id, workspace_id) is None:
+            if not await Workspace.objects.filter(pk=workspace_id).aexists():
+                response["error"]["message"] = "Workspace does not exist."
+                return JsonResponse(response, status=status.HTTP_404_NOT_FOUND)
+            response["error"]["message"] = "You are not a member of this workspace."
+            return JsonResponse(response, status=status.HTTP_403_FORBIDDEN)
+
+        stream = StreamingHttpResponse(
+            stream_events(workspace_id), content_type="text/event-stream"
+        )
+        stream["Cache-Control"] = "no-cache"
+        # Stops nginx from buffering the stream
+        stream["X-Accel-Buffering"] = "no"
+        return stream
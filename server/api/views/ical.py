@@ -0,0 +1,187 @@
+from django.conf import settings
+from django.http import HttpResponseNotModified, JsonResponse, StreamingHttpResponse
+from django.urls import reverse
+from django.utils import timezone
+from django.views import View
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+
+from ..authentication import ClaimsJWTAuthentication
+from ..ical import (
+    CHUNK_SIZE,
+    MEMBER_FEED,
+    WORKSPACE_FEED,
+    feed_rows,
+    feed_token,
+    read_feed_token,
+    stream_calendar,
+)
+from ..membership import MembershipMixin, get_membership
+from ..models import Workspace, WorkspaceMember
+from ..versioning import collection_etag, not_modified
+
+
+def can_view_member_shifts(membership, member_id: int) -> bool:
+    """Return whether a membership may see a member's shifts.
+
+    Members see their own shifts; owners and managers see everyone's.
+
+    :param Membership membership: The requesting user's membership.
+    :param int member_id: Primary key of the member whose shifts are read.
+    :rtype: bool
+    """
+    return (
+        membership.is_owner
+        or membership.manage_workspace_members
+        or membership.manage_schedules
+        or membership.member_id == member_id
+    )
+
+
+def feed_url(request, kind: str, pk: int) -> str:
+    """Return the absolute URL of a feed issued to the requesting user.
+
+    :param request: Authenticated HTTP request.
+    :type request: rest_framework.request.Request
+    :param str kind: MEMBER_FEED or WORKSPACE_FEED.
+    :param int pk: Primary key of the member or workspace.
+    :rtype: str
+    """
+    token = feed_token(kind, pk, request.user.id)
+    return request.build_absolute_uri(reverse("calendar_feed", kwargs={"token": token}))
+
+
+class MemberCalendarView(MembershipMixin, APIView):
+    """API view returning the subscription URL of a member's shift calendar."""
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, member_id):
+        """Return the URL of an iCalendar feed of a member's shifts.
+
+        The URL embeds a token, so calendar clients can subscribe without
+        logging in. It stops working once the requesting user loses access to
+        the member's shifts.
+
+        :param request: Authenticated HTTP request with member_id in url.
+        :type request: rest_framework.request.Request
+        :return: The feed URL, or an error response.
+        :rtype: rest_framework.response.Response
+        """
+        response = {"error": {}}
+
+        workspace_id = (
+            WorkspaceMember.objects.filter(pk=member_id)
+            .values_list("workspace_id", flat=True)
+            .first()
+        )
+        if workspace_id is None:
+            response["error"]["message"] = "Member does not exist."
+            return Response(response, status=status.HTTP_404_NOT_FOUND)
+
+        membership = self.get_membership(request, workspace_id)
+        if membership is None:
+            response["error"]["message"] = "You are not a member of this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+        if not can_view_member_shifts(membership, member_id):
+            response["error"]["message"] = "You do not have permission to view this members shifts."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+
+        response["result"] = {"url": feed_url(request, MEMBER_FEED, member_id)}
+        return Response(response, status=status.HTTP_200_OK)
+
+
+class WorkspaceCalendarView(MembershipMixin, APIView):
+    """API view returning the subscription URL of a workspace's shift calendar."""
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, workspace_id):
+        """Return the URL of an iCalendar feed of all of a workspace's shifts.
+
+        :param request: Authenticated HTTP request with workspace_id in url.
+        :type request: rest_framework.request.Request
+        :return: The feed URL, or an error response.
+        :rtype: rest_framework.response.Response
+        """
+        response = {"error": {}}
+
+        if self.get_membership(request, workspace_id) is None:
+            if not Workspace.objects.filter(pk=workspace_id).exists():
+                response["error"]["message"] = "Workspace does not exist."
+                return Response(response, status=status.HTTP_404_NOT_FOUND)
+            response["error"]["message"] = "You are not a member of this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+
+        response["result"] = {"url": feed_url(request, WORKSPACE_FEED, workspace_id)}
+        return Response(response, status=status.HTTP_200_OK)
+
+
+class CalendarFeedView(View):
+    """iCalendar feed of a member's or a workspace's shifts, for calendar clients.
+
+    A plain Django view, authorized by the signed token in its URL rather than
+    a JWT. Every poll re-checks that the user the token was issued to may
+    still see the feed.
+    """
+
+    def get(self, request, token):
+        """Stream the feed named by a token as text/calendar.
+
+        Responses carry an ETag derived from the workspace version, so clients
+        sending If-None-Match get a 304 until the schedule changes.
+
+        :param request: HTTP request.
+        :type request: django.http.HttpRequest
+        :param str token: Feed token from MemberCalendarView or WorkspaceCalendarView.
+        :return: Streaming iCalendar response, 304, or an error response.
+        :rtype: django.http.HttpResponse
+        """
+        response = {"error": {}}
+        response["error"]["message"] = "Calendar feed does not exist."
+
+        feed = read_feed_token(token)
+        if feed is None:
+            return JsonResponse(response, status=status.HTTP_404_NOT_FOUND)
+        kind, pk, user_id = feed
+
+        if kind == MEMBER_FEED:
+            row = (
+                WorkspaceMember.objects.filter(pk=pk)
+                .values_list("workspace_id", "workspace__name", "workspace__version")
+                .first()
+            )
+        else:
+            row = Workspace.objects.filter(pk=pk).values_list("id", "name", "version").first()
+        if row is None:
+            return JsonResponse(response, status=status.HTTP_404_NOT_FOUND)
+        workspace_id, name, version = row
+
+        membership = get_membership(user_id, workspace_id)
+        if membership is None or (
+            kind == MEMBER_FEED and not can_view_member_shifts(membership, pk)
+        ):
+            return JsonResponse(response, status=status.HTTP_404_NOT_FOUND)
+
+        # The feed window moves daily, so the tag changes at least once a day
+        etag = collection_etag(
+            "calendar", workspace_id, version, kind, pk, name, timezone.localdate()
+        )
+        if not_modified(request, etag):
+            return HttpResponseNotModified(headers={"ETag": etag})
+
+        title = f"{name} shifts" if kind == MEMBER_FEED else f"{name} schedule"
+        rows = feed_rows(kind, pk).iterator(chunk_size=CHUNK_SIZE)
+        stream = StreamingHttpResponse(
+            stream_calendar(title, rows, kind), content_type="text/calendar; charset=utf-8"
+        )
+        stream["ETag"] = etag
+        stream["Cache-Control"] = (
+            f"private, max-age={int(settings.CALENDAR_FEED_REFRESH.total_seconds())}"
+        )
+        stream["Content-Disposition"] = 'inline; filename="shifts.ics"'
+        return stream
@@ -1,14 +1,18 @@
+from django.db import IntegrityError, transaction
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework.renderers import BrowsableAPIRenderer
 
+from ..authentication import ClaimsJWTAuthentication
+from ..renderers import FastJSONRenderer
 from ..serializers import (
     MemberReadSerializer,
     PermissionsReadSerializer,
     MemberDetailedReadSerializer,
-    ShiftReadSerializer,
+    shift_list_data,
+    shift_values,
 )
 
 from ..models import (
@@ -20,11 +24,13 @@ from ..models import (
     MemberRole,
     Shift,
 )
+from ..membership import MembershipMixin
+from ..utils import overlapping, paginate, parse_page_size, parse_window
 
 
-class MemberView(APIView):
+class MemberView(MembershipMixin, APIView):
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get(self, request, member_id):
@@ -58,9 +64,7 @@ class MemberView(APIView):
             return Response(response, status=status.HTTP_404_NOT_FOUND)
 
         # ensure request is from user in same workspace
-        try:
-            _ = WorkspaceMember.objects.get(workspace=member.workspace, user=request.user)
-        except WorkspaceMember.DoesNotExist:
+        if self.get_membership(request, member.workspace_id) is None:
             response["error"]["message"] = "Must share a workspace to get member."
             return Response(response, status=status.HTTP_403_FORBIDDEN)
 
@@ -80,17 +84,17 @@ class MemberView(APIView):
             return Response(response, status=status.HTTP_404_NOT_FOUND)
 
         # verify user is part of workspace
-        try:
-            request_member = WorkspaceMember.objects.get(
-                user=request.user, workspace=member.workspace
-            )
-        except WorkspaceMember.DoesNotExist:
+        membership = self.get_membership(request, member.workspace_id)
+        if membership is None:
             response["error"]["message"] = "You are not a member of this workspace."
             return Response(response, status=status.HTTP_403_FORBIDDEN)
 
-        # verify request user has perms to view member shifts or is viewing own shifts
-        perms = MemberPermissions.objects.get(member=request_member)
-        if perms.is_owner or perms.manage_workspace_members or member.id == request_member.id:
+        # verify request user has perms to delete members or is deleting own membership
+        if (
+            membership.is_owner
+            or membership.manage_workspace_members
+            or member.id == membership.member_id
+        ):
             member.delete()
             return Response(response, status=status.HTTP_200_OK)
         else:
@@ -98,8 +102,8 @@ class MemberView(APIView):
             return Response(response, status=status.HTTP_403_FORBIDDEN)
 
 
-class MemberPermissionsView(APIView):
-    authentication_classes = [JWTAuthentication]
+class MemberPermissionsView(MembershipMixin, APIView):
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get(self, request, member_id):
@@ -124,19 +128,15 @@ class MemberPermissionsView(APIView):
             return Response(response, status=status.HTTP_404_NOT_FOUND)
 
         # ensure request is from user in same workspace
-        try:
-            request_member = WorkspaceMember.objects.get(
-                workspace=member.workspace, user=request.user
-            )
-        except WorkspaceMember.DoesNotExist:
+        membership = self.get_membership(request, member.workspace_id)
+        if membership is None:
             response["error"]["message"] = "Must share a workspace to get member."
             return Response(response, status=status.HTTP_403_FORBIDDEN)
 
-        request_perms = MemberPermissions.objects.get(member=request_member)
         if (
-            request_member.id == member.id
-            or request_perms.is_owner
-            or request_perms.manage_workspace_members
+            membership.member_id == member.id
+            or membership.is_owner
+            or membership.manage_workspace_members
         ):
             permissions = MemberPermissions.objects.get(member=member)
             response["result"] = PermissionsReadSerializer(permissions).data
@@ -169,16 +169,8 @@ class MemberPermissionsView(APIView):
             return Response(response, status=status.HTTP_404_NOT_FOUND)
 
         # Verify user has required permissions
-        try:
-            workspace_member = WorkspaceMember.objects.get(
-                user=request.user, workspace=member.workspace
-            )
-            permissions = MemberPermissions.objects.get(
-                workspace=member.workspace,
-                member=workspace_member,
-                manage_workspace_members=True,
-            )
-        except (WorkspaceMember.DoesNotExist, MemberPermissions.DoesNotExist):
+        membership = self.get_membership(request, member.workspace_id)
+        if membership is None or not membership.manage_workspace_members:
             response["error"][
                 "message"
             ] = "You do not have permission to manage permissions for this workspace."
@@ -186,11 +178,13 @@ class MemberPermissionsView(APIView):
 
         try:
             # Check if permissions already exist
-            permissions = MemberPermissions.objects.get(workspace=member.workspace, member=member)
+            permissions = MemberPermissions.objects.get(
+                workspace_id=member.workspace_id, member=member
+            )
         except MemberPermissions.DoesNotExist:
             # Create permissions if they do not exist
             permissions = MemberPermissions.objects.create(
-                workspace=member.workspace,
+                workspace_id=member.workspace_id,
                 member=member,
             )
 
@@ -223,8 +217,8 @@ class MemberPermissionsView(APIView):
         return Response(response, status=status.HTTP_200_OK)
 
 
-class MemberRolesView(APIView):
-    authentication_classes = [JWTAuthentication]
+class MemberRolesView(MembershipMixin, APIView):
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     def post(self, request, member_id):
@@ -253,46 +247,36 @@ class MemberRolesView(APIView):
             return Response(response, status=status.HTTP_404_NOT_FOUND)
 
         # Get workspace
-        workspace = modify_member.workspace
+        workspace_id = modify_member.workspace_id
 
         # Verify user has permissions to manage workspace roles
-        try:
-            request_member = WorkspaceMember.objects.get(user=request.user, workspace=workspace)
-            MemberPermissions.objects.get(
-                workspace=workspace, member=request_member, manage_workspace_roles=True
-            )
-        except MemberPermissions.DoesNotExist:
+        membership = self.get_membership(request, workspace_id)
+        if membership is None:
+            response["error"]["message"] = "You are not a member of this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+        if not membership.manage_workspace_roles:
             response["error"][
                 "message"
             ] = "You do not have permission to modify roles in this workspace."
             return Response(response, status=status.HTTP_403_FORBIDDEN)
-        except WorkspaceMember.DoesNotExist:
-            response["error"]["message"] = "You are not a member of this workspace."
-            return Response(response, status=status.HTTP_403_FORBIDDEN)
 
         # Verify that role exists and is part of workspace
         try:
             workspace_role = WorkspaceRole.objects.get(
-                pk=request.data["workspace_role_id"], workspace=workspace
+                pk=request.data["workspace_role_id"], workspace_id=workspace_id
             )
         except WorkspaceRole.DoesNotExist:
             response["error"]["message"] = "Role is not part of this workspace or does not exist."
             return Response(response, status=status.HTTP_404_NOT_FOUND)
 
-        # Verify that member does not already have this role
+        # add role to member; the unique constraint rejects roles they already have
         try:
-            MemberRole.objects.get(
-                member=modify_member,
-                workspace_role=request.data["workspace_role_id"],
-            )
-        except MemberRole.DoesNotExist:
-            # add role to member if they did not have it
-            MemberRole.objects.create(member=modify_member, workspace_role=workspace_role)
-            return Response(response, status=status.HTTP_201_CREATED)
-
-        # member already had role
-        response["error"]["message"] = "Member already has this role."
-        return Response(response, status=status.HTTP_409_CONFLICT)
+            with transaction.atomic():
+                MemberRole.objects.create(member=modify_member, workspace_role=workspace_role)
+        except IntegrityError:
+            response["error"]["message"] = "Member already has this role."
+            return Response(response, status=status.HTTP_409_CONFLICT)
+        return Response(response, status=status.HTTP_201_CREATED)
 
     def get(self, request, member_id):
         """Return the list of WorkspaceRoles assigned to a given workspace member.
@@ -316,11 +300,8 @@ class MemberRolesView(APIView):
             return Response(response, status=status.HTTP_404_NOT_FOUND)
 
         # verify user is part of workspace
-        try:
-            request_member = WorkspaceMember.objects.get(
-                user=request.user, workspace=member.workspace
-            )
-        except WorkspaceMember.DoesNotExist:
+        membership = self.get_membership(request, member.workspace_id)
+        if membership is None:
             response["error"][
                 "message"
             ] = "You must be a member of the same workspace to retrieve member roles."
@@ -328,12 +309,11 @@ class MemberRolesView(APIView):
 
         # verify request user has perms to view member roles or is viewing own roles
         # TODO: test for this once this is confirmed to be desired behavior
-        perms = MemberPermissions.objects.get(member=request_member)
         if (
-            perms.is_owner
-            or perms.manage_workspace_members
-            or perms.manage_workspace_roles
-            or member.id == request_member.id
+            membership.is_owner
+            or membership.manage_workspace_members
+            or membership.manage_workspace_roles
+            or member.id == membership.member_id
         ):
             data = MemberDetailedReadSerializer(member).data
             response["result"] = data["member_roles"]
@@ -368,26 +348,24 @@ class MemberRolesView(APIView):
             return Response(response, status=status.HTTP_404_NOT_FOUND)
 
         # Get workspace
-        workspace = modify_member.workspace
+        workspace_id = modify_member.workspace_id
 
         # Verify user has permissions to manage workspace roles
-        try:
-            request_member = WorkspaceMember.objects.get(user=request.user, workspace=workspace)
-            MemberPermissions.objects.get(
-                workspace=workspace, member=request_member, manage_workspace_roles=True
-            )
-        except MemberPermissions.DoesNotExist:
+        membership = self.get_membership(request, workspace_id)
+        if membership is None:
+            response["error"]["message"] = "You are not a member of this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+        if not membership.manage_workspace_roles:
             response["error"][
                 "message"
             ] = "You do not have permission to modify roles in this workspace."
             return Response(response, status=status.HTTP_403_FORBIDDEN)
-        except WorkspaceMember.DoesNotExist:
-            response["error"]["message"] = "You are not a member of this workspace."
-            return Response(response, status=status.HTTP_403_FORBIDDEN)
 
         # Verify that role exists and is part of workspace
         try:
-            WorkspaceRole.objects.get(id=request.data["workspace_role_id"], workspace=workspace)
+            WorkspaceRole.objects.get(
+                id=request.data["workspace_role_id"], workspace_id=workspace_id
+            )
         except WorkspaceRole.DoesNotExist:
             response["error"]["message"] = "Role is not part of this workspace or does not exist."
             return Response(response, status=status.HTTP_404_NOT_FOUND)
@@ -407,13 +385,33 @@ class MemberRolesView(APIView):
         return Response(response, status=status.HTTP_200_OK)
 
 
-class MemberShiftsView(APIView):
-    authentication_classes = [JWTAuthentication]
+class MemberShiftsView(MembershipMixin, APIView):
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
 
     def get(self, request, member_id):
+        """Return one page of a member's shifts, ordered by start time.
+
+        Accepted query params (all optional): range_start, range_end (dates or
+        ISO 8601 datetimes), cursor, page_size. Without a range, shifts
+        overlapping the default window around the current day are returned.
+
+        :param request: Authenticated HTTP request with member_id in url.
+        :type request: rest_framework.request.Request
+        :return: List of shifts and next_cursor (null on the last page), or an
+            error response.
+        :rtype: rest_framework.response.Response
+        """
         response = {"error": {}}
 
+        try:
+            range_start, range_end = parse_window(request.query_params)
+            page_size = parse_page_size(request.query_params.get("page_size"))
+        except ValueError:
+            response["error"]["message"] = "Date range or page size is invalid."
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
         # Verify that member exists
         try:
             member = WorkspaceMember.objects.get(pk=member_id)
@@ -422,31 +420,33 @@ class MemberShiftsView(APIView):
             return Response(response, status=status.HTTP_404_NOT_FOUND)
 
         # verify user is part of workspace
-        try:
-            request_member = WorkspaceMember.objects.get(
-                user=request.user, workspace=member.workspace
-            )
-        except WorkspaceMember.DoesNotExist:
+        membership = self.get_membership(request, member.workspace_id)
+        if membership is None:
             response["error"]["message"] = "You are not a member of this workspace."
             return Response(response, status=status.HTTP_403_FORBIDDEN)
 
         # verify request user has perms to view member shifts or is viewing own shifts
-        perms = MemberPermissions.objects.get(member=request_member)
         if (
-            perms.is_owner
-            or perms.manage_workspace_members
-            or perms.manage_schedules
-            or member.id == request_member.id
+            membership.is_owner
+            or membership.manage_workspace_members
+            or membership.manage_schedules
+            or member.id == membership.member_id
         ):
-            shifts = (
-                Shift.objects.filter(member=member)
-                .select_related("member__user", "role")
-                .prefetch_related("member__member_roles__workspace_role")
+            fields = ["id", "role", "start_time", "end_time"]
+            shifts = shift_values(
+                overlapping(Shift.objects.filter(member=member), range_start, range_end), fields
             )
-            data = ShiftReadSerializer(
-                shifts, many=True, fields=["id", "role", "start_time", "end_time"]
-            ).data
+            try:
+                shifts, next_cursor = paginate(
+                    shifts, request.query_params.get("cursor"), page_size
+                )
+            except ValueError:
+                response["error"]["message"] = "Cursor is invalid."
+                return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+            data = shift_list_data(shifts, fields)
             response["result"] = data
+            response["next_cursor"] = next_cursor
             return Response(response, status=status.HTTP_200_OK)
         else:
             response["error"]["message"] = "You do not have permission to view this members shifts."
@@ -0,0 +1,36 @@
+import os
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from ..authentication import ClaimsJWTAuthentication
+from ..instrumentation import query_totals, request_stats
+
+
+class RequestStatsView(APIView):
+    """API view exposing this worker's aggregated request metrics to staff users."""
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        """Return request metrics aggregated by URL name since the worker started.
+
+        Each worker process keeps its own aggregates, so repeated calls may be
+        answered by different workers; the pid tells them apart.
+
+        :param request: Authenticated HTTP request from a staff user.
+        :type request: rest_framework.request.Request
+        :return: Per-URL-name request counts, query totals and means, database,
+            render and total milliseconds and response bytes, plus the queries
+            sent to each database alias.
+        :rtype: rest_framework.response.Response
+        """
+        response = {"error": {}}
+        response["result"] = {
+            "pid": os.getpid(),
+            "views": request_stats(),
+            "queries": query_totals(),
+        }
+        return Response(response, status=status.HTTP_200_OK)
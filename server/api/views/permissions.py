@@ -2,14 +2,14 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from ..authentication import ClaimsJWTAuthentication
 from ..models import MemberPermissions, WorkspaceMember, Workspace
 
 
 class GetPermissions(APIView):
     """API view for retrieving the authenticated user's permissions in a workspace."""
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
@@ -53,7 +53,7 @@ class GetPermissions(APIView):
 class UpdatePermissions(APIView):
     """API view for updating a workspace member's permission flags."""
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     def put(self, request):
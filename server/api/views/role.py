@@ -2,8 +2,8 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
-from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from ..authentication import ClaimsJWTAuthentication
 from ..serializers import RoleSerializer, RoleReadSerializer
 from ..models import (
     Workspace,
@@ -13,12 +13,13 @@ from ..models import (
     WorkspaceRole,
     MemberRole,
 )
+from ..membership import MembershipMixin
 
 
-class RoleView(APIView):
+class RoleView(MembershipMixin, APIView):
     """API view for workspace role."""
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get(self, request, role_id):
@@ -37,9 +38,7 @@ class RoleView(APIView):
             return Response(response, status=status.HTTP_404_NOT_FOUND)
 
         # verify user is member of workspace with role
-        try:
-            _ = WorkspaceMember.objects.get(user=request.user, workspace=role.workspace)
-        except WorkspaceMember.DoesNotExist:
+        if self.get_membership(request, role.workspace_id) is None:
             response["error"]["message"] = "Must be a member of the workspace to get a role."
             return Response(response, status=status.HTTP_403_FORBIDDEN)
 
@@ -75,22 +74,18 @@ class RoleView(APIView):
             response["error"]["message"] = "Workspace role does not exist."
             return Response(response, status=status.HTTP_404_NOT_FOUND)
 
-        workspace = workspace_role.workspace
+        workspace_id = workspace_role.workspace_id
 
         # Verify user has permissions to manage workspace roles
-        try:
-            member = WorkspaceMember.objects.get(user=request.user, workspace=workspace)
-            MemberPermissions.objects.get(
-                workspace=workspace, member=member, manage_workspace_roles=True
-            )
-        except MemberPermissions.DoesNotExist:
+        membership = self.get_membership(request, workspace_id)
+        if membership is None:
+            response["error"]["message"] = "You are not a member of this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+        if not membership.manage_workspace_roles:
             response["error"][
                 "message"
             ] = "You do not have permission to modify roles in this workspace."
             return Response(response, status=status.HTTP_403_FORBIDDEN)
-        except WorkspaceMember.DoesNotExist:
-            response["error"]["message"] = "You are not a member of this workspace."
-            return Response(response, status=status.HTTP_403_FORBIDDEN)
 
         # modify role
         if "name" in serializer.validated_data:
@@ -122,22 +117,18 @@ class RoleView(APIView):
             ] = "Workspace role does not exist or is not part of this workspace."
             return Response(response, status=status.HTTP_404_NOT_FOUND)
 
-        workspace = role.workspace
+        workspace_id = role.workspace_id
 
         # Verify user has permissions to manage workspace roles
-        try:
-            member = WorkspaceMember.objects.get(user=request.user, workspace=workspace)
-            MemberPermissions.objects.get(
-                workspace=workspace, member=member, manage_workspace_roles=True
-            )
-        except MemberPermissions.DoesNotExist:
+        membership = self.get_membership(request, workspace_id)
+        if membership is None:
+            response["error"]["message"] = "You are not a member of this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+        if not membership.manage_workspace_roles:
             response["error"][
                 "message"
             ] = "You do not have permission to modify roles in this workspace."
             return Response(response, status=status.HTTP_403_FORBIDDEN)
-        except WorkspaceMember.DoesNotExist:
-            response["error"]["message"] = "You are not a member of this workspace."
-            return Response(response, status=status.HTTP_403_FORBIDDEN)
 
         # delete role
         role.delete()
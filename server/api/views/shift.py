@@ -1,12 +1,21 @@
+from dataclasses import asdict
+
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
-from rest_framework_simplejwt.authentication import JWTAuthentication
-from datetime import datetime
-from datetime import date
 
-from ..serializers import ShiftSerializer, ModifyShiftSerializer, ShiftReadSerializer
+from rest_framework.renderers import BrowsableAPIRenderer
+
+from ..authentication import ClaimsJWTAuthentication
+from ..renderers import FastJSONRenderer
+from ..serializers import (
+    ShiftSerializer,
+    ModifyShiftSerializer,
+    ShiftReadSerializer,
+    shift_list_data,
+    shift_values,
+)
 from ..models import (
     Workspace,
     WorkspaceMember,
@@ -16,12 +25,22 @@ from ..models import (
     MemberRole,
     Shift,
 )
+from ..membership import MembershipMixin
+from .base import AsyncAPIView
+from ..scheduling import find_conflicts
+from ..utils import (
+    apaginate,
+    exceeds_max_shift_duration,
+    overlapping,
+    parse_page_size,
+    parse_range_bound,
+)
 
 
-class ShiftView(APIView):
+class ShiftView(MembershipMixin, APIView):
     """API view for shifts."""
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get(self, request, shift_id):
@@ -58,13 +77,8 @@ class ShiftView(APIView):
             response["error"]["message"] = "Shift could not be found."
             return Response(response, status=status.HTTP_404_NOT_FOUND)
 
-        # get workspace from shift
-        workspace = shift.workspace
-
-        # Verify user is part of workspace and has perms to manage schedules
-        try:
-            _ = WorkspaceMember.objects.get(user=request.user, workspace=workspace)
-        except WorkspaceMember.DoesNotExist:
+        # Verify user is part of workspace
+        if self.get_membership(request, shift.workspace_id) is None:
             response["error"][
                 "message"
             ] = "You must be a member of the workspace to retrieve shift details."
@@ -81,6 +95,9 @@ class ShiftView(APIView):
         Requires manage_schedules permission. Accepted body fields: member_id (optional), role_id (optional), start_time (optional),
         end_time (optional).
 
+        The assigned member must be free for the resulting times: overlapping
+        shifts, approved time off and unavailability are rejected with 409.
+
         :param request: Authenticated HTTP request with shift_id and optional
             update fields in the body.
         :type request: rest_framework.request.Request
@@ -103,22 +120,20 @@ class ShiftView(APIView):
             return Response(response, status=status.HTTP_404_NOT_FOUND)
 
         # get workspace from shift
-        workspace = shift.workspace
+        workspace_id = shift.workspace_id
 
         # Verify user is part of workspace and has perms to manage schedules
-        try:
-            creator_member = WorkspaceMember.objects.get(user=request.user, workspace=workspace)
-            MemberPermissions.objects.get(member=creator_member, manage_schedules=True)
-        except WorkspaceMember.DoesNotExist:
+        membership = self.get_membership(request, workspace_id)
+        if membership is None:
             response["error"]["message"] = "You are not a member of this workspace."
             return Response(response, status=status.HTTP_403_FORBIDDEN)
-        except MemberPermissions.DoesNotExist:
+        if not membership.manage_schedules:
             response["error"][
                 "message"
             ] = "You do not have permissions to manage schedules in this workspace."
             return Response(response, status=status.HTTP_403_FORBIDDEN)
 
-        # Make included modifications
+        # Apply included modifications, saving once every check has passed
 
         # seprate if for both start and end included since they have to be checked to not be invalid
         if ("start_time" in serializer.validated_data) and (
@@ -130,10 +145,12 @@ class ShiftView(APIView):
             if start_time > end_time:
                 response["error"]["message"] = "Start time cannot be after end time."
                 return Response(response, status=status.HTTP_400_BAD_REQUEST)
+            if exceeds_max_shift_duration(start_time, end_time):
+                response["error"]["message"] = "Shift is longer than the maximum shift length."
+                return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
             shift.start_time = start_time
             shift.end_time = end_time
-            shift.save()
         elif "start_time" in serializer.validated_data:
             start_time = serializer.validated_data["start_time"]
             end_time = shift.end_time
@@ -141,9 +158,11 @@ class ShiftView(APIView):
             if start_time > end_time:
                 response["error"]["message"] = "Start time cannot be after end time."
                 return Response(response, status=status.HTTP_400_BAD_REQUEST)
+            if exceeds_max_shift_duration(start_time, end_time):
+                response["error"]["message"] = "Shift is longer than the maximum shift length."
+                return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
             shift.start_time = start_time
-            shift.save()
         elif "end_time" in serializer.validated_data:
             start_time = shift.start_time
             end_time = serializer.validated_data["end_time"]
@@ -151,14 +170,16 @@ class ShiftView(APIView):
             if start_time > end_time:
                 response["error"]["message"] = "End time cannot be before start time."
                 return Response(response, status=status.HTTP_400_BAD_REQUEST)
+            if exceeds_max_shift_duration(start_time, end_time):
+                response["error"]["message"] = "Shift is longer than the maximum shift length."
+                return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
             shift.end_time = end_time
-            shift.save()
 
         if "member_id" in request.data:
             try:
                 member = WorkspaceMember.objects.get(
-                    pk=request.data["member_id"], workspace=workspace
+                    pk=request.data["member_id"], workspace_id=workspace_id
                 )
             except WorkspaceMember.DoesNotExist:
                 response["error"]["message"] = "Member does not exist or is not part of workspace."
@@ -166,12 +187,13 @@ class ShiftView(APIView):
 
             shift.member = member
             shift.open = False
-            shift.save()
 
         if "role_id" in request.data:
             # Verify role exists and is part of workspace
             try:
-                role = WorkspaceRole.objects.get(pk=request.data["role_id"], workspace=workspace)
+                role = WorkspaceRole.objects.get(
+                    pk=request.data["role_id"], workspace_id=workspace_id
+                )
             except WorkspaceRole.DoesNotExist:
                 response["error"][
                     "message"
@@ -179,7 +201,20 @@ class ShiftView(APIView):
                 return Response(response, status=status.HTTP_404_NOT_FOUND)
 
             shift.role = role
-            shift.save()
+
+        # Verify the assigned member is free if the assignment or its times changed
+        if shift.member_id is not None and (
+            "member_id" in request.data or serializer.validated_data
+        ):
+            conflicts = find_conflicts(
+                shift.member_id, shift.start_time, shift.end_time, ignore_shift=shift.id
+            )
+            if conflicts:
+                response["error"]["message"] = "Shift conflicts with the member's schedule."
+                response["error"]["conflicts"] = [asdict(conflict) for conflict in conflicts]
+                return Response(response, status=status.HTTP_409_CONFLICT)
+
+        shift.save()
 
         return Response(response, status=status.HTTP_200_OK)
 
@@ -204,16 +239,14 @@ class ShiftView(APIView):
             return Response(response, status=status.HTTP_404_NOT_FOUND)
 
         # get workspace from shift
-        workspace = shift.workspace
+        workspace_id = shift.workspace_id
 
         # Verify user is part of workspace and has perms to manage schedules
-        try:
-            creator_member = WorkspaceMember.objects.get(user=request.user, workspace=workspace)
-            MemberPermissions.objects.get(member=creator_member, manage_schedules=True)
-        except WorkspaceMember.DoesNotExist:
+        membership = self.get_membership(request, workspace_id)
+        if membership is None:
             response["error"]["message"] = "You are not a member of this workspace."
             return Response(response, status=status.HTTP_403_FORBIDDEN)
-        except MemberPermissions.DoesNotExist:
+        if not membership.manage_schedules:
             response["error"][
                 "message"
             ] = "You do not have permissions to manage schedules in this workspace."
@@ -224,24 +257,30 @@ class ShiftView(APIView):
         return Response(response, status=status.HTTP_200_OK)
 
 
-class ShiftFilterView(APIView):
+class ShiftFilterView(AsyncAPIView):
     """API view for querying shifts across the authenticated user's workspaces."""
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+    # POST only carries the filters, so reads may go to a replica
+    read_only = True
 
-    def post(self, request):
+    async def post(self, request):
         """Return shifts matching the provided filters.
 
         Results are always scoped to workspaces the authenticated user belongs to.
         All filter fields are optional but at least one should be provided.
         Accepted body fields: shift_id, member_id, role_id, workspace_id, open,
-        created_by_id, range_start (Y-m-d), range_end (Y-m-d).
+        created_by_id, range_start, range_end, cursor, page_size. Range bounds are dates (Y-m-d) or
+        ISO 8601 datetimes; a shift matches if it overlaps [range_start, range_end),
+        where a date range_end includes that whole day.
 
         :param request: Authenticated HTTP request with optional filter fields
             in the body.
         :type request: rest_framework.request.Request
-        :return: List of matching shifts, or an error response.
+        :return: One page of matching shifts ordered by start time and
+            next_cursor (null on the last page), or an error response.
         :rtype: rest_framework.response.Response
         """
         response = {"error": {}}
@@ -261,38 +300,37 @@ class ShiftFilterView(APIView):
             filters["created_by"] = request.data["created_by_id"]
 
         try:
-            if "range_start" in request.data and "range_end" in request.data:
-                filters["start_time__date__range"] = (
-                    datetime.strptime(request.data["range_start"], "%Y-%m-%d").date(),
-                    datetime.strptime(request.data["range_end"], "%Y-%m-%d").date(),
-                )
-            elif "range_start" in request.data:
-                filters["start_time__date__range"] = (
-                    datetime.strptime(request.data["range_start"], "%Y-%m-%d").date(),
-                    date.max,
-                )
-            elif "range_end" in request.data and "range_end" in request.data:
-                filters["start_time__date__range"] = (
-                    date.min,
-                    datetime.strptime(request.data["range_end"], "%Y-%m-%d").date(),
-                )
+            range_start = None
+            range_end = None
+            if "range_start" in request.data:
+                range_start = parse_range_bound(request.data["range_start"])
+            if "range_end" in request.data:
+                range_end = parse_range_bound(request.data["range_end"], end=True)
         except Exception:
             response["error"]["message"] = "Date range value is invalid."
             return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
         # add users workspaces to filters
-        filters["workspace__in"] = Workspace.objects.filter(
-            pk__in=WorkspaceMember.objects.filter(user=request.user)
+        filters["workspace__in"] = WorkspaceMember.objects.filter(user=request.user).values(
+            "workspace"
         )
 
+        try:
+            page_size = parse_page_size(request.data.get("page_size"))
+        except (TypeError, ValueError):
+            response["error"]["message"] = "Page size is invalid."
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
         # search by filters
-        results = (
-            Shift.objects.filter(**filters)
-            .select_related("member__user", "role")
-            .prefetch_related("member__member_roles__workspace_role")
-        )
+        results = shift_values(overlapping(Shift.objects.filter(**filters), range_start, range_end))
+        try:
+            shifts, next_cursor = await apaginate(results, request.data.get("cursor"), page_size)
+        except ValueError:
+            response["error"]["message"] = "Cursor is invalid."
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
-        data = ShiftReadSerializer(results, many=True).data
+        data = shift_list_data(shifts)
         response["result"] = data
+        response["next_cursor"] = next_cursor
 
         return Response(response, status=status.HTTP_200_OK)
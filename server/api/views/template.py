@@ -0,0 +1,86 @@
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+
+from ..authentication import ClaimsJWTAuthentication
+from ..serializers import ShiftTemplateReadSerializer
+from ..models import ShiftTemplate
+from ..membership import MembershipMixin
+
+
+class TemplateView(MembershipMixin, APIView):
+    """API view for a recurring shift template."""
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, template_id):
+        """Get a ShiftTemplate, must be a member of the workspace it belongs to.
+
+        :param request: Authenticated HTTP request with template_id in url params.
+        :type request: rest_framework.request.Request
+        :return: The template, or an error response.
+        :rtype: rest_framework.response.Response
+        """
+        response = {"error": {}}
+
+        # Verify template exists
+        try:
+            template = ShiftTemplate.objects.select_related("member__user", "role").get(
+                pk=template_id
+            )
+        except ShiftTemplate.DoesNotExist:
+            response["error"]["message"] = "Shift template could not be found."
+            return Response(response, status=status.HTTP_404_NOT_FOUND)
+
+        # Verify user is part of workspace
+        if self.get_membership(request, template.workspace_id) is None:
+            response["error"][
+                "message"
+            ] = "You must be a member of the workspace to retrieve template details."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+
+        data = ShiftTemplateReadSerializer(template).data
+        response["result"] = data
+
+        return Response(response, status=status.HTTP_200_OK)
+
+    def delete(self, request, template_id):
+        """Delete a ShiftTemplate and its materialized shifts that have not started.
+
+        Requires manage_schedules permission. Past shifts are kept, detached
+        from the template.
+
+        :param request: Authenticated HTTP request with template_id in url params.
+        :type request: rest_framework.request.Request
+        :return: Empty success response, or an error response.
+        :rtype: rest_framework.response.Response
+        """
+        response = {"error": {}}
+
+        # Verify template exists
+        try:
+            template = ShiftTemplate.objects.get(pk=template_id)
+        except ShiftTemplate.DoesNotExist:
+            response["error"]["message"] = "Shift template could not be found."
+            return Response(response, status=status.HTTP_404_NOT_FOUND)
+
+        # Verify user is part of workspace and has perms to manage schedules
+        membership = self.get_membership(request, template.workspace_id)
+        if membership is None:
+            response["error"]["message"] = "You are not a member of this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+        if not membership.manage_schedules:
+            response["error"][
+                "message"
+            ] = "You do not have permissions to manage schedules in this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+
+        with transaction.atomic():
+            template.shifts.filter(start_time__gte=timezone.now()).delete()
+            template.delete()
+
+        return Response(response, status=status.HTTP_200_OK)
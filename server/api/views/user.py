@@ -1,22 +1,22 @@
-from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
-from rest_framework_simplejwt.authentication import JWTAuthentication
 from django.core.validators import validate_email
 from django.core.exceptions import ValidationError
 from django.contrib.auth import authenticate
+from ..authentication import ClaimsJWTAuthentication, aload_user, load_user
 from ..models import Workspace, WorkspaceMember
 from ..serializers import UserDetailedReadSerializer, WorkspaceReadSerializer
+from .base import AsyncAPIView
 
 
-class GetUser(APIView):
+class GetUser(AsyncAPIView):
     """API view for retrieving and updating the authenticated user's profile."""
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
-    def get(self, request):
+    async def get(self, request):
         """Return the authenticated user's profile and their workspace memberships.
 
         :param request: Authenticated HTTP request.
@@ -48,11 +48,14 @@ class GetUser(APIView):
         """
         response = {"error": {}, "result": {}}
 
-        response["result"]["user"] = UserDetailedReadSerializer(request.user).data
+        response["result"]["user"] = UserDetailedReadSerializer(await aload_user(request.user)).data
 
         # get list of workspaces user is in
         members = WorkspaceMember.objects.filter(user=request.user).values_list("workspace")
-        results = Workspace.objects.filter(pk__in=members).select_related("owner")
+        results = [
+            workspace
+            async for workspace in Workspace.objects.filter(pk__in=members).select_related("owner")
+        ]
 
         response["result"]["workspaces"] = WorkspaceReadSerializer(results, many=True).data
 
@@ -71,6 +74,8 @@ class GetUser(APIView):
         """
         response = {"error": {}}
 
+        load_user(request.user)
+
         if "email" in request.data:
             try:
                 validate_email(request.data["email"])
@@ -1,17 +1,32 @@
+import math
+from dataclasses import asdict
+from datetime import timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db import IntegrityError, transaction
+from django.http import StreamingHttpResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework.renderers import BrowsableAPIRenderer
 
+from ..authentication import ClaimsJWTAuthentication
+from ..renderers import FastJSONRenderer
 from ..serializers import (
     WorkspaceSerializer,
     ShiftSerializer,
     RoleSerializer,
     WorkspaceReadSerializer,
     MemberReadSerializer,
-    ShiftReadSerializer,
     RoleReadSerializer,
+    ShiftTemplateSerializer,
+    ShiftTemplateReadSerializer,
+    ShiftOccurrenceSerializer,
+    shift_list_data,
+    shift_values,
 )
 from ..models import (
     Workspace,
@@ -22,13 +37,48 @@ from ..models import (
     WorkspaceRole,
     Shift,
     ShiftRequest,
+    ShiftTemplate,
+)
+from ..events import publish
+from ..exports import EXPORT_FORMATS, export_rows, stream_async, stream_csv, stream_xlsx
+from ..membership import MembershipMixin
+from .base import AsyncAPIView
+from ..versioning import (
+    aget_version,
+    bump_version,
+    collection_etag,
+    get_version,
+    not_modified,
+)
+from ..scheduling import (
+    LABOR_GROUPS,
+    ConflictIndex,
+    CursorExpired,
+    add_shifts,
+    apply_autofill,
+    autofill,
+    expand,
+    find_conflicts,
+    labor_summary,
+    materialize,
+    rollup_summary,
+    shift_changes,
+    week_start,
+)
+from ..utils import (
+    apaginate,
+    exceeds_max_shift_duration,
+    overlapping,
+    parse_page_size,
+    parse_range_bound,
+    parse_window,
 )
 
 
-class WorkspaceView(APIView):
+class WorkspaceView(MembershipMixin, APIView):
     """API view for creating a new workspace owned by the authenticated user."""
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
@@ -112,19 +162,13 @@ class WorkspaceView(APIView):
             return Response(response, status=status.HTTP_404_NOT_FOUND)
 
         # Verify user is owner
-        try:
-            old_owner_member = WorkspaceMember.objects.get(user=request.user, workspace=workspace)
-            MemberPermissions.objects.get(
-                workspace=workspace,
-                member=old_owner_member,
-                is_owner=True,
-            )
-        except MemberPermissions.DoesNotExist:
-            response["error"]["message"] = "You do not have permission to modify this workspace."
-            return Response(response, status=status.HTTP_403_FORBIDDEN)
-        except WorkspaceMember.DoesNotExist:
+        membership = self.get_membership(request, workspace.id)
+        if membership is None:
             response["error"]["message"] = "You are not a member of this workspace."
             return Response(response, status=status.HTTP_403_FORBIDDEN)
+        if not membership.is_owner:
+            response["error"]["message"] = "You do not have permission to modify this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
 
         # Update Workspace
         if "new_owner_id" in request.data:  # update workspace owner
@@ -136,9 +180,7 @@ class WorkspaceView(APIView):
                 new_owner_perms = MemberPermissions.objects.get(member=new_owner_member)
 
                 # set current owner to no longer be owner
-                old_owner_perms = MemberPermissions.objects.get(
-                    member=old_owner_member, workspace=workspace
-                )
+                old_owner_perms = MemberPermissions.objects.get(member_id=membership.member_id)
 
                 if new_owner_perms == old_owner_perms:  # cannot set new owner to current
                     response["error"]["message"] = "Member is already owner of this workspace."
@@ -156,7 +198,7 @@ class WorkspaceView(APIView):
                 new_owner_perms.save()
 
                 # update owner id in workspace
-                workspace.owner = User.objects.get(pk=request.data["new_owner_id"])
+                workspace.owner_id = new_owner_member.user_id
                 workspace.save()
 
             except MemberPermissions.DoesNotExist:
@@ -192,15 +234,13 @@ class WorkspaceView(APIView):
 
         # Verify workspace exists
         try:
-            workspace = Workspace.objects.get(pk=workspace_id)
+            workspace = Workspace.objects.select_related("owner").get(pk=workspace_id)
         except Workspace.DoesNotExist:
             response["error"]["message"] = "Workspace does not exist."
             return Response(response, status=status.HTTP_404_NOT_FOUND)
 
         # Verify user is member of workspace
-        try:
-            _ = WorkspaceMember.objects.get(user=request.user, workspace=workspace)
-        except WorkspaceMember.DoesNotExist:
+        if self.get_membership(request, workspace.id) is None:
             response["error"]["message"] = "You are not a member of this workspace."
             return Response(response, status=status.HTTP_403_FORBIDDEN)
 
@@ -226,36 +266,26 @@ class WorkspaceView(APIView):
             response["error"]["message"] = "Workspace ID is required."
             return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
-        # Verify workspace exists
-        try:
-            workspace = Workspace.objects.get(pk=workspace_id)
-        except Workspace.DoesNotExist:
-            response["error"]["message"] = "Workspace does not exist."
-            return Response(response, status=status.HTTP_404_NOT_FOUND)
-
         # Verify user is owner
-        try:
-            owner_member = WorkspaceMember.objects.get(user=request.user, workspace=workspace)
-            MemberPermissions.objects.get(
-                workspace=workspace,
-                member=owner_member,
-                is_owner=True,
-            )
-        except MemberPermissions.DoesNotExist:
-            response["error"]["message"] = "You do not have permission to modify this workspace."
-            return Response(response, status=status.HTTP_403_FORBIDDEN)
-        except WorkspaceMember.DoesNotExist:
+        membership = self.get_membership(request, workspace_id)
+        if membership is None:
+            if not Workspace.objects.filter(pk=workspace_id).exists():
+                response["error"]["message"] = "Workspace does not exist."
+                return Response(response, status=status.HTTP_404_NOT_FOUND)
             response["error"]["message"] = "You are not a member of this workspace."
             return Response(response, status=status.HTTP_403_FORBIDDEN)
+        if not membership.is_owner:
+            response["error"]["message"] = "You do not have permission to modify this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
 
-        workspace.delete()
+        Workspace.objects.filter(pk=workspace_id).delete()
         return Response(response, status=status.HTTP_200_OK)
 
 
-class WorkspaceMembersView(APIView):
+class WorkspaceMembersView(MembershipMixin, AsyncAPIView):
     """API view managing members of a workspace."""
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     def post(self, request, workspace_id):
@@ -275,25 +305,15 @@ class WorkspaceMembersView(APIView):
             response["error"]["message"] = "Added User ID is required."
             return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
-        # ensure workspace exists
-        try:
-            workspace = Workspace.objects.get(pk=workspace_id)
-        except Workspace.DoesNotExist:
-            response["error"]["message"] = "Workspace does not exist."
-            return Response(response, status=status.HTTP_404_NOT_FOUND)
-
         # Verify user is permitted to add members to workspace
-        try:
-            workspace_member = WorkspaceMember.objects.get(user=request.user, workspace=workspace)
-            MemberPermissions.objects.get(
-                member=workspace_member,
-                workspace=workspace,
-                manage_workspace_members=True,
-            )
-        except WorkspaceMember.DoesNotExist:
+        membership = self.get_membership(request, workspace_id)
+        if membership is None:
+            if not Workspace.objects.filter(pk=workspace_id).exists():
+                response["error"]["message"] = "Workspace does not exist."
+                return Response(response, status=status.HTTP_404_NOT_FOUND)
             response["error"]["message"] = "You are not a member of this workspace."
             return Response(response, status=status.HTTP_403_FORBIDDEN)
-        except MemberPermissions.DoesNotExist:
+        if not membership.manage_workspace_members:
             response["error"][
                 "message"
             ] = "You do not have permission to add members to this workspace."
@@ -306,69 +326,66 @@ class WorkspaceMembersView(APIView):
             response["error"]["message"] = "Added user does not exist."
             return Response(response, status=status.HTTP_404_NOT_FOUND)
 
-        if not (
-            WorkspaceMember.objects.filter(
-                user=added_user,
-                workspace=workspace,
-            ).exists()
-        ):  # check if user is already member of workspace
-            workspace_member = WorkspaceMember.objects.create(
-                workspace=workspace,
-                user=added_user,
-                added_by=request.user,
-            )
-
-            if "pay_rate" in request.data:
-                workspace_member.pay_rate = request.data["pay_rate"]
-                workspace_member.save()
+        # The (user, workspace) constraint rejects a user who is already a member
+        try:
+            with transaction.atomic():
+                workspace_member = WorkspaceMember.objects.create(
+                    workspace_id=workspace_id,
+                    user=added_user,
+                    added_by=request.user,
+                )
 
-            MemberPermissions.objects.create(
-                workspace=workspace,
-                member=workspace_member,
-            )
+                if "pay_rate" in request.data:
+                    workspace_member.pay_rate = request.data["pay_rate"]
+                    workspace_member.save()
 
-            response["result"] = workspace_member.id
-            return Response(response, status=status.HTTP_201_CREATED)
-        else:
+                MemberPermissions.objects.create(
+                    workspace_id=workspace_id,
+                    member=workspace_member,
+                )
+        except IntegrityError:
             response["error"]["message"] = "User is already a member of this workspace."
             return Response(response, status=status.HTTP_409_CONFLICT)
 
-    def get(self, request, workspace_id):
+        response["result"] = workspace_member.id
+        return Response(response, status=status.HTTP_201_CREATED)
+
+    async def get(self, request, workspace_id):
         """
         workspace_id (required)
         """
         response = {"error": {}}
 
-        # Verify workspace exists
-        try:
-            workspace = Workspace.objects.get(pk=workspace_id)
-        except Workspace.DoesNotExist:
-            response["error"]["message"] = "Workspace does not exist."
-            return Response(response, status=status.HTTP_404_NOT_FOUND)
-
         # Verify user is member of workspace
-        try:
-            _ = WorkspaceMember.objects.get(user=request.user, workspace=workspace)
-        except WorkspaceMember.DoesNotExist:
+        if await self.aget_membership(request, workspace_id) is None:
+            if not await Workspace.objects.filter(pk=workspace_id).aexists():
+                response["error"]["message"] = "Workspace does not exist."
+                return Response(response, status=status.HTTP_404_NOT_FOUND)
             response["error"]["message"] = "User is not a member of this workspace."
             return Response(response, status=status.HTTP_403_FORBIDDEN)
 
-        member_results = (
-            WorkspaceMember.objects.filter(workspace=workspace)
+        etag = collection_etag("members", workspace_id, await aget_version(workspace_id))
+        if not_modified(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        member_results = [
+            member
+            async for member in WorkspaceMember.objects.filter(workspace_id=workspace_id)
             .select_related("user")
             .prefetch_related("member_roles__workspace_role")
-        )
+        ]
         data = MemberReadSerializer(member_results, many=True).data
 
         response["result"] = data
-        return Response(response, status=status.HTTP_200_OK)
+        return Response(response, status=status.HTTP_200_OK, headers={"ETag": etag})
 
 
-class WorkspaceShiftsView(APIView):
+class WorkspaceShiftsView(MembershipMixin, AsyncAPIView):
     """API view managing shifts of a workspace."""
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
 
     def post(self, request, workspace_id):
         """Create a new Shift in the given workspace.
@@ -377,6 +394,9 @@ class WorkspaceShiftsView(APIView):
         role_id (required), start_time (required),
         end_time (required), member_id (optional).
 
+        An assigned member must be free: overlapping shifts, approved time off
+        and unavailability are rejected with 409.
+
         :param request: Authenticated HTTP request with workspace_id in url and shift details in the body.
         :type request: rest_framework.request.Request
         :return: Empty success response on creation, or an error response.
@@ -395,21 +415,15 @@ class WorkspaceShiftsView(APIView):
             response["error"]["message"] = "Role ID is required."
             return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
-        # Verify workspace exists
-        try:
-            workspace = Workspace.objects.get(pk=workspace_id)
-        except Workspace.DoesNotExist:
-            response["error"]["message"] = "Workspace does not exist."
-            return Response(response, status=status.HTTP_404_NOT_FOUND)
-
         # Verify user is part of workspace and has perms to manage schedules
-        try:
-            creator_member = WorkspaceMember.objects.get(user=request.user, workspace=workspace)
-            MemberPermissions.objects.get(member=creator_member, manage_schedules=True)
-        except WorkspaceMember.DoesNotExist:
+        membership = self.get_membership(request, workspace_id)
+        if membership is None:
+            if not Workspace.objects.filter(pk=workspace_id).exists():
+                response["error"]["message"] = "Workspace does not exist."
+                return Response(response, status=status.HTTP_404_NOT_FOUND)
             response["error"]["message"] = "You are not a member of this workspace."
             return Response(response, status=status.HTTP_403_FORBIDDEN)
-        except MemberPermissions.DoesNotExist:
+        if not membership.manage_schedules:
             response["error"][
                 "message"
             ] = "You do not have permissions to manage schedules in this workspace."
@@ -417,7 +431,7 @@ class WorkspaceShiftsView(APIView):
 
         # Verify role exists and is part of workspace
         try:
-            role = WorkspaceRole.objects.get(pk=request.data["role_id"], workspace=workspace)
+            role = WorkspaceRole.objects.get(pk=request.data["role_id"], workspace_id=workspace_id)
         except WorkspaceRole.DoesNotExist:
             response["error"][
                 "message"
@@ -428,7 +442,7 @@ class WorkspaceShiftsView(APIView):
         if "member_id" in request.data:
             try:
                 member = WorkspaceMember.objects.get(
-                    pk=request.data["member_id"], workspace=workspace
+                    pk=request.data["member_id"], workspace_id=workspace_id
                 )
             except WorkspaceMember.DoesNotExist:
                 response["error"]["message"] = "Member does not exist or is not part of workspace."
@@ -444,12 +458,24 @@ class WorkspaceShiftsView(APIView):
                 response, status=status.HTTP_400_BAD_REQUEST
             )  # idk if this is the right status code but wtvr
 
+        if exceeds_max_shift_duration(start_time, end_time):
+            response["error"]["message"] = "Shift is longer than the maximum shift length."
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+        # Verify assigned member is free
+        if "member_id" in request.data:
+            conflicts = find_conflicts(member.id, start_time, end_time)
+            if conflicts:
+                response["error"]["message"] = "Shift conflicts with the member's schedule."
+                response["error"]["conflicts"] = [asdict(conflict) for conflict in conflicts]
+                return Response(response, status=status.HTTP_409_CONFLICT)
+
         # could check if start time is before current time if we want to prevent creating shifts in the past, but i think we should allow that since a workplace might want to do that for recordkeeping or smth
         shift = Shift.objects.create(
-            workspace=workspace,
+            workspace_id=workspace_id,
             start_time=start_time,
             end_time=end_time,
-            created_by=creator_member,
+            created_by_id=membership.member_id,
             role=role,
             open=True,
         )
@@ -462,38 +488,650 @@ class WorkspaceShiftsView(APIView):
 
         return Response(response, status=status.HTTP_201_CREATED)
 
-    def get(self, request, workspace_id):
+    async def get(self, request, workspace_id):
+        """Return one page of the workspace's shifts, ordered by start time.
+
+        Accepted query params (all optional): range_start, range_end (dates or
+        ISO 8601 datetimes), cursor, page_size. Without a range, shifts
+        overlapping the default window around the current day are returned.
+
+        :param request: Authenticated HTTP request with workspace_id in url.
+        :type request: rest_framework.request.Request
+        :return: List of shifts and next_cursor (null on the last page), or an
+            error response.
+        :rtype: rest_framework.response.Response
+        """
         response = {"error": {}}
 
-        # Verify workspace exists
         try:
-            workspace = Workspace.objects.get(pk=workspace_id)
-        except Workspace.DoesNotExist:
-            response["error"]["message"] = "Workspace does not exist."
-            return Response(response, status=status.HTTP_404_NOT_FOUND)
+            range_start, range_end = parse_window(request.query_params)
+            page_size = parse_page_size(request.query_params.get("page_size"))
+        except ValueError:
+            response["error"]["message"] = "Date range or page size is invalid."
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+        # Verify user is part of workspace
+        if await self.aget_membership(request, workspace_id) is None:
+            if not await Workspace.objects.filter(pk=workspace_id).aexists():
+                response["error"]["message"] = "Workspace does not exist."
+                return Response(response, status=status.HTTP_404_NOT_FOUND)
+            response["error"]["message"] = "You are not a member of this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+
+        cursor = request.query_params.get("cursor")
+        etag = collection_etag(
+            "shifts",
+            workspace_id,
+            await aget_version(workspace_id),
+            range_start and range_start.isoformat(),
+            range_end and range_end.isoformat(),
+            cursor,
+            page_size,
+        )
+        if not_modified(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        result = shift_values(
+            overlapping(Shift.objects.filter(workspace_id=workspace_id), range_start, range_end)
+        )
+        try:
+            shifts, next_cursor = await apaginate(result, cursor, page_size)
+        except ValueError:
+            response["error"]["message"] = "Cursor is invalid."
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+        data = shift_list_data(shifts)
+        response["result"] = data
+        response["next_cursor"] = next_cursor
+
+        return Response(response, status=status.HTTP_200_OK, headers={"ETag": etag})
+
+
+class WorkspaceShiftsBulkView(MembershipMixin, APIView):
+    """API view creating many shifts of a workspace in one request."""
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, workspace_id):
+        """Create a batch of Shifts in the given workspace.
+
+        Requires manage_schedules permission. Accepted body fields: shifts
+        (required), a list of objects with the same fields as single shift
+        creation: role_id (required), start_time (required), end_time
+        (required), member_id (optional).
+
+        Roles and members are validated with one query each and the shifts are
+        inserted in a single transaction. Nothing is created if any item is
+        invalid (400) or assigns a member who is not free (409); the error lists
+        each failing item by index.
+
+        :param request: Authenticated HTTP request with workspace_id in url and shifts in the body.
+        :type request: rest_framework.request.Request
+        :return: Ids of the created shifts, or an error response.
+        :rtype: rest_framework.response.Response
+        """
+        response = {"error": {}}
+
+        items = request.data.get("shifts") if isinstance(request.data, dict) else None
+        if not isinstance(items, list) or not items:
+            response["error"]["message"] = "A non-empty list of shifts is required."
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > settings.SHIFT_BULK_MAX_ITEMS:
+            response["error"][
+                "message"
+            ] = f"Cannot create more than {settings.SHIFT_BULK_MAX_ITEMS} shifts at once."
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
         # Verify user is part of workspace and has perms to manage schedules
+        membership = self.get_membership(request, workspace_id)
+        if membership is None:
+            if not Workspace.objects.filter(pk=workspace_id).exists():
+                response["error"]["message"] = "Workspace does not exist."
+                return Response(response, status=status.HTTP_404_NOT_FOUND)
+            response["error"]["message"] = "You are not a member of this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+        if not membership.manage_schedules:
+            response["error"][
+                "message"
+            ] = "You do not have permissions to manage schedules in this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+
+        # Validate each item on its own, collecting referenced ids for the set checks below
+        errors = []
+        valid = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                errors.append({"index": index, "message": "Shift must be an object."})
+                continue
+
+            serializer = ShiftSerializer(data=item)
+            if not serializer.is_valid():
+                errors.append(
+                    {
+                        "index": index,
+                        "message": "Invalid request data, start and end time are required.",
+                    }
+                )
+                continue
+
+            if "role_id" not in item:
+                errors.append({"index": index, "message": "Role ID is required."})
+                continue
+
+            try:
+                role_id = int(item["role_id"])
+                member_id = int(item["member_id"]) if item.get("member_id") is not None else None
+            except (TypeError, ValueError):
+                errors.append({"index": index, "message": "Role and member IDs must be integers."})
+                continue
+
+            start_time = serializer.validated_data["start_time"]
+            end_time = serializer.validated_data["end_time"]
+            if start_time > end_time:
+                errors.append({"index": index, "message": "Start time cannot be after end time."})
+                continue
+            if exceeds_max_shift_duration(start_time, end_time):
+                errors.append(
+                    {"index": index, "message": "Shift is longer than the maximum shift length."}
+                )
+                continue
+
+            valid.append((index, role_id, member_id, start_time, end_time))
+
+        # Verify referenced roles and members are part of workspace, one query each
+        role_ids = set(
+            WorkspaceRole.objects.filter(
+                workspace_id=workspace_id, pk__in={role_id for _, role_id, _, _, _ in valid}
+            ).values_list("id", flat=True)
+        )
+        requested_member_ids = {member_id for _, _, member_id, _, _ in valid if member_id}
+        member_ids = (
+            set(
+                WorkspaceMember.objects.filter(
+                    workspace_id=workspace_id, pk__in=requested_member_ids
+                ).values_list("id", flat=True)
+            )
+            if requested_member_ids
+            else set()
+        )
+
+        shifts = []
+        shift_indexes = []
+        for index, role_id, member_id, start_time, end_time in valid:
+            if role_id not in role_ids:
+                errors.append(
+                    {
+                        "index": index,
+                        "message": "Workspace role does not exist or is not part of workspace.",
+                    }
+                )
+                continue
+            if member_id is not None and member_id not in member_ids:
+                errors.append(
+                    {
+                        "index": index,
+                        "message": "Member does not exist or is not part of workspace.",
+                    }
+                )
+                continue
+
+            shifts.append(
+                Shift(
+                    workspace_id=workspace_id,
+                    start_time=start_time,
+                    end_time=end_time,
+                    created_by_id=membership.member_id,
+                    role_id=role_id,
+                    member_id=member_id,
+                    open=member_id is None,
+                )
+            )
+            shift_indexes.append(index)
+
+        if errors:
+            response["error"]["message"] = "One or more shifts are invalid."
+            response["error"]["items"] = sorted(errors, key=lambda error: error["index"])
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+        # Verify assigned members are free, including against earlier shifts in the batch
+        assigned = [
+            (index, shift) for index, shift in zip(shift_indexes, shifts) if shift.member_id
+        ]
+        if assigned:
+            conflict_index = ConflictIndex.load(
+                {shift.member_id for _, shift in assigned},
+                min(shift.start_time for _, shift in assigned),
+                max(shift.end_time for _, shift in assigned),
+            )
+            for item_index, shift in assigned:
+                conflicts = conflict_index.conflicts(
+                    shift.member_id, shift.start_time, shift.end_time
+                )
+                if conflicts:
+                    errors.append(
+                        {
+                            "index": item_index,
+                            "message": "Shift conflicts with the member's schedule.",
+                            "conflicts": [asdict(conflict) for conflict in conflicts],
+                        }
+                    )
+                conflict_index.add(shift.member_id, shift.start_time, shift.end_time)
+
+        if errors:
+            response["error"]["message"] = "One or more shifts conflict with member schedules."
+            response["error"]["items"] = errors
+            return Response(response, status=status.HTTP_409_CONFLICT)
+
+        with transaction.atomic():
+            created = Shift.objects.bulk_create(shifts)
+            # bulk_create skips signals, so the labor rollup and version are updated here
+            add_shifts(shift.id for shift in created)
+            bump_version(int(workspace_id))
+            publish(workspace_id, "shift", "saved", [shift.id for shift in created])
+
+        response["result"] = {"ids": [shift.id for shift in created]}
+
+        return Response(response, status=status.HTTP_201_CREATED)
+
+
+class WorkspaceShiftChangesView(MembershipMixin, APIView):
+    """API view returning shifts changed since a cursor, for incremental sync."""
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+
+    def get(self, request, workspace_id):
+        """Return shifts created, modified or deleted after a cursor.
+
+        Accepted query params (all optional): since, page_size. Without since
+        every shift is returned. Clients store next_cursor and pass it as since
+        on the next call, repeating immediately while has_more is true. A 410
+        means the cursor is too old and the client must resync without since.
+
+        :param request: Authenticated HTTP request with workspace_id in url.
+        :type request: rest_framework.request.Request
+        :return: Changed shifts, ids of deleted shifts, next_cursor and
+            has_more, or an error response.
+        :rtype: rest_framework.response.Response
+        """
+        response = {"error": {}}
+
         try:
-            _ = WorkspaceMember.objects.get(user=request.user, workspace=workspace)
-        except WorkspaceMember.DoesNotExist:
+            page_size = parse_page_size(request.query_params.get("page_size"))
+        except ValueError:
+            response["error"]["message"] = "Page size is invalid."
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+        # Verify user is part of workspace
+        if self.get_membership(request, workspace_id) is None:
+            if not Workspace.objects.filter(pk=workspace_id).exists():
+                response["error"]["message"] = "Workspace does not exist."
+                return Response(response, status=status.HTTP_404_NOT_FOUND)
             response["error"]["message"] = "You are not a member of this workspace."
             return Response(response, status=status.HTTP_403_FORBIDDEN)
 
-        result = (
-            Shift.objects.filter(workspace=workspace)
-            .select_related("member__user", "role")
-            .prefetch_related("member__member_roles__workspace_role")
+        try:
+            changes = shift_changes(workspace_id, request.query_params.get("since"), page_size)
+        except ValueError:
+            response["error"]["message"] = "Cursor is invalid."
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+        except CursorExpired:
+            response["error"]["message"] = "Cursor has expired. Sync again without since."
+            return Response(response, status=status.HTTP_410_GONE)
+
+        response["result"] = {
+            "shifts": shift_list_data(changes.shifts),
+            "deleted": changes.deleted,
+        }
+        response["next_cursor"] = changes.cursor
+        response["has_more"] = changes.has_more
+
+        return Response(response, status=status.HTTP_200_OK)
+
+
+class WorkspaceShiftConflictsView(MembershipMixin, APIView):
+    """API view checking a batch of proposed shift assignments for conflicts."""
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, workspace_id):
+        """Report the conflicts of each proposed assignment without saving anything.
+
+        Requires manage_schedules permission. Accepted body fields: shifts
+        (required), a list of objects with member_id (required), start_time
+        (required), end_time (required) and shift_id (optional, an existing
+        shift being moved, which is then ignored as a conflict).
+
+        Each item is checked against the member's saved shifts, approved time
+        off and unavailability, and against earlier items in the list.
+
+        :param request: Authenticated HTTP request with workspace_id in url and shifts in the body.
+        :type request: rest_framework.request.Request
+        :return: For each item, its index and list of conflicts (empty when
+            free), or an error response.
+        :rtype: rest_framework.response.Response
+        """
+        response = {"error": {}}
+
+        items = request.data.get("shifts") if isinstance(request.data, dict) else None
+        if not isinstance(items, list) or not items:
+            response["error"]["message"] = "A non-empty list of shifts is required."
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > settings.SHIFT_BULK_MAX_ITEMS:
+            response["error"][
+                "message"
+            ] = f"Cannot check more than {settings.SHIFT_BULK_MAX_ITEMS} shifts at once."
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+        # Verify user is part of workspace and has perms to manage schedules
+        membership = self.get_membership(request, workspace_id)
+        if membership is None:
+            if not Workspace.objects.filter(pk=workspace_id).exists():
+                response["error"]["message"] = "Workspace does not exist."
+                return Response(response, status=status.HTTP_404_NOT_FOUND)
+            response["error"]["message"] = "You are not a member of this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+        if not membership.manage_schedules:
+            response["error"][
+                "message"
+            ] = "You do not have permissions to manage schedules in this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+
+        errors = []
+        proposed = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                errors.append({"index": index, "message": "Shift must be an object."})
+                continue
+
+            serializer = ShiftSerializer(data=item)
+            if not serializer.is_valid():
+                errors.append(
+                    {
+                        "index": index,
+                        "message": "Invalid request data, start and end time are required.",
+                    }
+                )
+                continue
+
+            try:
+                member_id = int(item["member_id"])
+                shift_id = int(item["shift_id"]) if item.get("shift_id") is not None else None
+            except (KeyError, TypeError, ValueError):
+                errors.append({"index": index, "message": "A valid member ID is required."})
+                continue
+
+            start_time = serializer.validated_data["start_time"]
+            end_time = serializer.validated_data["end_time"]
+            if start_time > end_time:
+                errors.append({"index": index, "message": "Start time cannot be after end time."})
+                continue
+
+            proposed.append((index, member_id, shift_id, start_time, end_time))
+
+        # Verify members are part of workspace
+        member_ids = set(
+            WorkspaceMember.objects.filter(
+                workspace_id=workspace_id,
+                pk__in={member_id for _, member_id, _, _, _ in proposed},
+            ).values_list("id", flat=True)
         )
-        data = ShiftReadSerializer(result, many=True).data
-        response["result"] = data
+        for index, member_id, _, _, _ in proposed:
+            if member_id not in member_ids:
+                errors.append(
+                    {
+                        "index": index,
+                        "message": "Member does not exist or is not part of workspace.",
+                    }
+                )
+
+        if errors:
+            response["error"]["message"] = "One or more shifts are invalid."
+            response["error"]["items"] = sorted(errors, key=lambda error: error["index"])
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+        conflict_index = ConflictIndex.load(
+            member_ids,
+            min(start_time for _, _, _, start_time, _ in proposed),
+            max(end_time for _, _, _, _, end_time in proposed),
+            exclude_shift_ids={shift_id for _, _, shift_id, _, _ in proposed if shift_id},
+        )
+
+        result = []
+        for index, member_id, _, start_time, end_time in proposed:
+            conflicts = conflict_index.conflicts(member_id, start_time, end_time)
+            result.append(
+                {"index": index, "conflicts": [asdict(conflict) for conflict in conflicts]}
+            )
+            conflict_index.add(member_id, start_time, end_time)
+
+        response["result"] = result
+
+        return Response(response, status=status.HTTP_200_OK)
+
+
+class WorkspaceShiftsAutofillView(MembershipMixin, APIView):
+    """API view assigning members to a workspace's open shifts automatically."""
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, workspace_id):
+        """Fill the open shifts overlapping a range with eligible members.
+
+        Requires manage_schedules permission. Accepted body fields:
+        range_start (required), range_end (required), time_budget (optional,
+        seconds, capped at SHIFT_AUTOFILL_TIME_BUDGET), dry_run (optional).
+
+        Members are eligible if they hold the shift's role and are free of
+        overlapping shifts, approved time off and unavailability; hours are
+        balanced across them. With dry_run the assignment is only returned.
+
+        :param request: Authenticated HTTP request with workspace_id in url and range in the body.
+        :type request: rest_framework.request.Request
+        :return: The assignments, unfilled shift ids and whether the search
+            finished within the budget, or an error response.
+        :rtype: rest_framework.response.Response
+        """
+        response = {"error": {}}
+
+        try:
+            range_start = parse_range_bound(request.data["range_start"])
+            range_end = parse_range_bound(request.data["range_end"], end=True)
+        except (KeyError, ValueError):
+            response["error"]["message"] = "A valid range_start and range_end are required."
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+        time_budget = settings.SHIFT_AUTOFILL_TIME_BUDGET
+        if "time_budget" in request.data:
+            try:
+                requested = float(request.data["time_budget"])
+            except (TypeError, ValueError):
+                requested = math.nan
+            # NaN compares false with everything, so min() would not cap it
+            if not (math.isfinite(requested) and requested > 0):
+                response["error"]["message"] = "Time budget is invalid."
+                return Response(response, status=status.HTTP_400_BAD_REQUEST)
+            time_budget = min(requested, time_budget)
+
+        # Verify user is part of workspace and has perms to manage schedules
+        membership = self.get_membership(request, workspace_id)
+        if membership is None:
+            if not Workspace.objects.filter(pk=workspace_id).exists():
+                response["error"]["message"] = "Workspace does not exist."
+                return Response(response, status=status.HTTP_404_NOT_FOUND)
+            response["error"]["message"] = "You are not a member of this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+        if not membership.manage_schedules:
+            response["error"][
+                "message"
+            ] = "You do not have permissions to manage schedules in this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+
+        result = autofill(workspace_id, range_start, range_end, time_budget)
+        if not request.data.get("dry_run"):
+            apply_autofill(result)
+
+        response["result"] = {
+            "assignments": [
+                {"shift_id": shift_id, "member_id": member_id}
+                for shift_id, member_id in result.assignments.items()
+            ],
+            "unfilled": result.unfilled,
+            "complete": result.complete,
+        }
+
+        return Response(response, status=status.HTTP_200_OK)
+
+
+class WorkspaceLaborView(MembershipMixin, APIView):
+    """API view reporting scheduled hours and labor cost of a workspace."""
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, workspace_id):
+        """Return hours and labor cost of shifts starting in a range, grouped.
+
+        Requires manage_schedules permission. Required query params:
+        range_start, range_end (dates or ISO 8601 datetimes). Optional:
+        group_by, one of member (default), role, day or week. Cost uses the
+        member's pay_rate, or the role's when the member has none.
+
+        With source=rollup the totals are read from the weekly LaborRollup
+        table instead of the shifts, covering every whole week (Monday to
+        Sunday) that the range touches; day grouping is not available there.
+
+        :param request: Authenticated HTTP request with workspace_id in url.
+        :type request: rest_framework.request.Request
+        :return: Rows with the group key, hours and cost, plus totals, or an
+            error response.
+        :rtype: rest_framework.response.Response
+        """
+        response = {"error": {}}
+
+        try:
+            range_start = parse_range_bound(request.query_params["range_start"])
+            range_end = parse_range_bound(request.query_params["range_end"], end=True)
+        except (KeyError, ValueError):
+            response["error"]["message"] = "A valid range_start and range_end are required."
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+        group_by = request.query_params.get("group_by", "member")
+        if group_by not in LABOR_GROUPS:
+            response["error"]["message"] = "group_by must be one of member, role, day or week."
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+        from_rollup = request.query_params.get("source") == "rollup"
+        if from_rollup and group_by == "day":
+            response["error"]["message"] = "The rollup cannot be grouped by day."
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+        # Verify user is part of workspace and has perms to manage schedules
+        membership = self.get_membership(request, workspace_id)
+        if membership is None:
+            if not Workspace.objects.filter(pk=workspace_id).exists():
+                response["error"]["message"] = "Workspace does not exist."
+                return Response(response, status=status.HTTP_404_NOT_FOUND)
+            response["error"]["message"] = "You are not a member of this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+        if not membership.manage_schedules:
+            response["error"][
+                "message"
+            ] = "You do not have permissions to manage schedules in this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+
+        if from_rollup:
+            rows = rollup_summary(
+                workspace_id,
+                week_start(range_start),
+                week_start(range_end - timedelta(microseconds=1)),
+                group_by,
+            )
+        else:
+            rows = labor_summary(workspace_id, range_start, range_end, group_by)
+        total_cost = sum((row["cost"] for row in rows), Decimal("0.00"))
+
+        # Costs are strings, matching how serializers render pay_rate
+        response["result"] = {
+            "rows": [{**row, "cost": str(row["cost"])} for row in rows],
+            "total_hours": round(sum(row["hours"] for row in rows), 2),
+            "total_cost": str(total_cost),
+        }
 
         return Response(response, status=status.HTTP_200_OK)
 
 
-class WorkspaceRolesView(APIView):
+class WorkspaceShiftsExportView(MembershipMixin, APIView):
+    """API view exporting a workspace's shifts with hours and cost as CSV or XLSX."""
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, workspace_id, file_format):
+        """Stream every shift of a workspace, oldest first, as a CSV or XLSX file.
+
+        Requires manage_schedules permission. Optional query params:
+        range_start, range_end (dates or ISO 8601 datetimes); without them
+        the whole history is exported. Rows are streamed as they are read, so
+        exports of any size use the same memory. Under ASGI the response
+        iterates asynchronously, as Django would otherwise buffer it.
+
+        :param request: Authenticated HTTP request with workspace_id and
+            file_format ("csv" or "xlsx") in url.
+        :type request: rest_framework.request.Request
+        :return: Streaming file download, or an error response.
+        :rtype: django.http.StreamingHttpResponse
+        """
+        response = {"error": {}}
+
+        if file_format not in EXPORT_FORMATS:
+            response["error"]["message"] = "Export format must be csv or xlsx."
+            return Response(response, status=status.HTTP_404_NOT_FOUND)
+
+        try:
+            range_start = None
+            range_end = None
+            if "range_start" in request.query_params:
+                range_start = parse_range_bound(request.query_params["range_start"])
+            if "range_end" in request.query_params:
+                range_end = parse_range_bound(request.query_params["range_end"], end=True)
+        except ValueError:
+            response["error"]["message"] = "Date range value is invalid."
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+        # Verify user is part of workspace and has perms to manage schedules
+        membership = self.get_membership(request, workspace_id)
+        if membership is None:
+            if not Workspace.objects.filter(pk=workspace_id).exists():
+                response["error"]["message"] = "Workspace does not exist."
+                return Response(response, status=status.HTTP_404_NOT_FOUND)
+            response["error"]["message"] = "You are not a member of this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+        if not membership.manage_schedules:
+            response["error"][
+                "message"
+            ] = "You do not have permissions to manage schedules in this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+
+        rows = export_rows(workspace_id, range_start, range_end)
+        stream = stream_csv(rows) if file_format == "csv" else stream_xlsx(rows)
+        if isinstance(request._request, ASGIRequest):
+            stream = stream_async(stream)
+        export = StreamingHttpResponse(stream, content_type=EXPORT_FORMATS[file_format])
+        export["Content-Disposition"] = (
+            f'attachment; filename="workspace-{workspace_id}-shifts.{file_format}"'
+        )
+        return export
+
+
+class WorkspaceRolesView(MembershipMixin, APIView):
     """API view managing roles of a workspace."""
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     def post(self, request, workspace_id):
@@ -516,31 +1154,21 @@ class WorkspaceRolesView(APIView):
             response["error"]["message"] = "Invalid request data"
             return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
-        # Verify workspace exists
-        try:
-            workspace = Workspace.objects.get(pk=workspace_id)
-        except Workspace.DoesNotExist:
-            response["error"]["message"] = "Workspace does not exist."
-            return Response(response, status=status.HTTP_404_NOT_FOUND)
-
         # Verify user has permissions to manage workspace roles
-        try:
-            member = WorkspaceMember.objects.get(user=request.user, workspace=workspace)
-            MemberPermissions.objects.get(
-                workspace=workspace,
-                member=member,
-                manage_workspace_roles=True,
-            )
-        except MemberPermissions.DoesNotExist:
+        membership = self.get_membership(request, workspace_id)
+        if membership is None:
+            if not Workspace.objects.filter(pk=workspace_id).exists():
+                response["error"]["message"] = "Workspace does not exist."
+                return Response(response, status=status.HTTP_404_NOT_FOUND)
+            response["error"]["message"] = "You are not a member of this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+        if not membership.manage_workspace_roles:
             response["error"][
                 "message"
             ] = "You do not have permission to modify roles in this workspace."
             return Response(response, status=status.HTTP_403_FORBIDDEN)
-        except WorkspaceMember.DoesNotExist:
-            response["error"]["message"] = "You are not a member of this workspace."
-            return Response(response, status=status.HTTP_403_FORBIDDEN)
 
-        workspace_role = WorkspaceRole.objects.create(workspace=workspace)
+        workspace_role = WorkspaceRole(workspace_id=workspace_id)
 
         if "name" in serializer.validated_data:
             workspace_role.name = serializer.validated_data["name"]
@@ -561,20 +1189,200 @@ class WorkspaceRolesView(APIView):
         """
         response = {"error": {}}
 
-        # Verify workspace exists
+        if self.get_membership(request, workspace_id) is None:
+            if not Workspace.objects.filter(pk=workspace_id).exists():
+                response["error"]["message"] = "Workspace does not exist."
+                return Response(response, status=status.HTTP_404_NOT_FOUND)
+            response["error"]["message"] = "You are not a member of this workspace"
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+
+        etag = collection_etag("roles", workspace_id, get_version(workspace_id))
+        if not_modified(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        results = WorkspaceRole.objects.filter(workspace_id=workspace_id)
+        data = RoleReadSerializer(results, many=True).data
+
+        response["result"] = data
+
+        return Response(response, status=status.HTTP_200_OK, headers={"ETag": etag})
+
+
+class WorkspaceTemplatesView(MembershipMixin, APIView):
+    """API view managing recurring shift templates of a workspace."""
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, workspace_id):
+        """Create a weekly ShiftTemplate in the given workspace.
+
+        Requires manage_schedules permission. Accepted body fields:
+        role_id (required), day_of_week (required, 0 is Monday), start_time
+        (required, HH:MM[:SS]), duration (required, HH:MM:SS), start_date
+        (required), end_date (optional), member_id (optional), timezone
+        (optional IANA name, defaults to the server TIME_ZONE). start_time is
+        wall-clock time in that timezone, so occurrences keep their local time
+        across daylight saving changes.
+
+        Shift rows are created for occurrences up to the rolling horizon; the
+        materialize_shifts command extends them as time passes. Occurrences
+        the member cannot work because of another shift, approved time off or
+        unavailability are created as open shifts.
+
+        :param request: Authenticated HTTP request with workspace_id in url and template details in the body.
+        :type request: rest_framework.request.Request
+        :return: Id of the new template, or an error response.
+        :rtype: rest_framework.response.Response
+        """
+        response = {"error": {}}
+
+        serializer = ShiftTemplateSerializer(data=request.data)
+        if not serializer.is_valid():
+            response["error"]["code"] = 400
+            response["error"][
+                "message"
+            ] = "Invalid request data, day of week, start time, duration and start date are required."
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+        # Verify body contains required fields
+        if "role_id" not in request.data:
+            response["error"]["message"] = "Role ID is required."
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+        duration = serializer.validated_data["duration"]
+        if duration <= timedelta(0) or duration > settings.SHIFT_MAX_DURATION:
+            response["error"][
+                "message"
+            ] = "Duration must be positive and no longer than the maximum shift length."
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+        end_date = serializer.validated_data.get("end_date")
+        if end_date is not None and end_date < serializer.validated_data["start_date"]:
+            response["error"]["message"] = "Start date cannot be after end date."
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+        # Verify user is part of workspace and has perms to manage schedules
+        membership = self.get_membership(request, workspace_id)
+        if membership is None:
+            if not Workspace.objects.filter(pk=workspace_id).exists():
+                response["error"]["message"] = "Workspace does not exist."
+                return Response(response, status=status.HTTP_404_NOT_FOUND)
+            response["error"]["message"] = "You are not a member of this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+        if not membership.manage_schedules:
+            response["error"][
+                "message"
+            ] = "You do not have permissions to manage schedules in this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+
+        # Verify role exists and is part of workspace
         try:
-            workspace = Workspace.objects.get(pk=workspace_id)
-        except Workspace.DoesNotExist:
-            response["error"]["message"] = "Workspace does not exist."
+            role = WorkspaceRole.objects.get(pk=request.data["role_id"], workspace_id=workspace_id)
+        except WorkspaceRole.DoesNotExist:
+            response["error"][
+                "message"
+            ] = "Workspace role does not exist or is not part of workspace."
             return Response(response, status=status.HTTP_404_NOT_FOUND)
 
-        if not WorkspaceMember.objects.filter(user=request.user, workspace=workspace).exists():
-            response["error"]["message"] = "You are not a member of this workspace"
+        # Verify member is valid if present
+        member = None
+        if "member_id" in request.data:
+            try:
+                member = WorkspaceMember.objects.get(
+                    pk=request.data["member_id"], workspace_id=workspace_id
+                )
+            except WorkspaceMember.DoesNotExist:
+                response["error"]["message"] = "Member does not exist or is not part of workspace."
+                return Response(response, status=status.HTTP_404_NOT_FOUND)
+
+        template = ShiftTemplate.objects.create(
+            workspace_id=workspace_id,
+            role=role,
+            member=member,
+            created_by_id=membership.member_id,
+            **serializer.validated_data,
+        )
+        materialize(template)
+
+        response["result"] = {"id": template.id}
+
+        return Response(response, status=status.HTTP_201_CREATED)
+
+    def get(self, request, workspace_id):
+        """Return the workspace's shift templates.
+
+        :param request: Authenticated HTTP request with workspace_id in url.
+        :type request: rest_framework.request.Request
+        :return: List of templates, or an error response.
+        :rtype: rest_framework.response.Response
+        """
+        response = {"error": {}}
+
+        # Verify user is part of workspace
+        if self.get_membership(request, workspace_id) is None:
+            if not Workspace.objects.filter(pk=workspace_id).exists():
+                response["error"]["message"] = "Workspace does not exist."
+                return Response(response, status=status.HTTP_404_NOT_FOUND)
+            response["error"]["message"] = "You are not a member of this workspace."
             return Response(response, status=status.HTTP_403_FORBIDDEN)
 
-        results = WorkspaceRole.objects.filter(workspace=workspace)
-        data = RoleReadSerializer(results, many=True).data
+        templates = (
+            ShiftTemplate.objects.filter(workspace_id=workspace_id)
+            .select_related("member__user", "role")
+            .order_by("day_of_week", "start_time", "id")
+        )
+
+        data = ShiftTemplateReadSerializer(templates, many=True).data
+        response["result"] = data
+
+        return Response(response, status=status.HTTP_200_OK)
+
+
+class WorkspaceTemplateOccurrencesView(MembershipMixin, APIView):
+    """API view computing template occurrences beyond the materialized horizon."""
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, workspace_id):
+        """Return template occurrences in a range that have no Shift rows yet.
+
+        Required query params: range_start, range_end (dates or ISO 8601
+        datetimes, at most SHIFT_TEMPLATE_EXPAND_MAX apart). Occurrences are
+        computed without being saved, so their id is null; combine them with
+        the workspace shifts endpoint for the full schedule.
+
+        :param request: Authenticated HTTP request with workspace_id in url.
+        :type request: rest_framework.request.Request
+        :return: List of occurrences ordered by start time, or an error response.
+        :rtype: rest_framework.response.Response
+        """
+        response = {"error": {}}
+
+        try:
+            range_start = parse_range_bound(request.query_params["range_start"])
+            range_end = parse_range_bound(request.query_params["range_end"], end=True)
+        except (KeyError, ValueError):
+            response["error"]["message"] = "A valid range_start and range_end are required."
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+        if range_end - range_start > settings.SHIFT_TEMPLATE_EXPAND_MAX:
+            response["error"]["message"] = "Date range is too long."
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+        # Verify user is part of workspace
+        if self.get_membership(request, workspace_id) is None:
+            if not Workspace.objects.filter(pk=workspace_id).exists():
+                response["error"]["message"] = "Workspace does not exist."
+                return Response(response, status=status.HTTP_404_NOT_FOUND)
+            response["error"]["message"] = "You are not a member of this workspace."
+            return Response(response, status=status.HTTP_403_FORBIDDEN)
+
+        templates = ShiftTemplate.objects.filter(workspace_id=workspace_id).select_related(
+            "member__user", "role"
+        )
 
+        data = ShiftOccurrenceSerializer(expand(templates, range_start, range_end), many=True).data
         response["result"] = data
 
         return Response(response, status=status.HTTP_200_OK)
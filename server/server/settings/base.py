@@ -46,8 +46,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "api.middleware.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "api.middleware.StaticFilesMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -55,6 +56,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "api.middleware.ReplicaRoutingMiddleware",
 ]
 
 ROOT_URLCONF = "server.urls"
@@ -84,6 +86,24 @@ WSGI_APPLICATION = "server.wsgi.application"
 
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
+# https://docs.djangoproject.com/en/5.1/ref/databases/#persistent-connections
+#
+# By default each worker keeps its connection open for POSTGRES_CONN_MAX_AGE
+# seconds, checking it is still usable before reusing it. That suits sync
+# (wsgi) workers, which serve one request at a time. Under SERVER_MODE=asgi
+# async views run their queries on many threads, so persistent connections are
+# disabled there; set POSTGRES_POOL=True (requires the "pool" extra, psycopg 3)
+# to use a connection pool in each worker instead.
+#
+# Every gunicorn worker has its own connections, so the pool size is derived
+# from POSTGRES_MAX_CONNECTIONS, the total the app may hold (keep it below the
+# server's max_connections, leaving room for migrations and cron jobs), divided
+# by GUNICORN_WORKERS.
+
+SERVER_MODE = os.getenv("SERVER_MODE", "wsgi")
+GUNICORN_WORKERS = int(os.getenv("GUNICORN_WORKERS", "3"))
+POSTGRES_POOL = os.getenv("POSTGRES_POOL", "False") == "True"
+POSTGRES_MAX_CONNECTIONS = int(os.getenv("POSTGRES_MAX_CONNECTIONS", "60"))
 
 DATABASES = {
     "default": {
@@ -93,12 +113,55 @@ DATABASES = {
         "PASSWORD": os.getenv("POSTGRES_PASSWORD"),
         "HOST": os.getenv("POSTGRES_HOST"),
         "PORT": os.getenv("POSTGRES_PORT"),
+        "CONN_MAX_AGE": (
+            0
+            if POSTGRES_POOL or SERVER_MODE == "asgi"
+            else int(os.getenv("POSTGRES_CONN_MAX_AGE", "60"))
+        ),
+        "CONN_HEALTH_CHECKS": os.getenv("POSTGRES_CONN_HEALTH_CHECKS", "True") == "True",
+        "OPTIONS": {},
     }
 }
 
+if POSTGRES_POOL:
+    _pool_max_size = max(2, POSTGRES_MAX_CONNECTIONS // max(1, GUNICORN_WORKERS))
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": min(int(os.getenv("POSTGRES_POOL_MIN_SIZE", "2")), _pool_max_size),
+        "max_size": _pool_max_size,
+        # Seconds a request waits for a free connection before failing
+        "timeout": float(os.getenv("POSTGRES_POOL_TIMEOUT", "10")),
+    }
+
+# Read replicas
+#
+# Each host in POSTGRES_REPLICA_HOSTS becomes a "replicaN" alias with the
+# default database's credentials. Requests that cannot write read from a
+# replica (see api.middleware.ReplicaRoutingMiddleware); after a user writes,
+# their reads go to the primary for DATABASE_REPLICA_STICKY, which should
+# exceed the usual replication lag. Pins are kept in the "replica_pins" cache,
+# so use a backend shared by all workers for them to hold across workers.
+
+DATABASE_REPLICAS = []
+for _index, _host in enumerate(
+    [h for h in os.getenv("POSTGRES_REPLICA_HOSTS", "").split(",") if h], start=1
+):
+    _replica = {**DATABASES["default"], "HOST": _host, "TEST": {"MIRROR": "default"}}
+    DATABASES[f"replica{_index}"] = _replica
+    DATABASE_REPLICAS.append(f"replica{_index}")
+
+DATABASE_ROUTERS = ["api.routers.ReplicaRouter"]
+DATABASE_REPLICA_STICKY = timedelta(seconds=int(os.getenv("DATABASE_REPLICA_STICKY", "10")))
+
+# Adds an X-Query-Split header counting each response's queries per alias.
+DATABASE_QUERY_SPLIT_HEADER = os.getenv("DATABASE_QUERY_SPLIT_HEADER", str(DEBUG)) == "True"
+
+# Adds a Server-Timing header with each response's query count and database,
+# serialization, render and total time (see api.middleware.RequestMetricsMiddleware).
+REQUEST_METRICS_SERVER_TIMING = os.getenv("REQUEST_METRICS_SERVER_TIMING", "True") == "True"
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "api.authentication.ClaimsJWTAuthentication",
     ],
 }
 
@@ -115,6 +178,112 @@ SIMPLE_JWT = {
     "USER_ID_CLAIM": "user_id",
 }
 
+# Build request.user from token claims instead of reading the User row on every
+# request. Tokens of deleted or deactivated users stay usable until they expire.
+JWT_CLAIMS_USER = os.getenv("JWT_CLAIMS_USER", "True") == "True"
+
+# Scheduling
+
+# Upper bound on shift length. Range queries rely on it to turn overlap checks
+# into a bounded index scan on start_time. Longer shifts are rejected on write,
+# and migration 0018 stops if any existing shift exceeds it.
+SHIFT_MAX_DURATION = timedelta(hours=24)
+
+# Shift lists are paginated by (start_time, id). Without an explicit range,
+# list endpoints return shifts overlapping a window around the current day.
+SHIFT_PAGE_SIZE = 200
+SHIFT_PAGE_SIZE_MAX = 1000
+SHIFT_WINDOW_PAST = timedelta(days=7)
+SHIFT_WINDOW_FUTURE = timedelta(days=35)
+
+# Maximum number of shifts accepted by one bulk creation request.
+SHIFT_BULK_MAX_ITEMS = 500
+
+# Shift templates keep Shift rows for this many days ahead; the
+# materialize_shifts command extends them daily. Occurrence reads beyond the
+# horizon are computed on the fly and may span at most SHIFT_TEMPLATE_EXPAND_MAX.
+SHIFT_TEMPLATE_HORIZON_DAYS = int(os.getenv("SHIFT_TEMPLATE_HORIZON_DAYS", "28"))
+SHIFT_TEMPLATE_EXPAND_MAX = timedelta(days=366)
+
+# Seconds the open shift autofill solver may spend searching before it
+# returns the best assignment found so far.
+SHIFT_AUTOFILL_TIME_BUDGET = float(os.getenv("SHIFT_AUTOFILL_TIME_BUDGET", "2.0"))
+
+# The shift changes feed only reports changes older than SHIFT_CHANGES_SETTLE,
+# so a write whose transaction commits shortly after its timestamp was taken
+# is not skipped by a cursor. Tombstones of deleted shifts are pruned after
+# SHIFT_TOMBSTONE_RETENTION, and older cursors must resync from scratch.
+SHIFT_CHANGES_SETTLE = timedelta(seconds=2)
+SHIFT_TOMBSTONE_RETENTION = timedelta(days=30)
+
+
+# Schedule change events
+#
+# Streams at workspace/<id>/events/ need an ASGI server (SERVER_MODE=asgi);
+# requests served over WSGI are answered with 501. The in-process backend
+# only reaches streams served by the publishing process; with several workers
+# use "api.events.PostgresBackend", which relays events with LISTEN/NOTIFY.
+# Streams send a comment every SCHEDULE_EVENTS_KEEPALIVE seconds, and a client
+# more than SCHEDULE_EVENTS_QUEUE_SIZE events behind is told to resync.
+
+SCHEDULE_EVENTS_BACKEND = os.getenv("SCHEDULE_EVENTS_BACKEND", "api.events.InProcessBackend")
+SCHEDULE_EVENTS_KEEPALIVE = 15
+SCHEDULE_EVENTS_QUEUE_SIZE = 100
+
+
+# Calendar feeds
+#
+# Members subscribe to calendar/<token>.ics from Google Calendar, Outlook and
+# the like. Feeds hold shifts from CALENDAR_FEED_PAST ago to
+# CALENDAR_FEED_FUTURE ahead, and ask clients to refresh every
+# CALENDAR_FEED_REFRESH. Rendered events are kept in the "calendar" cache.
+
+CALENDAR_FEED_PAST = timedelta(days=30)
+CALENDAR_FEED_FUTURE = timedelta(days=180)
+CALENDAR_FEED_REFRESH = timedelta(minutes=15)
+CALENDAR_UID_DOMAIN = os.getenv("CALENDAR_UID_DOMAIN", "schedulo")
+
+
+# Caches
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+#
+# "permissions" holds each user's membership and permission flags per
+# workspace. Invalidation only reaches the backend it runs against, so a
+# per-process cache would keep revoked members authorized on other workers
+# until the TTL expires. Caching is therefore off unless a shared backend is
+# configured, e.g. PERMISSIONS_CACHE_BACKEND=django.core.cache.backends.redis.RedisCache
+# with PERMISSIONS_CACHE_LOCATION=redis://redis:6379/1, or DatabaseCache with a
+# table made by createcachetable.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "permissions": {
+        "BACKEND": os.getenv(
+            "PERMISSIONS_CACHE_BACKEND", "django.core.cache.backends.dummy.DummyCache"
+        ),
+        "LOCATION": os.getenv("PERMISSIONS_CACHE_LOCATION", "permissions"),
+        "TIMEOUT": int(os.getenv("PERMISSIONS_CACHE_TTL", "60")),
+        "OPTIONS": {"MAX_ENTRIES": int(os.getenv("PERMISSIONS_CACHE_MAX_ENTRIES", "10000"))},
+    },
+    "replica_pins": {
+        "BACKEND": os.getenv(
+            "REPLICA_PINS_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("REPLICA_PINS_CACHE_LOCATION", "replica_pins"),
+    },
+    # Rendered calendar events, keyed by shift id and modification time
+    "calendar": {
+        "BACKEND": os.getenv(
+            "CALENDAR_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("CALENDAR_CACHE_LOCATION", "calendar"),
+        "TIMEOUT": int(os.getenv("CALENDAR_CACHE_TTL", str(7 * 24 * 3600))),
+        "OPTIONS": {"MAX_ENTRIES": int(os.getenv("CALENDAR_CACHE_MAX_ENTRIES", "50000"))},
+    },
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
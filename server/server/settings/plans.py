@@ -0,0 +1,31 @@
+"""Query plan test settings — the test settings on a local Postgres.
+
+Runs api.tests.integration.performance.test_query_plans, which is skipped on
+SQLite, against the server given by the POSTGRES_* variables:
+
+    python manage.py test api.tests.integration.performance.test_query_plans \
+        --settings=server.settings.plans
+
+Set QUERY_PLAN_UPDATE_BASELINES=True to record the plans' estimated costs as
+the new baseline instead of comparing against it.
+"""
+
+import os
+
+from .tests import *
+from .base import DATABASES as BASE_DATABASES
+
+_postgres = {
+    **BASE_DATABASES["default"],
+    "NAME": os.getenv("POSTGRES_DB", "schedulo"),
+    "USER": os.getenv("POSTGRES_USER", "postgres"),
+    "HOST": os.getenv("POSTGRES_HOST", "localhost"),
+    "PORT": os.getenv("POSTGRES_PORT", "5432"),
+    "CONN_MAX_AGE": 0,
+}
+DATABASES = {
+    "default": _postgres,
+    "replica": {**_postgres, "TEST": {"MIRROR": "default"}},
+}
+
+QUERY_PLAN_UPDATE_BASELINES = os.getenv("QUERY_PLAN_UPDATE_BASELINES", "False") == "True"
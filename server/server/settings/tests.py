@@ -1,8 +1,29 @@
 from .base import *
+from .base import CACHES
 
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": ":memory:",
-    }
+    },
+    # Replica routing tests enable this with DATABASE_REPLICAS = ["replica"]
+    "replica": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+        "TEST": {"MIRROR": "default"},
+    },
 }
+DATABASE_REPLICAS = []
+
+# Test databases reuse primary keys after each rollback, so cached memberships
+# would leak between tests.
+CACHES = {
+    **CACHES,
+    "permissions": {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+    },
+}
+
+# SQLite cannot create LaborRollup's nulls_distinct=False unique constraint;
+# Postgres, which production runs on, enforces it.
+SILENCED_SYSTEM_CHECKS = ["models.W047"]